@@ -14,9 +14,17 @@ Usage:
     $ realms realm call join_realm '("admin")' -f .realms/realm_X
 """
 
-from . import realm as realm
-from . import mundus as mundus
-from . import registry as registry
+import importlib
 
 __version__ = "0.4.0"
 __all__ = ["realm", "mundus", "registry", "__version__"]
+
+
+def __getattr__(name):
+    # The SDK modules are imported on first use: the CLI imports this package
+    # on every run, and ``realm`` alone drags in asyncio.
+    if name in ("realm", "mundus", "registry"):
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -24,6 +24,7 @@ def build_dfx_call_cmd(
     args: str,
     network: Optional[str] = None,
     output_format: Optional[str] = None,
+    identity: Optional[str] = None,
 ) -> list[str]:
     """Build a ``dfx canister call`` command list."""
     cmd = ["dfx", "canister", "call"]
@@ -32,6 +33,8 @@ def build_dfx_call_cmd(
     cmd.extend([canister_name, method, args])
     if output_format:
         cmd.extend(["--output", output_format])
+    if identity:
+        cmd.extend(["--identity", identity])
     return cmd
 
 
@@ -43,9 +46,10 @@ def run_dfx_call(
     cwd: Optional[str] = None,
     output_format: Optional[str] = None,
     timeout: int = 30,
+    identity: Optional[str] = None,
 ) -> subprocess.CompletedProcess:
     """Run a ``dfx canister call`` and return the CompletedProcess."""
-    cmd = build_dfx_call_cmd(canister_name, method, args, network, output_format)
+    cmd = build_dfx_call_cmd(canister_name, method, args, network, output_format, identity)
     return subprocess.run(cmd, capture_output=True, text=True, check=True, cwd=cwd, timeout=timeout)
 
 
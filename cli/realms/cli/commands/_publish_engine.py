@@ -0,0 +1,209 @@
+"""Shared file_registry publish engine.
+
+Every publisher — ``realms extension|codex|assistant publish`` and
+``scripts/publish_layered.py`` — hands this module a namespace and a list of
+files. It lists the namespace once, drops files whose SHA-256 already matches
+the registry, and uploads the rest with bounded parallelism across files *and*
+chunks (``store_file_chunk`` carries its own index, so chunks may land in any
+order). Each file is then finalized with multi-chunk
+``finalize_chunked_file_step`` batches.
+
+The transport is injected: ``call(method, payload, is_query)`` sends the JSON
+``payload`` as the single text argument and returns the decoded JSON reply, so
+the CLI can keep its icp/dfx helper and the script its plain dfx subprocess.
+"""
+
+import base64
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ..constants import DEFAULT_PUBLISH_JOBS
+
+# Each store_file_chunk JSON-parses + base64-decodes its payload inside the WASI
+# Python runtime; ~200 KiB/chunk blows the 40B per-message instruction budget, so
+# keep raw chunks small (64 KiB raw -> ~88 KiB base64 payload).
+CHUNK_SIZE_BYTES = 64 * 1024
+# Bytes concatenated per finalize_chunked_file_step. Concatenation is cheap
+# (the on-chain SHA-256 is skipped when expected_sha256 is passed), so a step
+# covers many chunks rather than one.
+FINALIZE_BATCH_BYTES = 1024 * 1024
+
+# Cost model from scripts/BENCHMARK_RESULTS.md: chunked upload ~13 M
+# cycles/KB; the one list_files query per namespace is ~2 M.
+CHUNK_CYCLES_PER_KB = 13_000_000
+QUERY_CYCLES = 2_000_000
+
+Caller = Callable[[str, dict, bool], dict]
+
+
+def _ok(res) -> bool:
+    return isinstance(res, dict) and (res.get("ok") is True or res.get("success") is True)
+
+
+@dataclass
+class PublishItem:
+    """One file to publish: its registry path, content and MIME type."""
+
+    path: str
+    data: bytes
+    content_type: str = "application/octet-stream"
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.data).hexdigest()
+
+
+@dataclass
+class PublishSummary:
+    uploaded: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    bytes_uploaded: int = 0
+    bytes_skipped: int = 0
+    calls: int = 0
+
+    @property
+    def cycles_saved(self) -> int:
+        """Upload cycles avoided by skipping unchanged files (estimate)."""
+        saved = self.bytes_skipped * CHUNK_CYCLES_PER_KB // 1024
+        return max(0, saved - QUERY_CYCLES)
+
+    def describe(self) -> str:
+        return (
+            f"{len(self.uploaded)} uploaded ({self.bytes_uploaded:,} bytes), "
+            f"{len(self.skipped)} unchanged ({self.bytes_skipped:,} bytes, "
+            f"~{self.cycles_saved / 1e9:.2f} B cycles saved), "
+            f"{len(self.failed)} failed, {self.calls} calls"
+        )
+
+
+def fetch_namespace_hashes(call: Caller, namespace: str) -> Dict[str, str]:
+    """``{path: sha256}`` for a namespace, via one ``list_files`` query.
+
+    Returns ``{}`` on any error so callers fall through to uploading everything.
+    """
+    try:
+        files = call("list_files", {"namespace": namespace}, True)
+        if isinstance(files, list):
+            return {f["path"]: f.get("sha256", "") for f in files if f.get("path")}
+    except Exception:
+        pass
+    return {}
+
+
+def _finalize(call: Caller, namespace: str, item: PublishItem, batch: int) -> Optional[str]:
+    """Run finalize steps until done. Returns an error string or None."""
+    for _ in range(100_000):
+        res = call(
+            "finalize_chunked_file_step",
+            {
+                "namespace": namespace,
+                "path": item.path,
+                "expected_sha256": item.sha256,
+                "batch_size": batch,
+            },
+            False,
+        )
+        if (
+            not isinstance(res, dict)
+            or res.get("error")
+            or not (res.get("ok") is True or "done" in res)
+        ):
+            return f"finalize failed: {res}"
+        if res.get("done") is True:
+            return None
+    return "finalize did not complete"
+
+
+def publish_files(
+    call: Caller,
+    namespace: str,
+    items: Iterable[PublishItem],
+    existing: Optional[Dict[str, str]] = None,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
+    chunk_size: int = CHUNK_SIZE_BYTES,
+    on_result: Optional[Callable[[PublishItem, str], None]] = None,
+) -> PublishSummary:
+    """Upload ``items`` to ``namespace``, skipping what the registry already has.
+
+    ``existing`` is a ``fetch_namespace_hashes`` result; it is fetched here when
+    not given. ``on_result(item, status)`` is called with ``"uploaded"``,
+    ``"skipped"`` or ``"failed"`` as each file settles (from worker threads).
+    """
+    summary = PublishSummary()
+    lock = threading.Lock()
+    if existing is None:
+        existing = fetch_namespace_hashes(call, namespace)
+        summary.calls += 1
+    finalize_batch = max(1, FINALIZE_BATCH_BYTES // chunk_size)
+
+    def counted_call(method, payload, is_query=False):
+        with lock:
+            summary.calls += 1
+        return call(method, payload, is_query)
+
+    def settle(item: PublishItem, status: str, error: str = "") -> None:
+        with lock:
+            if status == "skipped":
+                summary.skipped.append(item.path)
+                summary.bytes_skipped += len(item.data)
+            elif status == "uploaded":
+                summary.uploaded.append(item.path)
+                summary.bytes_uploaded += len(item.data)
+            else:
+                summary.failed[item.path] = error
+        if on_result:
+            on_result(item, status)
+
+    # A path listed twice publishes its last content, as sequential uploads did.
+    by_path = {item.path: item for item in items}
+    pending = []
+    for item in by_path.values():
+        if existing.get(item.path) == item.sha256:
+            settle(item, "skipped")
+        else:
+            pending.append(item)
+    if not pending:
+        return summary
+
+    def store_chunk(item: PublishItem, index: int, total: int) -> Optional[str]:
+        blob = item.data[index * chunk_size : (index + 1) * chunk_size]
+        res = counted_call(
+            "store_file_chunk",
+            {
+                "namespace": namespace,
+                "path": item.path,
+                "chunk_index": index,
+                "total_chunks": total,
+                "data_b64": base64.b64encode(blob).decode("ascii"),
+                "content_type": item.content_type,
+            },
+        )
+        if not _ok(res):
+            return f"chunk {index + 1}/{total} failed: {res}"
+        return None
+
+    def finish(item: PublishItem, chunk_futures) -> None:
+        try:
+            errors = [e for e in (f.result() for f in chunk_futures) if e]
+            error = errors[0] if errors else _finalize(
+                counted_call, namespace, item, finalize_batch
+            )
+        except Exception as e:
+            error = str(e)
+        settle(item, "failed" if error else "uploaded", error or "")
+
+    # Chunks of every file share one pool; finalizers run on their own pool
+    # so a finalizer waiting on its chunks never starves the chunk workers.
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as chunk_pool, \
+            ThreadPoolExecutor(max_workers=max(1, jobs)) as finalize_pool:
+        for item in pending:
+            total = max(1, (len(item.data) + chunk_size - 1) // chunk_size)
+            futures = [
+                chunk_pool.submit(store_chunk, item, i, total) for i in range(total)
+            ]
+            finalize_pool.submit(finish, item, futures)
+    return summary
@@ -1,19 +1,82 @@
 """Export command for extracting data and codexes from Realms."""
 
 import json
+import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import typer
 
+from ..constants import EXPORT_PAGE_SIZE
 from ..utils import (
     console,
     display_error_panel,
     display_success_panel,
-    get_project_root,
-    run_command,
+    get_effective_cwd,
 )
+from ._dfx_utils import parse_candid_json_response, run_dfx_call
+
+PROGRESS_FILE = "export_progress.json"
+# A page can carry up to a megabyte of records; give dfx room to deliver it.
+CALL_TIMEOUT = 300
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "_-" else "_" for c in name)
+
+
+def _call_backend(
+    method: str,
+    args: str,
+    network: str,
+    identity: Optional[str],
+    canister: str,
+    folder: Optional[str],
+) -> Dict[str, Any]:
+    # Called quietly: ``run_command`` would echo every page's stdout.
+    try:
+        result = run_dfx_call(
+            canister,
+            method,
+            args,
+            network=network,
+            cwd=get_effective_cwd(folder),
+            timeout=CALL_TIMEOUT,
+            identity=identity,
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(e.stderr or e.stdout or "dfx command failed") from e
+    if not result or not result.stdout:
+        raise RuntimeError(
+            (result.stderr if result else "") or "dfx command failed with no output"
+        )
+    response = parse_candid_json_response(result.stdout)
+    if not response.get("success"):
+        raise RuntimeError(response.get("error") or result.stdout[:500])
+    return response
+
+
+def _write_codex(codex_dir: Path, record: Dict[str, Any]) -> None:
+    codex_dir.mkdir(exist_ok=True)
+    name = record.get("name") or "unnamed_codex"
+    (codex_dir / f"{_safe_name(name)}.py").write_text(record.get("code") or "")
+    console.print(f"[green]✓[/green] Saved codex '{name}'")
+
+
+def _load_progress(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except Exception:
+        return {}
+
+
+def _save_progress(path: Path, progress: Dict[str, Any]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(progress, indent=2))
+    tmp.replace(path)
 
 
 def export_data_command(
@@ -22,8 +85,17 @@ def export_data_command(
     network: str = "local",
     identity: Optional[str] = None,
     include_codexes: bool = True,
+    page_size: int = EXPORT_PAGE_SIZE,
+    canister: str = "realm_backend",
+    folder: Optional[str] = None,
 ) -> None:
-    """Export data from the realm. Saves JSON data and Python codex files."""
+    """Export data from the realm. Saves NDJSON data and Python codex files.
+
+    Each entity type is paged from the backend by id cursor and appended to
+    ``entities/<Type>.ndjson`` as it arrives, so no single call has to carry
+    the whole realm. ``export_progress.json`` records the cursor per type; an
+    interrupted export run again into the same directory picks up there.
+    """
 
     console.print(
         f"[bold blue]📤 Exporting data to {output_dir}[/bold blue]\n"
@@ -31,145 +103,98 @@ def export_data_command(
 
     try:
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        entities_dir = output_path / "entities"
+        entities_dir.mkdir(parents=True, exist_ok=True)
+        progress_path = output_path / PROGRESS_FILE
+        progress = _load_progress(progress_path)
+
+        def call(method: str, args: str) -> Dict[str, Any]:
+            return _call_backend(method, args, network, identity, canister, folder)
+
+        console.print("📊 Listing entity types...")
+        available = call("export_entity_types", "()")["types"]
+        wanted = set(entity_types.split(",")) if entity_types else None
+        types = [
+            t for t in available
+            if t["count"]
+            and (wanted is None or t["type"] in wanted)
+            and (include_codexes or t["type"] != "Codex")
+        ]
+
+        codex_dir = output_path / "codexes"
+        summary_types: Dict[str, int] = {}
+        for entry in types:
+            type_name = entry["type"]
+            state = progress.get(type_name, {"next_from_id": 1, "records": 0})
+            ndjson = entities_dir / f"{_safe_name(type_name)}.ndjson"
+            if state.get("done"):
+                console.print(f"[dim]↩️  {type_name} already exported[/dim]")
+                summary_types[type_name] = state["records"]
+                continue
+
+            # Resume exactly after the last recorded page: anything written
+            # past that offset belongs to a page whose cursor was never saved.
+            if state["next_from_id"] > 1 and ndjson.exists():
+                f = open(ndjson, "r+")
+                f.seek(state.get("bytes", 0))
+                f.truncate()
+            else:
+                state = {"next_from_id": 1, "records": 0, "bytes": 0}
+                f = open(ndjson, "w")
+            with f:
+                next_from_id = state["next_from_id"]
+                while next_from_id is not None:
+                    page = call(
+                        "export_entities",
+                        f'("{type_name}", {next_from_id} : nat, {page_size} : nat)',
+                    )
+                    for record in page["records"]:
+                        f.write(json.dumps(record) + "\n")
+                        if type_name == "Codex" and include_codexes:
+                            _write_codex(codex_dir, record)
+                    f.flush()
+                    next_from_id = page["next_from_id"]
+                    state["records"] += len(page["records"])
+                    state["bytes"] = f.tell()
+                    state["next_from_id"] = next_from_id or state["next_from_id"]
+                    state["done"] = next_from_id is None
+                    progress[type_name] = state
+                    _save_progress(progress_path, progress)
+                    if next_from_id is not None:
+                        console.print(
+                            f"[dim]   {type_name}: {state['records']} records…[/dim]"
+                        )
 
-        project_root = get_project_root()
+            summary_types[type_name] = state["records"]
+            console.print(
+                f"[green]✓[/green] {type_name}: {state['records']} records → {ndjson}"
+            )
 
-        # Prepare export arguments
-        args = {
-            "entity_types": entity_types.split(",") if entity_types else None,
-            "include_codexes": include_codexes,
+        total = sum(summary_types.values())
+        summary = {
+            "export_date": datetime.now().isoformat(),
+            "network": network,
+            "format": "ndjson",
+            "total_entities": total,
+            "total_codexes": summary_types.get("Codex", 0),
+            "entity_types": summary_types,
         }
+        summary_file = output_path / "export_summary.json"
+        with open(summary_file, "w") as f:
+            json.dump(summary, f, indent=2)
+        if progress_path.exists():
+            progress_path.unlink()
 
-        args_json = json.dumps(args)
-        escaped_args = args_json.replace('"', '\\"')
-
-        console.print("📊 Fetching data from backend...")
-
-        cmd = [
-            "dfx",
-            "canister",
-            "call",
-            "realm_backend",
-            "extension_sync_call",
-            f'(record {{ extension_name = "admin_dashboard"; function_name = "export_data"; args = "{escaped_args}"; }})',
-            "--network",
-            network,
-            "--output",
-            "json",
-        ]
-        
-        if identity:
-            cmd.extend(["--identity", identity])
-        
-        result = run_command(
-            cmd,
-            cwd=project_root,
-            capture_output=True,
+        console.print(f"[green]✓[/green] Saved export summary to {summary_file}")
+        display_success_panel(
+            "Export Complete! 🎉",
+            f"Successfully exported {total} entities of {len(summary_types)} "
+            f"types to {output_dir}",
         )
 
-        # Parse the dfx response
-        if result and result.stdout:
-            # Parse the Candid response
-            if "'success': True" not in result.stdout and "success = true" not in result.stdout.lower():
-                display_error_panel("Backend Export Failed", result.stdout)
-                raise typer.Exit(1)
-
-            # Extract the JSON data from the Candid response
-            # The response format is typically: (variant { Ok = record { success = true; data = ... } })
-            try:
-                # Try to extract JSON from the response
-                import re
-                
-                # Look for the data field in the response
-                # First, try to find the raw data section
-                data_match = re.search(r'"data"\s*[:=]\s*"([^"]+)"', result.stdout, re.DOTALL)
-                if not data_match:
-                    data_match = re.search(r'data\s*=\s*"([^"]+)"', result.stdout, re.DOTALL)
-                
-                if not data_match:
-                    console.print("[yellow]⚠️  Could not extract data from response[/yellow]")
-                    console.print(f"[dim]Response: {result.stdout[:500]}...[/dim]")
-                    raise typer.Exit(1)
-                
-                # The data is JSON-encoded as a string, so we need to parse it
-                data_str = data_match.group(1)
-                # Unescape the JSON string
-                data_str = data_str.replace('\\n', '\n').replace('\\"', '"').replace('\\\\', '\\')
-                export_data = json.loads(data_str)
-                
-                # Separate entities and codexes
-                entities = export_data.get("entities", [])
-                codexes = export_data.get("codexes", [])
-                
-                console.print(f"[green]✓[/green] Retrieved {len(entities)} entities and {len(codexes)} codexes")
-                
-                # Save entities to JSON file
-                if entities:
-                    entities_file = output_path / "realm_data.json"
-                    with open(entities_file, "w") as f:
-                        json.dump(entities, f, indent=2)
-                    console.print(f"[green]✓[/green] Saved entities to {entities_file}")
-                
-                # Save codexes to individual Python files
-                if codexes and include_codexes:
-                    codex_dir = output_path / "codexes"
-                    codex_dir.mkdir(exist_ok=True)
-                    
-                    for codex in codexes:
-                        codex_name = codex.get("name", "unnamed_codex")
-                        codex_code = codex.get("code", "")
-                        
-                        # Sanitize filename
-                        safe_name = "".join(c if c.isalnum() or c in "_-" else "_" for c in codex_name)
-                        codex_file = codex_dir / f"{safe_name}.py"
-                        
-                        with open(codex_file, "w") as f:
-                            f.write(codex_code)
-                        
-                        console.print(f"[green]✓[/green] Saved codex '{codex_name}' to {codex_file}")
-                
-                # Create a summary file
-                summary = {
-                    "export_date": datetime.now().isoformat(),
-                    "network": network,
-                    "total_entities": len(entities),
-                    "total_codexes": len(codexes),
-                    "entity_types": {},
-                }
-                
-                # Count entities by type
-                for entity in entities:
-                    entity_type = entity.get("_type", "Unknown")
-                    summary["entity_types"][entity_type] = summary["entity_types"].get(entity_type, 0) + 1
-                
-                summary_file = output_path / "export_summary.json"
-                with open(summary_file, "w") as f:
-                    json.dump(summary, f, indent=2)
-                
-                console.print(f"[green]✓[/green] Saved export summary to {summary_file}")
-                
-                display_success_panel(
-                    "Export Complete! 🎉",
-                    f"Successfully exported {len(entities)} entities and {len(codexes)} codexes to {output_dir}",
-                )
-                
-            except json.JSONDecodeError as e:
-                display_error_panel("JSON Parse Error", f"Could not parse export data: {str(e)}")
-                console.print(f"[dim]Response: {result.stdout[:500]}...[/dim]")
-                raise typer.Exit(1)
-            except Exception as e:
-                display_error_panel("Export Processing Error", str(e))
-                console.print(f"[dim]Response: {result.stdout[:500]}...[/dim]")
-                raise typer.Exit(1)
-        
-        elif result and result.stderr:
-            display_error_panel("Backend Export Failed", result.stderr)
-            raise typer.Exit(1)
-        else:
-            display_error_panel("Backend Export Failed", "dfx command failed with no output")
-            raise typer.Exit(1)
-
     except Exception as e:
-        display_error_panel("Export Failed", str(e))
+        display_error_panel(
+            "Export Failed",
+            f"{e}\n\nRerun the same command to resume from {output_dir}/{PROGRESS_FILE}",
+        )
         raise typer.Exit(1)
@@ -5,7 +5,6 @@ Provides functionality for packaging, installing, and managing extensions
 in the Smart Social Contracts platform.
 """
 
-import hashlib
 import json
 import os
 import shutil
@@ -21,6 +20,9 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from ..constants import DEFAULT_PUBLISH_JOBS
+from ._publish_engine import PublishItem, PublishSummary, publish_files
+
 console = Console()
 
 # Allowlisted extensions under frontend-rt/dist/ (recursive). Source maps excluded.
@@ -1236,16 +1238,6 @@ def codex_runtime_list_command(canister: str, network: str = "local", identity:
 # Publish commands — upload extensions / codices to file_registry
 # ---------------------------------------------------------------------------
 
-# Each store_file_chunk JSON-parses + base64-decodes its payload inside the WASI
-# Python runtime; ~200 KiB/chunk blows the 40B per-message instruction budget, so
-# keep raw chunks small (64 KiB raw -> ~88 KiB base64 payload).
-_PUBLISH_CHUNK_SIZE_BYTES = 64 * 1024
-# Chunks concatenated per finalize_chunked_file_step call. Concatenation is cheap
-# (the expensive on-chain SHA-256 is skipped — we pass the local hash), so several
-# 64 KiB chunks per message stay well under budget.
-_PUBLISH_FINALIZE_BATCH = 8
-
-
 def _content_type_for(name: str) -> str:
     name_lower = name.lower()
     if name_lower.endswith(".json"):
@@ -1273,130 +1265,59 @@ def _content_type_for(name: str) -> str:
     return "application/octet-stream"
 
 
-def _local_file_sha256(path: str) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
+def _registry_caller(registry: str, network: str, identity: Optional[str]):
+    """JSON-in/JSON-out file_registry transport for the publish engine."""
 
-def _fetch_namespace_hashes(
-    registry: str, namespace: str, network: str, identity: Optional[str],
-) -> dict:
-    """Query list_files for a namespace and return {path: sha256} dict.
-
-    Uses --query (free, no cycles burned). Returns empty dict on any error
-    so callers fall through to uploading everything.
-    """
-    try:
-        arg = json.dumps({"namespace": namespace})
+    def call(method: str, payload: dict, is_query: bool = False):
+        arg = json.dumps(payload)
         candid_arg = '("' + arg.replace("\\", "\\\\").replace('"', '\\"') + '")'
         raw = _dfx_call(
-            registry, "list_files", candid_arg, network, identity,
-            is_query=True, timeout=30,
+            registry, method, candid_arg, network, identity,
+            is_query=is_query, timeout=30 if is_query else 600,
         )
-        files = json.loads(raw)
-        if isinstance(files, list):
-            return {f["path"]: f.get("sha256", "") for f in files}
-    except Exception:
-        pass
-    return {}
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return {"raw": raw}
+
+    return call
+
+
+def _publish_item(registry_path: str, local_path: str) -> PublishItem:
+    with open(local_path, "rb") as fh:
+        data = fh.read()
+    return PublishItem(registry_path, data, _content_type_for(local_path))
 
 
-def _upload_one_file(
+def _publish_items(
     registry: str,
     namespace: str,
-    registry_path: str,
-    local_path: str,
+    items: List[PublishItem],
     network: str,
     identity: Optional[str],
-    existing_hashes: Optional[dict] = None,
-) -> str:
-    """Upload a single file to file_registry, picking single-shot or chunked upload.
-
-    If existing_hashes is provided and the local file's SHA-256 matches
-    the on-chain hash, the upload is skipped entirely (no update call).
-
-    Returns "uploaded", "skipped", or "failed".
-    """
-    import base64 as _b64
-
-    size = os.path.getsize(local_path)
-
-    if existing_hashes and registry_path in existing_hashes:
-        local_hash = _local_file_sha256(local_path)
-        if local_hash == existing_hashes[registry_path]:
-            console.print(f"  [dim]⊜[/dim] {namespace}/{registry_path} [dim]unchanged[/dim]")
-            return "skipped"
-
-    content_type = _content_type_for(local_path)
-
-    total_chunks = max(1, (size + _PUBLISH_CHUNK_SIZE_BYTES - 1) // _PUBLISH_CHUNK_SIZE_BYTES)
-    if total_chunks > 1:
-        console.print(
-            f"  [blue]…[/blue] chunked upload of {namespace}/{registry_path} "
-            f"({size:,} bytes, {total_chunks} chunks)"
-        )
-    with open(local_path, "rb") as fh:
-        for chunk_index in range(total_chunks):
-            blob = fh.read(_PUBLISH_CHUNK_SIZE_BYTES)
-            payload = json.dumps({
-                "namespace": namespace,
-                "path": registry_path,
-                "chunk_index": chunk_index,
-                "total_chunks": total_chunks,
-                "data_b64": _b64.b64encode(blob).decode("ascii"),
-                "content_type": content_type,
-            })
-            candid_arg = '("' + payload.replace("\\", "\\\\").replace('"', '\\"') + '")'
-            raw = _dfx_call(
-                registry,
-                "store_file_chunk",
-                candid_arg,
-                network,
-                identity,
-                timeout=600,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
+) -> PublishSummary:
+    """Publish ``items`` through the shared engine, one console line per file."""
+
+    def report(item: PublishItem, status: str) -> None:
+        if status == "skipped":
+            console.print(f"  [dim]⊜[/dim] {namespace}/{item.path} [dim]unchanged[/dim]")
+        elif status == "uploaded":
+            console.print(
+                f"  [green]✓[/green] {namespace}/{item.path} ({len(item.data):,} bytes)"
             )
-            try:
-                res = json.loads(raw)
-            except json.JSONDecodeError:
-                res = {"raw": raw}
-            if not (isinstance(res, dict) and (res.get("ok") is True or res.get("success") is True)):
-                console.print(
-                    f"  [red]✗[/red] chunk {chunk_index + 1}/{total_chunks} of "
-                    f"{registry_path} failed: {res}"
-                )
-                return "failed"
-
-    local_sha = _local_file_sha256(local_path)
-    while True:
-        finalize_payload = json.dumps({
-            "namespace": namespace,
-            "path": registry_path,
-            "expected_sha256": local_sha,
-            "batch_size": _PUBLISH_FINALIZE_BATCH,
-        })
-        candid_arg = '("' + finalize_payload.replace("\\", "\\\\").replace('"', '\\"') + '")'
-        raw = _dfx_call(
-            registry,
-            "finalize_chunked_file_step",
-            candid_arg,
-            network,
-            identity,
-            timeout=600,
-        )
-        try:
-            res = json.loads(raw)
-        except json.JSONDecodeError:
-            res = {"raw": raw}
-        if not (isinstance(res, dict) and res.get("ok") is True):
-            console.print(f"  [red]✗[/red] finalize failed for {registry_path}: {res}")
-            return "failed"
-        if res.get("done") is True:
-            label = "chunked" if total_chunks > 1 else "stored"
-            console.print(f"  [green]✓[/green] {namespace}/{registry_path} ({size:,} bytes, {label})")
-            return "uploaded"
+
+    summary = publish_files(
+        _registry_caller(registry, network, identity),
+        namespace,
+        items,
+        jobs=jobs,
+        on_result=report,
+    )
+    for path, error in summary.failed.items():
+        console.print(f"  [red]✗[/red] {namespace}/{path}: {error}")
+    console.print(f"  [dim]{summary.describe()}[/dim]")
+    return summary
 
 
 _SCREENSHOT_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
@@ -1486,6 +1407,7 @@ def publish_extension_command(
     skip_publish: bool = False,
     network: str = "ic",
     identity: Optional[str] = None,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
 ):
     """Publish an extension (manifest, backend/, optional frontend-rt bundle, i18n)
     to a file_registry canister under ``{namespace_prefix}/<id>/<version>/``.
@@ -1530,20 +1452,11 @@ def publish_extension_command(
         f"{registry} ({network})…[/blue]"
     )
 
-    existing = _fetch_namespace_hashes(registry, namespace, network, identity)
+    items: List[PublishItem] = []
     failed = 0
-    uploaded = 0
 
     def _upload(reg_path, local):
-        nonlocal failed, uploaded
-        result = _upload_one_file(
-            registry, namespace, reg_path, local, network, identity,
-            existing_hashes=existing,
-        )
-        if result == "failed":
-            failed += 1
-        elif result == "uploaded":
-            uploaded += 1
+        items.append(_publish_item(reg_path, local))
 
     # Manifest
     _upload("manifest.json", manifest_path)
@@ -1634,6 +1547,10 @@ def publish_extension_command(
     for reg_path, local in screenshot_specs:
         _upload(reg_path, local)
 
+    summary = _publish_items(registry, namespace, items, network, identity, jobs)
+    uploaded = len(summary.uploaded)
+    failed += len(summary.failed)
+
     if uploaded == 0 and failed == 0:
         console.print(
             f"[green]✓ {ext_id}@{ver} already up-to-date on {registry}[/green]"
@@ -1662,6 +1579,7 @@ def publish_codex_command(
     skip_publish: bool = False,
     network: str = "ic",
     identity: Optional[str] = None,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
 ):
     """Publish a codex package to a file_registry canister.
 
@@ -1697,6 +1615,7 @@ def publish_codex_command(
             skip_publish=skip_publish,
             network=network,
             identity=identity,
+            jobs=jobs,
         )
 
     console.print(
@@ -1720,38 +1639,16 @@ def publish_codex_command(
         f"{registry} ({network})…[/blue]"
     )
 
-    existing = _fetch_namespace_hashes(registry, namespace, network, identity)
-    failed = 0
-    uploaded = 0
-
-    def _track(result):
-        nonlocal failed, uploaded
-        if result == "failed":
-            failed += 1
-        elif result == "uploaded":
-            uploaded += 1
-
+    items: List[PublishItem] = []
     if os.path.exists(manifest_path):
-        _track(_upload_one_file(
-            registry, namespace, "manifest.json", manifest_path, network, identity,
-            existing_hashes=existing,
-        ))
+        items.append(_publish_item("manifest.json", manifest_path))
     else:
         synthetic = json.dumps(
             {"name": cid, "version": ver, "description": f"Codex package {cid}"}
         )
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as tmp:
-            tmp.write(synthetic)
-            tmp_path = tmp.name
-        try:
-            _track(_upload_one_file(
-                registry, namespace, "manifest.json", tmp_path, network, identity,
-                existing_hashes=existing,
-            ))
-        finally:
-            os.unlink(tmp_path)
+        items.append(
+            PublishItem("manifest.json", synthetic.encode(), "application/json")
+        )
 
     for root, _dirs, files in os.walk(source_dir):
         for fname in sorted(files):
@@ -1763,10 +1660,11 @@ def publish_codex_command(
             if fname == "manifest.json" and os.path.dirname(local) == source_dir:
                 continue
             rel = os.path.relpath(local, source_dir).replace(os.sep, "/")
-            _track(_upload_one_file(
-                registry, namespace, rel, local, network, identity,
-                existing_hashes=existing,
-            ))
+            items.append(_publish_item(rel, local))
+
+    summary = _publish_items(registry, namespace, items, network, identity, jobs)
+    uploaded = len(summary.uploaded)
+    failed = len(summary.failed)
 
     if uploaded == 0 and failed == 0:
         console.print(
@@ -1796,6 +1694,7 @@ def publish_assistant_command(
     skip_publish: bool = False,
     network: str = "ic",
     identity: Optional[str] = None,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
 ):
     """Publish an assistant package (manifest, prompts/, persona.yaml, etc.) to file_registry."""
     source_dir = os.path.abspath(source_dir)
@@ -1819,17 +1718,7 @@ def publish_assistant_command(
         f"{registry} ({network})…[/blue]"
     )
 
-    existing = _fetch_namespace_hashes(registry, namespace, network, identity)
-    failed = 0
-    uploaded = 0
-
-    def _track(result):
-        nonlocal failed, uploaded
-        if result == "failed":
-            failed += 1
-        elif result == "uploaded":
-            uploaded += 1
-
+    items: List[PublishItem] = []
     skip_names = {"manifest.json"}
     for root, _dirs, files in os.walk(source_dir):
         for fname in sorted(files):
@@ -1839,15 +1728,13 @@ def publish_assistant_command(
             rel = os.path.relpath(local, source_dir).replace(os.sep, "/")
             if rel in skip_names:
                 continue
-            _track(_upload_one_file(
-                registry, namespace, rel, local, network, identity,
-                existing_hashes=existing,
-            ))
+            items.append(_publish_item(rel, local))
 
-    _track(_upload_one_file(
-        registry, namespace, "manifest.json", manifest_path, network, identity,
-        existing_hashes=existing,
-    ))
+    items.append(_publish_item("manifest.json", manifest_path))
+
+    summary = _publish_items(registry, namespace, items, network, identity, jobs)
+    uploaded = len(summary.uploaded)
+    failed = len(summary.failed)
 
     if uploaded == 0 and failed == 0:
         console.print(f"[green]✓ {aid}@{ver} already up-to-date on {registry}[/green]")
@@ -1954,6 +1841,11 @@ def extension_command(
         "--frontend-canister",
         help="Realm frontend asset canister (runtime-install / resync-frontends)",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_PUBLISH_JOBS,
+        "--jobs",
+        help="Concurrent registry upload calls (publish action only)",
+    ),
 ) -> None:
     """Manage Realm extensions."""
 
@@ -2044,6 +1936,7 @@ def extension_command(
             skip_publish=skip_publish_marker,
             network=network,
             identity=identity,
+            jobs=jobs,
         )
     else:
         console.print(f"[red]Unknown action: {action}[/red]")
@@ -2095,6 +1988,11 @@ def codex_command(
         "--skip-publish",
         help="Upload files but do not call publish_namespace (publish action only)",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_PUBLISH_JOBS,
+        "--jobs",
+        help="Concurrent registry upload calls (publish action only)",
+    ),
 ) -> None:
     """Manage Realm codex packages."""
 
@@ -2143,6 +2041,7 @@ def codex_command(
             skip_publish=skip_publish_marker,
             network=network,
             identity=identity,
+            jobs=jobs,
         )
     else:
         console.print(f"[red]Unknown action: {action}[/red]")
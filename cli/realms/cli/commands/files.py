@@ -16,9 +16,9 @@ from .extension import (
     publish_codex_command,
     publish_assistant_command,
     _dfx_call,
-    _fetch_namespace_hashes,
+    _publish_item,
+    _publish_items,
     _publish_namespace,
-    _upload_one_file,
 )
 
 console = Console()
@@ -293,9 +293,8 @@ def files_publish_branding_command(
     ])
 
     wanted = {n.lower() for n in realm_names} if realm_names else None
-    existing = _fetch_namespace_hashes(reg, _BRANDING_NAMESPACE, network, identity)
 
-    published = 0
+    items = []
     for d in realm_dirs:
         try:
             manifest = json.loads((d / "manifest.json").read_text())
@@ -315,16 +314,12 @@ def files_publish_branding_command(
             if not local.exists():
                 console.print(f"  [dim]⊘ {fname} not present, skipping[/dim]")
                 continue
-            registry_path = f"{realm_key}/{fname}"
-            r = _upload_one_file(
-                reg, _BRANDING_NAMESPACE, registry_path, str(local),
-                network, identity, existing,
-            )
-            if r == "failed":
-                console.print(f"[red]  ✗ failed to publish {registry_path}[/red]")
-                raise typer.Exit(1)
-            if r == "uploaded":
-                published += 1
+            items.append(_publish_item(f"{realm_key}/{fname}", str(local)))
+
+    summary = _publish_items(reg, _BRANDING_NAMESPACE, items, network, identity)
+    if summary.failed:
+        raise typer.Exit(1)
+    published = len(summary.uploaded)
 
     _publish_namespace(reg, _BRANDING_NAMESPACE, network, identity)
     console.print(f"\n[bold green]Branding publish complete ({published} file(s) uploaded).[/bold green]")
@@ -414,8 +409,10 @@ def files_publish_release_command(
         backend_hash = _sha256_file(backend_wasm)
         console.print(f"\n[bold]Backend WASM → {reg}:{backend_ns}/{backend_path}[/bold]")
         console.print(f"  sha256={backend_hash}")
-        existing = _fetch_namespace_hashes(reg, backend_ns, network, identity)
-        if _upload_one_file(reg, backend_ns, backend_path, backend_wasm, network, identity, existing) == "failed":
+        summary = _publish_items(
+            reg, backend_ns, [_publish_item(backend_path, backend_wasm)], network, identity
+        )
+        if summary.failed:
             raise typer.Exit(1)
         _publish_namespace(reg, backend_ns, network, identity)
 
@@ -425,20 +422,17 @@ def files_publish_release_command(
         if not os.path.isdir(frontend_dist):
             raise typer.BadParameter(f"frontend dist not found: {frontend_dist}")
         console.print(f"\n[bold]Frontend bundle → {reg}:{frontend_ns}/[/bold]")
-        existing = _fetch_namespace_hashes(reg, frontend_ns, network, identity)
-        failed = 0
+        items = []
         for root, _dirs, files in os.walk(frontend_dist):
             for fname in sorted(files):
                 local = os.path.join(root, fname)
                 rel = os.path.relpath(local, frontend_dist).replace(os.sep, "/")
-                r = _upload_one_file(reg, frontend_ns, rel, local, network, identity, existing)
-                if r == "failed":
-                    failed += 1
-                elif r == "uploaded":
-                    fe_count += 1
-        if failed:
-            console.print(f"[red]frontend upload had {failed} failures[/red]")
+                items.append(_publish_item(rel, local))
+        summary = _publish_items(reg, frontend_ns, items, network, identity)
+        if summary.failed:
+            console.print(f"[red]frontend upload had {len(summary.failed)} failures[/red]")
             raise typer.Exit(1)
+        fe_count = len(summary.uploaded)
         _publish_namespace(reg, frontend_ns, network, identity)
         console.print(f"  {fe_count} files uploaded")
 
@@ -464,8 +458,11 @@ def files_publish_release_command(
                 assets_ns = f"wasm/{family}-assetstorage/{version}"
                 assets_path = os.path.basename(assets_wasm)
                 console.print(f"  assets wasm → {reg}:{assets_ns}/{assets_path} (sha256={assets_hash})")
-                ex = _fetch_namespace_hashes(reg, assets_ns, network, identity)
-                if _upload_one_file(reg, assets_ns, assets_path, assets_wasm, network, identity, ex) != "failed":
+                summary = _publish_items(
+                    reg, assets_ns, [_publish_item(assets_path, assets_wasm)],
+                    network, identity,
+                )
+                if not summary.failed:
                     _publish_namespace(reg, assets_ns, network, identity)
                 _casals_add_authorized_wasm(casals, {
                     "key": frontend_key, "kind": "frontend",
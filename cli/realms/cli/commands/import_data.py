@@ -1,16 +1,17 @@
 """Import command for loading JSON data and codex files into Realms."""
 
 import base64
+import hashlib
 import json
-import math
 import sys
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import typer
 
-from ..constants import MAX_BATCH_SIZE
+from ..constants import DEFAULT_IMPORT_PARALLELISM, MAX_BATCH_SIZE
 from ..utils import (
     console,
     display_error_panel,
@@ -21,6 +22,132 @@ from ..utils import (
 )
 
 
+def _load_records(path: Path) -> List[dict]:
+    """Records from a JSON array, an NDJSON file, or an export directory.
+
+    A directory is what ``realms db export`` writes: one ``<Type>.ndjson`` per
+    entity type under ``entities/``.
+    """
+    if path.is_dir():
+        entities_dir = path / "entities" if (path / "entities").is_dir() else path
+        records: List[dict] = []
+        for ndjson in sorted(entities_dir.glob("*.ndjson")):
+            records.extend(_load_records(ndjson))
+        return records
+
+    if path.suffix in (".ndjson", ".jsonl"):
+        with open(path, "r") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    with open(path, "r") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError("JSON data must be an array of objects")
+    return data
+
+
+def _plan_batches(records: List[dict], batch_size: int) -> Dict[str, Any]:
+    """Dependency-ordered batches grouped into parallel-safe waves.
+
+    Falls back to the file order, one batch per wave, when the backend models
+    cannot be loaded here.
+    """
+    try:
+        backend_root = Path(__file__).resolve().parents[4] / "src" / "realm_backend"
+        if str(backend_root) not in sys.path:
+            sys.path.insert(0, str(backend_root))
+        import ggg  # noqa: F401
+        from core.entity_import import plan_import_batches
+
+        plan = plan_import_batches(records, batch_size=batch_size)
+        for warning in plan["warnings"]:
+            console.print(f"[yellow]⚠ {warning}[/yellow]")
+        return plan
+    except Exception as sort_err:
+        console.print(f"[yellow]⚠ Import order sort skipped: {sort_err}[/yellow]")
+        batches = [
+            records[i : i + batch_size] for i in range(0, len(records), batch_size)
+        ]
+        return {"batches": batches, "waves": [[i] for i in range(len(batches))]}
+
+
+def _fingerprint(batches: List[List[dict]]) -> str:
+    digest = hashlib.sha256()
+    for batch in batches:
+        digest.update(json.dumps(batch, sort_keys=True).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _load_checkpoint(path: Path, fingerprint: str) -> Set[int]:
+    """Batches already imported by an earlier run of this exact plan."""
+    if not path.exists():
+        return set()
+    try:
+        state = json.loads(path.read_text())
+    except Exception:
+        return set()
+    if state.get("fingerprint") != fingerprint:
+        console.print(
+            f"[yellow]⚠ {path} belongs to a different import; starting over[/yellow]"
+        )
+        return set()
+    return set(state.get("done", []))
+
+
+def _save_checkpoint(path: Path, fingerprint: str, done: Set[int]) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps({"fingerprint": fingerprint, "done": sorted(done)}))
+    tmp.replace(path)
+
+
+def _send_batch(
+    chunk: List[dict],
+    format: str,
+    network: str,
+    identity: Optional[str],
+    canister: str,
+    folder: Optional[str],
+) -> Tuple[bool, str]:
+    """One ``import_data`` call. Returns ``(ok, dfx output)``."""
+    args = {
+        "format": format,
+        "data": chunk,
+        "sort_records": False,
+    }
+    # Use base64 encoding to avoid shell escaping issues
+    args_b64 = base64.b64encode(json.dumps(args).encode()).decode()
+
+    cmd = [
+        "dfx",
+        "canister",
+        "call",
+        canister,
+        "extension_sync_call",
+        f'(record {{ extension_name = "import_export"; function_name = "import_data"; args = "base64:{args_b64}"; }})',
+        "--network",
+        network,
+        "--output",
+        "json",
+    ]
+    if identity:
+        cmd.extend(["--identity", identity])
+
+    # Run from realm folder so dfx can find .dfx/local/canister_ids.json
+    result = run_command(cmd, cwd=get_effective_cwd(folder), capture_output=True)
+
+    if result and result.stdout:
+        # Handle both JSON double quotes and Python single quotes
+        ok = (
+            '"success": true' in result.stdout.lower()
+            or "'success': True" in result.stdout
+        )
+        return ok, result.stdout
+    if result and result.stderr:
+        return False, result.stderr
+    return False, "dfx command failed with no output"
+
+
 def import_data_command(
     file_path: str,
     entity_type: Optional[str] = None,
@@ -31,8 +158,17 @@ def import_data_command(
     identity: Optional[str] = None,
     canister: str = "realm_backend",
     folder: Optional[str] = None,
+    parallel: int = DEFAULT_IMPORT_PARALLELISM,
+    checkpoint: Optional[str] = None,
+    resume: bool = True,
 ) -> None:
-    """Import data into the realm. Supports JSON data and Python codex files."""
+    """Import data into the realm. Supports JSON data and Python codex files.
+
+    Records are sorted so referents land first, split into batches, and sent
+    wave by wave: batches within a wave reference nothing in each other, so up
+    to ``parallel`` of them are in flight at once. Finished batches are recorded
+    in a checkpoint file, and a rerun of the same import skips them.
+    """
 
     # Handle codex files separately
     if entity_type == "codex":
@@ -48,106 +184,91 @@ def import_data_command(
     console.print(f"[bold blue]📥 Importing data from {file_path}[/bold blue]\n")
 
     try:
-        data_file = Path(file_path)
-        if not data_file.exists():
+        data_path = Path(file_path)
+        if not data_path.exists():
             raise FileNotFoundError(f"Data file not found: {file_path}")
 
-        with open(data_file, "r") as f:
-            data = json.load(f)
-
-        console.print(type(data))
+        data = _load_records(data_path)
+        console.print(f"📊 Found {len(data)} records to import")
 
-        if not isinstance(data, list):
-            raise ValueError("JSON data must be an array of objects")
+        plan = _plan_batches(data, batch_size)
+        batches, waves = plan["batches"], plan["waves"]
+        console.print(
+            f"📊 {len(batches)} batches in {len(waves)} waves "
+            f"(up to {parallel} in parallel)"
+        )
 
-        console.print(f"📊 Found {len(data)} records to import")
+        if dry_run:
+            console.print("[yellow]🔍 Dry run mode - no data will be imported[/yellow]")
+            display_success_panel(
+                "Dry Run Complete",
+                f"Would import {len(data)} records in {len(batches)} batches",
+            )
+            return
 
-        # Topologically sort so referents exist before referees (issue #14).
-        try:
-            backend_root = Path(__file__).resolve().parents[4] / "src" / "realm_backend"
-            if str(backend_root) not in sys.path:
-                sys.path.insert(0, str(backend_root))
-            import ggg  # noqa: F401
-            from core.entity_import import topological_sort_records
-
-            data, sort_warnings = topological_sort_records(data)
-            for warning in sort_warnings:
-                console.print(f"[yellow]⚠ {warning}[/yellow]")
-        except Exception as sort_err:
+        checkpoint_path = Path(
+            checkpoint or f"{str(data_path).rstrip('/')}.import-checkpoint.json"
+        )
+        fingerprint = _fingerprint(batches)
+        done = _load_checkpoint(checkpoint_path, fingerprint) if resume else set()
+        if done:
             console.print(
-                f"[yellow]⚠ Import order sort skipped: {sort_err}[/yellow]"
+                f"↩️  Resuming: {len(done)}/{len(batches)} batches already imported"
             )
+        lock = threading.Lock()
 
-        # Calculate the total number of chunks using ceiling division
-        total_chunks = math.ceil(len(data) / batch_size)
-
-        for i in range(0, len(data), batch_size):
-            chunk = data[i : i + batch_size]
-
-            console.print(f"📊 Sending chunk {i // batch_size + 1}/{total_chunks}")
-
-            args = {
-                "format": format,
-                "data": chunk,
-                "sort_records": False,
-            }
-
-            args_json = json.dumps(args)
-            # Use base64 encoding to avoid shell escaping issues
-            args_b64 = base64.b64encode(args_json.encode()).decode()
-
-            cmd = [
-                "dfx",
-                "canister",
-                "call",
-                canister,
-                "extension_sync_call",
-                f'(record {{ extension_name = "import_export"; function_name = "import_data"; args = "base64:{args_b64}"; }})',
-                "--network",
-                network,
-                "--output",
-                "json",
-            ]
-
-            if identity:
-                cmd.extend(["--identity", identity])
-
-            # Run from realm folder so dfx can find .dfx/local/canister_ids.json
-            effective_cwd = get_effective_cwd(folder)
-            result = run_command(
-                cmd,
-                cwd=effective_cwd,
-                capture_output=True,
+        for wave_num, wave in enumerate(waves, start=1):
+            pending = [b for b in wave if b not in done]
+            if not pending:
+                continue
+            console.print(
+                f"📊 Wave {wave_num}/{len(waves)}: sending {len(pending)} batches"
             )
-
-            # Parse the dfx response to check for backend errors
-            if result and result.stdout:
-                # Check for success in response (handle both JSON double quotes and Python single quotes)
-                if (
-                    '"success": true' in result.stdout.lower()
-                    or "'success': True" in result.stdout
-                ):
-                    display_success_panel("Import Chunk Complete! 🎉", result.stdout)
-                else:
-                    display_error_panel("Backend Import Chunk Failed", result.stdout)
-                    raise typer.Exit(1)
-
-            elif result and result.stderr:
-                # dfx command had stderr output
-                display_error_panel("Backend Import Chunk Failed", result.stderr)
-                raise typer.Exit(1)
-            else:
-                # dfx command failed completely
+            failures = []
+            with ThreadPoolExecutor(max_workers=max(1, parallel)) as pool:
+                futures = {
+                    pool.submit(
+                        _send_batch, batches[b], format, network, identity,
+                        canister, folder,
+                    ): b
+                    for b in pending
+                }
+                for future in as_completed(futures):
+                    b = futures[future]
+                    try:
+                        ok, output = future.result()
+                    except Exception as e:
+                        ok, output = False, str(e)
+                    if not ok:
+                        failures.append((b, output))
+                        continue
+                    with lock:
+                        done.add(b)
+                        _save_checkpoint(checkpoint_path, fingerprint, done)
+                    console.print(
+                        f"[green]✓[/green] Batch {b + 1}/{len(batches)} imported"
+                    )
+
+            if failures:
+                b, output = min(failures)
                 display_error_panel(
-                    "Backend Import Data Failed", "dfx command failed with no output"
+                    f"Backend Import Batch {b + 1} Failed",
+                    f"{output}\n\n{len(failures)} batch(es) failed in wave "
+                    f"{wave_num}; rerun the same command to resume from "
+                    f"{checkpoint_path}",
                 )
                 raise typer.Exit(1)
 
+        if checkpoint_path.exists():
+            checkpoint_path.unlink()
+
         display_success_panel(
             "Import Data Complete! 🎉",
             f"Successfully imported {len(data)} records from {file_path}",
         )
 
+    except typer.Exit:
+        raise
     except Exception as e:
         display_error_panel("Backend Import Data Failed", str(e))
         raise typer.Exit(1)
@@ -3,6 +3,12 @@
 import os
 
 MAX_BATCH_SIZE = 10
+# Import batches in flight at once (each is its own dfx subprocess)
+DEFAULT_IMPORT_PARALLELISM = 4
+# Records per export_entities page; the backend also caps pages by size
+EXPORT_PAGE_SIZE = 500
+# Concurrent file_registry chunk/finalize calls per publish
+DEFAULT_PUBLISH_JOBS = 8
 
 # Default realm folder
 # Can be overridden with REALMS_FOLDER environment variable
@@ -1,62 +1,20 @@
 """Main CLI application for Realms."""
 
-from typing import List, Optional
+import importlib
+from typing import Any, Callable, List, Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from .commands.create import create_command
-from .commands.db import db_command, db_find_command, db_get_command, db_schema_command
-from .commands.deploy import deploy_command, deploy_from_descriptor
-from .commands.import_data import import_data_command
-from .commands.export_data import export_data_command
-from .commands.extension import extension_command, codex_command
-from .commands.wasm_registry import wasm_command
-from .commands.installer import installer_health_command
-from .commands.env import env_deploy_command, env_status_command
-from .commands.marketplace import (
-    marketplace_call_command,
-    marketplace_deploy_command,
-    marketplace_status_command,
+from .constants import (
+    DEFAULT_IMPORT_PARALLELISM,
+    DEFAULT_PUBLISH_JOBS,
+    EXPORT_PAGE_SIZE,
+    MAX_BATCH_SIZE,
+    REALM_FOLDER,
 )
-from .commands.mundus import mundus_deploy_descriptor_command, mundus_deploy_new_command
-from .commands.files import (
-    files_build_command,
-    files_publish_assistant_command,
-    files_publish_branding_command,
-    files_publish_command,
-    files_publish_release_command,
-    files_reset_command,
-)
-from .commands.rollout import rollout_command
-from .commands.quarter import (
-    quarter_create_command,
-    quarter_list_command,
-    quarter_register_command,
-    quarter_remove_command,
-    quarter_status_command,
-)
-from .commands.registry import (
-    billing_add_credits_command,
-    billing_balance_command,
-    billing_deduct_credits_command,
-    billing_redeem_voucher_command,
-    billing_status_command,
-    realm_deploy_realm_command,
-    realm_deploy_status_command,
-    registry_count_command,
-    registry_create_command,
-    registry_deploy_command,
-    registry_get_command,
-    registry_list_command,
-    registry_remove_command,
-    registry_search_command,
-    registry_status_command,
-)
-from .commands.test import test_command
-from .constants import MAX_BATCH_SIZE, REALM_FOLDER
 from .utils import (
     check_dependencies,
     display_info_panel,
@@ -82,6 +40,74 @@ from .utils import (
 
 console = Console()
 
+
+def _lazy(module: str, name: str) -> Callable[..., Any]:
+    """``commands.<module>.<name>``, imported when the command first runs.
+
+    The command modules pull in most of the CLI's weight (prompt_toolkit for
+    the db explorer, the deploy and publish trees, ...). Importing them all up
+    front made ``realms --help``, shell completion and every scripted call pay
+    for all of it; this way a run pays only for the command it invokes.
+    """
+
+    def command(*args: Any, **kwargs: Any) -> Any:
+        implementation = importlib.import_module(f".commands.{module}", __package__)
+        return getattr(implementation, name)(*args, **kwargs)
+
+    command.__name__ = name
+    command.__qualname__ = name
+    return command
+
+
+create_command = _lazy("create", "create_command")
+db_command = _lazy("db", "db_command")
+db_find_command = _lazy("db", "db_find_command")
+db_get_command = _lazy("db", "db_get_command")
+db_schema_command = _lazy("db", "db_schema_command")
+deploy_command = _lazy("deploy", "deploy_command")
+deploy_from_descriptor = _lazy("deploy", "deploy_from_descriptor")
+import_data_command = _lazy("import_data", "import_data_command")
+export_data_command = _lazy("export_data", "export_data_command")
+extension_command = _lazy("extension", "extension_command")
+codex_command = _lazy("extension", "codex_command")
+wasm_command = _lazy("wasm_registry", "wasm_command")
+installer_health_command = _lazy("installer", "installer_health_command")
+env_deploy_command = _lazy("env", "env_deploy_command")
+env_status_command = _lazy("env", "env_status_command")
+marketplace_call_command = _lazy("marketplace", "marketplace_call_command")
+marketplace_deploy_command = _lazy("marketplace", "marketplace_deploy_command")
+marketplace_status_command = _lazy("marketplace", "marketplace_status_command")
+mundus_deploy_descriptor_command = _lazy("mundus", "mundus_deploy_descriptor_command")
+mundus_deploy_new_command = _lazy("mundus", "mundus_deploy_new_command")
+files_build_command = _lazy("files", "files_build_command")
+files_publish_assistant_command = _lazy("files", "files_publish_assistant_command")
+files_publish_branding_command = _lazy("files", "files_publish_branding_command")
+files_publish_command = _lazy("files", "files_publish_command")
+files_publish_release_command = _lazy("files", "files_publish_release_command")
+files_reset_command = _lazy("files", "files_reset_command")
+rollout_command = _lazy("rollout", "rollout_command")
+quarter_create_command = _lazy("quarter", "quarter_create_command")
+quarter_list_command = _lazy("quarter", "quarter_list_command")
+quarter_register_command = _lazy("quarter", "quarter_register_command")
+quarter_remove_command = _lazy("quarter", "quarter_remove_command")
+quarter_status_command = _lazy("quarter", "quarter_status_command")
+billing_add_credits_command = _lazy("registry", "billing_add_credits_command")
+billing_balance_command = _lazy("registry", "billing_balance_command")
+billing_deduct_credits_command = _lazy("registry", "billing_deduct_credits_command")
+billing_redeem_voucher_command = _lazy("registry", "billing_redeem_voucher_command")
+billing_status_command = _lazy("registry", "billing_status_command")
+realm_deploy_realm_command = _lazy("registry", "realm_deploy_realm_command")
+realm_deploy_status_command = _lazy("registry", "realm_deploy_status_command")
+registry_count_command = _lazy("registry", "registry_count_command")
+registry_create_command = _lazy("registry", "registry_create_command")
+registry_deploy_command = _lazy("registry", "registry_deploy_command")
+registry_get_command = _lazy("registry", "registry_get_command")
+registry_list_command = _lazy("registry", "registry_list_command")
+registry_remove_command = _lazy("registry", "registry_remove_command")
+registry_search_command = _lazy("registry", "registry_search_command")
+registry_status_command = _lazy("registry", "registry_status_command")
+test_command = _lazy("test", "test_command")
+
 app = typer.Typer(
     name="realms",
     help="CLI tool for deploying and managing Realms",
@@ -134,6 +160,10 @@ def extension(
         None, "--frontend-canister",
         help="Realm frontend asset canister (runtime-install: upload frontend-rt bundle same-origin)",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_PUBLISH_JOBS, "--jobs",
+        help="Concurrent registry upload calls (publish action only)",
+    ),
 ) -> None:
     """Manage Realm extensions."""
     extension_command(
@@ -152,6 +182,7 @@ def extension(
         namespace_prefix,
         skip_publish_marker,
         frontend_canister,
+        jobs,
     )
 
 
@@ -185,6 +216,10 @@ def codex(
         False, "--skip-publish",
         help="Upload files but do not call publish_namespace (publish action only)",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_PUBLISH_JOBS, "--jobs",
+        help="Concurrent registry upload calls (publish action only)",
+    ),
 ) -> None:
     """Manage Realm codex packages."""
     codex_command(
@@ -200,6 +235,7 @@ def codex(
         run_init,
         namespace_prefix,
         skip_publish_marker,
+        jobs,
     )
 
 
@@ -2316,14 +2352,33 @@ def db_import(
     identity: Optional[str] = typer.Option(
         None, "--identity", "-i", help="Identity to use for import"
     ),
+    parallel: int = typer.Option(
+        DEFAULT_IMPORT_PARALLELISM, "--parallel",
+        help="Batches in flight at once (only batches that do not reference each other)",
+    ),
+    checkpoint: Optional[str] = typer.Option(
+        None, "--checkpoint",
+        help="Checkpoint file (default: <file>.import-checkpoint.json)",
+    ),
+    restart: bool = typer.Option(
+        False, "--restart", help="Ignore an existing checkpoint and import everything"
+    ),
 ) -> None:
-    """Import data into the realm. Supports JSON data and Python codex files."""
+    """Import data into the realm. Supports JSON data and Python codex files.
+
+    FILE_PATH may be a JSON array, an NDJSON file, or a directory written by
+    ``realms db export``. An interrupted import resumes from its checkpoint.
+    """
     network = ctx.obj.get("network") if ctx.obj else None
     canister = ctx.obj.get("canister") if ctx.obj else None
     folder = ctx.obj.get("folder") if ctx.obj else None
     effective_network = network or "local"
     effective_canister = canister or "realm_backend"
-    import_data_command(file_path, entity_type, format, batch_size, dry_run, effective_network, identity, effective_canister, folder)
+    import_data_command(
+        file_path, entity_type, format, batch_size, dry_run, effective_network,
+        identity, effective_canister, folder,
+        parallel=parallel, checkpoint=checkpoint, resume=not restart,
+    )
 
 
 @db_app.command("export")
@@ -2341,11 +2396,22 @@ def db_export(
     include_codexes: bool = typer.Option(
         True, "--include-codexes/--no-codexes", help="Include codexes in export (default: True)"
     ),
+    page_size: int = typer.Option(
+        EXPORT_PAGE_SIZE, "--page-size", help="Records requested per backend call"
+    ),
 ) -> None:
-    """Export data from the realm. Saves JSON data and Python codex files."""
+    """Export data from the realm. Saves NDJSON data and Python codex files.
+
+    Rerunning into the same output directory resumes an interrupted export.
+    """
     network = ctx.obj.get("network") if ctx.obj else None
+    canister = ctx.obj.get("canister") if ctx.obj else None
+    folder = ctx.obj.get("folder") if ctx.obj else None
     effective_network = network or "local"
-    export_data_command(output_dir, entity_types, effective_network, identity, include_codexes)
+    export_data_command(
+        output_dir, entity_types, effective_network, identity, include_codexes,
+        page_size=page_size, canister=canister or "realm_backend", folder=folder,
+    )
 
 
 # Create network subcommand group
@@ -0,0 +1,173 @@
+"""Paged ``realms db export`` and checkpointed ``realms db import``.
+
+dfx is faked at ``run_dfx_call`` (export) and ``run_command`` (import):
+export pages come from an in-memory table, import batches are recorded, so no
+replica is needed.
+"""
+
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import typer
+
+from realms.cli.commands import export_data as ex
+from realms.cli.commands import import_data as im
+
+
+def _candid_text(payload) -> str:
+    return "(" + json.dumps(json.dumps(payload)) + ")"
+
+
+class FakeRealm:
+    """Serves ``export_entity_types`` / ``export_entities`` from a dict."""
+
+    def __init__(self, tables, fail_after=None):
+        self.tables = tables
+        self.fail_after = fail_after
+        self.page_calls = 0
+
+    def __call__(self, canister, method, args, **kwargs):
+        if method == "export_entity_types":
+            types = [
+                {"type": t, "count": len(rows), "max_id": len(rows)}
+                for t, rows in self.tables.items()
+            ]
+            return SimpleNamespace(
+                stdout=_candid_text({"success": True, "types": types}), stderr=""
+            )
+        type_name, from_id, limit = re.match(
+            r'\("([^"]+)", (\d+) : nat, (\d+) : nat\)', args
+        ).groups()
+        self.page_calls += 1
+        if self.fail_after is not None and self.page_calls > self.fail_after:
+            return SimpleNamespace(stdout="", stderr="replica went away")
+        rows = self.tables[type_name]
+        start = int(from_id) - 1
+        page = rows[start : start + int(limit)]
+        nxt = start + len(page) + 1
+        return SimpleNamespace(stdout=_candid_text({
+            "success": True,
+            "records": page,
+            "next_from_id": nxt if nxt <= len(rows) else None,
+        }), stderr="")
+
+
+def _rows(type_name, n, **extra):
+    return [dict({"_type": type_name, "_id": str(i)}, **extra) for i in range(1, n + 1)]
+
+
+def _read_ndjson(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_export_streams_each_type_to_ndjson(tmp_path):
+    tables = {
+        "User": _rows("User", 5),
+        "Codex": [{"_type": "Codex", "_id": "1", "name": "tax", "code": "x = 1\n"}],
+    }
+    with patch.object(ex, "run_dfx_call", FakeRealm(tables)):
+        ex.export_data_command(str(tmp_path), page_size=2)
+
+    assert _read_ndjson(tmp_path / "entities" / "User.ndjson") == tables["User"]
+    assert (tmp_path / "codexes" / "tax.py").read_text() == "x = 1\n"
+    summary = json.loads((tmp_path / "export_summary.json").read_text())
+    assert summary["entity_types"] == {"User": 5, "Codex": 1}
+    assert not (tmp_path / ex.PROGRESS_FILE).exists()
+
+
+def test_interrupted_export_resumes_without_duplicates(tmp_path):
+    tables = {"User": _rows("User", 7)}
+    with patch.object(ex, "run_dfx_call", FakeRealm(tables, fail_after=2)):
+        with pytest.raises(typer.Exit):
+            ex.export_data_command(str(tmp_path), page_size=2)
+    progress = json.loads((tmp_path / ex.PROGRESS_FILE).read_text())
+    assert progress["User"]["next_from_id"] == 5
+
+    realm = FakeRealm(tables)
+    with patch.object(ex, "run_dfx_call", realm):
+        ex.export_data_command(str(tmp_path), page_size=2)
+    assert realm.page_calls == 2
+    assert _read_ndjson(tmp_path / "entities" / "User.ndjson") == tables["User"]
+
+
+def test_export_prints_progress_not_pages(tmp_path, capsys):
+    tables = {"User": _rows("User", 5, bio="page-payload-marker")}
+    with patch.object(ex, "run_dfx_call", FakeRealm(tables)):
+        ex.export_data_command(str(tmp_path), page_size=2)
+    out = capsys.readouterr().out
+    assert "page-payload-marker" not in out
+    assert "User: 4 records" in out
+
+
+class FakeImport:
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.sent = []
+
+    def __call__(self, cmd, cwd=None, capture_output=False):
+        import base64
+
+        b64 = re.search(r'args = "base64:([^"]+)"', cmd[5]).group(1)
+        batch = json.loads(base64.b64decode(b64))["data"]
+        ids = [r["_id"] for r in batch]
+        self.sent.append(ids)
+        ok = not self.fail_ids.intersection(ids)
+        return SimpleNamespace(
+            stdout=json.dumps({"success": ok}), stderr=""
+        )
+
+
+def _three_batch_plan(records, batch_size):
+    batches = [records[0:1], records[1:2], records[2:3]]
+    return {"batches": batches, "waves": [[0, 1], [2]]}
+
+
+def test_import_resumes_from_checkpoint(tmp_path):
+    data = tmp_path / "data.json"
+    records = _rows("User", 3)
+    data.write_text(json.dumps(records))
+
+    first = FakeImport(fail_ids={"3"})
+    with patch.object(im, "run_command", first), \
+            patch.object(im, "_plan_batches", _three_batch_plan):
+        with pytest.raises(typer.Exit):
+            im.import_data_command(str(data), batch_size=1, parallel=2)
+    assert sorted(first.sent) == [["1"], ["2"], ["3"]]
+    checkpoint = tmp_path / "data.json.import-checkpoint.json"
+    assert json.loads(checkpoint.read_text())["done"] == [0, 1]
+
+    second = FakeImport()
+    with patch.object(im, "run_command", second), \
+            patch.object(im, "_plan_batches", _three_batch_plan):
+        im.import_data_command(str(data), batch_size=1)
+    assert second.sent == [["3"]]
+    assert not checkpoint.exists()
+
+
+def test_later_waves_wait_for_failed_dependencies(tmp_path):
+    data = tmp_path / "data.json"
+    data.write_text(json.dumps(_rows("User", 3)))
+
+    fake = FakeImport(fail_ids={"1"})
+    with patch.object(im, "run_command", fake), \
+            patch.object(im, "_plan_batches", _three_batch_plan):
+        with pytest.raises(typer.Exit):
+            im.import_data_command(str(data), batch_size=1)
+    assert ["3"] not in fake.sent
+
+
+def test_import_reads_an_export_directory(tmp_path):
+    entities = tmp_path / "entities"
+    entities.mkdir()
+    (entities / "User.ndjson").write_text(
+        "\n".join(json.dumps(r) for r in _rows("User", 2)) + "\n"
+    )
+    (entities / "Vote.ndjson").write_text(json.dumps(_rows("Vote", 1)[0]) + "\n")
+
+    records = im._load_records(tmp_path)
+    assert sorted((r["_type"], r["_id"]) for r in records) == [
+        ("User", "1"), ("User", "2"), ("Vote", "1"),
+    ]
@@ -0,0 +1,65 @@
+"""Import-time budget for the CLI entry point.
+
+``realms --help``, shell completion and every scripted call import
+``realms.cli.main`` before doing anything. Command implementations are loaded
+on first call (``main._lazy``), so the entry point must not reach them — or
+the heavy dependencies they carry — at import.
+"""
+
+import subprocess
+import sys
+
+# Generous on purpose: a measured run is ~0.2s, and CI machines are noisy.
+# The module checks below are what catch a regression precisely.
+BUDGET_US = 1_500_000
+
+# Loaded only by the commands that need them.
+DEFERRED = (
+    "realms.cli.commands.",
+    "prompt_toolkit",
+    "asyncio",
+    "realms.realm",
+)
+
+
+def _importtime(module: str) -> dict:
+    """Module -> cumulative import time (us), from ``python -X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_entry_point_defers_command_modules():
+    loaded = _importtime("realms.cli.main")
+    early = sorted(
+        name for name in loaded
+        if any(name == d.rstrip(".") or name.startswith(d) for d in DEFERRED)
+    )
+    assert early == []
+
+
+def test_entry_point_import_budget():
+    loaded = _importtime("realms.cli.main")
+    assert loaded["realms.cli.main"] < BUDGET_US
+
+
+def test_lazy_command_resolves_on_call(monkeypatch):
+    from realms.cli import main
+    from realms.cli.commands import rollout
+
+    calls = []
+    monkeypatch.setattr(rollout, "rollout_command", lambda *a, **k: calls.append((a, k)))
+    main.rollout_command("descriptor.yml", dry_run=True)
+    assert calls == [(("descriptor.yml",), {"dry_run": True})]
+    assert main.rollout_command.__name__ == "rollout_command"
@@ -0,0 +1,115 @@
+"""Shared file_registry publish engine (``_publish_engine.publish_files``).
+
+The registry is a thread-safe in-memory fake behind the injected ``call``, so
+chunk ordering, finalize batching and skip-by-hash are checked without dfx.
+"""
+
+import base64
+import hashlib
+import threading
+
+from realms.cli.commands._publish_engine import (
+    CHUNK_CYCLES_PER_KB,
+    PublishItem,
+    fetch_namespace_hashes,
+    publish_files,
+)
+
+
+class FakeRegistry:
+    def __init__(self, files=None, fail_paths=()):
+        self.files = dict(files or {})
+        self.fail_paths = set(fail_paths)
+        self.chunks = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, payload, is_query=False):
+        with self.lock:
+            self.calls.append((method, payload))
+            if method == "list_files":
+                return [
+                    {"path": p, "sha256": hashlib.sha256(d).hexdigest(), "size": len(d)}
+                    for p, d in self.files.items()
+                ]
+            path = payload["path"]
+            if method == "store_file_chunk":
+                if path in self.fail_paths:
+                    return {"error": "quota exceeded"}
+                self.chunks.setdefault(path, {})[payload["chunk_index"]] = (
+                    base64.b64decode(payload["data_b64"])
+                )
+                return {"ok": True}
+            if method == "finalize_chunked_file_step":
+                parts = self.chunks.pop(path)
+                self.files[path] = b"".join(parts[i] for i in sorted(parts))
+                return {"ok": True, "done": True}
+        raise AssertionError(f"unexpected call {method}")
+
+    def methods(self, name):
+        return [p for m, p in self.calls if m == name]
+
+
+def test_unchanged_files_are_skipped():
+    registry = FakeRegistry(files={"a.py": b"same", "b.py": b"old"})
+    summary = publish_files(
+        registry, "ext/x/1", [PublishItem("a.py", b"same"), PublishItem("b.py", b"new")]
+    )
+    assert summary.skipped == ["a.py"]
+    assert summary.uploaded == ["b.py"]
+    assert registry.files["b.py"] == b"new"
+    assert {p["path"] for p in registry.methods("store_file_chunk")} == {"b.py"}
+    assert len(registry.methods("list_files")) == 1
+
+
+def test_chunks_carry_index_and_finalize_in_one_batch():
+    data = bytes(range(256)) * 10
+    registry = FakeRegistry()
+    summary = publish_files(
+        registry, "ns", [PublishItem("big.bin", data)], existing={}, jobs=4, chunk_size=100
+    )
+    assert summary.uploaded == ["big.bin"]
+    assert registry.files["big.bin"] == data
+    indexes = sorted(p["chunk_index"] for p in registry.methods("store_file_chunk"))
+    assert indexes == list(range(26))
+    (step,) = registry.methods("finalize_chunked_file_step")
+    assert step["batch_size"] > 1
+    assert step["expected_sha256"] == hashlib.sha256(data).hexdigest()
+
+
+def test_duplicate_paths_publish_last_content():
+    registry = FakeRegistry()
+    publish_files(
+        registry, "ns", [PublishItem("m.json", b"first"), PublishItem("m.json", b"second")],
+        existing={},
+    )
+    assert registry.files["m.json"] == b"second"
+    assert len(registry.methods("finalize_chunked_file_step")) == 1
+
+
+def test_failures_are_reported_per_file():
+    registry = FakeRegistry(fail_paths={"bad.py"})
+    summary = publish_files(
+        registry, "ns", [PublishItem("ok.py", b"1"), PublishItem("bad.py", b"2")],
+        existing={},
+    )
+    assert summary.uploaded == ["ok.py"]
+    assert "quota exceeded" in summary.failed["bad.py"]
+    assert "bad.py" not in registry.files
+
+
+def test_summary_counts_bytes_and_cycles_saved():
+    blob = b"x" * 4096
+    registry = FakeRegistry(files={"w.wasm": blob})
+    summary = publish_files(registry, "wasm", [PublishItem("w.wasm", blob)])
+    assert summary.bytes_skipped == 4096
+    assert summary.bytes_uploaded == 0
+    assert summary.calls == 1
+    assert summary.cycles_saved > 3 * CHUNK_CYCLES_PER_KB
+
+
+def test_fetch_namespace_hashes_tolerates_errors():
+    def broken(method, payload, is_query=False):
+        raise RuntimeError("dfx missing")
+
+    assert fetch_namespace_hashes(broken, "ns") == {}
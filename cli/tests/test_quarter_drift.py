@@ -263,6 +263,13 @@ class TestRecentProposals:
         assert len(qd.recent_proposals(cls, limit=100)) == 3
         assert cls.load_calls == [(1, 100)]
 
+    def test_index_names_the_rows_to_load(self):
+        cls = _FakeProposalCls(count=5000)
+        cls.load = lambda i: None if i == "4999" else _FakeQuarter(proposal_id=f"prop_{i}")
+        got = qd.recent_proposals(cls, limit=3, recent_ids=lambda n: ["4998", "4999", "5000"][-n:])
+        assert [p.proposal_id for p in got] == ["prop_4998", "prop_5000"]
+        assert cls.load_calls == []
+
     def test_empty_and_failing_entity_degrade_to_empty(self):
         assert qd.recent_proposals(_FakeProposalCls(count=0)) == []
         assert qd.recent_proposals(_FakeProposalCls(count=10, fail_max_id=True)) == []
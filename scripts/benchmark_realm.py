@@ -0,0 +1,693 @@
+#!/usr/bin/env python3
+"""Benchmark realm_backend hot endpoints at 1k / 10k / 100k users.
+
+Companion to ``benchmark_cycles.py`` (file_registry only). Each scale is
+seeded from the bundled realm generator, then every case in ``CASES`` is run
+and measured:
+
+* ``--mode in-process`` (default, no replica): ``main`` is imported in a
+  fresh worker process against a dict-backed store with ``ic`` patched the way
+  the ``_cdk`` test stubs do it. ``ic.performance_counter`` does not exist off
+  the IC, so the instruction figure is the number of CPython bytecodes the
+  call executed (``sys.settrace`` opcode events) — deterministic across
+  machines, which is what a regression threshold needs. Wall time is
+  reported alongside.
+* ``--mode replica``: calls a deployed ``realm_backend`` through dfx.
+  Updates are charged by ``dfx canister status`` balance delta, as in
+  ``benchmark_cycles.py``; queries are free on a replica and only get wall
+  time.
+
+Results are written as JSON and compared against
+``benchmark_realm_thresholds.json``; ``--check`` exits 1 on a regression, and
+on any measured case that has no threshold recorded yet, so a scale without
+baselines cannot pass unchecked.
+
+Usage:
+    python scripts/benchmark_realm.py --scales 1000 --check
+    python scripts/benchmark_realm.py --scales 1000,10000 --update-thresholds
+    python scripts/benchmark_realm.py --mode replica --seed-replica --scales 1000 \\
+        --extension-sandboxed hello_world.greet
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+REALMS_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = REALMS_ROOT / "src" / "realm_backend"
+CLI_DIR = REALMS_ROOT / "cli"
+CACHE_DIR = REALMS_ROOT / ".benchmarks"
+THRESHOLDS_PATH = Path(__file__).resolve().with_name("benchmark_realm_thresholds.json")
+
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+DEFAULT_TOLERANCE = 0.2
+
+BENCH_EXTENSION = "bench_echo"
+PAYROLL_DEPARTMENT = "bench_payroll"
+PAYROLL_HEADCOUNT = 200
+GATE_DEPARTMENTS = 1_000
+GATE_DEPARTMENT = "bench_org_0500"
+ROTATE_SCOPE = "dept:bench_docs"
+ROTATE_MEMBERS = 5_000
+ROTATE_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class Case:
+    """One measured endpoint.
+
+    ``replica`` is ``(method, candid_args, is_query)`` or None when the case
+    cannot be reached through dfx; ``in_process`` is False for cases that only
+    exist on a real replica (the sandbox needs ``_basilisk_sandbox``).
+    """
+
+    name: str
+    replica: Optional[tuple] = None
+    in_process: bool = True
+
+
+CASES = [
+    Case("join_realm", ('("member", "", "")', False)),
+    Case("get_sidebar", ('("{}")', True)),
+    Case("get_quarter_info", ("()", True)),
+    Case("directory_list", ("()", True)),
+    Case("find_objects", ('("User", vec { record { "id"; "user_000" } })', True)),
+    Case("get_objects_paginated", ('("User", 0, 50, "asc")', True)),
+    Case("extension_call_in_process", None),
+    Case("extension_call_sandboxed", None, in_process=False),
+    Case("financial_report"),
+    Case("payroll_chunk"),
+    Case("governed_gate"),
+    Case("rotate_scope"),
+]
+# Candid method names for the replica specs above.
+_REPLICA_METHODS = {
+    "join_realm": "join_realm",
+    "get_sidebar": "get_sidebar",
+    "get_quarter_info": "get_quarter_info",
+    "directory_list": "directory_list",
+    "find_objects": "find_objects",
+    "get_objects_paginated": "get_objects_paginated",
+}
+
+
+# ---------------------------------------------------------------------------
+# Seed data
+# ---------------------------------------------------------------------------
+
+
+def realm_records(users: int, seed: int) -> Path:
+    """Serialized realm for ``users`` members, cached under ``.benchmarks/``.
+
+    Generated in a child process: the CLI entity models and the backend's
+    share the process-global ORM registry and must never meet.
+    """
+    path = CACHE_DIR / f"realm-{users}-{seed}.json"
+    if not path.exists():
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--generate", str(path),
+             "--scales", str(users), "--seed", str(seed)],
+            check=True,
+        )
+    return path
+
+
+def generate_records(path: Path, users: int, seed: int) -> None:
+    """Write the generated realm to ``path``.
+
+    Uses the CLI's bundled ``RealmGenerator`` (``realms.cli.generator``) —
+    the same generator ``realms create --random`` runs — limited to the
+    entity kinds the benchmarked endpoints read.
+    """
+    sys.path.insert(0, str(CLI_DIR))
+    from realms.cli.generator import RealmGenerator
+
+    gen = RealmGenerator(seed, quiet=True)
+    members = gen.generate_users(users)
+    entities = [gen.generate_realm_metadata("Benchmark Realm", users, max(5, users // 100))]
+    entities += members
+    entities += gen.generate_humans(members)
+    entities += gen.generate_members(members)
+    entities += gen.generate_organizations(max(5, users // 100))
+    instruments = gen.generate_instruments()
+    entities += instruments
+    entities += gen.generate_transfers(members, instruments, max(10, users // 5))
+
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps([e.serialize() for e in entities]))
+    tmp.replace(path)
+
+
+# ---------------------------------------------------------------------------
+# In-process worker
+# ---------------------------------------------------------------------------
+
+
+class _DictStorage(dict):
+    """Stable-map stand-in for ``Database.init(db_storage=...)``."""
+
+    def insert(self, key, value):
+        self[key] = value
+
+    def remove(self, key):
+        self.pop(key, None)
+
+    def contains_key(self, key):
+        return key in self
+
+
+class _Principal:
+    def __init__(self, text: str):
+        self._text = text
+
+    def to_str(self) -> str:
+        return self._text
+
+
+class _BenchWallet:
+    """ICRC-1 wallet whose transfers always succeed (answered by ``_drive``)."""
+
+    def transfer(self, **kwargs):
+        return ("icrc1_transfer", kwargs)
+
+
+def _drive(gen, counter: List[int]):
+    """Run an ``Async`` endpoint, answering every outcall with ``{"ok": n}``."""
+    if not hasattr(gen, "send"):
+        return gen
+    reply = None
+    while True:
+        try:
+            gen.send(reply)
+        except StopIteration as done:
+            return done.value
+        counter[0] += 1
+        reply = {"ok": counter[0]}
+
+
+def _count_opcodes(fn) -> int:
+    count = [0]
+
+    def tracer(frame, event, arg):
+        frame.f_trace_opcodes = True
+        if event == "opcode":
+            count[0] += 1
+        return tracer
+
+    sys.settrace(tracer)
+    try:
+        fn()
+    finally:
+        sys.settrace(None)
+    return count[0]
+
+
+class InProcessRealm:
+    """``main`` loaded against a seeded in-memory realm."""
+
+    def __init__(self, records_path: Path, ext_dir: Path):
+        sys.path.insert(0, str(BACKEND_DIR))
+        import ic_python_logging
+        from ic_python_db import Database
+
+        ic_python_logging.disable_logging()
+        Database.init(db_storage=_DictStorage(), audit_enabled=False)
+        db_init = Database.init
+        Database.init = classmethod(lambda cls, *a, **k: cls._instance)
+
+        from basilisk import ic
+
+        self.caller = "system"
+        self.outcalls = [0]
+        ic.caller = staticmethod(lambda: _Principal(self.caller))
+        ic.id = staticmethod(lambda: _Principal("uxrrr-q7777-77774-qaaaq-cai"))
+        ic.time = staticmethod(time.time_ns)
+        ic.performance_counter = staticmethod(lambda _kind=0: time.perf_counter_ns())
+        ic.print = staticmethod(lambda *_a: None)
+        try:
+            import main
+        finally:
+            Database.init = db_init
+        self.main = main
+
+        import ic_basilisk_toolkit.wallet as wallet_module
+
+        wallet_module.Wallet = _BenchWallet
+        from core import runtime_extensions
+
+        runtime_extensions.EXTENSIONS_DIR = str(ext_dir)
+        self._install_bench_extension(ext_dir)
+        self._seed(json.loads(records_path.read_text()))
+        self._joins = 0
+        self._payroll_runs = 0
+        self._rotations = 0
+
+    # -- seeding --------------------------------------------------------
+
+    def _seed(self, records: List[dict]) -> None:
+        """Canister init, then the generated realm as ``realms db import`` would."""
+        from ic_python_db import Database
+
+        self.main.create_foundational_objects()
+        types = Database.get_instance()._entity_types
+        for record in records:
+            cls = types.get(record["_type"])
+            if cls is not None:
+                cls.deserialize(dict(record))
+
+        from ggg import Realm, User, UserProfile
+
+        realm = Realm.load("1")
+        realm.status = "active"
+        realm.open_registration = True
+        member = UserProfile["member"]
+        self.users = []
+        for user in User.instances():
+            if user.id != "system":
+                user.profiles.add(member)
+                self.users.append(user.id)
+        self._seed_ledger(max(10, len(self.users) // 10))
+        self._seed_payroll(min(PAYROLL_HEADCOUNT, len(self.users)))
+
+    def _seed_ledger(self, transactions: int) -> None:
+        from ggg import Category, EntryType, FiscalPeriod, LedgerEntry
+
+        period = FiscalPeriod(
+            id="bench", name="Benchmark", start_date="2025-01-01",
+            end_date="2025-12-31", status="open",
+        )
+        for i in range(transactions):
+            day = f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}"
+            LedgerEntry.create_transaction(
+                f"BENCH-{i}",
+                [
+                    {"entry_type": EntryType.ASSET, "category": Category.CASH,
+                     "debit": 100 + i, "credit": 0, "entry_date": day,
+                     "fiscal_period": period},
+                    {"entry_type": EntryType.REVENUE, "category": Category.TAX,
+                     "debit": 0, "credit": 100 + i, "entry_date": day,
+                     "fiscal_period": period},
+                ],
+            )
+
+    def _seed_payroll(self, headcount: int) -> None:
+        from ggg import Appointment, Department, Fund, Position, User
+
+        dept = Department(name=PAYROLL_DEPARTMENT)
+        Fund(code="BENCHPAY", name="Benchmark payroll", department=dept)
+        position = Position(
+            key=f"{PAYROLL_DEPARTMENT}/clerk", title="clerk", department=dept,
+            headcount=headcount, salary_amount=100,
+        )
+        for principal in self.users[:headcount]:
+            Appointment(position=position, user=User[principal])
+
+    def _install_bench_extension(self, ext_dir: Path) -> None:
+        root = ext_dir / BENCH_EXTENSION
+        root.mkdir(parents=True, exist_ok=True)
+        (root / "manifest.json").write_text(json.dumps({
+            "name": BENCH_EXTENSION,
+            "version": "1.0.0",
+            "runtime": "in_process",
+            "entry_access": {"functions": {"echo": "member"}},
+        }))
+        (root / "entry.py").write_text(
+            "def echo(args: str) -> str:\n    return args\n"
+        )
+
+    # -- cases ----------------------------------------------------------
+
+    def join_realm(self):
+        from basilisk import Principal
+
+        self._joins += 1
+        self.caller = Principal.self_authenticating(
+            f"bench-joiner-{self._joins}".encode()
+        ).to_str()
+        try:
+            return _drive(self.main.join_realm("member", "", ""), self.outcalls)
+        finally:
+            self.caller = "system"
+
+    def get_sidebar(self):
+        return self.main.get_sidebar("{}")
+
+    def get_quarter_info(self):
+        return self.main.get_quarter_info()
+
+    def directory_list(self):
+        return self.main.directory_list()
+
+    def find_objects(self):
+        return self.main.find_objects("User", [("id", "user_000")])
+
+    def get_objects_paginated(self):
+        return self.main.get_objects_paginated("User", 0, 50, "asc")
+
+    def extension_call_in_process(self):
+        return self.main.extension_call(BENCH_EXTENSION, "echo", '{"ping": 1}')
+
+    def financial_report(self):
+        from core.financial_reports import compile_statements
+
+        return compile_statements("2025-12-31", window_start="2025-01-01")
+
+    def prepare_governed_gate(self):
+        """Orgs for the gate, seeded late so they stay out of other cases.
+
+        The first ``gate()`` in a canister's life builds the department
+        cache; this warms it, so the case measures the steady state.
+        """
+        from core.governed_action import governing_org
+        from ggg import Department
+
+        for i in range(GATE_DEPARTMENTS):
+            Department(name=f"bench_org_{i:04d}")
+        governing_org(GATE_DEPARTMENT)
+
+    def governed_gate(self):
+        """``gate()`` for a member acting under a 1/1 org: the direct path."""
+        from core.governed_action import gate
+
+        verdict = gate(
+            caller=self.users[0], summary="bench", replay_code="pass",
+            org_name=GATE_DEPARTMENT,
+        )
+        return {"success": verdict is None}
+
+    def prepare_rotate_scope(self):
+        """A document scope shared with ``ROTATE_MEMBERS`` principals.
+
+        Envelopes are granted in batches as a department share would; the
+        envelope index counts as backfilled, as it is on a realm whose
+        ``initialize()`` found no envelopes.
+        """
+        from api.crypto import grant_many
+        from core import envelope_index
+        from ic_python_db import Database
+
+        Database.get_instance().save("_system", envelope_index.INDEX_FLAG, "done")
+        members = [f"bench-reader-{i:05d}" for i in range(ROTATE_MEMBERS)]
+        for start in range(0, ROTATE_MEMBERS, ROTATE_CHUNK):
+            grant_many(ROTATE_SCOPE, {p: "00" for p in members[start:start + ROTATE_CHUNK]})
+        self._rotate_chunk = {p: "11" for p in members[:ROTATE_CHUNK]}
+
+    def rotate_scope(self):
+        """One ``ROTATE_CHUNK``-member chunk of a key rotation on that scope."""
+        from api.crypto import rotate_scope
+
+        self._rotations += 1
+        return rotate_scope(ROTATE_SCOPE, f"bench-{self._rotations}", self._rotate_chunk)
+
+    def payroll_chunk(self):
+        """One ``process_payroll_chunk`` over freshly pending salary transfers."""
+        from core import payroll
+        from ggg import Transfer
+
+        self._payroll_runs += 1
+        period = f"bench-{self._payroll_runs}"
+        for item in payroll.payment_items(PAYROLL_DEPARTMENT):
+            Transfer(
+                id=payroll.salary_transfer_id(item["position"], item["principal"], period),
+                principal_from="BENCHPAY", principal_to=item["principal"],
+                instrument="ckBTC", amount=item["amount"], timestamp="",
+                status=payroll.PENDING_STATUS,
+            )
+        return _drive(
+            payroll.process_payroll_chunk(PAYROLL_DEPARTMENT, period), self.outcalls
+        )
+
+
+def _ok(result) -> bool:
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)
+        except ValueError:
+            return True
+    if isinstance(result, dict):
+        if "success" in result:
+            return bool(result["success"])
+        return "error" not in result
+    return result is not None
+
+
+def run_worker(records_path: Path, scale: int, repeat: int, opcodes: bool) -> List[dict]:
+    with tempfile.TemporaryDirectory(prefix="bench-ext-") as ext_dir:
+        realm = InProcessRealm(records_path, Path(ext_dir))
+        results = []
+        for case in CASES:
+            if not case.in_process:
+                results.append({"case": case.name, "scale": scale, "skipped":
+                                "needs _basilisk_sandbox (replica only)"})
+                continue
+            fn = getattr(realm, case.name)
+            entry = {"case": case.name, "scale": scale}
+            try:
+                prepare = getattr(realm, f"prepare_{case.name}", None)
+                if prepare is not None:
+                    prepare()
+                if opcodes:
+                    entry["instructions"] = _count_opcodes(fn)
+                timings = []
+                result = None
+                for _ in range(repeat):
+                    start = time.perf_counter_ns()
+                    result = fn()
+                    timings.append((time.perf_counter_ns() - start) / 1e6)
+                entry["ok"] = _ok(result)
+                entry["wall_ms"] = round(statistics.median(timings), 3)
+                entry["wall_ms_max"] = round(max(timings), 3)
+            except Exception as e:
+                entry["ok"] = False
+                entry["error"] = f"{type(e).__name__}: {e}"
+            results.append(entry)
+        return results
+
+
+def run_in_process(scale: int, args) -> List[dict]:
+    """Run one scale in a fresh interpreter (the ORM is process-global)."""
+    records = realm_records(scale, args.seed)
+    print(f"  in-process worker: {scale:,} users ({records.name})", flush=True)
+    cmd = [
+        sys.executable, str(Path(__file__).resolve()), "--worker", str(records),
+        "--scales", str(scale), "--repeat", str(args.repeat),
+    ]
+    if args.no_opcodes:
+        cmd.append("--no-opcodes")
+    cp = subprocess.run(cmd, capture_output=True, text=True)
+    if cp.returncode != 0:
+        raise RuntimeError(f"worker failed for {scale} users:\n{cp.stderr[-2000:]}")
+    return json.loads(cp.stdout.strip().splitlines()[-1])
+
+
+# ---------------------------------------------------------------------------
+# Replica
+# ---------------------------------------------------------------------------
+
+
+def run_replica(scale: int, args) -> List[dict]:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import benchmark_cycles as bc
+
+    bc.NETWORK = args.network
+    if args.seed_replica:
+        records = realm_records(scale, args.seed)
+        print(f"  seeding {args.canister} with {records.name}", flush=True)
+        bc.run(["realms", "db", "import", str(records), "--network", args.network],
+               cwd=REALMS_ROOT)
+
+    extension_specs = {
+        "extension_call_in_process": args.extension_in_process,
+        "extension_call_sandboxed": args.extension_sandboxed,
+    }
+    results = []
+    for case in CASES:
+        entry = {"case": case.name, "scale": scale}
+        if case.name in extension_specs:
+            spec = extension_specs[case.name]
+            if not spec:
+                entry["skipped"] = "pass --" + case.name.replace("extension_call_", "extension-").replace("_", "-")
+                results.append(entry)
+                continue
+            ext, fn = spec.split(".", 1)
+            method, candid, is_query = "extension_call", f'("{ext}", "{fn}", "{{}}")', True
+        elif case.replica is not None:
+            method = _REPLICA_METHODS[case.name]
+            candid, is_query = case.replica
+        else:
+            entry["skipped"] = "no public endpoint"
+            results.append(entry)
+            continue
+        try:
+            before = None if is_query else bc.get_balance(args.canister)
+            start = time.perf_counter()
+            out = bc.dfx_call(args.canister, method, candid, query=is_query)
+            entry["wall_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            if before is not None:
+                time.sleep(0.3)
+                entry["cycles"] = before - bc.get_balance(args.canister)
+            entry["ok"] = "success = false" not in out
+        except RuntimeError as e:
+            entry["ok"] = False
+            entry["error"] = str(e)[:300]
+        results.append(entry)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Thresholds
+# ---------------------------------------------------------------------------
+
+
+def _metric(mode: str) -> str:
+    return "instructions" if mode == "in-process" else "cycles"
+
+
+def check_regressions(results: List[dict], thresholds: dict, mode: str) -> List[str]:
+    """Human-readable regressions against ``thresholds`` (empty when clean)."""
+    metric = _metric(mode)
+    tolerance = float(thresholds.get("tolerance", DEFAULT_TOLERANCE))
+    baseline = thresholds.get(mode, {})
+    problems = []
+    for entry in results:
+        if entry.get("skipped"):
+            continue
+        if entry.get("ok") is False:
+            problems.append(f"{entry['case']} @ {entry['scale']}: failed "
+                            f"({entry.get('error', 'unsuccessful response')})")
+            continue
+        limit = baseline.get(entry["case"], {}).get(str(entry["scale"]))
+        value = entry.get(metric)
+        if limit is None or value is None:
+            continue
+        if value > limit * (1 + tolerance):
+            problems.append(
+                f"{entry['case']} @ {entry['scale']}: {value:,} {metric} "
+                f"> {limit:,} +{tolerance:.0%}"
+            )
+    return problems
+
+
+def missing_thresholds(results: List[dict], thresholds: dict, mode: str) -> List[str]:
+    """Measured ``case @ scale`` entries with no recorded threshold."""
+    metric = _metric(mode)
+    baseline = thresholds.get(mode, {})
+    return [
+        f"{entry['case']} @ {entry['scale']}"
+        for entry in results
+        if entry.get("ok") and entry.get(metric) is not None
+        and baseline.get(entry["case"], {}).get(str(entry["scale"])) is None
+    ]
+
+
+def update_thresholds(results: List[dict], thresholds: dict, mode: str) -> dict:
+    metric = _metric(mode)
+    section = thresholds.setdefault(mode, {})
+    for entry in results:
+        if entry.get("ok") and entry.get(metric) is not None:
+            section.setdefault(entry["case"], {})[str(entry["scale"])] = entry[metric]
+    thresholds.setdefault("tolerance", DEFAULT_TOLERANCE)
+    return thresholds
+
+
+def print_table(results: List[dict], mode: str) -> None:
+    metric = _metric(mode)
+    print(f"\n{'Case':<28} {'Users':>8} {metric.capitalize():>16} {'Wall ms':>10}  Status")
+    print("-" * 80)
+    for e in results:
+        status = e.get("skipped") or ("ok" if e.get("ok") else e.get("error", "FAILED"))
+        value = e.get(metric)
+        print(
+            f"{e['case']:<28} {e['scale']:>8,} "
+            f"{(f'{value:,}' if value is not None else '-'):>16} "
+            f"{(str(e['wall_ms']) if 'wall_ms' in e else '-'):>10}  {status}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=("in-process", "replica"), default="in-process")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="Comma-separated user counts (default: 1000,10000,100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("--seed", type=int, default=12345, help="Generator seed")
+    parser.add_argument("--no-opcodes", action="store_true",
+                        help="Skip the bytecode count (much faster at 100k users)")
+    parser.add_argument("--output", default=None, help="Write results JSON here")
+    parser.add_argument("--thresholds", default=str(THRESHOLDS_PATH))
+    parser.add_argument("--check", action="store_true",
+                        help="Exit 1 if any case regresses past its threshold "
+                             "or has none recorded")
+    parser.add_argument("--update-thresholds", action="store_true",
+                        help="Record these results as the new thresholds")
+    parser.add_argument("--network", default="local")
+    parser.add_argument("--canister", default="realm_backend")
+    parser.add_argument("--seed-replica", action="store_true",
+                        help="Import the generated realm into the replica first")
+    parser.add_argument("--extension-in-process", default=None, metavar="EXT.FN",
+                        help="Installed in-process extension function to call (replica)")
+    parser.add_argument("--extension-sandboxed", default=None, metavar="EXT.FN",
+                        help="Installed sandboxed extension function to call (replica)")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--generate", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    if args.generate:
+        generate_records(Path(args.generate), scales[0], args.seed)
+        return 0
+    if args.worker:
+        results = run_worker(Path(args.worker), scales[0], args.repeat, not args.no_opcodes)
+        print(json.dumps(results))
+        return 0
+
+    results: List[dict] = []
+    for scale in scales:
+        runner = run_in_process if args.mode == "in-process" else run_replica
+        results.extend(runner(scale, args))
+    print_table(results, args.mode)
+
+    thresholds_path = Path(args.thresholds)
+    thresholds = json.loads(thresholds_path.read_text()) if thresholds_path.exists() else {}
+    report = {
+        "mode": args.mode,
+        "metric": _metric(args.mode),
+        "seed": args.seed,
+        "results": results,
+        "regressions": check_regressions(results, thresholds, args.mode),
+        "unchecked": missing_thresholds(results, thresholds, args.mode),
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+    if args.update_thresholds:
+        thresholds = update_thresholds(results, thresholds, args.mode)
+        thresholds_path.write_text(json.dumps(thresholds, indent=2, sort_keys=True) + "\n")
+        print(f"Thresholds updated: {thresholds_path}")
+        return 0
+    if report["regressions"]:
+        print("\nREGRESSIONS:")
+        for line in report["regressions"]:
+            print(f"  {line}")
+    if report["unchecked"]:
+        print("\nNO THRESHOLD (record with --update-thresholds):")
+        for line in report["unchecked"]:
+            print(f"  {line}")
+    if args.check and (report["regressions"] or report["unchecked"]):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
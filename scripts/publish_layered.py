@@ -58,7 +58,6 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import base64
 import gzip
 import hashlib
 import json
@@ -72,6 +71,24 @@ from pathlib import Path
 from typing import Iterable, List, Optional
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# The publish engine ships with the realms CLI; fall back to the in-repo copy
+# when the script runs without it installed.
+try:
+    from realms.cli.commands._publish_engine import (  # noqa: E402
+        DEFAULT_PUBLISH_JOBS,
+        PublishItem,
+        fetch_namespace_hashes,
+        publish_files,
+    )
+except ImportError:  # pragma: no cover - depends on the environment
+    sys.path.insert(0, str(REPO_ROOT / "cli"))
+    from realms.cli.commands._publish_engine import (  # noqa: E402
+        DEFAULT_PUBLISH_JOBS,
+        PublishItem,
+        fetch_namespace_hashes,
+        publish_files,
+    )
 DEFAULT_EXTENSIONS_REPO = REPO_ROOT.parent / "realms-extensions"
 DEFAULT_CODICES_ROOT = REPO_ROOT / "codices" / "codices"
 SKIP_EXTENSION_IDS = {"_shared"}
@@ -221,129 +238,37 @@ def _step_publish_base_wasm(
     base_wasm_version: str,
     namespace: str,
     registry_path: str,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
 ) -> int:
-    """Upload the base realm WASM directly to file_registry using the
-    `extension publish` chunked-upload helper, then publish the namespace.
-
-    For simplicity we ride on the ``store_file`` / ``store_file_chunk`` /
-    ``publish_namespace`` calls that the ``realms extension publish`` command
-    already exercises, by invoking dfx directly. We avoid a separate Python
-    canister call helper here so this script stays a thin orchestrator over
-    the ``realms`` CLI.
-    """
-    import base64
-    import json
+    """Upload the base realm WASM directly to file_registry through the shared
+    publish engine, then publish the namespace.
 
+    An identical WASM already stored at the same path is not uploaded again.
+    """
     if not base_wasm_path.exists():
         print(f"ERROR: --base-wasm not found: {base_wasm_path}", file=sys.stderr)
         return 1
 
-    # Use realms wasm install/hash helpers? No — those *install* the WASM.
-    # For *publishing* the WASM we use file_registry directly.
     size = base_wasm_path.stat().st_size
     print(
         f"Publishing base WASM {base_wasm_path} ({size:,} bytes) "
         f"→ {namespace}/{registry_path} on {registry} ({network})"
     )
+    summary = publish_files(
+        _registry_caller(registry, network, identity),
+        namespace,
+        [PublishItem(registry_path, base_wasm_path.read_bytes(), "application/wasm")],
+        jobs=jobs,
+    )
+    print(f"  {summary.describe()}")
+    for path, error in summary.failed.items():
+        print(f"  {path}: {error}", file=sys.stderr)
+        return 1
 
-    chunk_size = 200 * 1024
-
-    def _dfx_call(method: str, payload: dict) -> int:
-        import tempfile as _tempfile
-
-        cmd = ["dfx", "canister", "call"]
-        if identity:
-            cmd.extend(["--identity", identity])
-        if network:
-            cmd.extend(["--network", network])
-        candid = (
-            '("' + json.dumps(payload).replace("\\", "\\\\").replace('"', '\\"') + '")'
-        )
-        if len(candid.encode("utf-8")) >= 100 * 1024:
-            fd, arg_path = _tempfile.mkstemp(prefix="dfx-arg-", suffix=".did")
-            try:
-                with os.fdopen(fd, "w") as fh:
-                    fh.write(candid)
-                cmd.extend([registry, method, "--argument-file", arg_path])
-                return _run(cmd)
-            finally:
-                try:
-                    os.unlink(arg_path)
-                except OSError:
-                    pass
-        cmd.extend([registry, method, candid])
-        return _run(cmd)
-
-    total_chunks = max(1, (size + chunk_size - 1) // chunk_size)
-    print(f"  chunked upload: {total_chunks} chunks of up to {chunk_size:,} bytes")
-    with base_wasm_path.open("rb") as fh:
-        for i in range(total_chunks):
-            blob = fh.read(chunk_size)
-            rc = _dfx_call(
-                "store_file_chunk",
-                {
-                    "namespace": namespace,
-                    "path": registry_path,
-                    "chunk_index": i,
-                    "total_chunks": total_chunks,
-                    "data_b64": base64.b64encode(blob).decode("ascii"),
-                    "content_type": "application/wasm",
-                },
-            )
-            if rc != 0:
-                print(f"  chunk {i + 1}/{total_chunks} upload failed", file=sys.stderr)
-                return rc
-    import hashlib as _hashlib
-
-    h = _hashlib.sha256()
-    with base_wasm_path.open("rb") as fh:
-        for blob in iter(lambda: fh.read(1024 * 1024), b""):
-            h.update(blob)
-    expected_sha = h.hexdigest()
-    print(f"  finalizing incrementally (sha256={expected_sha[:16]}…)")
-
-    first = True
-    while True:
-        payload = {"namespace": namespace, "path": registry_path, "batch_size": 1}
-        if first:
-            payload["expected_sha256"] = expected_sha
-            first = False
-        import subprocess as _sp
-
-        cmd = ["dfx", "canister", "call"]
-        if identity:
-            cmd.extend(["--identity", identity])
-        if network:
-            cmd.extend(["--network", network])
-        candid = (
-            '("' + json.dumps(payload).replace("\\", "\\\\").replace('"', '\\"') + '")'
-        )
-        cmd.extend([registry, "finalize_chunked_file_step", candid])
-        print("$", " ".join(cmd), flush=True)
-        cp = _sp.run(cmd, capture_output=True, text=True)
-        if cp.returncode != 0:
-            print(cp.stderr, file=sys.stderr)
-            return cp.returncode
-        raw = cp.stdout
-        try:
-            start = raw.index('"')
-            end = raw.rindex('"')
-            inner = raw[start + 1 : end].encode("utf-8").decode("unicode_escape")
-            resp = json.loads(inner)
-        except Exception as e:
-            print(f"  could not parse step response: {raw!r} ({e})", file=sys.stderr)
-            return 1
-        if resp.get("error"):
-            print(f"  finalize step error: {resp['error']}", file=sys.stderr)
-            return 1
-        print(
-            f"  step ok: processed={resp.get('processed')}/"
-            f"{resp.get('total')} done={resp.get('done')}"
-        )
-        if resp.get("done"):
-            break
-
-    return _dfx_call("publish_namespace", {"namespace": namespace})
+    return _registry_dfx_call(
+        registry, network, identity, "publish_namespace", {"namespace": namespace},
+        quiet=False,
+    )
 
 
 def _step_publish_extensions(
@@ -355,6 +280,7 @@ def _step_publish_extensions(
     extensions_repo: Path,
     only: Optional[List[str]],
     namespace_prefix: str,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
 ) -> int:
     ext_dirs = _list_extensions(_resolve_extensions_root(extensions_repo), only)
     if not ext_dirs:
@@ -392,6 +318,8 @@ def _step_publish_extensions(
             namespace_prefix,
             "--network",
             network,
+            "--jobs",
+            str(jobs),
         ]
         if identity:
             cmd.extend(["--identity", identity])
@@ -413,6 +341,7 @@ def _step_publish_codices(
     codices_root: Path,
     only: Optional[List[str]],
     namespace_prefix: str,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
 ) -> int:
     codex_dirs = _list_codices(codices_root, only)
     if not codex_dirs:
@@ -434,6 +363,8 @@ def _step_publish_codices(
             namespace_prefix,
             "--network",
             network,
+            "--jobs",
+            str(jobs),
         ]
         if identity:
             cmd.extend(["--identity", identity])
@@ -528,40 +459,49 @@ def _registry_dfx_call(
     return _run(cmd, quiet=quiet)
 
 
-def _check_remote_sha256(
-    registry: str,
-    network: str,
-    identity: Optional[str],
-    namespace: str,
-    path: str,
-) -> Optional[str]:
-    """Query file_registry for the SHA-256 of an already-stored file.
+def _registry_caller(registry: str, network: str, identity: Optional[str]):
+    """dfx transport for the publish engine: JSON payload in, JSON reply out."""
 
-    Returns the hex digest if the file exists, or None otherwise.
-    Uses a query call (~2M cycles) which is ~1000x cheaper than an upload.
-    """
-    cmd = ["dfx", "canister", "call", "--query"]
-    if identity:
-        cmd.extend(["--identity", identity])
-    if network:
-        cmd.extend(["--network", network])
-    payload = {"namespace": namespace, "path": path}
-    candid = '("' + json.dumps(payload).replace("\\", "\\\\").replace('"', '\\"') + '")'
-    cmd.extend([registry, "get_file_size", candid])
-    try:
-        cp = subprocess.run(cmd, capture_output=True, text=True)
+    def call(method: str, payload: dict, is_query: bool = False):
+        cmd = ["dfx", "canister", "call"]
+        if is_query:
+            cmd.append("--query")
+        if identity:
+            cmd.extend(["--identity", identity])
+        if network:
+            cmd.extend(["--network", network])
+        candid = (
+            '("' + json.dumps(payload).replace("\\", "\\\\").replace('"', '\\"') + '")'
+        )
+        arg_path = None
+        if len(candid.encode("utf-8")) >= 100 * 1024:
+            import tempfile as _tempfile
+
+            fd, arg_path = _tempfile.mkstemp(prefix="dfx-arg-", suffix=".did")
+            with os.fdopen(fd, "w") as fh:
+                fh.write(candid)
+            cmd.extend([registry, method, "--argument-file", arg_path])
+        else:
+            cmd.extend([registry, method, candid])
+        try:
+            cp = subprocess.run(cmd, capture_output=True, text=True)
+        finally:
+            if arg_path:
+                try:
+                    os.unlink(arg_path)
+                except OSError:
+                    pass
         if cp.returncode != 0:
-            return None
+            return {"error": cp.stderr.strip() or f"dfx exited {cp.returncode}"}
         raw = cp.stdout
-        s = raw.index('"')
-        e = raw.rindex('"')
-        inner = raw[s + 1 : e].encode("utf-8").decode("unicode_escape")
-        resp = json.loads(inner)
-        if resp.get("error"):
-            return None
-        return resp.get("sha256") or None
-    except Exception:
-        return None
+        try:
+            s = raw.index('"')
+            e = raw.rindex('"')
+            return json.loads(raw[s + 1 : e].encode("utf-8").decode("unicode_escape"))
+        except Exception as exc:
+            return {"error": f"could not parse reply {raw[:200]!r} ({exc})"}
+
+    return call
 
 
 def _upload_blob_to_registry(
@@ -573,84 +513,27 @@ def _upload_blob_to_registry(
     namespace: str,
     path: str,
     content_type: str,
-    chunk_size: int = 200 * 1024,
 ) -> int:
-    """Upload a single blob to file_registry via the chunked path.
+    """Upload a single blob to file_registry via the chunked path, unconditionally.
 
-    Always uses store_file_chunk + finalize_chunked_file_step, which is
-    ~7x cheaper per KB than store_file (benchmarked: ~13M vs ~98M
-    cycles/KB) because chunks skip per-call SHA-256 in the WASI canister.
-
-    The chunk_size default (200 KiB) stays within the IC's 40B instruction
-    limit for a single message execution on a Python/WASI canister.
+    store_file_chunk + finalize_chunked_file_step is ~7x cheaper per KB than
+    store_file (benchmarked: ~13M vs ~98M cycles/KB) because chunks skip
+    per-call SHA-256 in the WASI canister.
 
     Returns 0 on success, non-zero on failure.
     """
-    file_size = len(blob)
-    total_chunks = max(1, (file_size + chunk_size - 1) // chunk_size)
-
-    for i in range(total_chunks):
-        start = i * chunk_size
-        end = min(start + chunk_size, file_size)
-        rc = _registry_dfx_call(
-            registry,
-            network,
-            identity,
-            "store_file_chunk",
-            {
-                "namespace": namespace,
-                "path": path,
-                "chunk_index": i,
-                "total_chunks": total_chunks,
-                "data_b64": base64.b64encode(blob[start:end]).decode("ascii"),
-                "content_type": content_type,
-            },
-        )
-        if rc != 0:
-            print(f"  chunk {i + 1}/{total_chunks} failed for {path}", file=sys.stderr)
-            return rc
-
-    expected_sha = hashlib.sha256(blob).hexdigest()
-    first = True
-    while True:
-        payload: dict = {"namespace": namespace, "path": path, "batch_size": 1}
-        if first:
-            payload["expected_sha256"] = expected_sha
-            first = False
-        cmd = ["dfx", "canister", "call"]
-        if identity:
-            cmd.extend(["--identity", identity])
-        if network:
-            cmd.extend(["--network", network])
-        candid = (
-            '("' + json.dumps(payload).replace("\\", "\\\\").replace('"', '\\"') + '")'
-        )
-        cmd.extend([registry, "finalize_chunked_file_step", candid])
-        cp = subprocess.run(cmd, capture_output=True, text=True)
-        if cp.returncode != 0:
-            print(cp.stderr, file=sys.stderr)
-            return cp.returncode
-        raw = cp.stdout
-        try:
-            s = raw.index('"')
-            e = raw.rindex('"')
-            inner = raw[s + 1 : e].encode("utf-8").decode("unicode_escape")
-            resp = json.loads(inner)
-        except Exception as exc:
-            print(f"  finalize parse error: {raw!r} ({exc})", file=sys.stderr)
-            return 1
-        if resp.get("error"):
-            print(f"  finalize error: {resp['error']}", file=sys.stderr)
-            return 1
-        if resp.get("done"):
-            break
-
+    summary = publish_files(
+        _registry_caller(registry, network, identity),
+        namespace,
+        [PublishItem(path, blob, content_type)],
+        existing={},
+    )
+    for failed_path, error in summary.failed.items():
+        print(f"  upload failed for {failed_path}: {error}", file=sys.stderr)
+        return 1
     return 0
 
 
-_FRONTEND_UPLOAD_WORKERS = 8
-
-
 def _step_publish_frontend(
     *,
     registry: str,
@@ -658,6 +541,7 @@ def _step_publish_frontend(
     identity: Optional[str],
     dist_dir: Path,
     namespace: str,
+    jobs: int = DEFAULT_PUBLISH_JOBS,
 ) -> int:
     """Upload every file in *dist_dir* to file_registry under *namespace*,
     then upload a ``_manifest.json`` listing all files with metadata, and
@@ -669,12 +553,10 @@ def _step_publish_frontend(
     both to the asset canister, enabling browsers to receive compressed
     responses.
 
-    Uploads are parallelized across ``_FRONTEND_UPLOAD_WORKERS`` threads
-    to reduce wall-clock time (each call has ~2-3s of network latency).
+    The namespace is listed once and files whose SHA-256 already matches are
+    skipped; the rest go through the shared publish engine with *jobs*
+    concurrent calls across files and chunks.
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    import threading
-
     if not dist_dir.is_dir():
         print(f"ERROR: dist dir not found: {dist_dir}", file=sys.stderr)
         return 1
@@ -690,7 +572,7 @@ def _step_publish_frontend(
     )
 
     # Phase 1: prepare all file data and upload tasks
-    upload_tasks = []  # (blob, path, content_type)
+    upload_items: List[PublishItem] = []
     manifest_entries = []
 
     for filepath in all_files:
@@ -711,14 +593,14 @@ def _step_publish_frontend(
             "encodings": ["identity"],
         }
 
-        upload_tasks.append((raw_bytes, rel, content_type))
+        upload_items.append(PublishItem(rel, raw_bytes, content_type))
 
         if content_type in _COMPRESSIBLE_CONTENT_TYPES and file_size > 0:
-            gz_bytes = gzip.compress(raw_bytes, compresslevel=9)
+            gz_bytes = gzip.compress(raw_bytes, compresslevel=9, mtime=0)
             if len(gz_bytes) < file_size:
                 gz_path = rel + ".gz"
                 gz_hash = hashlib.sha256(gz_bytes).hexdigest()
-                upload_tasks.append((gz_bytes, gz_path, content_type))
+                upload_items.append(PublishItem(gz_path, gz_bytes, content_type))
                 entry["encodings"].append("gzip")
                 entry["gzip_path"] = gz_path
                 entry["gzip_size"] = len(gz_bytes)
@@ -726,77 +608,25 @@ def _step_publish_frontend(
 
         manifest_entries.append(entry)
 
-    total_uploads = len(upload_tasks)
+    total_uploads = len(upload_items)
     print(
         f"  {total_uploads} upload tasks ({len(manifest_entries)} files + gzip variants)"
     )
 
     # Phase 2: upload in parallel, skipping unchanged files
-    progress_lock = threading.Lock()
-    completed_count = [0]
-    skipped_count = [0]
-    first_error = [None]
-
-    def _do_upload(task):
-        blob, upath, ct = task
-        local_sha = hashlib.sha256(blob).hexdigest()
-        remote_sha = _check_remote_sha256(
-            registry,
-            network,
-            identity,
-            namespace,
-            upath,
-        )
-        if remote_sha == local_sha:
-            with progress_lock:
-                skipped_count[0] += 1
-                completed_count[0] += 1
-                if completed_count[0] % 50 == 0 or completed_count[0] == total_uploads:
-                    print(
-                        f"  … {completed_count[0]}/{total_uploads} done "
-                        f"({skipped_count[0]} skipped)",
-                        flush=True,
-                    )
-            return (upath, 0)
-
-        rc = _upload_blob_to_registry(
-            blob,
-            registry=registry,
-            network=network,
-            identity=identity,
-            namespace=namespace,
-            path=upath,
-            content_type=ct,
-        )
-        with progress_lock:
-            completed_count[0] += 1
-            if completed_count[0] % 50 == 0 or completed_count[0] == total_uploads:
-                print(
-                    f"  … {completed_count[0]}/{total_uploads} done "
-                    f"({skipped_count[0]} skipped)",
-                    flush=True,
-                )
-        if rc != 0:
-            with progress_lock:
-                if first_error[0] is None:
-                    first_error[0] = upath
-            return (upath, rc)
-        return (upath, 0)
-
-    with ThreadPoolExecutor(max_workers=_FRONTEND_UPLOAD_WORKERS) as pool:
-        futures = {pool.submit(_do_upload, t): t for t in upload_tasks}
-        for fut in as_completed(futures):
-            upath, rc = fut.result()
-            if rc != 0:
-                print(f"  FAILED to upload {upath}", file=sys.stderr)
-                pool.shutdown(wait=False, cancel_futures=True)
-                return rc
-
-    print(
-        f"  uploads complete: {total_uploads - skipped_count[0]} uploaded, "
-        f"{skipped_count[0]} skipped (unchanged)",
-        flush=True,
-    )
+    call = _registry_caller(registry, network, identity)
+    summary = publish_files(
+        call,
+        namespace,
+        upload_items,
+        existing=fetch_namespace_hashes(call, namespace),
+        jobs=jobs,
+    )
+    if summary.failed:
+        for upath, error in sorted(summary.failed.items()):
+            print(f"  FAILED to upload {upath}: {error}", file=sys.stderr)
+        return 1
+    print(f"  uploads complete: {summary.describe()}", flush=True)
 
     # Phase 3: upload manifest (always) and publish
     manifest = {
@@ -972,6 +802,15 @@ def main(argv: Iterable[str]) -> int:
         default=1,
         help="Concurrent frontend-rt builds (default: 1)",
     )
+    parser.add_argument(
+        "--publish-jobs",
+        type=int,
+        default=DEFAULT_PUBLISH_JOBS,
+        help=(
+            "Concurrent file_registry calls per publish, across files and "
+            f"chunks (default: {DEFAULT_PUBLISH_JOBS})"
+        ),
+    )
     parser.add_argument(
         "--skip-install-existing",
         action="store_true",
@@ -1041,6 +880,7 @@ def main(argv: Iterable[str]) -> int:
             base_wasm_version=args.base_wasm_version,
             namespace=args.base_wasm_namespace,
             registry_path=registry_path,
+            jobs=args.publish_jobs,
         )
         if rc != 0:
             print("\nERROR: base WASM publish failed", file=sys.stderr)
@@ -1068,6 +908,7 @@ def main(argv: Iterable[str]) -> int:
             base_wasm_version=ew_version,
             namespace=ew_namespace,
             registry_path=ew_registry_path,
+            jobs=args.publish_jobs,
         )
         if rc != 0:
             print(f"\nERROR: extra WASM publish failed for {spec}", file=sys.stderr)
@@ -1083,6 +924,7 @@ def main(argv: Iterable[str]) -> int:
             extensions_repo=Path(args.extensions_repo).expanduser().resolve(),
             only=only_ext,
             namespace_prefix=args.ext_namespace_prefix,
+            jobs=args.publish_jobs,
         )
         if rc != 0:
             print("\nERROR: extension publish failed", file=sys.stderr)
@@ -1098,6 +940,7 @@ def main(argv: Iterable[str]) -> int:
             codices_root=Path(args.codices_root).expanduser().resolve(),
             only=only_cdx,
             namespace_prefix=args.codex_namespace_prefix,
+            jobs=args.publish_jobs,
         )
         if rc != 0:
             print("\nERROR: codex publish failed", file=sys.stderr)
@@ -1120,6 +963,7 @@ def main(argv: Iterable[str]) -> int:
             identity=args.identity,
             dist_dir=Path(fe_dist).expanduser().resolve(),
             namespace=fe_namespace,
+            jobs=args.publish_jobs,
         )
         if rc != 0:
             print(f"\nERROR: frontend publish failed for {spec}", file=sys.stderr)
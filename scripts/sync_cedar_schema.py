@@ -0,0 +1,98 @@
+"""Precompute the realm's Cedar and ORM schemas, and check they stay in sync.
+
+The canister derives its Cedar schema and the REPL's ORM schema from the ggg
+entity definitions (see ``core/cedar_schema_runtime.py``). The derivation is
+deterministic, so there is no reason to repeat it at every canister start and
+first authorization. This script runs it once and writes the results to
+``core/cedar_schema_frozen.py`` as constants, stamped with a hash of the
+definitions they came from; at runtime a hash mismatch falls back to
+generating, so a stale file is slow rather than wrong.
+
+``--check`` is for CI, in the same spirit as ``sync_cedar_policies.py``: the
+runtime hash cannot see validator constraints or toolkit renderer changes,
+but a byte comparison of the regenerated module can.
+
+    sync_cedar_schema.py --write   # regenerate the frozen module
+    sync_cedar_schema.py --check   # fail if it is out of date
+"""
+
+import argparse
+import os
+import pprint
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_BACKEND = os.path.join(_HERE, "..", "src", "realm_backend")
+_OUT = os.path.join(_BACKEND, "core", "cedar_schema_frozen.py")
+
+_HEADER = '''"""The realm's generated Cedar and ORM schemas, precomputed as constants.
+
+GENERATED FILE — do not edit. Regenerate with
+``scripts/sync_cedar_schema.py --write``; CI checks it is current with
+``--check``.
+
+``core/cedar_schema_runtime.py`` uses these while ``SOURCE_HASH`` matches the
+live ggg entity definitions, and generates at runtime otherwise.
+"""
+
+'''
+
+
+def render() -> str:
+    sys.path.insert(0, _BACKEND)
+    from ic_python_db.schema import build_schema
+
+    from core import cedar_schema_runtime as runtime
+
+    classes = runtime.entity_classes()
+    included, excluded = runtime.partition(classes)
+    orm = build_schema({cls.__name__: cls for cls in included})
+    cedar = runtime.render_cedar_schema(orm)
+
+    return "".join([
+        _HEADER,
+        f"SOURCE_HASH = {runtime.definitions_hash(classes)!r}\n\n",
+        "# Entity classes build_schema accepts, in ggg.__all__ order.\n",
+        f"INCLUDED = {pprint.pformat([cls.__name__ for cls in included], width=88)}\n\n",
+        "# Classes build_schema rejects, with the reason.\n",
+        f"EXCLUDED = {pprint.pformat(excluded, width=88)}\n\n",
+        f"CEDAR_SCHEMA = {cedar!r}\n\n",
+        f"ORM_SCHEMA = {pprint.pformat(orm, width=88, sort_dicts=True)}\n",
+    ])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--write", action="store_true")
+    group.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    rendered = render()
+
+    if args.write:
+        with open(_OUT, "w") as fh:
+            fh.write(rendered)
+        print(f"wrote {os.path.relpath(_OUT)}")
+        return 0
+
+    try:
+        with open(_OUT) as fh:
+            current = fh.read()
+    except OSError:
+        print(f"FAIL: {os.path.relpath(_OUT)} is missing; run --write", file=sys.stderr)
+        return 1
+
+    if current != rendered:
+        print(
+            f"FAIL: {os.path.relpath(_OUT)} is stale; run "
+            "scripts/sync_cedar_schema.py --write",
+            file=sys.stderr,
+        )
+        return 1
+    print("precomputed Cedar schema is current")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
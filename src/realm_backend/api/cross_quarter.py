@@ -13,7 +13,7 @@ cached counts stay fresh without relying on the recurring sync task.
 """
 
 import json
-from typing import Dict
+from typing import Dict, Optional
 
 from _cdk import Async, CallResult, Principal, Service, ic, nat, service_query, service_update, text
 from ic_python_logging import get_logger
@@ -28,6 +28,10 @@ class QuarterDirectoryService(Service):
     def get_quarter_directory(self) -> text:
         ...
 
+    @service_query
+    def get_quarter_directory_since(self, vector: text) -> text:
+        ...
+
 
 class PositionHoldersService(Service):
     """Remote interface of a peer quarter's position-holder snapshot."""
@@ -36,6 +40,10 @@ class PositionHoldersService(Service):
     def list_position_holders(self) -> text:
         ...
 
+    @service_query
+    def list_position_holders_since(self, vector: text) -> text:
+        ...
+
 
 class CapitalPopulationService(Service):
     """Remote interface of the capital's population-report endpoint."""
@@ -66,50 +74,100 @@ class FederationService(Service):
         ...
 
 
-def fetch_peer_directory(peer_canister_id: str) -> Async[Dict]:
+def _unwrap_text(result):
+    """The text of an Ok ``CallResult``, or ``None`` when the call failed.
+
+    Basilisk returns a CallResult variant; str() yields its repr (invalid
+    JSON). Unwrap the Ok text first (mirrors api/file_registry.py).
+    """
+    if isinstance(result, str):
+        return result
+    if isinstance(result, dict):
+        if "Err" in result or "err" in result:
+            return None
+        return result.get("Ok", result.get("ok", str(result)))
+    if hasattr(result, "Ok") and result.Ok is not None:
+        return result.Ok
+    return str(result)
+
+
+def fetch_peer_directory(peer_canister_id: str, since: Optional[dict] = None) -> Async[Dict]:
     """Query a peer quarter's ``get_quarter_directory`` and return parsed data.
 
     Returns ``{"success": bool, "quarters": [...]}`` or ``{"success": False,
     "error": ...}``.
+
+    With ``since`` (the version vector the peer last answered with, or ``{}``
+    for none) the peer's ``get_quarter_directory_since`` is asked instead.
+    The answer then also carries ``epoch``/``clock`` (the vector to send next
+    time) and ``full``; when ``full`` is False, ``quarters`` holds only the
+    entries that changed and ``self`` is absent unless it changed. Peers that
+    predate the delta endpoint reject the call and get the full request.
     """
     logger.info(f"Fetching quarter directory from peer {peer_canister_id}")
     try:
         service = QuarterDirectoryService(Principal.from_str(peer_canister_id))
-        result: CallResult[text] = yield service.get_quarter_directory()
-        # Basilisk returns a CallResult variant; str() yields its repr (invalid
-        # JSON). Unwrap the Ok text first (mirrors api/file_registry.py).
-        if isinstance(result, str):
-            raw = result
-        elif isinstance(result, dict):
-            raw = result.get("Ok", result.get("ok", str(result)))
-        elif hasattr(result, "Ok") and result.Ok is not None:
-            raw = result.Ok
-        else:
-            raw = str(result)
+        raw = None
+        if since is not None:
+            result: CallResult[text] = yield service.get_quarter_directory_since(
+                json.dumps(since)
+            )
+            raw = _unwrap_text(result)
+        if raw is None:
+            result = yield service.get_quarter_directory()
+            raw = _unwrap_text(result)
+            if raw is None:
+                return {"success": False, "error": f"Peer call failed: {result}"}
         try:
             parsed = json.loads(raw)
         except (json.JSONDecodeError, TypeError):
             return {"success": False, "error": f"Unparseable peer response: {raw[:200]}"}
         quarters = parsed.get("quarters", parsed) if isinstance(parsed, dict) else parsed
         self_block = parsed.get("self") if isinstance(parsed, dict) else None
-        return {
+        answer = {
             "success": True,
             "quarters": quarters or [],
             "self": self_block,
+            "full": True,
         }
+        if isinstance(parsed, dict) and "clock" in parsed:
+            answer.update(
+                epoch=parsed.get("epoch"),
+                clock=parsed.get("clock"),
+                full=bool(parsed.get("full", True)),
+            )
+        return answer
     except Exception as e:
         logger.error(f"Error fetching peer directory from {peer_canister_id}: {e}")
         return {"success": False, "error": str(e)}
 
 
-def fetch_position_holders(peer_canister_id: str) -> Async[Dict]:
+def fetch_position_holders(peer_canister_id: str, since: Optional[dict] = None) -> Async[Dict]:
     """Query a peer quarter's ``list_position_holders`` and return parsed data.
 
     Returns the parsed payload dict or ``{"success": False, "error": ...}``.
+
+    With ``since`` (the vector last applied from this peer, or ``{}`` for
+    none) the peer's ``list_position_holders_since`` is asked instead; its
+    answer carries ``epoch``/``clock`` and ``full``, and when ``full`` is
+    False lists only the seats that changed. Peers that predate the delta
+    endpoint reject the call and get the full request.
     """
     logger.info(f"Fetching position holders from peer {peer_canister_id}")
     try:
         service = PositionHoldersService(Principal.from_str(peer_canister_id))
+        if since is not None:
+            result: CallResult[text] = yield service.list_position_holders_since(
+                json.dumps(since)
+            )
+            raw = _unwrap_text(result)
+            if raw is not None:
+                try:
+                    parsed = json.loads(raw)
+                except (json.JSONDecodeError, TypeError):
+                    parsed = None
+                if isinstance(parsed, dict):
+                    return parsed
         result: CallResult[text] = yield service.list_position_holders()
         if isinstance(result, str):
             raw = result
@@ -2,6 +2,11 @@
 
 Wraps the ic-basilisk-toolkit CryptoService to expose envelope CRUD,
 group management, and scope queries to Candid endpoints in main.py.
+
+Envelope writes go through ``core.envelope_index.apply`` rather than the
+toolkit's per-call scans, so the scope and principal indexes stay in step
+with the ``KeyEnvelope`` rows; reads use those indexes once they are
+backfilled.
 """
 
 from typing import Any
@@ -14,6 +19,8 @@ from ic_basilisk_toolkit.crypto import (
 )
 from ic_python_logging import get_logger
 
+from core import envelope_index
+
 logger = get_logger("api.crypto")
 
 # Singleton — no VetKeyService needed for envelope storage operations.
@@ -29,7 +36,7 @@ _crypto = CryptoService(vetkey_service=None)
 def store_envelope(principal: str, scope: str, wrapped_dek: str) -> dict[str, Any]:
     """Store (or update) a wrapped DEK envelope for the caller."""
     logger.info(f"store_envelope: scope={scope!r} principal={principal}")
-    envelope = _crypto.grant_access(scope, principal, wrapped_dek)
+    envelope = _grant_one(scope, principal, wrapped_dek)
     return {
         "success": True,
         "scope": str(envelope.scope),
@@ -40,7 +47,13 @@ def store_envelope(principal: str, scope: str, wrapped_dek: str) -> dict[str, An
 
 def get_envelope(principal: str, scope: str) -> dict[str, Any]:
     """Retrieve the caller's envelope for a scope."""
-    envelope = _crypto.get_envelope(scope, principal)
+    if envelope_index.index_ready():
+        envelope_id = envelope_index.envelope_id(scope, principal)
+        envelope = KeyEnvelope.load(envelope_id) if envelope_id else None
+        if not envelope_index.is_envelope_for(envelope, scope, principal):
+            envelope = None
+    else:
+        envelope = _crypto.get_envelope(scope, principal)
     if not envelope:
         return {"success": False, "error": f"No envelope for scope {scope!r}"}
     return {
@@ -53,13 +66,23 @@ def get_envelope(principal: str, scope: str) -> dict[str, Any]:
 
 def list_scopes(principal: str) -> dict[str, Any]:
     """List all scopes the caller has access to."""
-    scopes = _crypto.list_scopes(principal)
+    if envelope_index.index_ready():
+        scopes = envelope_index.principal_scopes(principal)
+    else:
+        scopes = sorted(_crypto.list_scopes(principal))
     return {"success": True, "scopes": scopes}
 
 
 def list_envelopes(scope: str) -> dict[str, Any]:
     """List all envelopes for a scope (principals with access)."""
-    envelopes = _crypto.list_envelopes(scope)
+    if envelope_index.index_ready():
+        ids = envelope_index.scope_envelope_ids(scope)
+        envelopes = [
+            e for p, e in ((p, KeyEnvelope.load(i)) for p, i in ids.items())
+            if envelope_index.is_envelope_for(e, scope, p)
+        ]
+    else:
+        envelopes = _crypto.list_envelopes(scope)
     return {
         "success": True,
         "envelopes": [
@@ -78,7 +101,7 @@ def share_with_principal(
 ) -> dict[str, Any]:
     """Share access to a scope with another principal."""
     logger.info(f"share: scope={scope!r} -> {target_principal}")
-    envelope = _crypto.grant_access(scope, target_principal, wrapped_dek)
+    envelope = _grant_one(scope, target_principal, wrapped_dek)
     return {
         "success": True,
         "scope": str(envelope.scope),
@@ -89,7 +112,7 @@ def share_with_principal(
 def revoke_principal(scope: str, target_principal: str) -> dict[str, Any]:
     """Revoke a principal's access to a scope."""
     logger.info(f"revoke: scope={scope!r} from {target_principal}")
-    deleted = _crypto.revoke_access(scope, target_principal)
+    _granted, deleted, _stamped = envelope_index.apply(scope, revokes=[target_principal])
     if not deleted:
         return {
             "success": False,
@@ -99,53 +122,56 @@ def revoke_principal(scope: str, target_principal: str) -> dict[str, Any]:
 
 
 def grant_many(scope: str, wrapped_deks: dict[str, str]) -> dict[str, Any]:
-    """Grant access to many principals in a single pass (batch).
+    """Grant (or update) access for many principals in a single pass.
 
-    Uses the toolkit's ``grant_many`` when available (single envelope-index
-    snapshot); otherwise falls back to an equivalent local single-pass upsert so
-    this works against older pinned toolkit versions too.
+    Existing envelopes are found through the scope index, so the cost follows
+    the size of the batch rather than the number of envelopes in the realm.
     """
-    logger.info(f"grant_many: scope={scope!r} ({len(wrapped_deks)} principals)")
-    batch = wrapped_deks or {}
-    if hasattr(_crypto, "grant_many"):
-        count = _crypto.grant_many(scope, batch)
-    else:
-        from ic_basilisk_toolkit.crypto import encode_envelope
-
-        index = {str(e.principal): e for e in _crypto.list_envelopes(scope)}
-        count = 0
-        for principal, dek_hex in batch.items():
-            principal = str(principal)
-            existing = index.get(principal)
-            if existing:
-                if dek_hex:
-                    existing.wrapped_dek = encode_envelope(dek_hex)
-            else:
-                index[principal] = KeyEnvelope(
-                    scope=scope,
-                    principal=principal,
-                    wrapped_dek=encode_envelope(dek_hex or ""),
-                )
-            count += 1
+    logger.info(f"grant_many: scope={scope!r} ({len(wrapped_deks or {})} principals)")
+    count, _revoked, _stamped = envelope_index.apply(scope, wrapped_deks or {})
     return {"success": True, "envelopes_granted": count}
 
 
 def revoke_many(scope: str, principals: list[str]) -> dict[str, Any]:
     """Revoke access for many principals in a single pass (batch)."""
-    logger.info(f"revoke_many: scope={scope!r} ({len(principals)} principals)")
-    targets = principals or []
-    if hasattr(_crypto, "revoke_many"):
-        count = _crypto.revoke_many(scope, targets)
-    else:
-        target_set = {str(p) for p in targets}
-        count = 0
-        for e in list(_crypto.list_envelopes(scope)):
-            if str(e.principal) in target_set:
-                e.delete()
-                count += 1
+    logger.info(f"revoke_many: scope={scope!r} ({len(principals or [])} principals)")
+    _granted, count, _stamped = envelope_index.apply(scope, revokes=principals or [])
     return {"success": True, "envelopes_revoked": count}
 
 
+def rotate_scope(
+    scope: str, rotation_id: str, wrapped_deks: dict[str, str], final: bool = False
+) -> dict[str, Any]:
+    """Apply one chunk of a scope key rotation (see ``envelope_index.rotate``).
+
+    The client re-wraps the new DEK for members in chunks under one
+    *rotation_id*; a chunk may be resent after a lost reply. The last chunk
+    is sent with *final*, which revokes members that were not re-wrapped.
+    """
+    logger.info(
+        f"rotate_scope: scope={scope!r} rotation={rotation_id!r} "
+        f"({len(wrapped_deks or {})} principals, final={final})"
+    )
+    try:
+        progress = envelope_index.rotate(scope, rotation_id, wrapped_deks or {}, final)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    return {"success": True, **progress}
+
+
+def rotation_status(scope: str, cursor: int = 0, limit: int = 0) -> dict[str, Any]:
+    """Open rotation for *scope* and the members it has not re-wrapped yet."""
+    pending = envelope_index.rotation_pending(
+        scope, cursor, limit or envelope_index.PENDING_PAGE
+    )
+    return {"success": True, **pending}
+
+
+def _grant_one(scope: str, principal: str, wrapped_dek: str):
+    envelope_index.apply(scope, {principal: wrapped_dek})
+    return KeyEnvelope.load(envelope_index.envelope_id(scope, principal))
+
+
 # ------------------------------------------------------------------
 # Group operations
 # ------------------------------------------------------------------
@@ -226,12 +252,18 @@ def share_with_group(
 ) -> dict[str, Any]:
     """Share access to a scope with all members of a group."""
     logger.info(f"share_with_group: scope={scope!r} group={group_name!r}")
-    count = _crypto.grant_group_access(scope, group_name, wrapped_deks)
+    wrapped_deks = wrapped_deks or {}
+    batch = {
+        str(m.principal): wrapped_deks.get(str(m.principal), "")
+        for m in CryptoService.list_members(group_name)
+    }
+    count, _revoked, _stamped = envelope_index.apply(scope, batch)
     return {"success": True, "envelopes_created": count}
 
 
 def revoke_group(scope: str, group_name: str) -> dict[str, Any]:
     """Revoke all group members' access to a scope."""
     logger.info(f"revoke_group: scope={scope!r} group={group_name!r}")
-    count = _crypto.revoke_group_access(scope, group_name)
+    members = [str(m.principal) for m in CryptoService.list_members(group_name)]
+    _granted, count, _stamped = envelope_index.apply(scope, revokes=members)
     return {"success": True, "envelopes_deleted": count}
@@ -11,7 +11,9 @@ Refs: https://github.com/smart-social-contracts/realms/issues/168
 """
 
 import base64
+import hashlib
 import json
+from collections import OrderedDict
 from typing import Dict
 
 from _cdk import (
@@ -21,9 +23,12 @@ from _cdk import (
     Principal,
     Record,
     Service,
+    Variant,
+    Vec,
     blob,
     ic,
     nat,
+    nat64,
     service_query,
     service_update,
     text,
@@ -58,6 +63,11 @@ class FileRegistryService(Service):
         self, namespace: text, path: text, offset: text, length: text
     ) -> text: ...
 
+    @service_query
+    def get_file_chunk_blob_icc(
+        self, namespace: text, path: text, offset: nat64, length: nat64
+    ) -> blob: ...
+
     @service_update
     def get_namespace_approval_icc(self, namespace: text) -> text: ...
 
@@ -79,8 +89,55 @@ class _DeleteAssetArg(Record):
     key: text
 
 
+class _CreateBatchArg(Record):
+    pass
+
+
+class _CreateBatchResult(Record):
+    batch_id: nat
+
+
+class _CreateChunkArg(Record):
+    batch_id: nat
+    content: blob
+
+
+class _CreateChunkResult(Record):
+    chunk_id: nat
+
+
+class _CreateAssetOp(Record):
+    key: text
+    content_type: text
+    max_age: Opt[nat64]
+    enable_aliasing: Opt[bool]
+    allow_raw_access: Opt[bool]
+
+
+class _SetAssetContentOp(Record):
+    key: text
+    content_encoding: text
+    chunk_ids: Vec[nat]
+    sha256: Opt[blob]
+
+
+class _BatchOperation(Variant):
+    CreateAsset: _CreateAssetOp
+    SetAssetContent: _SetAssetContentOp
+
+
+class _CommitBatchArg(Record):
+    batch_id: nat
+    operations: Vec[_BatchOperation]
+
+
 class AssetCanisterService(Service):
-    """Minimal client for the DFINITY certified-assets canister `store`."""
+    """Minimal client for the DFINITY certified-assets canister.
+
+    ``store`` is the one-call path for small single files; bundles go through
+    ``create_batch`` / ``create_chunk`` / ``commit_batch`` so many assets land
+    in one commit and content travels as raw blobs.
+    """
 
     @service_update
     def store(self, arg: _AssetStoreArg) -> void: ...
@@ -91,6 +148,15 @@ class AssetCanisterService(Service):
     @service_update
     def delete_asset(self, arg: _DeleteAssetArg) -> void: ...
 
+    @service_update
+    def create_batch(self, arg: _CreateBatchArg) -> _CreateBatchResult: ...
+
+    @service_update
+    def create_chunk(self, arg: _CreateChunkArg) -> _CreateChunkResult: ...
+
+    @service_update
+    def commit_batch(self, arg: _CommitBatchArg) -> void: ...
+
 
 def _entity_method_override_error(codex_id: str, manifest: dict) -> str:
     """Refusal message when a codex manifest declares ``entity_method_overrides``.
@@ -229,7 +295,72 @@ def _unwrap_call_result(result) -> str:
     return str(result)
 
 
-def _pull_file_bytes(
+# Bytes asked for per raw-blob chunk call. Inter-canister replies are capped
+# at 2 MiB; a window this size leaves room for Candid framing. The base64 JSON
+# path keeps the registry's own default, since base64 inflates by a third.
+PULL_WINDOW_BYTES = 1_900_000
+
+# Files pulled this canister lifetime, by sha256, so a dependency shared by
+# several codices (or a re-install of the same version) is fetched once.
+_PULL_CACHE_MAX_BYTES = 16_000_000
+_pulled_by_hash: "OrderedDict[str, bytes]" = OrderedDict()
+_pulled_bytes = 0
+
+# Registries that rejected get_file_chunk_blob_icc; they get base64 chunks.
+# The method is newer than the vendored file_registry.did, so a registry that
+# has not been upgraded rejects it once and is remembered here by canister id.
+_blob_chunks_unsupported = set()
+
+
+def _cache_get(sha: str):
+    data = _pulled_by_hash.get(sha)
+    if data is not None:
+        _pulled_by_hash.move_to_end(sha)
+    return data
+
+
+def _cache_put(sha: str, data: bytes) -> None:
+    global _pulled_bytes
+    if sha in _pulled_by_hash or len(data) > _PULL_CACHE_MAX_BYTES:
+        return
+    _pulled_by_hash[sha] = data
+    _pulled_bytes += len(data)
+    while _pulled_bytes > _PULL_CACHE_MAX_BYTES:
+        _, evicted = _pulled_by_hash.popitem(last=False)
+        _pulled_bytes -= len(evicted)
+
+
+def _registry_key(registry: "FileRegistryService") -> str:
+    return str(getattr(registry, "canister_id", "") or "")
+
+
+def _pull_file_blob(
+    registry: "FileRegistryService", namespace: str, path: str, size: int = None
+) -> Async[bytes]:
+    """Pull a file as raw blob windows. Raises if the registry lacks the method.
+
+    A reply may be shorter than the window asked for (the registry caps its
+    own), so only *size* or an empty window ends the file.
+    """
+    data = bytearray()
+    for _ in range(4096):
+        if size is not None and len(data) >= size:
+            break
+        res: CallResult = yield registry.get_file_chunk_blob_icc(
+            namespace, path, len(data), PULL_WINDOW_BYTES
+        )
+        chunk = res if isinstance(res, (bytes, bytearray)) else _unwrap_call_result(res)
+        if isinstance(chunk, list):
+            chunk = bytes(chunk)
+        if not isinstance(chunk, (bytes, bytearray)):
+            raise Exception(f"unexpected blob chunk reply: {str(chunk)[:200]}")
+        if not chunk:
+            break
+        data.extend(chunk)
+    return bytes(data)
+
+
+def _pull_file_base64(
     registry: "FileRegistryService", namespace: str, path: str
 ) -> Async[bytes]:
     """Pull a stored file from the registry via chunked base64 reads."""
@@ -252,6 +383,47 @@ def _pull_file_bytes(
     return bytes(data)
 
 
+def _pull_file_bytes(
+    registry: "FileRegistryService", namespace: str, path: str, size: int = None
+) -> Async[bytes]:
+    """Pull a stored file, as raw blob windows where the registry supports it.
+
+    A registry that rejects the blob method is remembered and falls back to
+    base64 JSON chunks for the rest of this canister's lifetime.
+    """
+    key = _registry_key(registry)
+    if key not in _blob_chunks_unsupported:
+        try:
+            return (yield from _pull_file_blob(registry, namespace, path, size))
+        except RuntimeError as e:
+            # _unwrap_call_result raises RuntimeError on a rejected call.
+            logger.info(f"Registry {key or '?'} has no blob chunks ({e}); using base64")
+            _blob_chunks_unsupported.add(key)
+    return (yield from _pull_file_base64(registry, namespace, path))
+
+
+def _pull_listed_file(
+    registry: "FileRegistryService", namespace: str, entry: dict
+) -> Async[bytes]:
+    """Pull one listing entry, checked against and cached by its sha256."""
+    path = entry["path"]
+    sha = str(entry.get("sha256") or "").lower()
+    if sha:
+        cached = _cache_get(sha)
+        if cached is not None:
+            return cached
+    size = entry.get("size")
+    data = yield from _pull_file_bytes(
+        registry, namespace, path, int(size) if size is not None else None
+    )
+    if sha:
+        actual = hashlib.sha256(data).hexdigest()
+        if actual != sha:
+            raise Exception(f"sha256 mismatch (listed {sha[:12]}, got {actual[:12]})")
+        _cache_put(sha, data)
+    return data
+
+
 def _pull_namespace_file_text(
     registry: "FileRegistryService", namespace: str, path: str
 ) -> Async[str]:
@@ -338,16 +510,24 @@ def _resolve_registry_namespace(
     return "", "", json.dumps({"error": f"Unknown category: {category}"})
 
 
-def _list_namespace_paths(
+def _list_namespace_entries(
     registry: "FileRegistryService", namespace: str
 ) -> Async[list]:
+    """Registry listing for ``namespace``: dicts with ``path`` (and ``sha256``)."""
     raw: CallResult = yield registry.list_files_icc(namespace)
     listing = json.loads(_unwrap_call_result(raw))
     if isinstance(listing, dict) and listing.get("error"):
         raise Exception(listing["error"])
     if not isinstance(listing, list):
         return []
-    return [entry["path"] for entry in listing if entry.get("path")]
+    return [entry for entry in listing if entry.get("path")]
+
+
+def _list_namespace_paths(
+    registry: "FileRegistryService", namespace: str
+) -> Async[list]:
+    entries = yield from _list_namespace_entries(registry, namespace)
+    return [entry["path"] for entry in entries]
 
 
 def _pull_namespace_files(
@@ -356,18 +536,14 @@ def _pull_namespace_files(
     path_filter,
 ) -> Async[Dict[str, str]]:
     files = {}
-    paths = yield from _list_namespace_paths(registry, namespace)
-    for path in paths:
+    entries = yield from _list_namespace_entries(registry, namespace)
+    for entry in entries:
+        path = entry["path"]
         if not path_filter(path):
             continue
         try:
-            size_res: CallResult = yield registry.get_file_size_icc(namespace, path)
-            size_obj = json.loads(_unwrap_call_result(size_res))
-            if size_obj.get("error"):
-                continue
-            files[path] = yield from _pull_namespace_file_text(
-                registry, namespace, path
-            )
+            data = yield from _pull_listed_file(registry, namespace, entry)
+            files[path] = data.decode("utf-8", errors="replace")
         except Exception as e:
             logger.warning(f"Skip {namespace}/{path}: {e}")
     return files
@@ -550,8 +726,14 @@ def _pull_extension_frontend_files(
     registry: "FileRegistryService",
     ext_id: str,
     version: str,
+    existing: dict = None,
 ) -> Async[tuple]:
-    """Returns (files dict, resolved_version, error_json)."""
+    """Returns (files dict, resolved_version, error_json).
+
+    Files are raw bytes keyed by registry path. ``existing`` is the frontend's
+    ``{asset_key: sha256_hex}``; a file the registry lists with the hash the
+    frontend already serves is not pulled and maps to ``None`` instead.
+    """
     namespace, resolved_version, err = yield from _resolve_registry_namespace(
         registry, "ext", ext_id, version
     )
@@ -564,11 +746,21 @@ def _pull_extension_frontend_files(
     if refusal:
         return {}, resolved_version, json.dumps({"error": refusal})
 
-    files = yield from _pull_namespace_files(
-        registry,
-        namespace,
-        lambda path: path.startswith("frontend/"),
-    )
+    existing = existing or {}
+    files = {}
+    for entry in (yield from _list_namespace_entries(registry, namespace)):
+        path = entry["path"]
+        if not path.startswith("frontend/"):
+            continue
+        sha = str(entry.get("sha256") or "").lower()
+        key = _frontend_asset_key(ext_id, resolved_version, path)
+        if sha and existing.get(key) == sha:
+            files[path] = None
+            continue
+        try:
+            files[path] = yield from _pull_listed_file(registry, namespace, entry)
+        except Exception as e:
+            logger.warning(f"Skip {namespace}/{path}: {e}")
     return files, resolved_version, None
 
 
@@ -1192,14 +1384,51 @@ def _extract_asset_key(entry) -> str:
     return ""
 
 
-def _list_frontend_asset_keys(frontend_principal: Principal) -> Async[list]:
-    """Return all asset keys from the frontend canister."""
+def _field(obj, name):
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _extract_identity_sha256(entry) -> str:
+    """Hex sha256 of an asset listing entry's ``identity`` encoding, or ''."""
+    for enc in _field(entry, "encodings") or []:
+        if _field(enc, "content_encoding") != "identity":
+            continue
+        sha = _field(enc, "sha256")
+        if isinstance(sha, list) and sha and not isinstance(sha[0], int):
+            sha = sha[0]  # opt surfaced as a one-element list
+        if isinstance(sha, list):
+            sha = bytes(sha)  # blob surfaced as a list of ints
+        if isinstance(sha, (bytes, bytearray)) and sha:
+            return bytes(sha).hex()
+        if isinstance(sha, str):
+            return sha.lower()
+    return ""
+
+
+def _list_frontend_assets(frontend_principal: Principal) -> Async[dict]:
+    """``{asset_key: sha256_hex}`` for every asset on the frontend canister.
+
+    One ``list`` call. The hash is '' when the canister did not report one.
+    """
     asset = AssetCanisterService(frontend_principal)
     list_res: CallResult = yield asset.list({"start": None, "length": None})
     entries = _unwrap_call_result(list_res)
     if not isinstance(entries, list):
-        return []
-    return [k for k in (_extract_asset_key(e) for e in entries) if k]
+        return {}
+    assets = {}
+    for entry in entries:
+        key = _extract_asset_key(entry)
+        if key:
+            assets[key] = _extract_identity_sha256(entry)
+    return assets
+
+
+def _list_frontend_asset_keys(frontend_principal: Principal) -> Async[list]:
+    """Return all asset keys from the frontend canister."""
+    assets = yield from _list_frontend_assets(frontend_principal)
+    return list(assets)
 
 
 def _delete_frontend_asset_key(frontend_principal: Principal, key: str) -> Async[None]:
@@ -1258,16 +1487,111 @@ def cleanup_extension_frontend_on_uninstall(
         yield from _pin_frontend_prefix(frontend_principal, prefix)
 
 
+def _frontend_asset_key(ext_id: str, version: str, path: str) -> str:
+    return f"/ext/{ext_id}/{version}/{path}"
+
+
+# Per create_chunk call. Well under the 2 MiB ingress limit once Candid
+# framing is added.
+_ASSET_CHUNK_SIZE = 1_900_000
+# Content per commit_batch. The asset canister certifies every asset in a
+# commit within one message, so very large bundles are split across commits.
+_ASSET_BATCH_BYTES = 16_000_000
+
+
+def _group_uploads(uploads: list) -> list:
+    groups, current, size = [], [], 0
+    for item in uploads:
+        if current and size + len(item[1]) > _ASSET_BATCH_BYTES:
+            groups.append(current)
+            current, size = [], 0
+        current.append(item)
+        size += len(item[1])
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _upload_frontend_assets(
+    frontend_principal: Principal,
+    uploads: list,
+    existing: dict,
+) -> Async[list]:
+    """Upload ``[(asset_key, content_bytes, sha256_hex)]`` through the batch API.
+
+    Returns the asset keys that failed; a failed commit fails its whole group.
+    """
+    asset = AssetCanisterService(frontend_principal)
+    failed = []
+    for group in _group_uploads(uploads):
+        try:
+            batch_res: CallResult = yield asset.create_batch({})
+            batch_id = _field(_unwrap_call_result(batch_res), "batch_id")
+            operations = []
+            for key, content, sha in group:
+                chunk_ids = []
+                for offset in range(0, len(content) or 1, _ASSET_CHUNK_SIZE):
+                    chunk_res: CallResult = yield asset.create_chunk(
+                        {
+                            "batch_id": batch_id,
+                            "content": content[offset : offset + _ASSET_CHUNK_SIZE],
+                        }
+                    )
+                    chunk_ids.append(
+                        _field(_unwrap_call_result(chunk_res), "chunk_id")
+                    )
+                if key not in existing:
+                    operations.append(
+                        {
+                            "CreateAsset": {
+                                "key": key,
+                                "content_type": _guess_content_type(key),
+                                "max_age": None,
+                                "enable_aliasing": None,
+                                "allow_raw_access": None,
+                            }
+                        }
+                    )
+                operations.append(
+                    {
+                        "SetAssetContent": {
+                            "key": key,
+                            "content_encoding": "identity",
+                            "chunk_ids": chunk_ids,
+                            "sha256": bytes.fromhex(sha),
+                        }
+                    }
+                )
+            commit_res: CallResult = yield asset.commit_batch(
+                {"batch_id": batch_id, "operations": operations}
+            )
+            _unwrap_call_result(commit_res)
+            for key, _, sha in group:
+                existing[key] = sha
+        except Exception as e:
+            logger.error(
+                f"Frontend batch upload failed for {len(group)} assets "
+                f"(first {group[0][0]}): {e}"
+            )
+            failed.extend(f"{key}: {e}" for key, _, _ in group)
+    return failed
+
+
 def _copy_frontend_to_asset_canister(
     registry_canister_id: str,
     ext_id: str,
     version: str,
     frontend_canister_id: str,
     files: dict = None,
+    existing: dict = None,
 ) -> Async[Opt[str]]:
     """Fetch frontend files from the file registry and upload them to the
     realm's frontend asset canister under /ext/{ext_id}/{version}/...
 
+    ``existing`` is the frontend's ``{asset_key: sha256_hex}`` listing (fetched
+    here when not given). Files whose hash already matches are neither pulled
+    nor uploaded; the rest go up in as few ``commit_batch`` calls as fit.
+
     Returns None on success, or an error message string on failure.
     """
     logger.info(
@@ -1275,11 +1599,19 @@ def _copy_frontend_to_asset_canister(
         f"from registry {registry_canister_id} to frontend {frontend_canister_id}"
     )
 
+    frontend_principal = Principal.from_str(frontend_canister_id)
+    if existing is None:
+        try:
+            existing = yield from _list_frontend_assets(frontend_principal)
+        except Exception as e:
+            logger.warning(f"Frontend asset listing failed ({e}); uploading all")
+            existing = {}
+
     pulled_from_registry = files is None
     if files is None:
         registry = FileRegistryService(Principal.from_str(registry_canister_id))
         files, resolved_version, err = yield from _pull_extension_frontend_files(
-            registry, ext_id, version or ""
+            registry, ext_id, version or "", existing
         )
         if err:
             err_obj = json.loads(err)
@@ -1298,43 +1630,27 @@ def _copy_frontend_to_asset_canister(
         return None
 
     resolved_version = version
-    copied = 0
-    errors = []
-    frontend_principal = Principal.from_str(frontend_canister_id)
-
+    uploads = []
     for path, content in files.items():
-        asset_key = f"/ext/{ext_id}/{resolved_version}/{path}"
-        content_type = _guess_content_type(path)
-
-        escaped = content.replace("\\", "\\\\").replace('"', '\\"')
-        candid_arg = (
-            f'(record {{ key = "{asset_key}"; '
-            f'content_type = "{content_type}"; '
-            f'content_encoding = "identity"; '
-            f'content = blob "{escaped}"; '
-            f"sha256 = null }})"
-        )
-
-        try:
-            store_result: CallResult = yield ic.call_raw(
-                frontend_principal,
-                "store",
-                ic.candid_encode(candid_arg),
-                0,
-            )
-            if isinstance(store_result, dict) and "Err" in store_result:
-                msg = f"{asset_key}: {store_result['Err']}"
-                errors.append(msg)
-                logger.error(f"Frontend store failed for {msg}")
-            else:
-                copied += 1
-        except Exception as e:
-            msg = f"{asset_key}: {e}"
-            errors.append(msg)
-            logger.error(f"Frontend store exception for {msg}")
+        if content is None:
+            continue
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        asset_key = _frontend_asset_key(ext_id, resolved_version, path)
+        sha = hashlib.sha256(content).hexdigest()
+        if existing.get(asset_key) == sha:
+            continue
+        uploads.append((asset_key, content, sha))
 
+    errors = []
+    if uploads:
+        errors = yield from _upload_frontend_assets(
+            frontend_principal, uploads, existing
+        )
+    copied = len(uploads) - len(errors)
     logger.info(
-        f"Copied {copied}/{len(files)} frontend files for {ext_id}@{resolved_version}"
+        f"Copied {copied}/{len(files)} frontend files for {ext_id}@{resolved_version} "
+        f"({len(files) - len(uploads)} unchanged)"
     )
     if errors:
         preview = "; ".join(errors[:3])
@@ -1342,7 +1658,7 @@ def _copy_frontend_to_asset_canister(
             preview += f"; ... and {len(errors) - 3} more"
         return (
             f"Failed to copy frontend files for '{ext_id}@{resolved_version}' "
-            f"({copied}/{len(files)} succeeded): {preview}"
+            f"({copied}/{len(uploads)} succeeded): {preview}"
         )
     if copied > 0:
         yield from _pin_frontend_prefix(frontend_principal, "/ext/")
@@ -1378,7 +1694,15 @@ def resync_extension_frontends(
             }
         )
 
-    yield from _pin_frontend_prefix(Principal.from_str(fe_canister), "/ext/")
+    fe_principal = Principal.from_str(fe_canister)
+    yield from _pin_frontend_prefix(fe_principal, "/ext/")
+
+    # One listing for the whole resync; every extension diffs against it.
+    try:
+        existing = yield from _list_frontend_assets(fe_principal)
+    except Exception as e:
+        logger.warning(f"Frontend asset listing failed ({e}); uploading all")
+        existing = {}
 
     default_registry = (registry_canister_id or "").strip()
     if not default_registry:
@@ -1418,6 +1742,7 @@ def resync_extension_frontends(
             ext_id,
             version,
             fe_canister,
+            existing=existing,
         )
         if copy_err:
             errors.append(
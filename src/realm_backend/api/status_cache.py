@@ -0,0 +1,221 @@
+"""
+Response cache for the status and extension-list reads.
+
+``get_status`` runs fourteen ``count()`` calls, loads the Realm several times
+and enumerates every extension manifest. It backs the ``status`` query,
+``http_request`` ``/status`` and the CLI's status polling, so a dashboard or
+load balancer polling a quiet realm pays for all of that on every hit. This
+keeps the last answer, its serialized JSON and an ETag, and serves them while
+the realm is unchanged.
+
+A cached entry is valid while its *stamp* matches. The stamp is cheap to take:
+
+- the entity counts ``get_status`` reports (one ``_system`` load each), so a
+  join or a new proposal changes it without any hook;
+- the Realm's update timestamp, so any realm config write changes it;
+- a heap generation that :func:`invalidate` bumps, for changes neither of the
+  above can see (extension and codex installs, quarter population pushes,
+  and — through the ``User`` save hook below — a user moving home quarter).
+
+Queries cannot keep what they compute — their heap writes are rolled back —
+so a query that misses builds a fresh answer and serves it uncached, exactly
+as before. The cache is filled from update context instead: a timer rebuilds
+stale entries every ``REFRESH_SECONDS``. Heap memory is cleared on upgrade and
+the first tick after it warms the cache again.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from _cdk import ic
+from ic_python_logging import get_logger
+
+logger = get_logger("api.status_cache")
+
+REFRESH_SECONDS = 30
+
+_generation = 0
+
+# key -> (stamp, data, body, etag)
+_entries: Dict[str, Tuple[tuple, Any, bytes, str]] = {}
+
+
+def invalidate() -> None:
+    """Mark every cached response stale (call after a change counts miss)."""
+    global _generation
+    _generation += 1
+
+
+def _stamp() -> tuple:
+    from ggg import (
+        Codex,
+        Dispute,
+        Instrument,
+        License,
+        Mandate,
+        Organization,
+        Proposal,
+        Quarter,
+        Realm,
+        Registry,
+        Task,
+        Trade,
+        Transfer,
+        User,
+        UserProfile,
+        Vote,
+    )
+
+    counts = tuple(
+        cls.count()
+        for cls in (
+            User, Organization, Realm, Mandate, Task, Transfer, Instrument,
+            Codex, Dispute, License, Trade, Proposal, Vote, UserProfile,
+            Quarter, Registry,
+        )
+    )
+    realm_updated = 0
+    try:
+        realm = Realm.load("1")
+        if realm:
+            realm_updated = getattr(realm, "_timestamp_updated", 0) or 0
+    except Exception:
+        pass
+    return (_generation, counts, realm_updated)
+
+
+def _serialize(data: Any) -> Tuple[bytes, str]:
+    body = bytes(json.dumps(data) + "\n", "ascii")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return body, etag
+
+
+def _entry(key: str, build: Callable[[], Any]) -> Tuple[Any, bytes, str]:
+    stamp = _stamp()
+    cached = _entries.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2], cached[3]
+    data = build()
+    body, etag = _serialize(data)
+    _entries[key] = (stamp, data, body, etag)
+    return data, body, etag
+
+
+def _build_status() -> dict:
+    from api.status import get_status
+
+    return get_status()
+
+
+def _build_extensions() -> dict:
+    from api.extensions import get_all_extension_manifests
+
+    manifests = get_all_extension_manifests()
+    return {"extensions": [manifests[name] for name in sorted(manifests)]}
+
+
+BUILDERS: Dict[str, Callable[[], Any]] = {
+    "status": _build_status,
+    "extensions": _build_extensions,
+}
+
+
+def status() -> dict:
+    """``get_status()``, from cache while the realm is unchanged."""
+    return _entry("status", BUILDERS["status"])[0]
+
+
+def response(key: str) -> Tuple[bytes, str]:
+    """``(json_body, etag)`` for a cached response: ``status`` or ``extensions``."""
+    _data, body, etag = _entry(key, BUILDERS[key])
+    return body, etag
+
+
+def _not_modified(etag: str, headers) -> bool:
+    for name, value in headers or []:
+        if name.lower() == "if-none-match":
+            tags = [tag.strip() for tag in value.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+    return False
+
+
+def http_response(key: str, request_headers) -> dict:
+    """An ``http_request`` reply for a cached response.
+
+    Carries the ETag, and is a bodiless 304 when the client's
+    ``If-None-Match`` already names it. ``Cache-Control: no-cache`` makes
+    clients revalidate every time rather than trust a stale copy.
+    """
+    body, etag = response(key)
+    headers = [
+        ("Access-Control-Allow-Origin", "*"),
+        ("ETag", etag),
+        ("Cache-Control", "no-cache"),
+    ]
+    if _not_modified(etag, request_headers):
+        return {
+            "status_code": 304,
+            "headers": headers,
+            "body": b"",
+            "streaming_strategy": None,
+            "upgrade": False,
+        }
+    return {
+        "status_code": 200,
+        "headers": [("Content-Type", "application/json")] + headers,
+        "body": body,
+        "streaming_strategy": None,
+        "upgrade": False,
+    }
+
+
+def refresh() -> int:
+    """Rebuild stale entries. Returns how many were rebuilt."""
+    rebuilt = 0
+    for key, build in BUILDERS.items():
+        before = _entries.get(key)
+        try:
+            _entry(key, build)
+        except Exception as e:
+            logger.warning(f"status cache refresh of '{key}' failed: {e}")
+        if _entries.get(key) is not before:
+            rebuilt += 1
+    return rebuilt
+
+
+def schedule_refresh(seconds: int = REFRESH_SECONDS) -> Optional[Any]:
+    """Keep the cache warm from a recurring timer.
+
+    Timers must be set in init/post_upgrade/update context, which is why
+    ``initialize()`` calls this.
+    """
+    return ic.set_timer_interval(seconds, refresh)
+
+
+# ── Save hooks ──────────────────────────────────────────────────────────────
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("User",)
+
+
+def entity_changed(entity) -> None:
+    """Save hook: a user write may change ``home_quarter``.
+
+    ``get_status`` counts quarter populations from ``home_quarter`` only in
+    realms small enough to scan users; above that a user save cannot change
+    the answer, so the cache is kept.
+    """
+    if not _entries:
+        return
+    from api.status import _POP_SCAN_LIMIT
+    from ggg import User
+
+    if User.count() <= _POP_SCAN_LIMIT:
+        invalidate()
+
+
+def entity_removed(entity) -> None:
+    # A delete changes ``User.count()``, which the stamp already follows.
+    pass
@@ -6,6 +6,7 @@ resolution) is computed by the browser using h3-js. See issue #254.
 
 from typing import Any, Dict
 
+from core.land_bridge import zone_aggregate
 from ggg import Zone
 from ic_python_logging import get_logger
 
@@ -19,8 +20,13 @@ def get_zone_aggregation(resolution: int = 6) -> Dict[str, Any]:
     geometry from h3-js. Territory zones are those not linked to a Land parcel
     (``zone.land is None``); parcel zones are owned by the Land Registry.
 
+    At a resolution coarser than the zones themselves (see
+    ``land_bridge.AGGREGATE_RESOLUTIONS``) zones are bucketed into their
+    ancestor cell server-side, one entry per occupied cell with
+    ``zone_count`` and ``zone_types``, instead of shipping every zone.
+
     Args:
-        resolution: kept for API compatibility only; no longer used.
+        resolution: H3 resolution to aggregate at.
 
     Returns:
         Dictionary with zone data:
@@ -29,6 +35,10 @@ def get_zone_aggregation(resolution: int = 6) -> Dict[str, Any]:
         - resolution: passed through
     """
     try:
+        aggregated = zone_aggregate(resolution)
+        if aggregated is not None:
+            return aggregated
+
         zones = []
         unique_users = set()
 
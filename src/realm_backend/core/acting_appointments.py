@@ -1,21 +1,45 @@
 """Inherit capital seat-holders as acting officers on a new quarter (issue #301).
 
-Copy is creation-time only. A later local substantive appointment ends the
-acting term (see ``ggg.appoint``). Re-applying is idempotent and never
-overwrites a substantive holder.
+The full copy happens at creation; after that a quarter asks the capital only
+for seats that changed since the version it last applied (see
+``core.position_holders``), and seats whose spec is what was last applied are
+not touched. A later local substantive appointment ends the acting term (see
+``ggg.appoint``). Re-applying is idempotent and never overwrites a
+substantive holder.
 """
 
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import json
+from typing import List, Optional
 
 from ic_python_logging import get_logger
 
 logger = get_logger("core.acting_appointments")
 
 
-def dump_position_holders(canister_id: str = "") -> dict:
-    """Serialize local seats + active holders for a peer quarter to consume."""
+# ``_system`` key of what a quarter last applied from one capital:
+# ``{"epoch", "clock", "applied": {position_key: spec digest}}``.
+INHERIT_STATE_PREFIX = "acting_inherit:"
+
+
+def dump_position_holders(canister_id: str = "", since: Optional[dict] = None) -> dict:
+    """Serialize local seats + active holders for a peer quarter to consume.
+
+    Once ``core.position_holders`` is built the answer comes from there and
+    carries its ``epoch``/``clock``; with *since* (a vector from an earlier
+    answer) only the seats changed after it are listed and ``full`` is False.
+    """
+    from core import position_holders
+
+    if position_holders.ready():
+        answer = (
+            position_holders.since(since) if since is not None
+            else position_holders.journal().full()
+        )
+        return {"success": True, "canister_id": canister_id, **answer}
+
     from ggg import AppointmentKind, Position, appointment_kind
 
     positions = []
@@ -45,10 +69,35 @@ def dump_position_holders(canister_id: str = "") -> dict:
     return {
         "success": True,
         "canister_id": canister_id,
+        "full": True,
         "positions": positions,
     }
 
 
+def _state_key(capital_id: str) -> str:
+    return f"{INHERIT_STATE_PREFIX}{capital_id}"
+
+
+def _load_state(capital_id: str) -> dict:
+    from ic_python_db import Database
+
+    raw = Database.get_instance().load("_system", _state_key(capital_id))
+    return raw if isinstance(raw, dict) else {}
+
+
+def inherit_vector(capital_id: str) -> Optional[dict]:
+    """The ``{epoch, clock}`` last applied from *capital_id*, if any."""
+    state = _load_state(capital_id)
+    if "clock" not in state:
+        return None
+    return {"epoch": state.get("epoch"), "clock": state.get("clock")}
+
+
+def _digest(spec: dict) -> str:
+    raw = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
 def _has_substantive(position) -> bool:
     from ggg import AppointmentKind, appointment_kind
 
@@ -61,6 +110,9 @@ def _has_substantive(position) -> bool:
 def apply_inherited_holders(payload: dict, capital_id: str) -> dict:
     """Create acting appointments from a capital ``list_position_holders`` payload.
 
+    The payload may be full or a delta (``list_position_holders_since``).
+    - Skips, without reading or writing anything, seats whose spec is the one
+      last applied from this capital (``unchanged``).
     - Skips seats with ``inherit_from_capital`` false on *either* side.
     - Skips seats that already have a local substantive holder.
     - Registers missing users with the seat profile (idempotent).
@@ -70,17 +122,27 @@ def apply_inherited_holders(payload: dict, capital_id: str) -> dict:
     from ggg.system.user import user_register as register_user
 
     capital_id = (capital_id or payload.get("canister_id") or "").strip()
+    state = _load_state(capital_id)
+    applied = dict(state.get("applied") or {})
     created = 0
     skipped = 0
+    unchanged = 0
     errors: List[str] = []
 
     for spec in payload.get("positions") or []:
         key = (spec.get("key") or "").strip()
         if not key:
             continue
+        digest = _digest(spec)
+        if applied.get(key) == digest:
+            unchanged += 1
+            continue
         if spec.get("inherit_from_capital") is False:
+            applied[key] = digest
             skipped += 1
             continue
+        # Skips below depend on local state, so the seat is not marked
+        # applied: the next full payload looks at it again.
         pos = Position[key]
         if pos is None:
             skipped += 1
@@ -96,6 +158,7 @@ def apply_inherited_holders(payload: dict, capital_id: str) -> dict:
         profile_name = getattr(profile, "name", "") or "member"
         dept = getattr(pos, "department", None)
 
+        failed = len(errors)
         for holder in spec.get("holders") or []:
             principal = (holder.get("principal") or "").strip()
             if not principal:
@@ -122,10 +185,22 @@ def apply_inherited_holders(payload: dict, capital_id: str) -> dict:
             except Exception as e:
                 logger.error(f"inherit {key} / {principal}: {e}")
                 errors.append(f"{key}: {principal}: {e}")
+        if len(errors) == failed:
+            applied[key] = digest
+
+    fresh = dict(state, applied=applied)
+    # A delta with errors keeps the old vector, so the failed seats come again.
+    if "clock" in payload and not errors:
+        fresh.update(epoch=payload.get("epoch"), clock=payload.get("clock"))
+    if fresh != state:
+        from ic_python_db import Database
+
+        Database.get_instance().save("_system", _state_key(capital_id), fresh)
 
     return {
         "success": not errors,
         "created": created,
         "skipped": skipped,
+        "unchanged": unchanged,
         "errors": errors,
     }
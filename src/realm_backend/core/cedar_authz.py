@@ -27,12 +27,28 @@ no authorizer at all, so :func:`enabled` is False and the existing Python checks
 remain the only gate — exactly as before this module existed. What must never
 happen is a deployment that believes it has Cedar and silently does not, which is
 why :func:`require_enforcement` exists for a realm that wants that guarantee.
+
+**Decisions are cached, and the cache cannot say yes on its own.** Handing
+any store to Cedar costs millions of instructions in parsing alone, and the
+bridge asks the same question on every ``entity.*`` call. So a decision is
+remembered under everything it was made on — principal, a fingerprint of the
+principal's slice, action, resource, a digest of the resource's attributes,
+the call origin and the policy generation — and anything that changes one of
+those produces a different key rather than a stale answer. :func:`load` bumps
+the generation; user and profile saves drop the cached slices
+(:func:`entity_changed`). Any error while building a key denies, exactly as
+an uncached failure would.
 """
 
-from typing import Any, List, Optional
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 
+from core import cedar_entities
 from core.call_origin import current as current_origin
 from core.cedar_policies import GUARDRAILS, POLICIES
+from core.perf import profiled
 
 try:  # pragma: no cover - exercised by which artifact the canister is built on
     from ic_basilisk_toolkit import cedar as _cedar
@@ -50,6 +66,13 @@ except ImportError:  # pragma: no cover
 
 _engine: Optional["CedarEngine"] = None
 
+DECISION_CACHE_SIZE = 4096
+
+# Bumped by every load(): decisions made under older policies never match.
+_policy_generation = 0
+_decisions: "OrderedDict[tuple, bool]" = OrderedDict()
+_decision_stats = {"hits": 0, "misses": 0}
+
 
 def schema() -> str:
     """The effective Cedar schema text, generated from ggg entity definitions."""
@@ -115,9 +138,54 @@ def status() -> dict:
         }
     out = _engine.status()
     out.pop("has_extra_policies", None)
+    out["cache"] = cache_stats()
     return out
 
 
+def cache_stats() -> Dict[str, Any]:
+    """Decision and principal-slice cache sizes and hit rates."""
+    def rate(stats: Dict[str, int]) -> float:
+        total = stats["hits"] + stats["misses"]
+        return round(stats["hits"] / total, 4) if total else 0.0
+
+    slices = cedar_entities.slice_cache_stats()
+    return {
+        "policy_generation": _policy_generation,
+        "decisions": {
+            "size": len(_decisions), **_decision_stats,
+            "hit_rate": rate(_decision_stats),
+        },
+        "slices": {**slices, "hit_rate": rate(slices)},
+    }
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("User", "UserProfile")
+
+
+def entity_changed(entity: Any) -> None:
+    """Forget cached principal slices a save or delete may have changed.
+
+    A user's own save covers its memberships too: adding or removing a
+    profile or department saves the user. A profile save forgets every slice,
+    since profiles are parents by name and a rename reaches all holders.
+    Never raises.
+    """
+    try:
+        name = type(entity).__name__
+        if name == "User":
+            principal_id = getattr(entity, "id", None)
+            cedar_entities.forget(str(principal_id) if principal_id else None)
+        elif name == "UserProfile":
+            cedar_entities.forget()
+    except Exception:
+        pass
+
+
+# A delete invalidates exactly what a save would.
+entity_removed = entity_changed
+
+
 def load(extra_policies: str = "") -> bool:
     """Parse the schema and policies and hold them for later decisions.
 
@@ -126,8 +194,11 @@ def load(extra_policies: str = "") -> bool:
     finds nothing (smart-social-contracts/realms#281). Call it from the deferred
     timer that already performs extension discovery.
     """
+    global _policy_generation
     if CedarEngine is None or Slicer is None:
         return False
+    _policy_generation += 1
+    _decisions.clear()
     return _get_engine().load(extra_policies)
 
 
@@ -159,6 +230,7 @@ def action_for(verb: str, is_read: bool) -> str:
     return "read" if is_read else "write"
 
 
+@profiled("cedar.is_authorized")
 def is_authorized(
     principal_id: str,
     action: str,
@@ -174,13 +246,62 @@ def is_authorized(
     caller here has no way of knowing. Passing it explicitly would mean every
     call site could get it wrong; taking it from the ambient origin means only
     the bridge can.
+
+    Unless the caller supplies ``entities``, the store is the one the engine
+    would build itself — the principal slice from
+    :func:`cedar_entities.principal_slice` plus the resource — so caching
+    changes no decision. A caller-supplied ``entities`` store bypasses the decision cache, since
+    nothing about it can be keyed cheaply.
     """
     if _engine is None:
         return False
-    return _engine.is_authorized(
+    if entities is not None:
+        return _engine.is_authorized(
+            principal_id, action, resource_type, resource_id, resource_row,
+            entities=entities,
+        )
+
+    try:
+        fingerprint, store = cedar_entities.principal_slice(principal_id)
+        resource = cedar_entities.resource_entity(
+            resource_type, resource_id, resource_row
+        )
+        key = (
+            principal_id,
+            fingerprint,
+            action,
+            resource_type,
+            resource_id,
+            _digest(resource) if resource_row is not None else "",
+            _digest(current_origin()),
+            _policy_generation,
+        )
+    except Exception:
+        return False
+
+    cached = _decisions.get(key)
+    if cached is not None:
+        _decisions.move_to_end(key)
+        _decision_stats["hits"] += 1
+        return cached
+
+    _decision_stats["misses"] += 1
+    store.extend(resource)
+    decision = bool(_engine.is_authorized(
         principal_id, action, resource_type, resource_id, resource_row,
-        entities=entities,
-    )
+        entities=store,
+    ))
+    _decisions[key] = decision
+    while len(_decisions) > DECISION_CACHE_SIZE:
+        _decisions.popitem(last=False)
+    return decision
+
+
+def _digest(value: Any) -> str:
+    if not value:
+        return ""
+    text = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
 
 
 def check(
@@ -220,9 +341,12 @@ def require_enforcement() -> None:
 
 
 def reset_for_tests() -> None:
-    global _engine
+    global _engine, _policy_generation
     _engine = None
-    from core import cedar_entities, cedar_schema_runtime
+    _policy_generation = 0
+    _decisions.clear()
+    _decision_stats.update(hits=0, misses=0)
+    from core import cedar_schema_runtime
 
     cedar_schema_runtime.reset_for_tests()
     cedar_entities.reset_for_tests()
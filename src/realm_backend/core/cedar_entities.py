@@ -25,7 +25,10 @@ not be affordable is projecting everything, which is why the slice is narrow
 rather than convenient.
 """
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 try:  # pragma: no cover - client-side / partial installs
     from ic_basilisk_toolkit.cedar_slicing import Slicer
@@ -40,6 +43,13 @@ _NEVER_PROJECT = frozenset({"password", "secret", "private_key", "ciphertext"})
 
 _slicer: Optional["Slicer"] = None
 
+# Principal slices, most recently used last: principal -> (fingerprint, json).
+# Every decision for a caller needs the same one until a save says otherwise
+# (``forget``).
+SLICE_CACHE_SIZE = 1024
+_slices: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+_slice_stats = {"hits": 0, "misses": 0}
+
 
 def _get_slicer() -> "Slicer":
     global _slicer
@@ -56,6 +66,8 @@ def _get_slicer() -> "Slicer":
 def reset_for_tests() -> None:
     global _slicer
     _slicer = None
+    forget()
+    _slice_stats.update(hits=0, misses=0)
 
 
 def uid(entity_type: str, entity_id: str) -> str:
@@ -130,6 +142,46 @@ def principal_entity(principal_id: str) -> List[Dict[str, Any]]:
     return _get_slicer().principal_entity(principal_id, parents, row=user)
 
 
+def principal_slice(principal_id: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """The principal as the Cedar engine slices it, cached, with a fingerprint.
+
+    This is the store ``CedarEngine.is_authorized`` builds when it is handed
+    none — the principal alone, without the profile parents
+    :func:`principal_entity` adds — so a decision made on it is the decision
+    the engine would have made. The fingerprint changes whenever the slice
+    would; decisions keyed on it cannot outlive the facts they were made on,
+    even if a stale entry lingers elsewhere. Each call returns a fresh copy,
+    so a caller extending the list cannot corrupt the cache.
+    """
+    cached = _slices.get(principal_id)
+    if cached is not None:
+        _slices.move_to_end(principal_id)
+        _slice_stats["hits"] += 1
+        fingerprint, text = cached
+        return fingerprint, json.loads(text)
+
+    _slice_stats["misses"] += 1
+    entities = _get_slicer().principal_entity(principal_id)
+    text = json.dumps(entities, sort_keys=True)
+    fingerprint = hashlib.sha256(text.encode()).hexdigest()[:16]
+    _slices[principal_id] = (fingerprint, text)
+    while len(_slices) > SLICE_CACHE_SIZE:
+        _slices.popitem(last=False)
+    return fingerprint, entities
+
+
+def forget(principal_id: Optional[str] = None) -> None:
+    """Drop the cached slice for *principal_id*, or every slice."""
+    if principal_id is None:
+        _slices.clear()
+    else:
+        _slices.pop(principal_id, None)
+
+
+def slice_cache_stats() -> Dict[str, int]:
+    return {"size": len(_slices), **_slice_stats}
+
+
 def _profiles_of(user: Any) -> List[Any]:
     """The user's profiles, tolerant of how the relation is exposed."""
     for attribute in ("profiles", "user_profiles", "profile"):
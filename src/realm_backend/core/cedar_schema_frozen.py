@@ -0,0 +1,2594 @@
+"""The realm's generated Cedar and ORM schemas, precomputed as constants.
+
+GENERATED FILE — do not edit. Regenerate with
+``scripts/sync_cedar_schema.py --write``; CI checks it is current with
+``--check``.
+
+``core/cedar_schema_runtime.py`` uses these while ``SOURCE_HASH`` matches the
+live ggg entity definitions, and generates at runtime otherwise.
+"""
+
+SOURCE_HASH = 'db95fd9e69fd65cf28c2bba25ca4e43d134633f64f58e3451d1aa559ee91c38e'
+
+# Entity classes build_schema accepts, in ggg.__all__ order.
+INCLUDED = ['AllocationRule',
+ 'Appointment',
+ 'Balance',
+ 'Calendar',
+ 'Budget',
+ 'Call',
+ 'Codex',
+ 'Contract',
+ 'Department',
+ 'DepartmentAuthority',
+ 'Delegation',
+ 'Dispute',
+ 'EntityMigration',
+ 'Extension',
+ 'FederalVote',
+ 'FederalVoteLeg',
+ 'FederationMessage',
+ 'FinancialReport',
+ 'FiscalPeriod',
+ 'Fund',
+ 'Human',
+ 'Identity',
+ 'Instrument',
+ 'Invoice',
+ 'Land',
+ 'LedgerEntry',
+ 'MarketPlace',
+ 'License',
+ 'Mandate',
+ 'MenuCategoryConfig',
+ 'MenuDepartmentVisibility',
+ 'MenuItemConfig',
+ 'JusticeSystem',
+ 'Court',
+ 'Judge',
+ 'Case',
+ 'Verdict',
+ 'Penalty',
+ 'Appeal',
+ 'Member',
+ 'Notification',
+ 'Organization',
+ 'PaymentAccount',
+ 'Permission',
+ 'Position',
+ 'Proposal',
+ 'Quarter',
+ 'QuarterResident',
+ 'Realm',
+ 'RegistrationCode',
+ 'Registry',
+ 'Service',
+ 'Task',
+ 'TaskExecution',
+ 'TaskSchedule',
+ 'TaskStep',
+ 'Token',
+ 'NFTToken',
+ 'Trade',
+ 'Transfer',
+ 'Treasury',
+ 'TreasuryConfig',
+ 'User',
+ 'UserProfile',
+ 'Vote',
+ 'Zone']
+
+# Classes build_schema rejects, with the reason.
+EXCLUDED = {}
+
+CEDAR_SCHEMA = 'namespace Realm {\n    entity AllocationRule {\n        description?: String,\n        id?: String,\n        proposal_id?: String,\n        rules?: String,\n        source_fund_code?: String,\n        status?: String,\n    };\n\n    entity Appeal {\n        decided_date?: String,\n        decision?: String,\n        decision_reasoning?: String,\n        filed_date?: String,\n        grounds?: String,\n        id?: String,\n        metadata?: String,\n        status?: String,\n        appellant?: User,\n        appellate_court?: Court,\n        new_verdict?: Verdict,\n        original_case?: Case,\n        original_verdict?: Verdict,\n    };\n\n    entity Appointment {\n        ended_at?: Long,\n        kind?: String,\n        source_canister_id?: String,\n        source_position_key?: String,\n        started_at?: Long,\n        status?: String,\n        position?: Position,\n        user?: User,\n    };\n\n    entity Balance {\n        amount?: Long,\n        id?: String,\n        instrument?: String,\n        tag?: String,\n        user?: User,\n    };\n\n    entity Budget {\n        actual_amount?: Long,\n        budget_type?: String,\n        category?: String,\n        description?: String,\n        id?: String,\n        name?: String,\n        planned_amount?: Long,\n        status?: String,\n        fiscal_period?: FiscalPeriod,\n        fund?: Fund,\n        proposal?: Proposal,\n    };\n\n    entity Calendar {\n        benefit_cycle?: Long,\n        codex_release_cycle?: Long,\n        custom_cycles?: String,\n        epoch?: Long,\n        fiscal_period?: Long,\n        license_review_cycle?: Long,\n        name?: String,\n        service_payment_cycle?: Long,\n        voting_window?: Long,\n        realm?: Realm,\n    };\n\n    entity Call {\n        is_async?: Bool,\n        codex?: Codex,\n        task_step?: TaskStep,\n    };\n\n    entity Case {\n        case_number?: String,\n        closed_date?: String,\n        description?: String,\n        filed_date?: String,\n        metadata?: String,\n        status?: String,\n        title?: String,\n        court?: Court,\n        defendant?: User,\n        plaintiff?: User,\n        verdict?: Verdict,\n    };\n\n    entity Codex {\n        checksum?: String,\n        name?: String,\n        url?: String,\n        federation?: Realm,\n    };\n\n    entity Contract {\n        metadata?: String,\n        name?: String,\n        status?: String,\n        mandate?: Mandate,\n    };\n\n    entity Court {\n        description?: String,\n        jurisdiction?: String,\n        level?: String,\n        metadata?: String,\n        name?: String,\n        status?: String,\n        codex?: Codex,\n        justice_system?: JusticeSystem,\n        license?: License,\n        parent_court?: Court,\n    };\n\n    entity Delegation {\n        accepted_at?: Long,\n        delegate?: String,\n        expires_at?: Long,\n        granted_by?: String,\n        grantor?: String,\n        id?: String,\n        label?: String,\n        requires_acceptance?: Long,\n        revoked_at?: Long,\n        revoked_by?: String,\n        scope_json?: String,\n        status?: String,\n    };\n\n    entity Department {\n        description?: String,\n        is_root?: Bool,\n        name?: String,\n        policy_quorum_percent?: Long,\n        policy_threshold_m?: Long,\n        policy_threshold_n?: Long,\n        policy_veto_principals?: String,\n        target_policy_quorum_percent?: Long,\n        target_policy_threshold_m?: Long,\n        target_policy_threshold_n?: Long,\n        fund?: Fund,\n        head?: User,\n        parent?: Department,\n    };\n\n    entity DepartmentAuthority {\n        description?: String,\n        id?: String,\n        permissions?: String,\n        target_org_name?: String,\n        target_quarter_canister_id?: String,\n        grantor?: Department,\n        target?: Department,\n    };\n\n    entity Dispute {\n        actions_taken?: String,\n        case_title?: String,\n        description?: String,\n        dispute_id?: String,\n        metadata?: String,\n        status?: String,\n        verdict?: String,\n        defendant?: User,\n        requester?: User,\n    };\n\n    entity EntityMigration {\n        entity_type?: String,\n        moved_at?: String,\n        next_ref?: String,\n        prev_ref?: String,\n        signature?: String,\n        subject?: String,\n    };\n\n    entity Extension {\n        description?: String,\n        name?: String,\n    };\n\n    entity FederalVote {\n        "action"?: String,\n        deadline?: Long,\n        known_quarters?: Long,\n        origin_quarter?: String,\n        rule_json?: String,\n        status?: String,\n        tally_json?: String,\n        vote_hash?: String,\n        vote_id?: String,\n    };\n\n    entity FederalVoteLeg {\n        eligible?: Long,\n        error?: String,\n        leg_key?: String,\n        outcome?: String,\n        proposal_id?: String,\n        quarter_canister_id?: String,\n        reported?: Bool,\n        status?: String,\n        vote_hash?: String,\n        vote_id?: String,\n        votes_abstain?: Long,\n        votes_no?: Long,\n        votes_yes?: Long,\n    };\n\n    entity FederationMessage {\n        body?: String,\n        msg_id?: String,\n        response?: String,\n        source?: String,\n        topic?: String,\n    };\n\n    entity FinancialReport {\n        as_of?: String,\n        currency?: String,\n        entry_count?: Long,\n        id?: String,\n        issued_at?: String,\n        issued_by?: String,\n        kind?: String,\n        source_hash?: String,\n        statements?: String,\n        period?: FiscalPeriod,\n        supersedes?: FinancialReport,\n    };\n\n    entity FiscalPeriod {\n        end_date?: String,\n        id?: String,\n        name?: String,\n        start_date?: String,\n        status?: String,\n    };\n\n    entity Fund {\n        code?: String,\n        description?: String,\n        fund_type?: String,\n        name?: String,\n        department?: Department,\n        realm?: Realm,\n    };\n\n    entity Human {\n        date_of_birth?: String,\n        h3_index?: String,\n        name?: String,\n        user?: User,\n    };\n\n    entity Identity {\n        metadata?: String,\n        type?: String,\n        human?: Human,\n    };\n\n    entity Instrument {\n        metadata?: String,\n        name?: String,\n        principal_id?: String,\n    };\n\n    entity Invoice {\n        currency?: String,\n        due_date?: String,\n        id?: String,\n        metadata?: String,\n        paid_at?: String,\n        payment_amount_raw?: Long,\n        payment_currency?: String,\n        payment_nonce?: Long,\n        status?: String,\n        user?: User,\n    };\n\n    entity Judge {\n        appointment_date?: String,\n        id?: String,\n        metadata?: String,\n        specialization?: String,\n        status?: String,\n        court?: Court,\n        member?: Member,\n    };\n\n    entity JusticeSystem {\n        description?: String,\n        metadata?: String,\n        name?: String,\n        status?: String,\n        system_type?: String,\n        license?: License,\n        realm?: Realm,\n    };\n\n    entity Land {\n        id?: String,\n        land_type?: String,\n        metadata?: String,\n        nft_token_id?: String,\n        registered_by?: String,\n        size_height?: Long,\n        size_width?: Long,\n        status?: String,\n        x_coordinate?: Long,\n        y_coordinate?: Long,\n        owner_organization?: Organization,\n        owner_user?: User,\n    };\n\n    entity LedgerEntry {\n        category?: String,\n        credit?: Long,\n        currency?: String,\n        debit?: Long,\n        description?: String,\n        entry_date?: String,\n        entry_type?: String,\n        id?: String,\n        reference?: String,\n        tags?: String,\n        transaction_id?: String,\n        appeal?: Appeal,\n        case?: Case,\n        contract?: Contract,\n        fiscal_period?: FiscalPeriod,\n        fund?: Fund,\n        invoice?: Invoice,\n        organization?: Organization,\n        penalty?: Penalty,\n        transfer?: Transfer,\n        user?: User,\n    };\n\n    entity License {\n        description?: String,\n        expires_at?: Long,\n        issued_at?: Long,\n        issuing_authority?: String,\n        license_type?: String,\n        metadata?: String,\n        name?: String,\n        status?: String,\n        court?: Court,\n        justice_system?: JusticeSystem,\n        organization?: Organization,\n    };\n\n    entity Mandate {\n        metadata?: String,\n        name?: String,\n    };\n\n    entity MarketPlace {\n        metadata?: String,\n        name?: String,\n        principal_id?: String,\n    };\n\n    entity Member {\n        id?: String,\n        judge?: Judge,\n        user?: User,\n    };\n\n    entity MenuCategoryConfig {\n        category_id?: String,\n        label?: String,\n        position?: Long,\n    };\n\n    entity MenuDepartmentVisibility {\n        extension_name?: String,\n        visible?: Bool,\n        department?: Department,\n    };\n\n    entity MenuItemConfig {\n        category_id?: String,\n        extension_name?: String,\n        position?: Long,\n    };\n\n    entity NFTToken {\n        canister_id?: String,\n        description?: String,\n        enabled?: String,\n        id?: String,\n        name?: String,\n        nft_type?: String,\n        supply_cap?: Long,\n        symbol?: String,\n        total_supply?: Long,\n    };\n\n    entity Notification {\n        audience_type?: String,\n        color?: String,\n        href?: String,\n        icon?: String,\n        message?: String,\n        metadata?: String,\n        origin_realm?: String,\n        read?: Bool,\n        read_by?: String,\n        recipient?: String,\n        sender?: String,\n        title?: String,\n        topic?: String,\n        visibility?: String,\n        department?: Department,\n        user?: User,\n    };\n\n    entity Organization {\n        name?: String,\n        license?: License,\n    };\n\n    entity PaymentAccount {\n        address?: String,\n        currency?: String,\n        id?: String,\n        is_active?: Bool,\n        is_verified?: Bool,\n        label?: String,\n        metadata?: String,\n        network?: String,\n        user?: User,\n    };\n\n    entity Penalty {\n        currency?: String,\n        description?: String,\n        due_date?: String,\n        executed_date?: String,\n        id?: String,\n        metadata?: String,\n        penalty_type?: String,\n        status?: String,\n        target_user?: User,\n        verdict?: Verdict,\n    };\n\n    entity Permission {\n        category?: String,\n        description?: String,\n        name?: String,\n        scope?: String,\n    };\n\n    entity Position {\n        description?: String,\n        headcount?: Long,\n        inherit_from_capital?: Bool,\n        key?: String,\n        salary_amount?: Long,\n        salary_period?: String,\n        status?: String,\n        title?: String,\n        department?: Department,\n        profile?: UserProfile,\n    };\n\n    entity Proposal {\n        code_checksum?: String,\n        code_url?: String,\n        description?: String,\n        metadata?: String,\n        org_scope?: String,\n        proposal_id?: String,\n        status?: String,\n        title?: String,\n        voting_deadline?: String,\n        proposer?: User,\n    };\n\n    entity Quarter {\n        canister_id?: String,\n        index?: Long,\n        last_sync_ballot_id?: String,\n        last_sync_ballot_status?: String,\n        name?: String,\n        population?: Long,\n        reported_codex_id?: String,\n        reported_codex_version?: String,\n        status?: String,\n        federation?: Realm,\n    };\n\n    entity QuarterResident {\n        "principal"?: String,\n        quarter_canister_id?: String,\n    };\n\n    entity Realm {\n        accounting_currency?: String,\n        accounting_currency_decimals?: Long,\n        ai_assistant_enabled?: Bool,\n        auto_scale_enabled?: Bool,\n        background_image_url?: String,\n        bootstrap_state?: String,\n        can_test_mode?: Bool,\n        federation_realm_id?: String,\n        file_registry_canister_id?: String,\n        frontend_canister_id?: String,\n        installed_version?: String,\n        installer_canister_id?: String,\n        is_capital?: Bool,\n        is_quarter?: Bool,\n        logo_url?: String,\n        manifest_data?: String,\n        manifesto?: String,\n        marketplace_canister_id?: String,\n        name?: String,\n        network?: String,\n        nft_canister_id?: String,\n        open_registration?: Bool,\n        principal_id?: String,\n        quarter_join_mode?: String,\n        require_marketplace_approval?: Bool,\n        scale_in_flight?: Bool,\n        scale_requested_at?: String,\n        status?: String,\n        sync_state?: String,\n        test_mode?: Bool,\n        test_mode_demo_data?: Bool,\n        test_mode_ii_bypass?: Bool,\n        test_mode_skip_authentication?: Bool,\n        test_mode_skip_passport_zkproof?: Bool,\n        test_mode_skip_terms?: Bool,\n        test_mode_user_self_registration?: Bool,\n        token_canister_id?: String,\n        trusted_approvers?: String,\n        trusted_principals?: String,\n        welcome_message?: String,\n        calendar?: Calendar,\n        federation_codex?: Codex,\n        treasury?: Treasury,\n    };\n\n    entity RegistrationCode {\n        code?: String,\n        code_hash?: String,\n        created_by?: String,\n        department?: String,\n        email?: String,\n        expires_at?: Long,\n        frontend_url?: String,\n        max_uses?: Long,\n        metadata?: String,\n        position?: String,\n        principals_redeemed?: String,\n        profile?: String,\n        revoked?: Long,\n        used?: Long,\n        used_at?: Long,\n        user_id?: String,\n        uses_count?: Long,\n    };\n\n    entity Registry {\n        description?: String,\n        name?: String,\n        principal_id?: String,\n    };\n\n    entity Service {\n        description?: String,\n        due_date?: String,\n        link?: String,\n        metadata?: String,\n        name?: String,\n        provider?: String,\n        service_id?: String,\n        status?: String,\n        user?: User,\n    };\n\n    entity Task {\n        metadata?: String,\n        name?: String,\n        status?: String,\n        step_to_execute?: Long,\n    };\n\n    entity TaskExecution {\n        completed_at?: Long,\n        name?: String,\n        result?: String,\n        started_at?: Long,\n        status?: String,\n        task?: Task,\n    };\n\n    entity TaskSchedule {\n        disabled?: Bool,\n        last_run_at?: Long,\n        name?: String,\n        repeat_every?: Long,\n        run_at?: Long,\n        task?: Task,\n    };\n\n    entity TaskStep {\n        run_next_after?: Long,\n        status?: String,\n        timer_id?: Long,\n        call?: Call,\n        task?: Task,\n    };\n\n    entity Token {\n        decimals?: Long,\n        fee?: Long,\n        indexer?: String,\n        ledger?: String,\n        name?: String,\n    };\n\n    entity Trade {\n        metadata?: String,\n        contract?: Contract,\n        transfer_1?: Transfer,\n        transfer_2?: Transfer,\n    };\n\n    entity Transfer {\n        amount?: Long,\n        id?: String,\n        instrument?: String,\n        principal_from?: String,\n        principal_to?: String,\n        status?: String,\n        subaccount?: String,\n        tags?: String,\n        timestamp?: String,\n        invoice?: Invoice,\n    };\n\n    entity Treasury {\n        balance?: Long,\n        name?: String,\n        realm?: Realm,\n    };\n\n    entity TreasuryConfig {\n        anchor_month?: Long,\n        auto_allocate?: String,\n        epoch_length?: String,\n        epoch_minutes?: Long,\n        id?: String,\n        source_fund_code?: String,\n    };\n\n    entity User in [Department, UserProfile] {\n        avatar?: String,\n        home_quarter?: String,\n        id?: String,\n        nickname?: String,\n        human?: Human,\n        member?: Member,\n    };\n\n    entity UserProfile {\n        allowed_to?: String,\n        description?: String,\n        name?: String,\n    };\n\n    entity Verdict {\n        decision?: String,\n        id?: String,\n        issued_date?: String,\n        metadata?: String,\n        reasoning?: String,\n        appeal?: Appeal,\n        case?: Case,\n        issued_by?: Judge,\n    };\n\n    entity Vote {\n        metadata?: String,\n        vote_choice?: String,\n        proposal?: Proposal,\n        voter?: User,\n    };\n\n    entity Zone {\n        description?: String,\n        h3_index?: String,\n        metadata?: String,\n        name?: String,\n        zone_type?: String,\n        land?: Land,\n        user?: User,\n    };\n\n    action read\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n\n    action write\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n\n    action "appeal.decide" in [write]\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n\n    action "entity.create" in [write]\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n\n    action "entity.delete" in [write]\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n\n    action "entity.get" in [read]\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n\n    action "entity.list" in [read]\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n\n    action "entity.update" in [write]\n        appliesTo { principal: [User], resource: [AllocationRule, Appeal, Appointment, Balance, Budget, Calendar, Call, Case, Codex, Contract, Court, Delegation, Department, DepartmentAuthority, Dispute, EntityMigration, Extension, FederalVote, FederalVoteLeg, FederationMessage, FinancialReport, FiscalPeriod, Fund, Human, Identity, Instrument, Invoice, Judge, JusticeSystem, Land, LedgerEntry, License, Mandate, MarketPlace, Member, MenuCategoryConfig, MenuDepartmentVisibility, MenuItemConfig, NFTToken, Notification, Organization, PaymentAccount, Penalty, Permission, Position, Proposal, Quarter, QuarterResident, Realm, RegistrationCode, Registry, Service, Task, TaskExecution, TaskSchedule, TaskStep, Token, Trade, Transfer, Treasury, TreasuryConfig, User, UserProfile, Verdict, Vote, Zone], context: { extension?: String, repl?: Bool } };\n}\n'
+
+ORM_SCHEMA = {'AllocationRule': {'fields': {'description': {'constraints': {'max_length': 512},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'},
+                               'id': {'constraints': {'max_length': 64},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                               'proposal_id': {'constraints': {'max_length': 64},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'},
+                               'rules': {'constraints': {'max_length': 1024},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                               'source_fund_code': {'constraints': {'max_length': 16},
+                                                    'default': 'ROOT',
+                                                    'kind': 'property',
+                                                    'type': 'String'},
+                               'status': {'constraints': {'max_length': 16},
+                                          'default': 'draft',
+                                          'kind': 'property',
+                                          'type': 'String'}},
+                    'relationships': {},
+                    'version': 1},
+ 'Appeal': {'fields': {'decided_date': {'constraints': {'max_length': 64},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                       'decision': {'constraints': {'max_length': 256},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                       'decision_reasoning': {'constraints': {'max_length': 4096},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'},
+                       'filed_date': {'constraints': {'max_length': 64},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                       'grounds': {'constraints': {'max_length': 4096},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                       'id': {'constraints': {'max_length': 64},
+                              'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'},
+                       'metadata': {'constraints': {'max_length': 2048},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                       'status': {'constraints': {'max_length': 16},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'}},
+            'relationships': {'appellant': {'inverse': 'appeals_filed',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'User',
+                                            'type': 'ManyToOne'},
+                              'appellate_court': {'inverse': 'appeals_received',
+                                                  'kind': 'relationship',
+                                                  'many': False,
+                                                  'target': 'Court',
+                                                  'type': 'ManyToOne'},
+                              'ledger_entries': {'inverse': 'appeal',
+                                                 'kind': 'relationship',
+                                                 'many': True,
+                                                 'target': 'LedgerEntry',
+                                                 'type': 'OneToMany'},
+                              'new_verdict': {'inverse': 'appeal_result',
+                                              'kind': 'relationship',
+                                              'many': False,
+                                              'target': 'Verdict',
+                                              'type': 'OneToOne'},
+                              'original_case': {'inverse': 'appeals',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'Case',
+                                                'type': 'ManyToOne'},
+                              'original_verdict': {'inverse': 'appeal',
+                                                   'kind': 'relationship',
+                                                   'many': False,
+                                                   'target': 'Verdict',
+                                                   'type': 'OneToOne'}},
+            'version': 1},
+ 'Appointment': {'fields': {'ended_at': {'default': 0,
+                                         'kind': 'property',
+                                         'type': 'Integer'},
+                            'kind': {'constraints': {'max_length': 16},
+                                     'default': 'substantive',
+                                     'kind': 'property',
+                                     'type': 'String'},
+                            'source_canister_id': {'constraints': {'max_length': 64},
+                                                   'default': '',
+                                                   'kind': 'property',
+                                                   'type': 'String'},
+                            'source_position_key': {'constraints': {'max_length': 512},
+                                                    'default': '',
+                                                    'kind': 'property',
+                                                    'type': 'String'},
+                            'started_at': {'default': 0,
+                                           'kind': 'property',
+                                           'type': 'Integer'},
+                            'status': {'constraints': {'max_length': 16},
+                                       'default': 'active',
+                                       'kind': 'property',
+                                       'type': 'String'}},
+                 'has_migrate': True,
+                 'relationships': {'position': {'inverse': 'appointments',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'Position',
+                                                'type': 'ManyToOne'},
+                                   'user': {'inverse': 'appointments',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'User',
+                                            'type': 'ManyToOne'}},
+                 'version': 2},
+ 'Balance': {'fields': {'amount': {'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'Integer'},
+                        'id': {'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'},
+                        'instrument': {'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                        'tag': {'has_default': False,
+                                'kind': 'property',
+                                'type': 'String'}},
+             'relationships': {'transfers': {'inverse': 'balance',
+                                             'kind': 'relationship',
+                                             'many': True,
+                                             'target': 'Transfer',
+                                             'type': 'OneToMany'},
+                               'user': {'inverse': 'balances',
+                                        'kind': 'relationship',
+                                        'many': False,
+                                        'target': 'User',
+                                        'type': 'ManyToOne'}},
+             'version': 1},
+ 'Budget': {'fields': {'actual_amount': {'default': 0,
+                                         'kind': 'property',
+                                         'type': 'Integer'},
+                       'budget_type': {'constraints': {'max_length': 16},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                       'category': {'constraints': {'max_length': 64},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                       'description': {'constraints': {'max_length': 512},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                       'id': {'constraints': {'max_length': 64},
+                              'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'},
+                       'name': {'constraints': {'max_length': 256},
+                                'has_default': False,
+                                'kind': 'property',
+                                'type': 'String'},
+                       'planned_amount': {'default': 0,
+                                          'kind': 'property',
+                                          'type': 'Integer'},
+                       'status': {'constraints': {'max_length': 16},
+                                  'default': 'draft',
+                                  'kind': 'property',
+                                  'type': 'String'}},
+            'relationships': {'fiscal_period': {'inverse': 'budgets',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'FiscalPeriod',
+                                                'type': 'ManyToOne'},
+                              'fund': {'inverse': 'budgets',
+                                       'kind': 'relationship',
+                                       'many': False,
+                                       'target': 'Fund',
+                                       'type': 'ManyToOne'},
+                              'proposal': {'inverse': 'budgets',
+                                           'kind': 'relationship',
+                                           'many': False,
+                                           'target': 'Proposal',
+                                           'type': 'ManyToOne'}},
+            'version': 1},
+ 'Calendar': {'fields': {'benefit_cycle': {'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'Integer'},
+                         'codex_release_cycle': {'has_default': False,
+                                                 'kind': 'property',
+                                                 'type': 'Integer'},
+                         'custom_cycles': {'constraints': {'max_length': 2048},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                         'epoch': {'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'Integer'},
+                         'fiscal_period': {'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'Integer'},
+                         'license_review_cycle': {'has_default': False,
+                                                  'kind': 'property',
+                                                  'type': 'Integer'},
+                         'name': {'constraints': {'max_length': 256},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                         'service_payment_cycle': {'has_default': False,
+                                                   'kind': 'property',
+                                                   'type': 'Integer'},
+                         'voting_window': {'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'Integer'}},
+              'relationships': {'realm': {'inverse': 'calendar',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'Realm',
+                                          'type': 'OneToOne'}},
+              'version': 1},
+ 'Call': {'fields': {'is_async': {'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'Boolean'}},
+          'relationships': {'codex': {'inverse': 'calls',
+                                      'kind': 'relationship',
+                                      'many': False,
+                                      'target': 'Codex',
+                                      'type': 'ManyToOne'},
+                            'task_step': {'inverse': 'call',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'TaskStep',
+                                          'type': 'OneToOne'}},
+          'version': 1},
+ 'Case': {'fields': {'case_number': {'constraints': {'max_length': 64},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                     'closed_date': {'constraints': {'max_length': 64},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                     'description': {'constraints': {'max_length': 4096},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                     'filed_date': {'constraints': {'max_length': 64},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                     'metadata': {'constraints': {'max_length': 2048},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                     'status': {'constraints': {'max_length': 16},
+                                'has_default': False,
+                                'kind': 'property',
+                                'type': 'String'},
+                     'title': {'constraints': {'max_length': 256},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'}},
+          'relationships': {'appeals': {'inverse': 'original_case',
+                                        'kind': 'relationship',
+                                        'many': True,
+                                        'target': 'Appeal',
+                                        'type': 'OneToMany'},
+                            'court': {'inverse': 'cases',
+                                      'kind': 'relationship',
+                                      'many': False,
+                                      'target': 'Court',
+                                      'type': 'ManyToOne'},
+                            'defendant': {'inverse': 'cases_as_defendant',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'User',
+                                          'type': 'ManyToOne'},
+                            'judges': {'inverse': 'cases_assigned',
+                                       'kind': 'relationship',
+                                       'many': True,
+                                       'target': ['Judge'],
+                                       'type': 'ManyToMany'},
+                            'ledger_entries': {'inverse': 'case',
+                                               'kind': 'relationship',
+                                               'many': True,
+                                               'target': 'LedgerEntry',
+                                               'type': 'OneToMany'},
+                            'plaintiff': {'inverse': 'cases_as_plaintiff',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'User',
+                                          'type': 'ManyToOne'},
+                            'verdict': {'inverse': 'case',
+                                        'kind': 'relationship',
+                                        'many': False,
+                                        'target': 'Verdict',
+                                        'type': 'OneToOne'}},
+          'version': 1},
+ 'Codex': {'fields': {'checksum': {'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                      'name': {'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'},
+                      'url': {'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'}},
+           'relationships': {'calls': {'inverse': 'codex',
+                                       'kind': 'relationship',
+                                       'many': True,
+                                       'target': 'Call',
+                                       'type': 'OneToMany'},
+                             'courts': {'inverse': 'codex',
+                                        'kind': 'relationship',
+                                        'many': True,
+                                        'target': 'Court',
+                                        'type': 'OneToMany'},
+                             'federation': {'inverse': 'federation_codex',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'Realm',
+                                            'type': 'OneToOne'}},
+           'version': 1},
+ 'Contract': {'fields': {'metadata': {'constraints': {'max_length': 256},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                         'name': {'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                         'status': {'constraints': {'max_length': 16},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'}},
+              'relationships': {'ledger_entries': {'inverse': 'contract',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'LedgerEntry',
+                                                   'type': 'OneToMany'},
+                                'mandate': {'inverse': 'contracts',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'Mandate',
+                                            'type': 'ManyToOne'}},
+              'version': 1},
+ 'Court': {'fields': {'description': {'constraints': {'max_length': 1024},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                      'jurisdiction': {'constraints': {'max_length': 256},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                      'level': {'constraints': {'max_length': 32},
+                                'has_default': False,
+                                'kind': 'property',
+                                'type': 'String'},
+                      'metadata': {'constraints': {'max_length': 1024},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                      'name': {'constraints': {'max_length': 256, 'min_length': 2},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'},
+                      'status': {'constraints': {'max_length': 16},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'}},
+           'relationships': {'appeals_received': {'inverse': 'appellate_court',
+                                                  'kind': 'relationship',
+                                                  'many': True,
+                                                  'target': 'Appeal',
+                                                  'type': 'OneToMany'},
+                             'cases': {'inverse': 'court',
+                                       'kind': 'relationship',
+                                       'many': True,
+                                       'target': 'Case',
+                                       'type': 'OneToMany'},
+                             'child_courts': {'inverse': 'parent_court',
+                                              'kind': 'relationship',
+                                              'many': True,
+                                              'target': 'Court',
+                                              'type': 'OneToMany'},
+                             'codex': {'inverse': 'courts',
+                                       'kind': 'relationship',
+                                       'many': False,
+                                       'target': 'Codex',
+                                       'type': 'ManyToOne'},
+                             'judges': {'inverse': 'court',
+                                        'kind': 'relationship',
+                                        'many': True,
+                                        'target': 'Judge',
+                                        'type': 'OneToMany'},
+                             'justice_system': {'inverse': 'courts',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'JusticeSystem',
+                                                'type': 'ManyToOne'},
+                             'license': {'inverse': 'court',
+                                         'kind': 'relationship',
+                                         'many': False,
+                                         'target': 'License',
+                                         'type': 'OneToOne'},
+                             'parent_court': {'inverse': 'child_courts',
+                                              'kind': 'relationship',
+                                              'many': False,
+                                              'target': 'Court',
+                                              'type': 'ManyToOne'}},
+           'version': 1},
+ 'Delegation': {'fields': {'accepted_at': {'default': 0,
+                                           'kind': 'property',
+                                           'type': 'Integer'},
+                           'delegate': {'constraints': {'max_length': 64},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                           'expires_at': {'default': 0,
+                                          'kind': 'property',
+                                          'type': 'Integer'},
+                           'granted_by': {'constraints': {'max_length': 64},
+                                          'default': '',
+                                          'kind': 'property',
+                                          'type': 'String'},
+                           'grantor': {'constraints': {'max_length': 64},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                           'id': {'constraints': {'max_length': 64},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                           'label': {'constraints': {'max_length': 256},
+                                     'default': '',
+                                     'kind': 'property',
+                                     'type': 'String'},
+                           'requires_acceptance': {'default': 1,
+                                                   'kind': 'property',
+                                                   'type': 'Integer'},
+                           'revoked_at': {'default': 0,
+                                          'kind': 'property',
+                                          'type': 'Integer'},
+                           'revoked_by': {'constraints': {'max_length': 64},
+                                          'default': '',
+                                          'kind': 'property',
+                                          'type': 'String'},
+                           'scope_json': {'constraints': {'max_length': 2048},
+                                          'default': '{}',
+                                          'kind': 'property',
+                                          'type': 'String'},
+                           'status': {'constraints': {'max_length': 16},
+                                      'default': 'pending',
+                                      'kind': 'property',
+                                      'type': 'String'}},
+                'relationships': {},
+                'version': 1},
+ 'Department': {'fields': {'description': {'constraints': {'max_length': 512},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                           'is_root': {'default': False,
+                                       'kind': 'property',
+                                       'type': 'Boolean'},
+                           'name': {'constraints': {'max_length': 256},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                           'policy_quorum_percent': {'default': 0,
+                                                     'kind': 'property',
+                                                     'type': 'Integer'},
+                           'policy_threshold_m': {'default': 1,
+                                                  'kind': 'property',
+                                                  'type': 'Integer'},
+                           'policy_threshold_n': {'default': 1,
+                                                  'kind': 'property',
+                                                  'type': 'Integer'},
+                           'policy_veto_principals': {'constraints': {'max_length': 2048},
+                                                      'default': '',
+                                                      'kind': 'property',
+                                                      'type': 'String'},
+                           'target_policy_quorum_percent': {'default': 0,
+                                                            'kind': 'property',
+                                                            'type': 'Integer'},
+                           'target_policy_threshold_m': {'default': 0,
+                                                         'kind': 'property',
+                                                         'type': 'Integer'},
+                           'target_policy_threshold_n': {'default': 0,
+                                                         'kind': 'property',
+                                                         'type': 'Integer'}},
+                'has_migrate': True,
+                'relationships': {'authorities_granted': {'inverse': 'grantor',
+                                                          'kind': 'relationship',
+                                                          'many': True,
+                                                          'target': 'DepartmentAuthority',
+                                                          'type': 'OneToMany'},
+                                  'authorities_received': {'inverse': 'target',
+                                                           'kind': 'relationship',
+                                                           'many': True,
+                                                           'target': 'DepartmentAuthority',
+                                                           'type': 'OneToMany'},
+                                  'extensions': {'inverse': 'departments',
+                                                 'kind': 'relationship',
+                                                 'many': True,
+                                                 'target': ['Extension'],
+                                                 'type': 'ManyToMany'},
+                                  'fund': {'inverse': 'department',
+                                           'kind': 'relationship',
+                                           'many': False,
+                                           'target': 'Fund',
+                                           'type': 'OneToOne'},
+                                  'head': {'inverse': 'headed_departments',
+                                           'kind': 'relationship',
+                                           'many': False,
+                                           'target': 'User',
+                                           'type': 'ManyToOne'},
+                                  'notifications': {'inverse': 'department',
+                                                    'kind': 'relationship',
+                                                    'many': True,
+                                                    'target': 'Notification',
+                                                    'type': 'OneToMany'},
+                                  'parent': {'inverse': 'sub_departments',
+                                             'kind': 'relationship',
+                                             'many': False,
+                                             'target': 'Department',
+                                             'type': 'ManyToOne'},
+                                  'permissions': {'inverse': 'departments',
+                                                  'kind': 'relationship',
+                                                  'many': True,
+                                                  'target': ['Permission'],
+                                                  'type': 'ManyToMany'},
+                                  'sub_departments': {'inverse': 'parent',
+                                                      'kind': 'relationship',
+                                                      'many': True,
+                                                      'target': 'Department',
+                                                      'type': 'OneToMany'}},
+                'version': 3},
+ 'DepartmentAuthority': {'fields': {'description': {'constraints': {'max_length': 512},
+                                                    'default': '',
+                                                    'kind': 'property',
+                                                    'type': 'String'},
+                                    'id': {'constraints': {'max_length': 64},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                                    'permissions': {'constraints': {'max_length': 1024},
+                                                    'default': '',
+                                                    'kind': 'property',
+                                                    'type': 'String'},
+                                    'target_org_name': {'constraints': {'max_length': 256},
+                                                        'default': '',
+                                                        'kind': 'property',
+                                                        'type': 'String'},
+                                    'target_quarter_canister_id': {'constraints': {'max_length': 64},
+                                                                   'default': '',
+                                                                   'kind': 'property',
+                                                                   'type': 'String'}},
+                         'relationships': {'grantor': {'inverse': 'authorities_granted',
+                                                       'kind': 'relationship',
+                                                       'many': False,
+                                                       'target': 'Department',
+                                                       'type': 'ManyToOne'},
+                                           'target': {'inverse': 'authorities_received',
+                                                      'kind': 'relationship',
+                                                      'many': False,
+                                                      'target': 'Department',
+                                                      'type': 'ManyToOne'}},
+                         'version': 1},
+ 'Dispute': {'fields': {'actions_taken': {'constraints': {'max_length': 2048},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                        'case_title': {'constraints': {'max_length': 256},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                        'description': {'constraints': {'max_length': 2048},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                        'dispute_id': {'constraints': {'max_length': 64},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                        'metadata': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'status': {'constraints': {'max_length': 16},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                        'verdict': {'constraints': {'max_length': 1024},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'}},
+             'relationships': {'defendant': {'inverse': 'disputes_defendant',
+                                             'kind': 'relationship',
+                                             'many': False,
+                                             'target': 'User',
+                                             'type': 'ManyToOne'},
+                               'requester': {'inverse': 'disputes_requested',
+                                             'kind': 'relationship',
+                                             'many': False,
+                                             'target': 'User',
+                                             'type': 'ManyToOne'}},
+             'version': 1},
+ 'EntityMigration': {'fields': {'entity_type': {'constraints': {'max_length': 64},
+                                                'default': 'User',
+                                                'kind': 'property',
+                                                'type': 'String'},
+                                'moved_at': {'constraints': {'max_length': 64},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                'next_ref': {'constraints': {'max_length': 256},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                'prev_ref': {'constraints': {'max_length': 256},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                'signature': {'constraints': {'max_length': 512},
+                                              'default': '',
+                                              'kind': 'property',
+                                              'type': 'String'},
+                                'subject': {'constraints': {'max_length': 128},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'}},
+                     'relationships': {},
+                     'version': 1},
+ 'Extension': {'fields': {'description': {'constraints': {'max_length': 512},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                          'name': {'constraints': {'max_length': 256},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'}},
+               'relationships': {'departments': {'inverse': 'extensions',
+                                                 'kind': 'relationship',
+                                                 'many': True,
+                                                 'target': ['Department'],
+                                                 'type': 'ManyToMany'},
+                                 'profiles': {'inverse': 'extensions',
+                                              'kind': 'relationship',
+                                              'many': True,
+                                              'target': ['UserProfile'],
+                                              'type': 'ManyToMany'}},
+               'version': 1},
+ 'FederalVote': {'fields': {'action': {'constraints': {'max_length': 2048},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                            'deadline': {'default': 0,
+                                         'kind': 'property',
+                                         'type': 'Integer'},
+                            'known_quarters': {'default': 0,
+                                               'kind': 'property',
+                                               'type': 'Integer'},
+                            'origin_quarter': {'constraints': {'max_length': 64},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'},
+                            'rule_json': {'constraints': {'max_length': 512},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                            'status': {'constraints': {'max_length': 32},
+                                       'default': 'open',
+                                       'kind': 'property',
+                                       'type': 'String'},
+                            'tally_json': {'constraints': {'max_length': 2048},
+                                           'default': '',
+                                           'kind': 'property',
+                                           'type': 'String'},
+                            'vote_hash': {'constraints': {'max_length': 80},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                            'vote_id': {'constraints': {'max_length': 64},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'}},
+                 'relationships': {},
+                 'version': 1},
+ 'FederalVoteLeg': {'fields': {'eligible': {'default': 0,
+                                            'kind': 'property',
+                                            'type': 'Integer'},
+                               'error': {'constraints': {'max_length': 256},
+                                         'default': '',
+                                         'kind': 'property',
+                                         'type': 'String'},
+                               'leg_key': {'constraints': {'max_length': 130},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                               'outcome': {'constraints': {'max_length': 32},
+                                           'default': '',
+                                           'kind': 'property',
+                                           'type': 'String'},
+                               'proposal_id': {'constraints': {'max_length': 64},
+                                               'default': '',
+                                               'kind': 'property',
+                                               'type': 'String'},
+                               'quarter_canister_id': {'constraints': {'max_length': 64},
+                                                       'has_default': False,
+                                                       'kind': 'property',
+                                                       'type': 'String'},
+                               'reported': {'default': False,
+                                            'kind': 'property',
+                                            'type': 'Boolean'},
+                               'status': {'constraints': {'max_length': 32},
+                                          'default': 'open',
+                                          'kind': 'property',
+                                          'type': 'String'},
+                               'vote_hash': {'constraints': {'max_length': 80},
+                                             'default': '',
+                                             'kind': 'property',
+                                             'type': 'String'},
+                               'vote_id': {'constraints': {'max_length': 64},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                               'votes_abstain': {'default': 0,
+                                                 'kind': 'property',
+                                                 'type': 'Integer'},
+                               'votes_no': {'default': 0,
+                                            'kind': 'property',
+                                            'type': 'Integer'},
+                               'votes_yes': {'default': 0,
+                                             'kind': 'property',
+                                             'type': 'Integer'}},
+                    'relationships': {},
+                    'version': 1},
+ 'FederationMessage': {'fields': {'body': {'constraints': {'max_length': 4096},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                                  'msg_id': {'constraints': {'max_length': 128},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                  'response': {'constraints': {'max_length': 4096},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'},
+                                  'source': {'constraints': {'max_length': 64},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                  'topic': {'constraints': {'max_length': 128},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'}},
+                       'relationships': {},
+                       'version': 1},
+ 'FinancialReport': {'fields': {'as_of': {'constraints': {'max_length': 32},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                                'currency': {'constraints': {'max_length': 16},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                'entry_count': {'default': 0,
+                                                'kind': 'property',
+                                                'type': 'Integer'},
+                                'id': {'constraints': {'max_length': 64},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                                'issued_at': {'constraints': {'max_length': 32},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'},
+                                'issued_by': {'constraints': {'max_length': 64},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'},
+                                'kind': {'constraints': {'max_length': 16},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                                'source_hash': {'constraints': {'max_length': 64},
+                                                'has_default': False,
+                                                'kind': 'property',
+                                                'type': 'String'},
+                                'statements': {'constraints': {'max_length': 8192},
+                                               'default': '{}',
+                                               'kind': 'property',
+                                               'type': 'String'}},
+                     'relationships': {'period': {'inverse': 'financial_reports',
+                                                  'kind': 'relationship',
+                                                  'many': False,
+                                                  'target': 'FiscalPeriod',
+                                                  'type': 'ManyToOne'},
+                                       'restatements': {'inverse': 'supersedes',
+                                                        'kind': 'relationship',
+                                                        'many': True,
+                                                        'target': 'FinancialReport',
+                                                        'type': 'OneToMany'},
+                                       'supersedes': {'inverse': 'restatements',
+                                                      'kind': 'relationship',
+                                                      'many': False,
+                                                      'target': 'FinancialReport',
+                                                      'type': 'ManyToOne'}},
+                     'version': 1},
+ 'FiscalPeriod': {'fields': {'end_date': {'constraints': {'max_length': 32},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                             'id': {'constraints': {'max_length': 16},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                             'name': {'constraints': {'max_length': 64},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                             'start_date': {'constraints': {'max_length': 32},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'},
+                             'status': {'constraints': {'max_length': 16},
+                                        'default': 'open',
+                                        'kind': 'property',
+                                        'type': 'String'}},
+                  'relationships': {'budgets': {'inverse': 'fiscal_period',
+                                                'kind': 'relationship',
+                                                'many': True,
+                                                'target': 'Budget',
+                                                'type': 'OneToMany'},
+                                    'financial_reports': {'inverse': 'period',
+                                                          'kind': 'relationship',
+                                                          'many': True,
+                                                          'target': 'FinancialReport',
+                                                          'type': 'OneToMany'},
+                                    'ledger_entries': {'inverse': 'fiscal_period',
+                                                       'kind': 'relationship',
+                                                       'many': True,
+                                                       'target': 'LedgerEntry',
+                                                       'type': 'OneToMany'}},
+                  'version': 1},
+ 'Fund': {'fields': {'code': {'constraints': {'max_length': 16},
+                              'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'},
+                     'description': {'constraints': {'max_length': 512},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                     'fund_type': {'constraints': {'max_length': 32},
+                                   'default': 'general',
+                                   'kind': 'property',
+                                   'type': 'String'},
+                     'name': {'constraints': {'max_length': 256},
+                              'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'}},
+          'has_migrate': True,
+          'relationships': {'budgets': {'inverse': 'fund',
+                                        'kind': 'relationship',
+                                        'many': True,
+                                        'target': 'Budget',
+                                        'type': 'OneToMany'},
+                            'department': {'inverse': 'fund',
+                                           'kind': 'relationship',
+                                           'many': False,
+                                           'target': 'Department',
+                                           'type': 'OneToOne'},
+                            'ledger_entries': {'inverse': 'fund',
+                                               'kind': 'relationship',
+                                               'many': True,
+                                               'target': 'LedgerEntry',
+                                               'type': 'OneToMany'},
+                            'realm': {'inverse': 'funds',
+                                      'kind': 'relationship',
+                                      'many': False,
+                                      'target': 'Realm',
+                                      'type': 'ManyToOne'}},
+          'version': 2},
+ 'Human': {'fields': {'date_of_birth': {'constraints': {'max_length': 256},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                      'h3_index': {'constraints': {'max_length': 20},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                      'latitude': {'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'Float'},
+                      'longitude': {'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'Float'},
+                      'name': {'constraints': {'max_length': 256},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'}},
+           'relationships': {'identities': {'inverse': 'human',
+                                            'kind': 'relationship',
+                                            'many': True,
+                                            'target': 'Identity',
+                                            'type': 'OneToMany'},
+                             'user': {'inverse': 'human',
+                                      'kind': 'relationship',
+                                      'many': False,
+                                      'target': 'User',
+                                      'type': 'OneToOne'}},
+           'version': 1},
+ 'Identity': {'fields': {'metadata': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                         'type': {'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'}},
+              'relationships': {'human': {'inverse': 'identities',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'Human',
+                                          'type': 'ManyToOne'}},
+              'version': 1},
+ 'Instrument': {'fields': {'metadata': {'constraints': {'max_length': 256},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                           'name': {'constraints': {'max_length': 256},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                           'principal_id': {'constraints': {'max_length': 256},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'}},
+                'relationships': {},
+                'version': 1},
+ 'Invoice': {'fields': {'amount': {'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'Float'},
+                        'currency': {'constraints': {'max_length': 16},
+                                     'default': '',
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'due_date': {'constraints': {'max_length': 64},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'id': {'constraints': {'max_length': 32},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'},
+                        'metadata': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'paid_at': {'constraints': {'max_length': 64},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                        'payment_amount': {'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'Float'},
+                        'payment_amount_raw': {'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'Integer'},
+                        'payment_currency': {'constraints': {'max_length': 16},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                        'payment_nonce': {'default': 0,
+                                          'kind': 'property',
+                                          'type': 'Integer'},
+                        'status': {'constraints': {'max_length': 32},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'}},
+             'relationships': {'ledger_entries': {'inverse': 'invoice',
+                                                  'kind': 'relationship',
+                                                  'many': True,
+                                                  'target': 'LedgerEntry',
+                                                  'type': 'OneToMany'},
+                               'transfers': {'inverse': 'invoice',
+                                             'kind': 'relationship',
+                                             'many': True,
+                                             'target': 'Transfer',
+                                             'type': 'OneToMany'},
+                               'user': {'inverse': 'invoices',
+                                        'kind': 'relationship',
+                                        'many': False,
+                                        'target': 'User',
+                                        'type': 'ManyToOne'}},
+             'version': 1},
+ 'Judge': {'fields': {'appointment_date': {'constraints': {'max_length': 64},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                      'id': {'constraints': {'max_length': 64},
+                             'has_default': False,
+                             'kind': 'property',
+                             'type': 'String'},
+                      'metadata': {'constraints': {'max_length': 1024},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                      'specialization': {'constraints': {'max_length': 256},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                      'status': {'constraints': {'max_length': 16},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'}},
+           'relationships': {'cases_assigned': {'inverse': 'judges',
+                                                'kind': 'relationship',
+                                                'many': True,
+                                                'target': ['Case'],
+                                                'type': 'ManyToMany'},
+                             'court': {'inverse': 'judges',
+                                       'kind': 'relationship',
+                                       'many': False,
+                                       'target': 'Court',
+                                       'type': 'ManyToOne'},
+                             'member': {'inverse': 'judge',
+                                        'kind': 'relationship',
+                                        'many': False,
+                                        'target': 'Member',
+                                        'type': 'OneToOne'},
+                             'verdicts_issued': {'inverse': 'issued_by',
+                                                 'kind': 'relationship',
+                                                 'many': True,
+                                                 'target': 'Verdict',
+                                                 'type': 'OneToMany'}},
+           'version': 1},
+ 'JusticeSystem': {'fields': {'description': {'constraints': {'max_length': 1024},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'},
+                              'metadata': {'constraints': {'max_length': 1024},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                              'name': {'constraints': {'max_length': 256,
+                                                       'min_length': 2},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                              'status': {'constraints': {'max_length': 16},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                              'system_type': {'constraints': {'max_length': 16},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'}},
+                   'relationships': {'courts': {'inverse': 'justice_system',
+                                                'kind': 'relationship',
+                                                'many': True,
+                                                'target': 'Court',
+                                                'type': 'OneToMany'},
+                                     'license': {'inverse': 'justice_system',
+                                                 'kind': 'relationship',
+                                                 'many': False,
+                                                 'target': 'License',
+                                                 'type': 'OneToOne'},
+                                     'realm': {'inverse': 'justice_systems',
+                                               'kind': 'relationship',
+                                               'many': False,
+                                               'target': 'Realm',
+                                               'type': 'ManyToOne'}},
+                   'version': 1},
+ 'Land': {'fields': {'id': {'has_default': False, 'kind': 'property', 'type': 'String'},
+                     'land_type': {'constraints': {'max_length': 64},
+                                   'default': 'unassigned',
+                                   'kind': 'property',
+                                   'type': 'String'},
+                     'metadata': {'constraints': {'max_length': 512},
+                                  'default': '{}',
+                                  'kind': 'property',
+                                  'type': 'String'},
+                     'nft_token_id': {'constraints': {'max_length': 64},
+                                      'default': '',
+                                      'kind': 'property',
+                                      'type': 'String'},
+                     'registered_by': {'constraints': {'max_length': 256},
+                                       'default': '',
+                                       'kind': 'property',
+                                       'type': 'String'},
+                     'size_height': {'default': 1,
+                                     'kind': 'property',
+                                     'type': 'Integer'},
+                     'size_width': {'default': 1,
+                                    'kind': 'property',
+                                    'type': 'Integer'},
+                     'status': {'constraints': {'max_length': 16},
+                                'default': 'active',
+                                'kind': 'property',
+                                'type': 'String'},
+                     'x_coordinate': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'Integer'},
+                     'y_coordinate': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'Integer'}},
+          'relationships': {'owner_organization': {'inverse': 'owned_lands',
+                                                   'kind': 'relationship',
+                                                   'many': False,
+                                                   'target': 'Organization',
+                                                   'type': 'ManyToOne'},
+                            'owner_user': {'inverse': 'owned_lands',
+                                           'kind': 'relationship',
+                                           'many': False,
+                                           'target': 'User',
+                                           'type': 'ManyToOne'},
+                            'zones': {'inverse': 'land',
+                                      'kind': 'relationship',
+                                      'many': True,
+                                      'target': 'Zone',
+                                      'type': 'OneToMany'}},
+          'version': 1},
+ 'LedgerEntry': {'fields': {'category': {'constraints': {'max_length': 64},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                            'credit': {'default': 0,
+                                       'kind': 'property',
+                                       'type': 'Integer'},
+                            'currency': {'constraints': {'max_length': 16},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                            'debit': {'default': 0,
+                                      'kind': 'property',
+                                      'type': 'Integer'},
+                            'description': {'constraints': {'max_length': 512},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'},
+                            'entry_date': {'constraints': {'max_length': 32},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                            'entry_type': {'constraints': {'max_length': 32},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                            'id': {'constraints': {'max_length': 64},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                            'reference': {'constraints': {'max_length': 128},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                            'tags': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                            'transaction_id': {'constraints': {'max_length': 64},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'}},
+                 'relationships': {'appeal': {'inverse': 'ledger_entries',
+                                              'kind': 'relationship',
+                                              'many': False,
+                                              'target': 'Appeal',
+                                              'type': 'ManyToOne'},
+                                   'case': {'inverse': 'ledger_entries',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'Case',
+                                            'type': 'ManyToOne'},
+                                   'contract': {'inverse': 'ledger_entries',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'Contract',
+                                                'type': 'ManyToOne'},
+                                   'fiscal_period': {'inverse': 'ledger_entries',
+                                                     'kind': 'relationship',
+                                                     'many': False,
+                                                     'target': 'FiscalPeriod',
+                                                     'type': 'ManyToOne'},
+                                   'fund': {'inverse': 'ledger_entries',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'Fund',
+                                            'type': 'ManyToOne'},
+                                   'invoice': {'inverse': 'ledger_entries',
+                                               'kind': 'relationship',
+                                               'many': False,
+                                               'target': 'Invoice',
+                                               'type': 'ManyToOne'},
+                                   'organization': {'inverse': 'ledger_entries',
+                                                    'kind': 'relationship',
+                                                    'many': False,
+                                                    'target': 'Organization',
+                                                    'type': 'ManyToOne'},
+                                   'penalty': {'inverse': 'ledger_entries',
+                                               'kind': 'relationship',
+                                               'many': False,
+                                               'target': 'Penalty',
+                                               'type': 'ManyToOne'},
+                                   'transfer': {'inverse': 'ledger_entries',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'Transfer',
+                                                'type': 'ManyToOne'},
+                                   'user': {'inverse': 'ledger_entries',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'User',
+                                            'type': 'ManyToOne'}},
+                 'version': 1},
+ 'License': {'fields': {'description': {'constraints': {'max_length': 1024},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                        'expires_at': {'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'Integer'},
+                        'issued_at': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'Integer'},
+                        'issuing_authority': {'constraints': {'max_length': 256},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'},
+                        'license_type': {'constraints': {'max_length': 32},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                        'metadata': {'constraints': {'max_length': 1024},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'name': {'constraints': {'max_length': 256},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'},
+                        'status': {'constraints': {'max_length': 16},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'}},
+             'relationships': {'court': {'inverse': 'license',
+                                         'kind': 'relationship',
+                                         'many': False,
+                                         'target': 'Court',
+                                         'type': 'OneToOne'},
+                               'justice_system': {'inverse': 'license',
+                                                  'kind': 'relationship',
+                                                  'many': False,
+                                                  'target': 'JusticeSystem',
+                                                  'type': 'OneToOne'},
+                               'organization': {'inverse': 'license',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'Organization',
+                                                'type': 'OneToOne'}},
+             'version': 1},
+ 'Mandate': {'fields': {'metadata': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'name': {'constraints': {'max_length': 256},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'}},
+             'relationships': {},
+             'version': 1},
+ 'MarketPlace': {'fields': {'metadata': {'constraints': {'max_length': 256},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                            'name': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                            'principal_id': {'constraints': {'max_length': 256},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'}},
+                 'relationships': {},
+                 'version': 1},
+ 'Member': {'fields': {'id': {'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'}},
+            'relationships': {'judge': {'inverse': 'member',
+                                        'kind': 'relationship',
+                                        'many': False,
+                                        'target': 'Judge',
+                                        'type': 'OneToOne'},
+                              'user': {'inverse': 'member',
+                                       'kind': 'relationship',
+                                       'many': False,
+                                       'target': 'User',
+                                       'type': 'OneToOne'}},
+            'version': 1},
+ 'MenuCategoryConfig': {'fields': {'category_id': {'constraints': {'max_length': 64},
+                                                   'has_default': False,
+                                                   'kind': 'property',
+                                                   'type': 'String'},
+                                   'label': {'constraints': {'max_length': 128},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                   'position': {'default': 0,
+                                                'kind': 'property',
+                                                'type': 'Integer'}},
+                        'relationships': {},
+                        'version': 1},
+ 'MenuDepartmentVisibility': {'fields': {'extension_name': {'constraints': {'max_length': 256},
+                                                            'has_default': False,
+                                                            'kind': 'property',
+                                                            'type': 'String'},
+                                         'visible': {'default': True,
+                                                     'kind': 'property',
+                                                     'type': 'Boolean'}},
+                              'relationships': {'department': {'inverse': 'menu_visibility_rules',
+                                                               'kind': 'relationship',
+                                                               'many': False,
+                                                               'target': 'Department',
+                                                               'type': 'ManyToOne'}},
+                              'version': 1},
+ 'MenuItemConfig': {'fields': {'category_id': {'constraints': {'max_length': 64},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'},
+                               'extension_name': {'constraints': {'max_length': 256},
+                                                  'has_default': False,
+                                                  'kind': 'property',
+                                                  'type': 'String'},
+                               'position': {'default': 0,
+                                            'kind': 'property',
+                                            'type': 'Integer'}},
+                    'relationships': {},
+                    'version': 1},
+ 'NFTToken': {'fields': {'canister_id': {'constraints': {'max_length': 64},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                         'description': {'constraints': {'max_length': 256},
+                                         'default': '',
+                                         'kind': 'property',
+                                         'type': 'String'},
+                         'enabled': {'constraints': {'max_length': 8},
+                                     'default': 'true',
+                                     'kind': 'property',
+                                     'type': 'String'},
+                         'id': {'constraints': {'max_length': 16},
+                                'has_default': False,
+                                'kind': 'property',
+                                'type': 'String'},
+                         'name': {'constraints': {'max_length': 64},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                         'nft_type': {'constraints': {'max_length': 16},
+                                      'default': 'land',
+                                      'kind': 'property',
+                                      'type': 'String'},
+                         'supply_cap': {'default': 0,
+                                        'kind': 'property',
+                                        'type': 'Integer'},
+                         'symbol': {'constraints': {'max_length': 16},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                         'total_supply': {'default': 0,
+                                          'kind': 'property',
+                                          'type': 'Integer'}},
+              'relationships': {},
+              'version': 1},
+ 'Notification': {'fields': {'audience_type': {'constraints': {'max_length': 16},
+                                               'default': 'user',
+                                               'kind': 'property',
+                                               'type': 'String'},
+                             'color': {'constraints': {'max_length': 32},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                             'href': {'constraints': {'max_length': 256},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                             'icon': {'constraints': {'max_length': 64},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                             'message': {'constraints': {'max_length': 2048},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                             'metadata': {'constraints': {'max_length': 256},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                             'origin_realm': {'constraints': {'max_length': 64},
+                                              'default': '',
+                                              'kind': 'property',
+                                              'type': 'String'},
+                             'read': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'Boolean'},
+                             'read_by': {'constraints': {'max_length': 8192},
+                                         'default': '',
+                                         'kind': 'property',
+                                         'type': 'String'},
+                             'recipient': {'constraints': {'max_length': 128},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                             'sender': {'constraints': {'max_length': 128},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                             'title': {'constraints': {'max_length': 256},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                             'topic': {'constraints': {'max_length': 64},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                             'visibility': {'constraints': {'max_length': 16},
+                                            'default': 'private',
+                                            'kind': 'property',
+                                            'type': 'String'}},
+                  'relationships': {'department': {'inverse': 'notifications',
+                                                   'kind': 'relationship',
+                                                   'many': False,
+                                                   'target': 'Department',
+                                                   'type': 'ManyToOne'},
+                                    'user': {'inverse': 'notifications',
+                                             'kind': 'relationship',
+                                             'many': False,
+                                             'target': 'User',
+                                             'type': 'ManyToOne'}},
+                  'version': 1},
+ 'Organization': {'fields': {'name': {'constraints': {'max_length': 256,
+                                                      'min_length': 2},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'}},
+                  'relationships': {'ledger_entries': {'inverse': 'organization',
+                                                       'kind': 'relationship',
+                                                       'many': True,
+                                                       'target': 'LedgerEntry',
+                                                       'type': 'OneToMany'},
+                                    'license': {'inverse': 'organization',
+                                                'kind': 'relationship',
+                                                'many': False,
+                                                'target': 'License',
+                                                'type': 'OneToOne'},
+                                    'owned_lands': {'inverse': 'owner_organization',
+                                                    'kind': 'relationship',
+                                                    'many': True,
+                                                    'target': 'Land',
+                                                    'type': 'OneToMany'}},
+                  'version': 1},
+ 'PaymentAccount': {'fields': {'address': {'constraints': {'max_length': 256},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                               'currency': {'constraints': {'max_length': 20},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'},
+                               'id': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                               'is_active': {'default': True,
+                                             'kind': 'property',
+                                             'type': 'Boolean'},
+                               'is_verified': {'default': False,
+                                               'kind': 'property',
+                                               'type': 'Boolean'},
+                               'label': {'constraints': {'max_length': 100},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                               'metadata': {'constraints': {'max_length': 512},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'},
+                               'network': {'constraints': {'max_length': 50},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'}},
+                    'relationships': {'user': {'inverse': 'payment_accounts',
+                                               'kind': 'relationship',
+                                               'many': False,
+                                               'target': 'User',
+                                               'type': 'ManyToOne'}},
+                    'version': 1},
+ 'Penalty': {'fields': {'amount': {'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'Float'},
+                        'currency': {'constraints': {'max_length': 16},
+                                     'default': '',
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'description': {'constraints': {'max_length': 1024},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                        'due_date': {'constraints': {'max_length': 64},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'executed_date': {'constraints': {'max_length': 64},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                        'id': {'constraints': {'max_length': 64},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'},
+                        'metadata': {'constraints': {'max_length': 1024},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'penalty_type': {'constraints': {'max_length': 32},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                        'status': {'constraints': {'max_length': 16},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'}},
+             'relationships': {'ledger_entries': {'inverse': 'penalty',
+                                                  'kind': 'relationship',
+                                                  'many': True,
+                                                  'target': 'LedgerEntry',
+                                                  'type': 'OneToMany'},
+                               'target_user': {'inverse': 'penalties_received',
+                                               'kind': 'relationship',
+                                               'many': False,
+                                               'target': 'User',
+                                               'type': 'ManyToOne'},
+                               'verdict': {'inverse': 'penalties',
+                                           'kind': 'relationship',
+                                           'many': False,
+                                           'target': 'Verdict',
+                                           'type': 'ManyToOne'}},
+             'version': 1},
+ 'Permission': {'fields': {'category': {'constraints': {'max_length': 64},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                           'description': {'constraints': {'max_length': 256},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                           'name': {'constraints': {'max_length': 256},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                           'scope': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'}},
+                'relationships': {'departments': {'inverse': 'permissions',
+                                                  'kind': 'relationship',
+                                                  'many': True,
+                                                  'target': ['Department'],
+                                                  'type': 'ManyToMany'},
+                                  'profiles': {'inverse': 'permissions',
+                                               'kind': 'relationship',
+                                               'many': True,
+                                               'target': ['UserProfile'],
+                                               'type': 'ManyToMany'},
+                                  'users': {'inverse': 'permissions',
+                                            'kind': 'relationship',
+                                            'many': True,
+                                            'target': ['User'],
+                                            'type': 'ManyToMany'}},
+                'version': 1},
+ 'Position': {'fields': {'description': {'constraints': {'max_length': 512},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                         'headcount': {'default': 1,
+                                       'kind': 'property',
+                                       'type': 'Integer'},
+                         'inherit_from_capital': {'default': True,
+                                                  'kind': 'property',
+                                                  'type': 'Boolean'},
+                         'key': {'constraints': {'max_length': 512},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'},
+                         'salary_amount': {'default': 0,
+                                           'kind': 'property',
+                                           'type': 'Integer'},
+                         'salary_period': {'constraints': {'max_length': 16},
+                                           'default': 'monthly',
+                                           'kind': 'property',
+                                           'type': 'String'},
+                         'status': {'constraints': {'max_length': 16},
+                                    'default': 'open',
+                                    'kind': 'property',
+                                    'type': 'String'},
+                         'title': {'constraints': {'max_length': 256},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'}},
+              'has_migrate': True,
+              'relationships': {'appointments': {'inverse': 'position',
+                                                 'kind': 'relationship',
+                                                 'many': True,
+                                                 'target': 'Appointment',
+                                                 'type': 'OneToMany'},
+                                'department': {'inverse': 'positions',
+                                               'kind': 'relationship',
+                                               'many': False,
+                                               'target': 'Department',
+                                               'type': 'ManyToOne'},
+                                'profile': {'inverse': 'positions',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'UserProfile',
+                                            'type': 'ManyToOne'}},
+              'version': 2},
+ 'Proposal': {'fields': {'code_checksum': {'constraints': {'max_length': 128},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                         'code_url': {'constraints': {'max_length': 512},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                         'description': {'constraints': {'max_length': 2048},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                         'metadata': {'constraints': {'max_length': 4096},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                         'org_scope': {'constraints': {'max_length': 128},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                         'proposal_id': {'constraints': {'max_length': 64},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                         'required_threshold': {'has_default': False,
+                                                'kind': 'property',
+                                                'type': 'Float'},
+                         'status': {'constraints': {'max_length': 32},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                         'title': {'constraints': {'max_length': 256},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'},
+                         'total_voters': {'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'Float'},
+                         'votes_abstain': {'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'Float'},
+                         'votes_no': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'Float'},
+                         'votes_yes': {'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'Float'},
+                         'voting_deadline': {'constraints': {'max_length': 64},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'}},
+              'has_migrate': True,
+              'relationships': {'budgets': {'inverse': 'proposal',
+                                            'kind': 'relationship',
+                                            'many': True,
+                                            'target': 'Budget',
+                                            'type': 'OneToMany'},
+                                'proposer': {'inverse': 'proposals',
+                                             'kind': 'relationship',
+                                             'many': False,
+                                             'target': 'User',
+                                             'type': 'ManyToOne'},
+                                'votes': {'inverse': 'proposal',
+                                          'kind': 'relationship',
+                                          'many': True,
+                                          'target': 'Vote',
+                                          'type': 'OneToMany'}},
+              'version': 2},
+ 'Quarter': {'fields': {'canister_id': {'constraints': {'max_length': 64},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                        'index': {'default': 0, 'kind': 'property', 'type': 'Integer'},
+                        'last_sync_ballot_id': {'constraints': {'max_length': 64},
+                                                'default': '',
+                                                'kind': 'property',
+                                                'type': 'String'},
+                        'last_sync_ballot_status': {'constraints': {'max_length': 32},
+                                                    'default': '',
+                                                    'kind': 'property',
+                                                    'type': 'String'},
+                        'name': {'constraints': {'max_length': 256, 'min_length': 2},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'},
+                        'population': {'default': 0,
+                                       'kind': 'property',
+                                       'type': 'Integer'},
+                        'reported_codex_id': {'constraints': {'max_length': 128},
+                                              'default': '',
+                                              'kind': 'property',
+                                              'type': 'String'},
+                        'reported_codex_version': {'constraints': {'max_length': 64},
+                                                   'default': '',
+                                                   'kind': 'property',
+                                                   'type': 'String'},
+                        'status': {'constraints': {'max_length': 16},
+                                   'default': 'setup',
+                                   'kind': 'property',
+                                   'type': 'String'}},
+             'has_migrate': True,
+             'relationships': {'federation': {'inverse': 'quarter_ids',
+                                              'kind': 'relationship',
+                                              'many': False,
+                                              'target': 'Realm',
+                                              'type': 'ManyToOne'}},
+             'version': 2},
+ 'QuarterResident': {'fields': {'principal': {'constraints': {'max_length': 64},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'},
+                                'quarter_canister_id': {'constraints': {'max_length': 64},
+                                                        'has_default': False,
+                                                        'kind': 'property',
+                                                        'type': 'String'}},
+                     'relationships': {},
+                     'version': 1},
+ 'Realm': {'fields': {'accounting_currency': {'constraints': {'max_length': 16},
+                                              'default': '',
+                                              'kind': 'property',
+                                              'type': 'String'},
+                      'accounting_currency_decimals': {'default': 8,
+                                                       'kind': 'property',
+                                                       'type': 'Integer'},
+                      'ai_assistant_enabled': {'default': True,
+                                               'kind': 'property',
+                                               'type': 'Boolean'},
+                      'auto_scale_enabled': {'default': True,
+                                             'kind': 'property',
+                                             'type': 'Boolean'},
+                      'background_image_url': {'constraints': {'max_length': 512},
+                                               'default': '',
+                                               'kind': 'property',
+                                               'type': 'String'},
+                      'bootstrap_state': {'constraints': {'max_length': 8192},
+                                          'default': '',
+                                          'kind': 'property',
+                                          'type': 'String'},
+                      'can_test_mode': {'default': False,
+                                        'kind': 'property',
+                                        'type': 'Boolean'},
+                      'federation_realm_id': {'constraints': {'max_length': 64},
+                                              'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'String'},
+                      'file_registry_canister_id': {'constraints': {'max_length': 64},
+                                                    'has_default': False,
+                                                    'kind': 'property',
+                                                    'type': 'String'},
+                      'frontend_canister_id': {'constraints': {'max_length': 64},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'},
+                      'installed_version': {'constraints': {'max_length': 32},
+                                            'default': '',
+                                            'kind': 'property',
+                                            'type': 'String'},
+                      'installer_canister_id': {'constraints': {'max_length': 64},
+                                                'default': '',
+                                                'kind': 'property',
+                                                'type': 'String'},
+                      'is_capital': {'default': False,
+                                     'kind': 'property',
+                                     'type': 'Boolean'},
+                      'is_quarter': {'default': False,
+                                     'kind': 'property',
+                                     'type': 'Boolean'},
+                      'logo_url': {'constraints': {'max_length': 512},
+                                   'default': '',
+                                   'kind': 'property',
+                                   'type': 'String'},
+                      'manifest_data': {'constraints': {'max_length': 4096},
+                                        'default': '{}',
+                                        'kind': 'property',
+                                        'type': 'String'},
+                      'manifesto': {'constraints': {'max_length': 256},
+                                    'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                      'marketplace_canister_id': {'constraints': {'max_length': 64},
+                                                  'has_default': False,
+                                                  'kind': 'property',
+                                                  'type': 'String'},
+                      'name': {'constraints': {'max_length': 256, 'min_length': 2},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'},
+                      'network': {'constraints': {'max_length': 16},
+                                  'default': '',
+                                  'kind': 'property',
+                                  'type': 'String'},
+                      'nft_canister_id': {'constraints': {'max_length': 64},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                      'open_registration': {'default': False,
+                                            'kind': 'property',
+                                            'type': 'Boolean'},
+                      'principal_id': {'constraints': {'max_length': 64},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                      'quarter_join_mode': {'constraints': {'max_length': 16},
+                                            'default': 'auto',
+                                            'kind': 'property',
+                                            'type': 'String'},
+                      'require_marketplace_approval': {'default': True,
+                                                       'kind': 'property',
+                                                       'type': 'Boolean'},
+                      'scale_in_flight': {'default': False,
+                                          'kind': 'property',
+                                          'type': 'Boolean'},
+                      'scale_requested_at': {'constraints': {'max_length': 32},
+                                             'default': '',
+                                             'kind': 'property',
+                                             'type': 'String'},
+                      'status': {'constraints': {'max_length': 16},
+                                 'default': 'setup',
+                                 'kind': 'property',
+                                 'type': 'String'},
+                      'sync_state': {'constraints': {'max_length': 8192},
+                                     'default': '',
+                                     'kind': 'property',
+                                     'type': 'String'},
+                      'test_mode': {'default': False,
+                                    'kind': 'property',
+                                    'type': 'Boolean'},
+                      'test_mode_demo_data': {'default': False,
+                                              'kind': 'property',
+                                              'type': 'Boolean'},
+                      'test_mode_ii_bypass': {'default': False,
+                                              'kind': 'property',
+                                              'type': 'Boolean'},
+                      'test_mode_skip_authentication': {'default': False,
+                                                        'kind': 'property',
+                                                        'type': 'Boolean'},
+                      'test_mode_skip_passport_zkproof': {'default': False,
+                                                          'kind': 'property',
+                                                          'type': 'Boolean'},
+                      'test_mode_skip_terms': {'default': False,
+                                               'kind': 'property',
+                                               'type': 'Boolean'},
+                      'test_mode_user_self_registration': {'default': False,
+                                                           'kind': 'property',
+                                                           'type': 'Boolean'},
+                      'token_canister_id': {'constraints': {'max_length': 64},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'},
+                      'trusted_approvers': {'constraints': {'max_length': 1024},
+                                            'default': '',
+                                            'kind': 'property',
+                                            'type': 'String'},
+                      'trusted_principals': {'constraints': {'max_length': 2048},
+                                             'default': '',
+                                             'kind': 'property',
+                                             'type': 'String'},
+                      'welcome_message': {'constraints': {'max_length': 1024},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'}},
+           'has_migrate': True,
+           'relationships': {'calendar': {'inverse': 'realm',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'Calendar',
+                                          'type': 'OneToOne'},
+                             'federation_codex': {'inverse': 'federation',
+                                                  'kind': 'relationship',
+                                                  'many': False,
+                                                  'target': 'Codex',
+                                                  'type': 'OneToOne'},
+                             'funds': {'inverse': 'realm',
+                                       'kind': 'relationship',
+                                       'many': True,
+                                       'target': 'Fund',
+                                       'type': 'OneToMany'},
+                             'justice_systems': {'inverse': 'realm',
+                                                 'kind': 'relationship',
+                                                 'many': True,
+                                                 'target': 'JusticeSystem',
+                                                 'type': 'OneToMany'},
+                             'quarter_ids': {'inverse': 'federation',
+                                             'kind': 'relationship',
+                                             'many': True,
+                                             'target': 'Quarter',
+                                             'type': 'OneToMany'},
+                             'treasury': {'inverse': 'realm',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'Treasury',
+                                          'type': 'OneToOne'}},
+           'version': 8},
+ 'RegistrationCode': {'fields': {'code': {'constraints': {'max_length': 64},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                                 'code_hash': {'constraints': {'max_length': 128},
+                                               'has_default': False,
+                                               'kind': 'property',
+                                               'type': 'String'},
+                                 'created_by': {'constraints': {'max_length': 64},
+                                                'has_default': False,
+                                                'kind': 'property',
+                                                'type': 'String'},
+                                 'department': {'constraints': {'max_length': 256},
+                                                'default': '',
+                                                'kind': 'property',
+                                                'type': 'String'},
+                                 'email': {'constraints': {'max_length': 255},
+                                           'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                                 'expires_at': {'has_default': False,
+                                                'kind': 'property',
+                                                'type': 'Integer'},
+                                 'frontend_url': {'constraints': {'max_length': 512},
+                                                  'has_default': False,
+                                                  'kind': 'property',
+                                                  'type': 'String'},
+                                 'max_uses': {'default': 1,
+                                              'kind': 'property',
+                                              'type': 'Integer'},
+                                 'metadata': {'constraints': {'max_length': 1024},
+                                              'default': '',
+                                              'kind': 'property',
+                                              'type': 'String'},
+                                 'position': {'constraints': {'max_length': 512},
+                                              'default': '',
+                                              'kind': 'property',
+                                              'type': 'String'},
+                                 'principals_redeemed': {'constraints': {'max_length': 4096},
+                                                         'default': '',
+                                                         'kind': 'property',
+                                                         'type': 'String'},
+                                 'profile': {'constraints': {'max_length': 64},
+                                             'default': 'member',
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                 'revoked': {'default': 0,
+                                             'kind': 'property',
+                                             'type': 'Integer'},
+                                 'used': {'default': 0,
+                                          'kind': 'property',
+                                          'type': 'Integer'},
+                                 'used_at': {'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'Integer'},
+                                 'user_id': {'constraints': {'max_length': 64},
+                                             'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'String'},
+                                 'uses_count': {'default': 0,
+                                                'kind': 'property',
+                                                'type': 'Integer'}},
+                      'has_migrate': True,
+                      'relationships': {},
+                      'version': 3},
+ 'Registry': {'fields': {'description': {'constraints': {'max_length': 256},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                         'name': {'constraints': {'max_length': 256, 'min_length': 2},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                         'principal_id': {'constraints': {'max_length': 64},
+                                          'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'}},
+              'relationships': {},
+              'version': 1},
+ 'Service': {'fields': {'description': {'constraints': {'max_length': 2048},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                        'due_date': {'constraints': {'max_length': 64},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'link': {'constraints': {'max_length': 512},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'},
+                        'metadata': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'name': {'constraints': {'max_length': 256},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'},
+                        'provider': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'service_id': {'constraints': {'max_length': 64},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                        'status': {'constraints': {'max_length': 32},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'}},
+             'relationships': {'user': {'inverse': 'services',
+                                        'kind': 'relationship',
+                                        'many': False,
+                                        'target': 'User',
+                                        'type': 'ManyToOne'}},
+             'version': 1},
+ 'Task': {'fields': {'metadata': {'constraints': {'max_length': 256},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                     'name': {'constraints': {'max_length': 256},
+                              'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'},
+                     'status': {'constraints': {'max_length': 32},
+                                'default': 'pending',
+                                'kind': 'property',
+                                'type': 'String'},
+                     'step_to_execute': {'default': 0,
+                                         'kind': 'property',
+                                         'type': 'Integer'}},
+          'relationships': {'executions': {'inverse': 'task',
+                                           'kind': 'relationship',
+                                           'many': True,
+                                           'target': 'TaskExecution',
+                                           'type': 'OneToMany'},
+                            'schedules': {'inverse': 'task',
+                                          'kind': 'relationship',
+                                          'many': True,
+                                          'target': 'TaskSchedule',
+                                          'type': 'OneToMany'},
+                            'steps': {'inverse': 'task',
+                                      'kind': 'relationship',
+                                      'many': True,
+                                      'target': 'TaskStep',
+                                      'type': 'OneToMany'}},
+          'version': 1},
+ 'TaskExecution': {'fields': {'completed_at': {'default': 0,
+                                               'kind': 'property',
+                                               'type': 'Integer'},
+                              'name': {'constraints': {'max_length': 256},
+                                       'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'},
+                              'result': {'constraints': {'max_length': 5000},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'},
+                              'started_at': {'default': 0,
+                                             'kind': 'property',
+                                             'type': 'Integer'},
+                              'status': {'constraints': {'max_length': 50},
+                                         'has_default': False,
+                                         'kind': 'property',
+                                         'type': 'String'}},
+                   'relationships': {'task': {'inverse': 'executions',
+                                              'kind': 'relationship',
+                                              'many': False,
+                                              'target': 'Task',
+                                              'type': 'ManyToOne'}},
+                   'version': 1},
+ 'TaskSchedule': {'fields': {'disabled': {'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'Boolean'},
+                             'last_run_at': {'has_default': False,
+                                             'kind': 'property',
+                                             'type': 'Integer'},
+                             'name': {'constraints': {'max_length': 256},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                             'repeat_every': {'has_default': False,
+                                              'kind': 'property',
+                                              'type': 'Integer'},
+                             'run_at': {'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'Integer'}},
+                  'relationships': {'task': {'inverse': 'schedules',
+                                             'kind': 'relationship',
+                                             'many': False,
+                                             'target': 'Task',
+                                             'type': 'ManyToOne'}},
+                  'version': 1},
+ 'TaskStep': {'fields': {'run_next_after': {'default': 0,
+                                            'kind': 'property',
+                                            'type': 'Integer'},
+                         'status': {'constraints': {'max_length': 32},
+                                    'default': 'pending',
+                                    'kind': 'property',
+                                    'type': 'String'},
+                         'timer_id': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'Integer'}},
+              'relationships': {'call': {'inverse': 'task_step',
+                                         'kind': 'relationship',
+                                         'many': False,
+                                         'target': 'Call',
+                                         'type': 'OneToOne'},
+                                'task': {'inverse': 'steps',
+                                         'kind': 'relationship',
+                                         'many': False,
+                                         'target': 'Task',
+                                         'type': 'ManyToOne'}},
+              'version': 1},
+ 'Token': {'fields': {'decimals': {'default': 8, 'kind': 'property', 'type': 'Integer'},
+                      'fee': {'default': 10, 'kind': 'property', 'type': 'Integer'},
+                      'indexer': {'constraints': {'max_length': 64},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                      'ledger': {'constraints': {'max_length': 64},
+                                 'has_default': False,
+                                 'kind': 'property',
+                                 'type': 'String'},
+                      'name': {'constraints': {'max_length': 64},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'}},
+           'relationships': {'balances': {'inverse': 'token',
+                                          'kind': 'relationship',
+                                          'many': True,
+                                          'target': 'WalletBalance',
+                                          'type': 'OneToMany'},
+                             'subaccounts': {'inverse': 'token',
+                                             'kind': 'relationship',
+                                             'many': True,
+                                             'target': 'WalletSubaccount',
+                                             'type': 'OneToMany'},
+                             'transfers': {'inverse': 'token',
+                                           'kind': 'relationship',
+                                           'many': True,
+                                           'target': 'WalletTransfer',
+                                           'type': 'OneToMany'}},
+           'version': 1},
+ 'Trade': {'fields': {'metadata': {'constraints': {'max_length': 256},
+                                   'has_default': False,
+                                   'kind': 'property',
+                                   'type': 'String'}},
+           'relationships': {'contract': {'inverse': 'trades',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'Contract',
+                                          'type': 'ManyToOne'},
+                             'transfer_1': {'inverse': 'trade',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'Transfer',
+                                            'type': 'OneToOne'},
+                             'transfer_2': {'inverse': 'trade',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'Transfer',
+                                            'type': 'OneToOne'}},
+           'version': 1},
+ 'Transfer': {'fields': {'amount': {'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'Integer'},
+                         'id': {'has_default': False,
+                                'kind': 'property',
+                                'type': 'String'},
+                         'instrument': {'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                         'principal_from': {'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'},
+                         'principal_to': {'has_default': False,
+                                          'kind': 'property',
+                                          'type': 'String'},
+                         'status': {'has_default': False,
+                                    'kind': 'property',
+                                    'type': 'String'},
+                         'subaccount': {'constraints': {'max_length': 64},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                         'tags': {'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                         'timestamp': {'has_default': False,
+                                       'kind': 'property',
+                                       'type': 'String'}},
+              'relationships': {'invoice': {'inverse': 'transfers',
+                                            'kind': 'relationship',
+                                            'many': False,
+                                            'target': 'Invoice',
+                                            'type': 'ManyToOne'},
+                                'ledger_entries': {'inverse': 'transfer',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'LedgerEntry',
+                                                   'type': 'OneToMany'}},
+              'version': 1},
+ 'Treasury': {'fields': {'balance': {'default': 0,
+                                     'kind': 'property',
+                                     'type': 'Integer'},
+                         'name': {'constraints': {'max_length': 256, 'min_length': 2},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'}},
+              'relationships': {'realm': {'inverse': 'treasury',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'Realm',
+                                          'type': 'OneToOne'}},
+              'version': 1},
+ 'TreasuryConfig': {'fields': {'anchor_month': {'default': 1,
+                                                'kind': 'property',
+                                                'type': 'Integer'},
+                               'auto_allocate': {'constraints': {'max_length': 8},
+                                                 'default': 'false',
+                                                 'kind': 'property',
+                                                 'type': 'String'},
+                               'epoch_length': {'constraints': {'max_length': 16},
+                                                'default': 'monthly',
+                                                'kind': 'property',
+                                                'type': 'String'},
+                               'epoch_minutes': {'default': 0,
+                                                 'kind': 'property',
+                                                 'type': 'Integer'},
+                               'id': {'constraints': {'max_length': 8},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                               'source_fund_code': {'constraints': {'max_length': 16},
+                                                    'default': 'ROOT',
+                                                    'kind': 'property',
+                                                    'type': 'String'}},
+                    'relationships': {},
+                    'version': 1},
+ 'User': {'fields': {'avatar': {'constraints': {'max_length': 512},
+                                'has_default': False,
+                                'kind': 'property',
+                                'type': 'String'},
+                     'home_quarter': {'constraints': {'max_length': 64},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'},
+                     'id': {'has_default': False, 'kind': 'property', 'type': 'String'},
+                     'nickname': {'constraints': {'max_length': 256},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                     'private_data': {'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'EncryptedString'}},
+          'relationships': {'appeals_filed': {'inverse': 'appellant',
+                                              'kind': 'relationship',
+                                              'many': True,
+                                              'target': 'Appeal',
+                                              'type': 'OneToMany'},
+                            'cases_as_defendant': {'inverse': 'defendant',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'Case',
+                                                   'type': 'OneToMany'},
+                            'cases_as_plaintiff': {'inverse': 'plaintiff',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'Case',
+                                                   'type': 'OneToMany'},
+                            'departments': {'inverse': 'members',
+                                            'kind': 'relationship',
+                                            'many': True,
+                                            'target': ['Department'],
+                                            'type': 'ManyToMany',
+                                            'unidirectional': True},
+                            'disputes_defendant': {'inverse': 'defendant',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'Dispute',
+                                                   'type': 'OneToMany'},
+                            'disputes_requested': {'inverse': 'requester',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'Dispute',
+                                                   'type': 'OneToMany'},
+                            'extensions': {'inverse': 'users',
+                                           'kind': 'relationship',
+                                           'many': True,
+                                           'target': ['Extension'],
+                                           'type': 'ManyToMany',
+                                           'unidirectional': True},
+                            'headed_departments': {'inverse': 'head',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'Department',
+                                                   'type': 'OneToMany'},
+                            'human': {'inverse': 'user',
+                                      'kind': 'relationship',
+                                      'many': False,
+                                      'target': 'Human',
+                                      'type': 'OneToOne'},
+                            'invoices': {'inverse': 'user',
+                                         'kind': 'relationship',
+                                         'many': True,
+                                         'target': 'Invoice',
+                                         'type': 'OneToMany'},
+                            'ledger_entries': {'inverse': 'user',
+                                               'kind': 'relationship',
+                                               'many': True,
+                                               'target': 'LedgerEntry',
+                                               'type': 'OneToMany'},
+                            'member': {'inverse': 'user',
+                                       'kind': 'relationship',
+                                       'many': False,
+                                       'target': 'Member',
+                                       'type': 'OneToOne'},
+                            'notifications': {'inverse': 'user',
+                                              'kind': 'relationship',
+                                              'many': True,
+                                              'target': 'Notification',
+                                              'type': 'OneToMany'},
+                            'payment_accounts': {'inverse': 'user',
+                                                 'kind': 'relationship',
+                                                 'many': True,
+                                                 'target': 'PaymentAccount',
+                                                 'type': 'OneToMany'},
+                            'penalties_received': {'inverse': 'target_user',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': 'Penalty',
+                                                   'type': 'OneToMany'},
+                            'permissions': {'inverse': 'users',
+                                            'kind': 'relationship',
+                                            'many': True,
+                                            'target': ['Permission'],
+                                            'type': 'ManyToMany'},
+                            'profiles': {'inverse': 'users',
+                                         'kind': 'relationship',
+                                         'many': True,
+                                         'target': ['UserProfile'],
+                                         'type': 'ManyToMany',
+                                         'unidirectional': True},
+                            'proposals': {'inverse': 'proposer',
+                                          'kind': 'relationship',
+                                          'many': True,
+                                          'target': 'Proposal',
+                                          'type': 'OneToMany'},
+                            'services': {'inverse': 'user',
+                                         'kind': 'relationship',
+                                         'many': True,
+                                         'target': 'Service',
+                                         'type': 'OneToMany'},
+                            'tax_records': {'inverse': 'user',
+                                            'kind': 'relationship',
+                                            'many': True,
+                                            'target': 'TaxRecord',
+                                            'type': 'OneToMany'},
+                            'votes': {'inverse': 'voter',
+                                      'kind': 'relationship',
+                                      'many': True,
+                                      'target': 'Vote',
+                                      'type': 'OneToMany'},
+                            'zones': {'inverse': 'user',
+                                      'kind': 'relationship',
+                                      'many': True,
+                                      'target': 'Zone',
+                                      'type': 'OneToMany'}},
+          'version': 1},
+ 'UserProfile': {'fields': {'allowed_to': {'has_default': False,
+                                           'kind': 'property',
+                                           'type': 'String'},
+                            'description': {'constraints': {'max_length': 256},
+                                            'has_default': False,
+                                            'kind': 'property',
+                                            'type': 'String'},
+                            'name': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'}},
+                 'relationships': {'extensions': {'inverse': 'profiles',
+                                                  'kind': 'relationship',
+                                                  'many': True,
+                                                  'target': ['Extension'],
+                                                  'type': 'ManyToMany'},
+                                   'permissions': {'inverse': 'profiles',
+                                                   'kind': 'relationship',
+                                                   'many': True,
+                                                   'target': ['Permission'],
+                                                   'type': 'ManyToMany'}},
+                 'version': 1},
+ 'Verdict': {'fields': {'decision': {'constraints': {'max_length': 256},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'id': {'constraints': {'max_length': 64},
+                               'has_default': False,
+                               'kind': 'property',
+                               'type': 'String'},
+                        'issued_date': {'constraints': {'max_length': 64},
+                                        'has_default': False,
+                                        'kind': 'property',
+                                        'type': 'String'},
+                        'metadata': {'constraints': {'max_length': 2048},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                        'reasoning': {'constraints': {'max_length': 8192},
+                                      'has_default': False,
+                                      'kind': 'property',
+                                      'type': 'String'}},
+             'relationships': {'appeal': {'inverse': 'original_verdict',
+                                          'kind': 'relationship',
+                                          'many': False,
+                                          'target': 'Appeal',
+                                          'type': 'OneToOne'},
+                               'case': {'inverse': 'verdict',
+                                        'kind': 'relationship',
+                                        'many': False,
+                                        'target': 'Case',
+                                        'type': 'OneToOne'},
+                               'issued_by': {'inverse': 'verdicts_issued',
+                                             'kind': 'relationship',
+                                             'many': False,
+                                             'target': 'Judge',
+                                             'type': 'ManyToOne'},
+                               'penalties': {'inverse': 'verdict',
+                                             'kind': 'relationship',
+                                             'many': True,
+                                             'target': 'Penalty',
+                                             'type': 'OneToMany'}},
+             'version': 1},
+ 'Vote': {'fields': {'metadata': {'constraints': {'max_length': 256},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                     'vote_choice': {'constraints': {'max_length': 16},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'}},
+          'relationships': {'proposal': {'inverse': 'votes',
+                                         'kind': 'relationship',
+                                         'many': False,
+                                         'target': 'Proposal',
+                                         'type': 'ManyToOne'},
+                            'voter': {'inverse': 'votes',
+                                      'kind': 'relationship',
+                                      'many': False,
+                                      'target': 'User',
+                                      'type': 'ManyToOne'}},
+          'version': 1},
+ 'Zone': {'fields': {'description': {'constraints': {'max_length': 1024},
+                                     'has_default': False,
+                                     'kind': 'property',
+                                     'type': 'String'},
+                     'h3_index': {'constraints': {'max_length': 32},
+                                  'has_default': False,
+                                  'kind': 'property',
+                                  'type': 'String'},
+                     'metadata': {'constraints': {'max_length': 2048},
+                                  'default': '{}',
+                                  'kind': 'property',
+                                  'type': 'String'},
+                     'name': {'constraints': {'max_length': 256},
+                              'has_default': False,
+                              'kind': 'property',
+                              'type': 'String'},
+                     'zone_type': {'constraints': {'max_length': 32},
+                                   'default': 'unassigned',
+                                   'kind': 'property',
+                                   'type': 'String'}},
+          'has_migrate': True,
+          'relationships': {'land': {'inverse': 'zones',
+                                     'kind': 'relationship',
+                                     'many': False,
+                                     'target': 'Land',
+                                     'type': 'ManyToOne'},
+                            'user': {'inverse': 'zones',
+                                     'kind': 'relationship',
+                                     'many': False,
+                                     'target': 'User',
+                                     'type': 'ManyToOne'}},
+          'version': 2}}
@@ -4,11 +4,23 @@ The schema describes every entity type the ORM stores so Cedar can validate
 policies and entity slices. It is derived from ``build_schema()`` output rather
 than committed as a hand-written file, so entity changes cannot silently drift
 from what the authorizer expects.
+
+Deriving it is deterministic but not cheap: ``build_schema`` once per class to
+find the ones it rejects, again over the rest, then the Cedar rendering — and
+``main._init_secure_orm`` needs the same ORM schema at import. So
+``scripts/sync_cedar_schema.py`` precomputes all of it into
+``core/cedar_schema_frozen.py``, and this module serves those constants while
+:func:`definitions_hash` of the live classes still matches the one they were
+built from. On a mismatch (an entity changed and nobody regenerated) it falls
+back to generating at runtime, so a stale file costs time, never correctness.
 """
 
-from typing import Optional
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
 
 _SCHEMA_CACHE: Optional[str] = None
+_ORM_CACHE: Optional[Tuple[List[type], Dict[str, Any]]] = None
+_FROZEN_CACHE: Optional[Any] = None
 
 NAMESPACE = "Realm"
 PRINCIPAL_TYPE = "User"
@@ -74,48 +86,148 @@ def _ensure_schema_deps():
                 del sys.modules[name]
 
 
-def generate_realm_cedar_schema() -> str:
-    """Build Cedar schema text from the current ggg entity definitions."""
-    global _SCHEMA_CACHE
-    if _SCHEMA_CACHE is not None:
-        return _SCHEMA_CACHE
-
+def entity_classes() -> List[type]:
+    """Every ``Entity`` subclass ggg exports, in ``ggg.__all__`` order."""
     _ensure_schema_deps()
     import ggg
     from ic_python_db import Entity
-    from ic_python_db.schema import build_schema
-    from ic_basilisk_toolkit.cedar_schema import generate_cedar_schema
 
-    candidates = [
+    return [
         getattr(ggg, name)
         for name in ggg.__all__
         if isinstance(getattr(ggg, name), type)
         and issubclass(getattr(ggg, name), Entity)
     ]
-    included = []
-    for cls in candidates:
+
+
+def definitions_hash(classes: List[type]) -> str:
+    """A fingerprint of everything the generated schemas are derived from.
+
+    Covers each class's name, version and declared fields (type, relation
+    targets and inverse, defaults) plus the generator settings above. Much
+    cheaper than ``build_schema``; validator constraints are not included,
+    which is what ``sync_cedar_schema.py --check`` in CI is for.
+    """
+    from ic_python_db.properties import Property, Relation
+
+    h = hashlib.sha256()
+    h.update(repr((NAMESPACE, PRINCIPAL_TYPE, MEMBERSHIPS, ACTIONS, CONTEXT)).encode())
+    for cls in classes:
+        h.update(f"|{cls.__name__}:{cls.__version__}".encode())
+        for base in reversed(cls.__mro__):
+            for attr, value in base.__dict__.items():
+                if attr.startswith("_"):
+                    continue
+                if isinstance(value, Relation):
+                    h.update(
+                        f";{attr}={type(value).__name__}"
+                        f"{value.entity_types!r}{value.reverse_name!r}"
+                        f"{getattr(value, 'unidirectional', False)!r}".encode()
+                    )
+                elif isinstance(value, Property):
+                    h.update(
+                        f";{attr}={type(value).__name__}{value.default!r}".encode()
+                    )
+    return h.hexdigest()
+
+
+def partition(classes: List[type]) -> Tuple[List[type], Dict[str, str]]:
+    """Split *classes* into those ``build_schema`` accepts and those it rejects.
+
+    Rejected classes map to the reason, and are logged: they are left out of
+    the Cedar schema and the REPL stubs rather than taking either down.
+    """
+    from ic_python_db.schema import build_schema
+
+    included, excluded = [], {}
+    for cls in classes:
         try:
             build_schema({cls.__name__: cls})
         except Exception as exc:
-            _log_warning(
-                f"cedar_schema: excluding {cls.__name__} from schema: {exc}"
-            )
+            _log_warning(f"cedar_schema: excluding {cls.__name__} from schema: {exc}")
+            excluded[cls.__name__] = str(exc)
             continue
         included.append(cls)
+    return included, excluded
+
+
+def render_cedar_schema(orm_schema: Dict[str, Any]) -> str:
+    from ic_basilisk_toolkit.cedar_schema import generate_cedar_schema
 
-    schema_dict = build_schema({cls.__name__: cls for cls in included})
     text, _report = generate_cedar_schema(
-        schema_dict,
+        orm_schema,
         namespace=NAMESPACE,
         principal_type=PRINCIPAL_TYPE,
         memberships=MEMBERSHIPS,
         actions=ACTIONS,
         context=CONTEXT,
     )
-    _SCHEMA_CACHE = text
     return text
 
 
-def reset_for_tests() -> None:
+def _frozen():
+    """The precomputed module if it matches the live definitions, else None."""
+    global _FROZEN_CACHE
+    if _FROZEN_CACHE is None:
+        _FROZEN_CACHE = False
+        try:
+            from core import cedar_schema_frozen as frozen
+        except ImportError:
+            frozen = None
+        if frozen is not None:
+            if frozen.SOURCE_HASH == definitions_hash(entity_classes()):
+                _FROZEN_CACHE = frozen
+            else:
+                _log_warning(
+                    "cedar_schema: entity definitions changed since "
+                    "cedar_schema_frozen.py was generated; generating at "
+                    "runtime (run scripts/sync_cedar_schema.py --write)"
+                )
+    return _FROZEN_CACHE or None
+
+
+def orm_schema() -> Tuple[List[type], Dict[str, Any]]:
+    """``(included classes, build_schema output)`` for the ggg entities."""
+    global _ORM_CACHE
+    if _ORM_CACHE is not None:
+        return _ORM_CACHE
+
+    frozen = _frozen()
+    if frozen is not None:
+        import ggg
+
+        included = [getattr(ggg, name) for name in frozen.INCLUDED]
+        _ORM_CACHE = (included, frozen.ORM_SCHEMA)
+        return _ORM_CACHE
+
+    from ic_python_db.schema import build_schema
+
+    included, _excluded = partition(entity_classes())
+    _ORM_CACHE = (included, build_schema({cls.__name__: cls for cls in included}))
+    return _ORM_CACHE
+
+
+def schema_source() -> str:
+    """``"frozen"`` when the precomputed constants are in use, else ``"runtime"``."""
+    return "frozen" if _frozen() is not None else "runtime"
+
+
+def generate_realm_cedar_schema() -> str:
+    """Build Cedar schema text from the current ggg entity definitions."""
     global _SCHEMA_CACHE
+    if _SCHEMA_CACHE is not None:
+        return _SCHEMA_CACHE
+
+    frozen = _frozen()
+    if frozen is not None:
+        _SCHEMA_CACHE = frozen.CEDAR_SCHEMA
+    else:
+        _SCHEMA_CACHE = render_cedar_schema(orm_schema()[1])
+    return _SCHEMA_CACHE
+
+
+def reset_for_tests() -> None:
+    global _SCHEMA_CACHE, _ORM_CACHE, _FROZEN_CACHE
     _SCHEMA_CACHE = None
+    _ORM_CACHE = None
+    _FROZEN_CACHE = None
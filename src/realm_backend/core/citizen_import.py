@@ -12,10 +12,23 @@ imported record to the freshly created User (nickname, private_data, home
 quarter preference) instead of leaving a blank profile.
 
 Imports are chunked by the caller (``MAX_BATCH`` per call) to stay well below
-the IC per-message instruction limit.
+the IC per-message instruction limit. A chunk may name the import ``job`` and
+the ``offset`` of its first record in the caller's file; the realm remembers
+how far each job got, so a resent chunk is skipped and an interrupted import
+resumes from :func:`import_status`'s ``job.next_offset``.
+
+Skipping already-imported citizens used to scan every ``RegistrationCode``
+and parse its metadata, which made a census import quadratic. The citizen
+index below keeps, per external citizen id, its live (unrevoked) codes, plus
+running pending/claimed/revoked tallies for :func:`import_status`.
+``RegistrationCode`` saves and deletes keep it current through
+``ggg.projection``; codes written before it existed are backfilled by a timer
+chain started in ``initialize()``, and until that is done
+:func:`index_ready` is False and the scan is used.
 """
 
 import json
+from typing import Optional
 
 from ic_python_logging import get_logger
 
@@ -27,29 +40,189 @@ MAX_BATCH = 200
 # Citizen invites are long-lived: a census migration can take months.
 DEFAULT_EXPIRES_HOURS = 24 * 365
 
+INDEX_TYPE = "_CitizenCode"
+INDEX_FLAG = "ix_backfill:RegistrationCode:citizen:v1"
+INDEX_FIELD = "citizen"
+TALLY_KEY = "citizen_import_tally"
+JOB_KEY = "citizen_import_job"
+
+STATES = ("pending", "claimed", "revoked")
+
+
+def _db():
+    from ic_python_db import Database
+
+    return Database.get_instance()
+
+
+def _import_meta(code) -> Optional[dict]:
+    """Parsed metadata of a citizen-import code, or None for any other code."""
+    meta = code.metadata or ""
+    if CITIZEN_IMPORT_KIND not in meta:
+        return None
+    try:
+        parsed = json.loads(meta)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(parsed, dict) and parsed.get("kind") == CITIZEN_IMPORT_KIND:
+        return parsed
+    return None
+
 
 def _citizen_codes():
     from ggg import RegistrationCode
 
     out = []
     for c in RegistrationCode.instances():
-        meta = c.metadata or ""
-        if not meta:
-            continue
-        try:
-            parsed = json.loads(meta)
-        except (json.JSONDecodeError, TypeError):
-            continue
-        if isinstance(parsed, dict) and parsed.get("kind") == CITIZEN_IMPORT_KIND:
+        parsed = _import_meta(c)
+        if parsed is not None:
             out.append((c, parsed))
     return out
 
 
+# ---------------------------------------------------------------------------
+# Citizen index
+# ---------------------------------------------------------------------------
+
+
+def index_ready() -> bool:
+    """True once existing codes have been backfilled into the index."""
+    try:
+        return bool(_db().load("_system", INDEX_FLAG))
+    except Exception:
+        return False
+
+
+def _state(code) -> str:
+    # Same precedence as the scan in ``import_status`` always used.
+    if code.uses_count and code.uses_count > 0:
+        return "claimed"
+    if code.revoked == 1:
+        return "revoked"
+    return "pending"
+
+
+def _entry(code) -> Optional[str]:
+    """``state:live:citizen_id`` for a citizen-import code, else None."""
+    if _import_meta(code) is None:
+        return None
+    live = "0" if code.revoked == 1 else "1"
+    return f"{_state(code)}:{live}:{(code.user_id or '').strip()}"
+
+
+def _tally(db, state: str, delta: int) -> None:
+    tally = db.load("_system", TALLY_KEY) or {}
+    tally[state] = max(0, int(tally.get(state, 0)) + delta)
+    db.save("_system", TALLY_KEY, tally)
+
+
+def _index_add(entry: str, code_id: str) -> None:
+    db = _db()
+    state, live, citizen_id = entry.split(":", 2)
+    if live == "1":
+        db.field_index_add(INDEX_TYPE, "citizen", citizen_id, code_id)
+    db.field_index_add(INDEX_TYPE, "code", code_id, entry)
+    _tally(db, state, 1)
+
+
+def _index_remove(entry: str, code_id: str) -> None:
+    db = _db()
+    state, live, citizen_id = entry.split(":", 2)
+    if live == "1":
+        db.field_index_remove(INDEX_TYPE, "citizen", citizen_id, code_id)
+    db.field_index_remove(INDEX_TYPE, "code", code_id, entry)
+    _tally(db, state, -1)
+
+
+def sync_code(code) -> bool:
+    """Bring *code*'s index entry in line with its state.
+
+    Returns True if anything was rewritten. Idempotent, so the backfill and
+    the save hook may both reach the same code.
+    """
+    code_id = str(code._id)
+    wanted = _entry(code)
+    indexed = _db().field_index_get(INDEX_TYPE, "code", code_id)
+    if indexed == ([wanted] if wanted else []):
+        return False
+    for entry in indexed:
+        _index_remove(entry, code_id)
+    if wanted:
+        _index_add(wanted, code_id)
+    return True
+
+
+def forget_code(code) -> None:
+    code_id = str(code._id)
+    for entry in _db().field_index_get(INDEX_TYPE, "code", code_id):
+        _index_remove(entry, code_id)
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("RegistrationCode",)
+
+
+def entity_changed(entity) -> None:
+    """Save hook: reindex a registration code. Never raises."""
+    if type(entity).__name__ != "RegistrationCode":
+        return
+    try:
+        sync_code(entity)
+    except Exception as e:
+        logger.warning(f"citizen index: could not sync code {entity._id}: {e}")
+
+
+def entity_removed(entity) -> None:
+    """Delete hook: unindex a registration code. Never raises."""
+    if type(entity).__name__ != "RegistrationCode":
+        return
+    try:
+        forget_code(entity)
+    except Exception as e:
+        logger.warning(f"citizen index: could not drop code {entity._id}: {e}")
+
+
+def rebuild_index(field=INDEX_FIELD, from_id=1, batch=50):
+    """Index one batch of existing codes for ``main``'s backfill timer."""
+    from ggg import RegistrationCode
+
+    from core.index_backfill import rebuild_batch
+
+    return rebuild_batch(RegistrationCode, sync_code, from_id, batch)
+
+
+def _live_citizen_ids() -> set:
+    """Fallback before the backfill: every citizen id with a live code."""
+    return {c.user_id for c, _meta in _citizen_codes() if c.revoked != 1}
+
+
+# ---------------------------------------------------------------------------
+# Import jobs
+# ---------------------------------------------------------------------------
+
+
+def _load_job() -> Optional[dict]:
+    try:
+        job = _db().load("_system", JOB_KEY)
+    except Exception:
+        return None
+    return job if isinstance(job, dict) else None
+
+
+def _save_job(job: dict) -> None:
+    try:
+        _db().save("_system", JOB_KEY, job)
+    except Exception as e:
+        logger.warning(f"citizen import: could not record progress: {e}")
+
+
 def import_citizens(
     records: list,
     created_by: str = "admin",
     frontend_url: str = "",
     expires_in_hours: int = DEFAULT_EXPIRES_HOURS,
+    job: str = "",
+    offset: Optional[int] = None,
 ) -> dict:
     """Create one single-use invite code per imported citizen.
 
@@ -57,8 +230,14 @@ def import_citizens(
     "email": str, "quarter": str, "extra": {...}}``. Re-importing an id that
     already has a live citizen code is skipped (idempotent re-runs).
 
+    With *job*, the chunk is one slice of a larger import starting at
+    *offset* (default: where the job left off). Records the job has already
+    applied are skipped without being looked at; a chunk that would leave a
+    gap is refused.
+
     Returns a report: created/skipped/errors plus the personal invite for each
-    created citizen (code + URL) so the caller can distribute them.
+    created citizen (code + URL) so the caller can distribute them, and with
+    *job* the job's running totals and ``next_offset``.
     """
     from ggg import RegistrationCode
 
@@ -70,15 +249,39 @@ def import_citizens(
             "error": f"Too many records ({len(records)}). Import in batches of {MAX_BATCH}.",
         }
 
-    existing_ids = {
-        c.user_id for c, _meta in _citizen_codes() if c.revoked != 1
-    }
+    progress = None
+    first = 0
+    if job:
+        progress = _load_job()
+        if not progress or progress.get("job") != job:
+            progress = {"job": job, "next_offset": 0, "created": 0,
+                        "skipped": 0, "errors": 0}
+        start = progress["next_offset"] if offset is None else int(offset)
+        if start > progress["next_offset"]:
+            return {
+                "success": False,
+                "error": f"Chunk starts at {start}; job '{job}' is at "
+                         f"{progress['next_offset']}.",
+            }
+        first = progress["next_offset"] - start
+
+    indexed = index_ready()
+    existing_ids = set() if indexed else _live_citizen_ids()
+
+    def _exists(cid):
+        if cid in existing_ids:
+            return True
+        return indexed and bool(
+            _db().field_index_get(INDEX_TYPE, "citizen", cid)
+        )
 
     created = []
     skipped = []
     errors = []
 
     for i, rec in enumerate(records):
+        if i < first:
+            continue
         if not isinstance(rec, dict):
             errors.append({"index": i, "error": "record is not an object"})
             continue
@@ -87,7 +290,7 @@ def import_citizens(
         if not cid:
             errors.append({"index": i, "error": "missing required field 'id'"})
             continue
-        if cid in existing_ids:
+        if _exists(cid):
             skipped.append(cid)
             continue
 
@@ -129,17 +332,22 @@ def import_citizens(
         f"Citizen import by {created_by}: {len(created)} created, "
         f"{len(skipped)} skipped, {len(errors)} errors"
     )
-    return {
-        "success": True,
-        "data": {
-            "created": created,
-            "created_count": len(created),
-            "skipped": skipped,
-            "skipped_count": len(skipped),
-            "errors": errors,
-            "error_count": len(errors),
-        },
+    data = {
+        "created": created,
+        "created_count": len(created),
+        "skipped": skipped,
+        "skipped_count": len(skipped),
+        "errors": errors,
+        "error_count": len(errors),
     }
+    if progress is not None:
+        progress["next_offset"] += max(0, len(records) - first)
+        progress["created"] += len(created)
+        progress["skipped"] += len(skipped)
+        progress["errors"] += len(errors)
+        _save_job(progress)
+        data["job"] = progress
+    return {"success": True, "data": data}
 
 
 def bind_citizen(user, consume_data: dict) -> str:
@@ -182,19 +390,25 @@ def bind_citizen(user, consume_data: dict) -> str:
 
 
 def import_status() -> dict:
-    """Progress report: how many imported citizens have claimed their record."""
-    total = 0
-    claimed = 0
-    revoked = 0
-    for c, _meta in _citizen_codes():
-        total += 1
-        if c.uses_count and c.uses_count > 0:
-            claimed += 1
-        elif c.revoked == 1:
-            revoked += 1
-    return {
-        "total": total,
-        "claimed": claimed,
-        "revoked": revoked,
-        "pending": total - claimed - revoked,
+    """Progress report: how many imported citizens have claimed their record.
+
+    Read from the index tallies once it is ready; the last import job, if
+    any, is reported under ``job``.
+    """
+    if index_ready():
+        tally = _db().load("_system", TALLY_KEY) or {}
+        counts = {state: int(tally.get(state, 0)) for state in STATES}
+    else:
+        counts = dict.fromkeys(STATES, 0)
+        for c, _meta in _citizen_codes():
+            counts[_state(c)] += 1
+    status = {
+        "total": sum(counts.values()),
+        "claimed": counts["claimed"],
+        "revoked": counts["revoked"],
+        "pending": counts["pending"],
     }
+    job = _load_job()
+    if job:
+        status["job"] = job
+    return status
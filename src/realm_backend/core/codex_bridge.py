@@ -63,6 +63,7 @@ from core.bridge_core import (
     to_plain,
 )
 from core.call_origin import codex_call, dispatch
+from core.perf import profiled
 
 # ---------------------------------------------------------------------------
 # Verb registry — the GGG-public operations a codex may invoke
@@ -612,6 +613,7 @@ def _resolve_refs(value: Any, results: List[Any]) -> Any:
     return value
 
 
+@profiled("codex_bridge.apply_effects")
 def apply_effects(
     context_id: str,
     capabilities: List[str],
@@ -112,24 +112,17 @@ def _project_position(pos) -> dict:
 
 
 def _members_by_department() -> dict:
-    """One user scan, since the reverse index was removed in issue #242."""
+    """Members of every department, from the reverse membership index."""
     by_department: dict = {}
     try:
-        from core.membership import iter_users
-
-        for user in iter_users():
-            principal = getattr(user, "id", None)
-            if not principal:
-                continue
-            try:
-                memberships = list(user.departments)
-            except Exception:
-                continue
-            for dept in memberships:
-                by_department.setdefault(dept.name, []).append({
-                    "principal": principal,
-                    "nickname": user.nickname or "",
-                })
+        from core.membership import KIND_DEPARTMENT, members_by_name
+
+        for name, users in members_by_name(KIND_DEPARTMENT).items():
+            by_department[name] = [
+                {"principal": user.id, "nickname": user.nickname or ""}
+                for user in users
+                if getattr(user, "id", None)
+            ]
     except Exception:
         pass
     return by_department
@@ -321,8 +314,13 @@ def v_regenerate_invite(caller="", department="", profile="",
 
 
 def v_import_citizens(caller="", citizens=None, frontend_url="",
-                      expires_in_hours=None, **kwargs) -> dict:
-    """Bulk-import citizens, minting one single-use personal invite each."""
+                      expires_in_hours=None, job="", offset=None,
+                      **kwargs) -> dict:
+    """Bulk-import citizens, minting one single-use personal invite each.
+
+    ``job``/``offset`` name a chunk of a larger import so it can be resumed
+    (see ``core.citizen_import.import_citizens``).
+    """
     _require(caller, IMPORT_OPERATION, "console.import_citizens")
     from core.citizen_import import DEFAULT_EXPIRES_HOURS
     from core.citizen_import import import_citizens as run_import
@@ -339,6 +337,8 @@ def v_import_citizens(caller="", citizens=None, frontend_url="",
             expires_in_hours
             if expires_in_hours is not None else DEFAULT_EXPIRES_HOURS
         ),
+        job=str(job or ""),
+        offset=None if offset is None else int(offset),
     )
 
 
@@ -152,6 +152,9 @@ def merge_quarter_directory(
       monotonic-ish; we take the freshest/largest count we've seen) and a
       non-empty peer ``name``/``status`` fills gaps.
     * Entries without a ``canister_id`` are ignored (coarse data only).
+    * ``peer_quarters`` may be a delta (``get_quarter_directory_since``):
+      every rule is per entry and nothing is ever removed, so merging only
+      the changed entries gives the same result as merging the full list.
     * When ``peer_self`` is present (issue #295), codex + sync-ballot fields
       from the responding realm are merged onto the entry for
       ``peer_canister_id``. Old peers omit ``self``; new capitals tolerate
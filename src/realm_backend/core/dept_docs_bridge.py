@@ -346,14 +346,18 @@ def _load_job(job_id: Any):
 
 
 def _pending_job_exists(department: str, principal: str) -> bool:
-    for job in _reshare_job_class().instances():
-        if (
-            getattr(job, "status", "") == "pending"
-            and getattr(job, "department", "") == department
-            and getattr(job, "new_member_principal", "") == principal
-        ):
-            return True
-    return False
+    from core import extension_bridge
+
+    return bool(
+        extension_bridge.rows_where(
+            _reshare_job_class(),
+            {
+                "new_member_principal": principal,
+                "department": department,
+                "status": "pending",
+            },
+        )
+    )
 
 
 def _notify_reshare_managers(dept, department_name: str, new_member_principal: str) -> None:
@@ -0,0 +1,345 @@
+"""Maintained realm directory projection for entity pickers.
+
+``directory_list`` used to walk every ``User`` (dereferencing ``human`` for a
+display name) and every ``Department`` (dereferencing ``head``) on each call.
+This keeps the answer instead: one compact row per user or department,
+
+    [kind, principal, label, id]
+
+updated as those entities are saved or deleted (``User``, ``Human`` and
+``Department`` call :func:`entity_changed` / :func:`entity_removed`), so a read
+costs only what it returns.
+
+The projection lives in heap memory. It is rebuilt after init/upgrade by a
+timer chain of small batches (:func:`schedule_rebuild`); until that finishes
+:func:`ready` is False and callers fall back to the scan. Every change bumps a
+generation and is logged, so a client holding generation *g* can ask for just
+what changed since (:func:`delta`). A rebuild starts a new *epoch*; a client
+on an old epoch, or too far behind for the log, is told to reload.
+
+Search matches a prefix of the label, of any word in it, or of the principal,
+case-insensitively. Terms are bucketed by their first two characters so a
+lookup touches one bucket rather than the whole directory.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+from ic_python_logging import get_logger
+
+logger = get_logger("core.directory")
+
+KIND_USER = "user"
+KIND_DEPARTMENT = "department"
+
+# Changes remembered for ``delta``. A client further behind than this reloads.
+LOG_SIZE = 10_000
+DEFAULT_LIMIT = 200
+MAX_LIMIT = 1000
+REBUILD_BATCH = 200
+
+_rows: Dict[str, list] = {}
+_buckets: Dict[str, Set[str]] = {}
+_log: deque = deque(maxlen=LOG_SIZE)
+_generation = 0
+_epoch = 0
+_ready = False
+
+
+def ready() -> bool:
+    return _ready
+
+
+def generation() -> int:
+    return _generation
+
+
+def epoch() -> int:
+    return _epoch
+
+
+# ── Rows ────────────────────────────────────────────────────────────────────
+
+
+def _key(kind: str, entity_id) -> str:
+    return f"{kind[0]}{entity_id}"
+
+
+def user_row(user) -> Optional[list]:
+    """The directory row for *user*, or None when it has no principal."""
+    principal = getattr(user, "id", None)
+    if not principal:
+        return None
+    human = getattr(user, "human", None)
+    human_name = ""
+    if human is not None:
+        human_name = (
+            getattr(human, "name", None) or getattr(human, "full_name", None) or ""
+        )
+    label = human_name or (getattr(user, "nickname", "") or "") or str(principal)
+    return [KIND_USER, str(principal), label, str(user._id)]
+
+
+def department_row(dept) -> Optional[list]:
+    """The directory row for *dept*, or None when it has no name."""
+    name = getattr(dept, "name", "") or ""
+    if not name:
+        return None
+    head = getattr(dept, "head", None)
+    head_principal = str(getattr(head, "id", "")) if head is not None else ""
+    return [KIND_DEPARTMENT, head_principal, name, str(getattr(dept, "_id", "") or "")]
+
+
+def _terms(row: list) -> Set[str]:
+    label = row[2].lower()
+    terms = {label, row[1].lower()}
+    terms.update(label.split())
+    terms.discard("")
+    return terms
+
+
+def _index(key: str, row: list, add: bool) -> None:
+    for term in _terms(row):
+        bucket = term[:2]
+        if add:
+            _buckets.setdefault(bucket, set()).add(key)
+        else:
+            keys = _buckets.get(bucket)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del _buckets[bucket]
+
+
+def _changed(key: str) -> None:
+    global _generation
+    _generation += 1
+    _log.append((_generation, key))
+
+
+def _put(key: str, row: Optional[list]) -> None:
+    old = _rows.get(key)
+    if row == old:
+        return
+    if old is not None:
+        _index(key, old, add=False)
+    if row is None:
+        del _rows[key]
+    else:
+        _rows[key] = row
+        _index(key, row, add=True)
+    _changed(key)
+
+
+# ── Maintenance (called from the ggg entities) ─────────────────────────────
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("User", "Department", "Human")
+
+
+def entity_changed(entity) -> None:
+    """Refresh the row(s) *entity* contributes to. Never raises."""
+    try:
+        name = type(entity).__name__
+        if name == "User":
+            _put(_key(KIND_USER, entity._id), user_row(entity))
+        elif name == "Department":
+            _put(_key(KIND_DEPARTMENT, entity._id), department_row(entity))
+        elif name == "Human":
+            user = getattr(entity, "user", None)
+            if user is not None:
+                _put(_key(KIND_USER, user._id), user_row(user))
+    except Exception as e:
+        logger.warning(f"directory: could not refresh {entity!r}: {e}")
+
+
+def entity_removed(entity) -> None:
+    """Drop *entity*'s row after it was deleted. Never raises."""
+    try:
+        name = type(entity).__name__
+        if name == "User":
+            _put(_key(KIND_USER, entity._id), None)
+        elif name == "Department":
+            _put(_key(KIND_DEPARTMENT, entity._id), None)
+        elif name == "Human":
+            user = getattr(entity, "user", None)
+            if user is not None:
+                _put(_key(KIND_USER, user._id), user_row(user))
+    except Exception as e:
+        logger.warning(f"directory: could not drop {entity!r}: {e}")
+
+
+# ── Rebuild ─────────────────────────────────────────────────────────────────
+
+
+def reset() -> None:
+    """Forget everything and start a new epoch (not ready until rebuilt)."""
+    global _generation, _epoch, _ready
+    _rows.clear()
+    _buckets.clear()
+    _log.clear()
+    _generation = 0
+    _ready = False
+    now = 0
+    try:
+        from _cdk import ic
+
+        now = int(ic.time())
+    except Exception:
+        pass
+    _epoch = max(_epoch + 1, now)
+
+
+def rebuild_batch(kind: str, from_id: int = 1, batch: int = REBUILD_BATCH):
+    """Project one batch of users or departments; next cursor, or ``None``."""
+    from ggg import Department, User
+
+    from core import index_backfill
+
+    cls, row_of = (User, user_row) if kind == KIND_USER else (Department, department_row)
+    return index_backfill.rebuild_batch(
+        cls, lambda entity: _put(_key(kind, entity._id), row_of(entity)),
+        from_id, batch,
+    )
+
+
+def rebuild() -> None:
+    """Rebuild synchronously. For tests and small realms."""
+    global _ready
+    reset()
+    for kind in (KIND_USER, KIND_DEPARTMENT):
+        cursor = 1
+        while cursor is not None:
+            cursor = rebuild_batch(kind, cursor)
+    _ready = True
+
+
+def schedule_rebuild(batch: int = REBUILD_BATCH) -> None:
+    """Rebuild as a timer chain, one batch per message.
+
+    Timers must be set in init/post_upgrade/update context, which is why
+    ``initialize()`` calls this. Saves that land mid-rebuild are applied as
+    usual; the batch that reaches them later finds the row already current.
+    """
+    from _cdk import ic
+
+    reset()
+    state = {"kind": 0, "cursor": 1}
+    kinds = (KIND_USER, KIND_DEPARTMENT)
+
+    def _step():
+        global _ready
+        try:
+            cursor = rebuild_batch(kinds[state["kind"]], state["cursor"], batch)
+            if cursor is None:
+                state["kind"] += 1
+                state["cursor"] = 1
+                if state["kind"] >= len(kinds):
+                    _ready = True
+                    logger.info(f"directory: projection ready ({len(_rows)} rows)")
+                    return
+            else:
+                state["cursor"] = cursor
+            ic.set_timer(0, _step)
+        except Exception as e:
+            logger.error(f"directory: rebuild step failed: {e}")
+
+    ic.set_timer(0, _step)
+
+
+# ── Reads ───────────────────────────────────────────────────────────────────
+
+
+def _matching(prefix: str) -> List[str]:
+    if len(prefix) >= 2:
+        candidates = _buckets.get(prefix[:2], ())
+    else:
+        candidates = set()
+        for bucket, keys in _buckets.items():
+            if bucket.startswith(prefix):
+                candidates |= keys
+    return [
+        key for key in candidates
+        if any(term.startswith(prefix) for term in _terms(_rows[key]))
+    ]
+
+
+def search(prefix: str = "", offset: int = 0, limit: int = DEFAULT_LIMIT,
+           kind: str = "") -> dict:
+    """One page of rows, optionally filtered by prefix and kind.
+
+    With a prefix, rows are ordered by label; without, in projection order.
+    ``next_offset`` is None on the last page.
+    """
+    offset = max(0, int(offset or 0))
+    limit = max(1, min(int(limit or DEFAULT_LIMIT), MAX_LIMIT))
+    prefix = (prefix or "").strip().lower()
+    if prefix:
+        keys = sorted(_matching(prefix), key=lambda k: (_rows[k][2].lower(), k))
+        rows = [_rows[k] for k in keys]
+    else:
+        rows = list(_rows.values())
+    if kind:
+        rows = [row for row in rows if row[0] == kind]
+    page = rows[offset:offset + limit]
+    end = offset + len(page)
+    return {
+        "epoch": _epoch,
+        "generation": _generation,
+        "total": len(rows),
+        "rows": page,
+        "next_offset": end if end < len(rows) else None,
+    }
+
+
+def delta(since_generation: int, since_epoch: int) -> dict:
+    """Rows changed after *since_generation* within *since_epoch*.
+
+    ``reset`` is True when the log cannot answer (other epoch, or changes
+    already rotated out); the client then reloads through :func:`search`.
+    Deleted rows come back as ``[kind, id]`` pairs in ``removed``.
+    """
+    since = int(since_generation or 0)
+    out = {"epoch": _epoch, "generation": _generation, "reset": False,
+           "rows": [], "removed": []}
+    oldest = _log[0][0] if _log else _generation + 1
+    if (
+        not _ready
+        or int(since_epoch or 0) != _epoch
+        or since > _generation
+        or since < oldest - 1
+    ):
+        out["reset"] = True
+        return out
+
+    keys = []
+    seen = set()
+    for gen, key in reversed(_log):
+        if gen <= since:
+            break
+        if key not in seen:
+            seen.add(key)
+            keys.append(key)
+    for key in reversed(keys):
+        row = _rows.get(key)
+        if row is not None:
+            out["rows"].append(row)
+        else:
+            kind = KIND_USER if key[0] == KIND_USER[0] else KIND_DEPARTMENT
+            out["removed"].append([kind, key[1:]])
+    return out
+
+
+def entries() -> List[dict]:
+    """The legacy ``directory_list`` shape: users first, then departments."""
+    out = []
+    for kind in (KIND_USER, KIND_DEPARTMENT):
+        for row in _rows.values():
+            if row[0] != kind:
+                continue
+            entry = {"kind": kind, "principal": row[1], "label": row[2]}
+            if kind == KIND_DEPARTMENT:
+                entry["id"] = row[3]
+            out.append(entry)
+    return out
@@ -0,0 +1,91 @@
+"""Paged realm export — one entity type, one id range per call.
+
+The old export asked ``admin_dashboard.export_data`` for the whole realm in a
+single response, which stops working once the serialized realm outgrows the
+reply limit. Here the caller first lists the registered types, then walks each
+one by ``_id`` cursor. A page is capped both by record count and by serialized
+size, so a handful of very large rows cannot push a reply over the limit.
+
+Consumers: ``export_entity_types`` / ``export_entities`` queries, CLI
+``realms db export``. Records are ``Entity.serialize()`` output, which is what
+``realms db import`` sends back.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+from ic_python_db import Database
+from ic_python_logging import get_logger
+
+logger = get_logger("core.entity_export")
+
+MAX_PAGE_RECORDS = 500
+# Serialized budget per page. Query replies are capped at a few MB; this
+# leaves room for Candid framing and the JSON-in-text escaping.
+MAX_PAGE_BYTES = 1_000_000
+
+
+def _entity_class(type_name: str, db: Optional[Database] = None):
+    db = db or Database.get_instance()
+    cls = db._entity_types.get(type_name)
+    if cls is None:
+        raise ValueError(f"Unknown entity type '{type_name}'")
+    return cls
+
+
+def export_types(db: Optional[Database] = None) -> List[Dict[str, Any]]:
+    """Every registered entity type with its row count and id high-water mark."""
+    db = db or Database.get_instance()
+    types = []
+    for type_name in sorted(db._entity_types):
+        cls = db._entity_types[type_name]
+        try:
+            types.append({
+                "type": type_name,
+                "count": cls.count(),
+                "max_id": cls.max_id(),
+            })
+        except Exception as e:
+            logger.warning(f"Skipping {type_name} in export listing: {e}")
+    return types
+
+
+def export_page(
+    type_name: str,
+    from_id: int = 1,
+    limit: int = MAX_PAGE_RECORDS,
+    db: Optional[Database] = None,
+) -> Dict[str, Any]:
+    """One page of serialized ``type_name`` rows starting at ``from_id``.
+
+    ``next_from_id`` is ``None`` once the type is exhausted. At least one record
+    is returned whenever any remain, however large, so the walk always advances.
+    """
+    cls = _entity_class(type_name, db)
+    from_id = max(1, int(from_id or 1))
+    limit = max(1, min(int(limit or MAX_PAGE_RECORDS), MAX_PAGE_RECORDS))
+    max_id = cls.max_id()
+
+    rows = cls.load_some(from_id=from_id, count=limit) if from_id <= max_id else []
+    records: List[dict] = []
+    size = 0
+    next_from_id: Optional[int] = None
+    for entity in rows:
+        record = entity.serialize()
+        encoded = len(json.dumps(record))
+        if records and size + encoded > MAX_PAGE_BYTES:
+            next_from_id = int(entity._id)
+            break
+        records.append(record)
+        size += encoded
+        last_id = int(entity._id)
+        next_from_id = last_id + 1 if last_id < max_id else None
+
+    return {
+        "type": type_name,
+        "records": records,
+        "next_from_id": next_from_id,
+        "max_id": max_id,
+    }
@@ -5,7 +5,7 @@ Import records are sorted so referents exist before referees:
   2. Record-level ordering when a batch references other records in the same import
      (e.g. Department.parent, Vote.proposal).
 
-Consumers: import_export ``import_data``, CLI ``realms import``.
+Consumers: import_export ``import_data``, CLI ``realms db import``.
 """
 
 from __future__ import annotations
@@ -316,12 +316,55 @@ def chunk_records(records: List[dict], batch_size: int = 200) -> List[List[dict]
     return [records[i : i + batch_size] for i in range(0, len(records), batch_size)]
 
 
+def batch_waves(
+    batches: List[List[dict]],
+    db: Optional[Database] = None,
+) -> List[List[int]]:
+    """Group batch indexes into waves that may be sent concurrently.
+
+    A batch lands in the wave after the latest batch holding a record it
+    references, so every wave only depends on earlier waves. Batches come
+    from :func:`topological_sort_records`, so references point backwards
+    except inside a cycle, where they are ignored as the serial order would.
+    """
+    db = db or Database.get_instance()
+    classes = _entity_classes(db)
+    home: Dict[RecordKey, int] = {}
+    for b, batch in enumerate(batches):
+        for record in batch:
+            key = _record_key(record) if isinstance(record, dict) else None
+            if key:
+                home.setdefault(key, b)
+    all_keys = set(home)
+
+    levels: List[int] = []
+    for b, batch in enumerate(batches):
+        level = 0
+        for record in batch:
+            if not isinstance(record, dict):
+                continue
+            for dep in _record_dependencies(record, all_keys, classes):
+                dep_batch = home[dep]
+                if dep_batch < b:
+                    level = max(level, levels[dep_batch] + 1)
+        levels.append(level)
+
+    waves: List[List[int]] = [[] for _ in range(max(levels, default=-1) + 1)]
+    for b, level in enumerate(levels):
+        waves[level].append(b)
+    return waves
+
+
 def plan_import_batches(
     records: List[dict],
     batch_size: int = 200,
     db: Optional[Database] = None,
 ) -> Dict[str, Any]:
-    """Sort records topologically, then split into fixed-size batches."""
+    """Sort records topologically, then split into fixed-size batches.
+
+    ``waves`` lists batch indexes that can be imported in parallel, wave by
+    wave (see :func:`batch_waves`).
+    """
     sorted_records, warnings = topological_sort_records(records, db=db)
     batches = chunk_records(sorted_records, batch_size=batch_size)
     return {
@@ -330,6 +373,7 @@ def plan_import_batches(
         "batch_size": batch_size,
         "warnings": warnings,
         "batches": batches,
+        "waves": batch_waves(batches, db=db),
     }
 
 
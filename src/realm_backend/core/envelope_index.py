@@ -0,0 +1,484 @@
+"""Scope and principal indexes over ``KeyEnvelope`` rows, and batched writes.
+
+The toolkit's ``CryptoService`` answers every question about envelopes by
+loading all of them: ``list_envelopes(scope)``, ``list_scopes(principal)`` and
+``get_envelope`` filter ``KeyEnvelope.instances()``, and ``grant_many`` /
+``revoke_many`` start with that scan. Sharing a department document with its
+members, or re-wrapping its key, therefore cost every envelope in the realm.
+
+This keeps two indexes beside the rows:
+
+* scope -> ``{principal: [envelope_id, generation]}``, split into ``PAGES``
+  pages by a hash of the principal, so one grant rewrites one bounded page
+  and a 5k-member scope is never one record;
+* principal -> ``{scope: envelope_id}``, one record per principal.
+
+:func:`apply` is the one writer: it upserts and revokes any number of
+envelopes of one scope in a single pass, loading each touched index page once
+and saving it once. ``api.crypto`` routes every envelope write through it.
+Rows written before the index existed are backfilled by a timer chain started
+in ``initialize()``; until then :func:`index_ready` is False and the batch
+writers find existing envelopes with one scan per call, as the toolkit did.
+
+``KeyEnvelope`` lives in the toolkit and carries no save hooks, so rows can
+still be written behind the index's back — by an import, by the toolkit's own
+``CryptoService`` or by extension code. The index therefore records a
+watermark, the highest row id it is known to cover, and :func:`index_ready`
+only trusts the index while the watermark reaches the last row. Reads never
+write: rows past the watermark are indexed by :func:`catch_up`, which
+:func:`apply` runs before every batch and :func:`schedule_catch_up` chains on
+timers. Rows deleted behind its back are skipped by the readers, which load
+every row they return.
+
+The generation stamp drives key rotation (:func:`rotate`): a rotation opens a
+new generation for the scope, every chunk of re-wrapped envelopes is stamped
+with it, and closing the rotation revokes whoever was not re-wrapped — they
+only hold the retired key. Rotation state lives in the scope record, so an
+interrupted rotation resumes from :func:`rotation_pending`, and the last closed
+rotation is kept there too, so a resent final chunk is answered, not re-run.
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ic_python_logging import get_logger
+
+logger = get_logger("core.envelope_index")
+
+INDEX_TYPE = "_EnvelopeIndex"
+INDEX_FLAG = "ix_backfill:KeyEnvelope:scope:v2"
+INDEX_FIELD = "scope"
+# Highest ``KeyEnvelope`` id such that every row up to it is indexed.
+INDEX_WATERMARK = "ix_backfill:KeyEnvelope:upto"
+# Rows past the watermark one :func:`catch_up` call will index; a larger gap
+# is left to the timer chain and readers scan meanwhile.
+CATCH_UP = 200
+
+# Pages per scope: a 5k-member scope keeps ~80 principals a page.
+PAGES = 64
+# Principals returned per ``rotation_pending`` call by default.
+PENDING_PAGE = 500
+
+
+def _db():
+    from ic_python_db import Database
+
+    return Database.get_instance()
+
+
+def index_ready() -> bool:
+    """True once the index covers every ``KeyEnvelope`` row.
+
+    A read-only check of the backfill flag and the watermark, safe on query
+    paths; it answers False while rows past the watermark wait for
+    :func:`catch_up`.
+    """
+    try:
+        from ic_basilisk_toolkit.crypto import KeyEnvelope
+
+        return bool(_db().load("_system", INDEX_FLAG)) and _watermark() >= KeyEnvelope.max_id()
+    except Exception:
+        return False
+
+
+def _watermark() -> int:
+    try:
+        return int(_db().load("_system", INDEX_WATERMARK) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def catch_up(limit: int = CATCH_UP) -> bool:
+    """Index up to *limit* rows written past the watermark.
+
+    Returns True when none remain. Writes, so update or timer context only;
+    before the backfill has finished there is nothing to catch up to.
+    """
+    from ic_basilisk_toolkit.crypto import KeyEnvelope
+
+    if not _db().load("_system", INDEX_FLAG):
+        return False
+    mark, last = _watermark(), KeyEnvelope.max_id()
+    while mark < last and limit > 0:
+        step = min(50, limit)
+        _index_from(mark + 1, step)
+        mark, limit = _watermark(), limit - step
+    return mark >= last
+
+
+_chained = False
+
+
+def schedule_catch_up(delay: int = 1) -> None:
+    """Run :func:`catch_up` one timer tick at a time until the index is current.
+
+    Started from init/post_upgrade and by a write that finds more rows behind
+    than one call indexes; a chain already running is not doubled.
+    """
+    global _chained
+    from _cdk import ic
+
+    if _chained:
+        return
+
+    def _step():
+        global _chained
+        try:
+            if catch_up() or not _db().load("_system", INDEX_FLAG):
+                _chained = False
+                return
+            ic.set_timer(1, _step)
+        except Exception as e:
+            _chained = False
+            logger.error(f"envelope index catch-up failed: {e}")
+
+    _chained = True
+    ic.set_timer(delay, _step)
+
+
+def _page_of(principal: str) -> int:
+    return int(hashlib.sha256(principal.encode("utf-8")).hexdigest()[:8], 16) % PAGES
+
+
+class _Scope:
+    """One scope's index record and pages: each read once, each written once."""
+
+    def __init__(self, scope: str):
+        self.db = _db()
+        self.scope = scope
+        self.key = f"scope:{scope}"
+        self.meta = self.db.load(INDEX_TYPE, self.key) or {
+            "pages": [], "count": 0, "gen": 0, "rotation": None,
+        }
+        self.pages: Dict[int, dict] = {}
+        self.dirty = set()
+        self.meta_dirty = False
+
+    def _page(self, number: int) -> dict:
+        if number not in self.pages:
+            page = None
+            if number in self.meta["pages"]:
+                page = self.db.load(INDEX_TYPE, f"{self.key}#{number}")
+            self.pages[number] = page or {}
+        return self.pages[number]
+
+    def get(self, principal: str) -> Optional[list]:
+        return self._page(_page_of(principal)).get(principal)
+
+    def put(self, principal: str, envelope_id: str, gen: int) -> None:
+        number = _page_of(principal)
+        page = self._page(number)
+        if page.get(principal) == [envelope_id, gen]:
+            return
+        if principal not in page:
+            self.meta["count"] += 1
+            self.meta_dirty = True
+        page[principal] = [envelope_id, gen]
+        self.dirty.add(number)
+
+    def drop(self, principal: str) -> Optional[list]:
+        number = _page_of(principal)
+        entry = self._page(number).pop(principal, None)
+        if entry is not None:
+            self.meta["count"] = max(0, self.meta["count"] - 1)
+            self.meta_dirty = True
+            self.dirty.add(number)
+        return entry
+
+    def page_numbers(self) -> List[int]:
+        return sorted(self.meta["pages"])
+
+    def members(self) -> Dict[str, list]:
+        out = {}
+        for number in self.page_numbers():
+            out.update(self._page(number))
+        return out
+
+    def flush(self) -> None:
+        pages = set(self.meta["pages"])
+        for number in sorted(self.dirty):
+            page = self.pages[number]
+            if page:
+                self.db.save(INDEX_TYPE, f"{self.key}#{number}", page)
+                pages.add(number)
+            elif number in pages:
+                self.db.delete(INDEX_TYPE, f"{self.key}#{number}")
+                pages.discard(number)
+        if pages != set(self.meta["pages"]):
+            self.meta["pages"] = sorted(pages)
+            self.meta_dirty = True
+        if self.meta_dirty:
+            self.db.save(INDEX_TYPE, self.key, self.meta)
+        self.dirty.clear()
+        self.meta_dirty = False
+
+
+def _principal_record(principal: str) -> dict:
+    return _db().load(INDEX_TYPE, f"principal:{principal}") or {}
+
+
+def _save_principal(principal: str, record: dict) -> None:
+    key = f"principal:{principal}"
+    if record:
+        _db().save(INDEX_TYPE, key, record)
+    else:
+        _db().delete(INDEX_TYPE, key)
+
+
+def _link(principal: str, scope: str, envelope_id: Optional[str]) -> None:
+    record = _principal_record(principal)
+    if record.get(scope) == envelope_id:
+        return
+    if envelope_id is None:
+        record.pop(scope, None)
+    else:
+        record[scope] = envelope_id
+    _save_principal(principal, record)
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+
+def envelope_id(scope: str, principal: str) -> Optional[str]:
+    entry = _Scope(scope).get(principal)
+    return entry[0] if entry else None
+
+
+def scope_envelope_ids(scope: str) -> Dict[str, str]:
+    """``{principal: envelope_id}`` for every holder of *scope*."""
+    return {p: entry[0] for p, entry in _Scope(scope).members().items()}
+
+
+def scope_member_count(scope: str) -> int:
+    return int(_Scope(scope).meta["count"])
+
+
+def principal_scopes(principal: str) -> List[str]:
+    """Scopes *principal* holds an envelope for, skipping rows deleted since."""
+    from ic_basilisk_toolkit.crypto import KeyEnvelope
+
+    return sorted(
+        scope for scope, envelope_id in _principal_record(principal).items()
+        if is_envelope_for(KeyEnvelope.load(envelope_id), scope, principal)
+    )
+
+
+def is_envelope_for(envelope, scope: str, principal: str) -> bool:
+    """True if *envelope* (a loaded row, or None) still is *principal*'s in *scope*."""
+    return (
+        envelope is not None
+        and str(envelope.scope) == scope
+        and str(envelope.principal) == principal
+    )
+
+
+# ---------------------------------------------------------------------------
+# Writes
+# ---------------------------------------------------------------------------
+
+
+def _scan_scope(scope: str) -> Dict[str, object]:
+    from ic_basilisk_toolkit.crypto import KeyEnvelope
+
+    return {str(e.principal): e for e in KeyEnvelope.instances() if str(e.scope) == scope}
+
+
+def apply(
+    scope: str,
+    grants: Optional[Dict[str, str]] = None,
+    revokes: Iterable[str] = (),
+    gen: Optional[int] = None,
+) -> Tuple[int, int, int]:
+    """Upsert *grants* (``principal -> wrapped_dek_hex``) and delete *revokes*.
+
+    One pass for the whole batch: an existing envelope is found through the
+    index (or one scan, before the backfill), updated in place when a new
+    wrapped key is given, and otherwise created. Entries are stamped with
+    *gen*, defaulting to the scope's current generation.
+
+    Returns ``(granted, revoked, newly_stamped)``; the last counts grants whose
+    entry did not already carry *gen*, which is what makes a resent rotation
+    chunk count once.
+    """
+    from ic_basilisk_toolkit.crypto import KeyEnvelope, encode_envelope
+
+    if not catch_up() and _db().load("_system", INDEX_FLAG):
+        schedule_catch_up()
+    record = _Scope(scope)
+    gen = record.meta["gen"] if gen is None else int(gen)
+    scanned = None if index_ready() else _scan_scope(scope)
+
+    def _existing(principal):
+        if scanned is not None:
+            return scanned.get(principal)
+        entry = record.get(principal)
+        return KeyEnvelope.load(entry[0]) if entry else None
+
+    granted = stamped = created = 0
+    for principal, dek_hex in (grants or {}).items():
+        principal = str(principal)
+        envelope = _existing(principal)
+        if envelope is not None:
+            if dek_hex:
+                envelope.wrapped_dek = encode_envelope(dek_hex)
+        else:
+            envelope = KeyEnvelope(
+                scope=scope, principal=principal,
+                wrapped_dek=encode_envelope(dek_hex or ""),
+            )
+            created += 1
+            if scanned is not None:
+                scanned[principal] = envelope
+        entry = record.get(principal)
+        if entry is None or entry[1] != gen:
+            stamped += 1
+        record.put(principal, str(envelope._id), gen)
+        if entry is None or entry[0] != str(envelope._id):
+            _link(principal, scope, str(envelope._id))
+        granted += 1
+
+    revoked = 0
+    for principal in revokes or ():
+        principal = str(principal)
+        envelope = _existing(principal)
+        record.drop(principal)
+        if envelope is None:
+            continue
+        envelope.delete()
+        if scanned is not None:
+            scanned.pop(principal, None)
+        _link(principal, scope, None)
+        revoked += 1
+
+    record.flush()
+    if created and scanned is None:
+        # The index was current on entry, so the new rows are the only ones
+        # past the watermark.
+        _db().save("_system", INDEX_WATERMARK, str(KeyEnvelope.max_id()))
+    return granted, revoked, stamped
+
+
+def index_envelope(envelope) -> None:
+    """Record one existing envelope, keeping any generation already stamped."""
+    scope, principal = str(envelope.scope), str(envelope.principal)
+    record = _Scope(scope)
+    entry = record.get(principal)
+    gen = entry[1] if entry else 0
+    record.put(principal, str(envelope._id), gen)
+    record.flush()
+    _link(principal, scope, str(envelope._id))
+
+
+def _index_from(from_id: int, batch: int):
+    """Index one batch of rows from *from_id* and move the watermark past it."""
+    from ic_basilisk_toolkit.crypto import KeyEnvelope
+
+    from core.index_backfill import rebuild_batch
+
+    next_id = rebuild_batch(KeyEnvelope, index_envelope, from_id, batch)
+    mark = next_id - 1 if next_id is not None else KeyEnvelope.max_id()
+    if mark > _watermark():
+        _db().save("_system", INDEX_WATERMARK, str(mark))
+    return next_id
+
+
+def rebuild_index(field=INDEX_FIELD, from_id=1, batch=50):
+    """Index one batch of existing envelopes for ``main``'s backfill timer."""
+    return _index_from(from_id, batch)
+
+
+# ---------------------------------------------------------------------------
+# Rotation
+# ---------------------------------------------------------------------------
+
+
+def rotation_state(scope: str) -> Optional[dict]:
+    return _Scope(scope).meta.get("rotation")
+
+
+def rotate(scope: str, rotation_id: str, wrapped_deks: Dict[str, str],
+           final: bool = False) -> dict:
+    """Apply one chunk of a key rotation for *scope*.
+
+    *wrapped_deks* maps members to the new key wrapped for each. The first
+    chunk with a new *rotation_id* opens the rotation (abandoning any other
+    open one); resending a chunk is harmless. With *final*, members that were
+    not re-wrapped are revoked and the rotation is closed; a chunk resent
+    after that gets the closing answer again. Grants made while a rotation
+    is open count as not yet re-wrapped.
+    """
+    if not rotation_id:
+        raise ValueError("rotation_id is required")
+    record = _Scope(scope)
+    rotation = record.meta.get("rotation")
+    closed = record.meta.get("closed")
+    if not rotation and closed and closed.get("id") == rotation_id:
+        return _progress(closed, int(record.meta["count"]), closed["revoked"], True)
+    if not rotation or rotation.get("id") != rotation_id:
+        rotation = {
+            "id": rotation_id,
+            "gen": int(record.meta["gen"]) + 1,
+            "rewrapped": 0,
+        }
+        record.meta["rotation"] = rotation
+        record.meta_dirty = True
+        record.flush()
+
+    _granted, _revoked, stamped = apply(scope, wrapped_deks, gen=rotation["gen"])
+    record = _Scope(scope)
+    rotation = record.meta["rotation"]
+    rotation["rewrapped"] += stamped
+    revoked = 0
+    if final:
+        stale = [p for p, entry in record.members().items() if entry[1] != rotation["gen"]]
+        if stale:
+            _g, revoked, _s = apply(scope, revokes=stale)
+            record = _Scope(scope)
+        record.meta["gen"] = rotation["gen"]
+        record.meta["rotation"] = None
+        record.meta["closed"] = {**rotation, "revoked": revoked}
+    else:
+        record.meta["rotation"] = rotation
+    record.meta_dirty = True
+    record.flush()
+    logger.info(
+        f"rotate: scope={scope!r} rotation={rotation_id!r} "
+        f"+{stamped} re-wrapped{' (closed)' if final else ''}, {revoked} revoked"
+    )
+    return _progress(rotation, int(record.meta["count"]), revoked, bool(final))
+
+
+def _progress(rotation: dict, members: int, revoked: int, closed: bool) -> dict:
+    return {
+        "rotation": rotation["id"],
+        "generation": rotation["gen"],
+        "rewrapped": rotation["rewrapped"],
+        "members": members,
+        "revoked": revoked,
+        "closed": closed,
+    }
+
+
+def rotation_pending(scope: str, cursor: int = 0, limit: int = PENDING_PAGE) -> dict:
+    """Members of *scope* the open rotation has not re-wrapped yet, paged.
+
+    *cursor* is an index page number; whole pages are returned until *limit*
+    is reached, and ``next_cursor`` is None after the last one.
+    """
+    record = _Scope(scope)
+    rotation = record.meta.get("rotation")
+    out = {"rotation": rotation, "members": int(record.meta["count"]),
+           "pending": [], "next_cursor": None}
+    if not rotation:
+        return out
+    numbers = [n for n in record.page_numbers() if n >= int(cursor)]
+    for i, number in enumerate(numbers):
+        out["pending"].extend(sorted(
+            p for p, entry in record._page(number).items() if entry[1] != rotation["gen"]
+        ))
+        if len(out["pending"]) >= limit:
+            out["next_cursor"] = numbers[i + 1] if i + 1 < len(numbers) else None
+            break
+    return out
@@ -63,6 +63,7 @@ from core.bridge_core import (  # noqa: F401
     to_plain,
 )
 from core.call_origin import dispatch, extension_call
+from core.perf import measure
 from ic_python_logging import get_logger
 
 logger = get_logger("core.extension_bridge")
@@ -572,19 +573,33 @@ def _v_crypto_envelope(caller="", scope="", **kwargs) -> dict:
     }
 
 
-def _v_system_snapshot(caller="", sections=None, **kwargs) -> dict:
+def _v_system_snapshot(caller="", sections=None, options=None, **kwargs) -> dict:
     """Operational diagnostics: cycles, memory, entity counts, file counts.
 
     Realm-wide operational state rather than member data, so it is gated by a
     single admin operation instead of per-record scoping. Gathering happens
     host-side (see :mod:`core.system_snapshot`) so extension code never gets
-    to walk the filesystem itself.
+    to walk the filesystem itself. *options* carries the audit sections'
+    cursor; repairing is ``system.repair``.
     """
     if not caller_has_operation(caller, "realm.admin"):
         raise PermissionError("system.snapshot requires the 'realm.admin' operation")
     from core import system_snapshot
 
-    return system_snapshot.snapshot(sections)
+    return system_snapshot.snapshot(sections, options)
+
+
+def _v_system_repair(caller="", section="", cursor=None, **kwargs) -> dict:
+    """Rewrite the entity counters or the file ledger from a full audit.
+
+    The write counterpart of the ``db_audit``/``files_audit`` snapshot
+    sections, under the same admin operation.
+    """
+    if not caller_has_operation(caller, "realm.admin"):
+        raise PermissionError("system.repair requires the 'realm.admin' operation")
+    from core import system_snapshot
+
+    return system_snapshot.repair(section, cursor)
 
 
 def _v_realm_info(caller="", **kwargs) -> dict:
@@ -621,9 +636,9 @@ def _v_realm_info(caller="", **kwargs) -> dict:
 
     version = ""
     try:
-        from api.status import get_status
+        from api import status_cache
 
-        version = str((get_status() or {}).get("version", ""))
+        version = str((status_cache.status() or {}).get("version", ""))
     except Exception:
         pass
 
@@ -759,8 +774,8 @@ def _owned_zone_or_denied(h3_index: str, caller: str):
     from ggg import Zone
 
     zone = None
-    for z in Zone.instances():
-        if z.h3_index == h3_index and _is_territory_zone(z):
+    for z in rows_where(Zone, {"h3_index": h3_index}):
+        if _is_territory_zone(z):
             zone = z
             break
     if zone is None:
@@ -786,8 +801,8 @@ def _v_zone_create(caller="", h3_index="", **kwargs) -> dict:
 
     # Invariant: one territory zone per cell, realm-wide. It has to live here —
     # an extension enforcing it in the sandbox could simply not.
-    for existing in Zone.instances():
-        if existing.h3_index == h3_index and _is_territory_zone(existing):
+    for existing in rows_where(Zone, {"h3_index": h3_index}):
+        if _is_territory_zone(existing):
             raise ValueError("A zone already exists at this location")
 
     leftover = None
@@ -804,6 +819,7 @@ def _v_zone_create(caller="", h3_index="", **kwargs) -> dict:
                 leftover.zone_type = zone_type
                 leftover.metadata = kwargs.get("metadata") or "{}"
                 leftover.user = user
+                _land_bridge.index_zone(leftover)
                 _land_bridge.sync_parcels_covering([h3_index])
                 return _project(leftover, ENTITY_POLICIES["Zone"])
         except Exception:
@@ -820,6 +836,7 @@ def _v_zone_create(caller="", h3_index="", **kwargs) -> dict:
     # Return the projection so the caller needs no follow-up read. A Zone's
     # entity ``id`` is not its h3_index, so a round-trip through entity.get
     # would not find it.
+    _land_bridge.index_zone(zone)
     _land_bridge.sync_parcels_covering([h3_index])
     return _project(zone, ENTITY_POLICIES["Zone"])
 
@@ -840,6 +857,7 @@ def _v_zone_update(caller="", h3_index="", **kwargs) -> dict:
         updated.append(field)
 
     if "zone_type" in updated and getattr(zone, "zone_type", None) != old_zone_type:
+        _land_bridge.index_zone(zone)
         _land_bridge.sync_parcels_covering([h3_index])
     return dict(_project(zone, ENTITY_POLICIES["Zone"]), updated_fields=updated)
 
@@ -847,6 +865,7 @@ def _v_zone_update(caller="", h3_index="", **kwargs) -> dict:
 def _v_zone_delete(caller="", h3_index="", **kwargs) -> dict:
     """Delete a territory zone the caller owns (or any, for a realm admin)."""
     zone = _owned_zone_or_denied(h3_index, caller)
+    _land_bridge.unindex_zone(zone)
     zone.delete()
     _land_bridge.sync_parcels_covering([h3_index])
     return {"id": h3_index, "deleted": True}
@@ -892,9 +911,14 @@ def declared_entities(manifest: dict) -> Dict[str, Any]:
           "AppConfig": {
             "alias": "key",
             "fields": {"key": {"type": "String", "max_length": 256},
-                       "value": {"type": "String"}}
+                       "value": {"type": "String"}},
+            "indexes": ["key"]
           }
         }
+
+    ``indexes`` names fields the host keeps a persistent equality index for
+    (``indexed=True`` on the ORM property), so ``ext_entity.list`` filtering on
+    them costs O(matches) instead of a scan of every row.
     """
     # Absent is fine; present-but-wrong-type is not. `or {}` alone would let a
     # list quietly read as "declares nothing".
@@ -924,16 +948,33 @@ def declared_entities(manifest: dict) -> Dict[str, Any]:
             clean[field] = {"type": ftype}
             if "max_length" in (fspec or {}):
                 clean[field]["max_length"] = int(fspec["max_length"])
-        out[name] = {"alias": (spec or {}).get("alias"), "fields": clean}
+        indexes = (spec or {}).get("indexes") or []
+        if not isinstance(indexes, list):
+            raise ValueError(f"entity '{name}': 'indexes' must be a list")
+        for field in indexes:
+            if field not in clean:
+                raise ValueError(
+                    f"entity '{name}' indexes undeclared field '{field}'"
+                )
+        out[name] = {
+            "alias": (spec or {}).get("alias"),
+            "fields": clean,
+            "indexes": sorted(set(indexes)),
+        }
     return out
 
 
-def register_declared_entities(ext_id: str, manifest: dict) -> List[str]:
+def register_declared_entities(
+    ext_id: str, manifest: dict, backfill: bool = True
+) -> List[str]:
     """Build real ORM classes for an extension's declared entities.
 
     Runs host-side at install/boot, turning the manifest's plain schema into
     the same namespaced classes ``create_extension_entity_class`` produced —
     so storage layout is unchanged and existing rows keep working.
+
+    With *backfill* (install, init/upgrade) the declared indexes are brought
+    up to date by timer; pass ``False`` from paths that may run as a query.
     """
     from core.extensions import create_extension_entity_class
     from ic_python_db import Boolean, Float, Integer, String
@@ -943,20 +984,82 @@ def register_declared_entities(ext_id: str, manifest: dict) -> List[str]:
     registered = []
     for name, spec in declared_entities(manifest).items():
         attrs: Dict[str, Any] = {}
+        indexes = set(spec.get("indexes") or ())
         for field, fspec in spec["fields"].items():
             kind = kinds[fspec["type"]]
-            attrs[field] = (
-                kind(max_length=fspec["max_length"])
-                if "max_length" in fspec
-                else kind()
-            )
+            opts: Dict[str, Any] = {}
+            if "max_length" in fspec:
+                opts["max_length"] = fspec["max_length"]
+            if field in indexes:
+                opts["indexed"] = True
+            attrs[field] = kind(**opts)
         if spec.get("alias"):
             attrs["__alias__"] = spec["alias"]
-        _EXT_ENTITY_CLASSES[(ext_id, name)] = type(name, (base,), attrs)
+        cls = type(name, (base,), attrs)
+        _EXT_ENTITY_CLASSES[(ext_id, name)] = cls
+        if backfill:
+            _forget_dropped_indexes(cls, sorted(set(spec["fields"]) - indexes))
+            _backfill_indexes(cls, sorted(indexes))
         registered.append(name)
     return registered
 
 
+# Declaring an index on a type that already has rows leaves those rows out of
+# it: the ORM only indexes on write. ``find_by`` over a partial index would
+# silently drop matches, so the list verb only trusts an index once this flag
+# is set, and falls back to the scan until then.
+_INDEX_READY_FLAG = "fi_backfill:{type}:{field}"
+
+
+def _index_flag(cls, field: str) -> str:
+    return _INDEX_READY_FLAG.format(type=cls.get_full_type_name(), field=field)
+
+
+def _backfill_indexes(cls, fields: List[str]) -> None:
+    """Schedule the batched backfill of each declared index not yet ready.
+
+    One timer chain per field, each setting its own flag, so a field added to
+    ``indexes`` later is backfilled without redoing the others. A failure
+    leaves the flag unset, which only means the scan keeps serving.
+    """
+    from core import index_backfill
+
+    for field in fields:
+        try:
+            index_backfill.kick_off(cls, [field], _index_flag(cls, field))
+        except Exception as e:
+            logger.warning(
+                f"index backfill for {cls.__name__}.{field} not scheduled: {e}"
+            )
+
+
+def _forget_dropped_indexes(cls, fields: List[str]) -> None:
+    """Clear the ready flag of declared fields that are no longer indexed.
+
+    Rows written while a field is unindexed never reach its index, so if the
+    field is indexed again it must be backfilled again rather than trusted.
+    """
+    try:
+        from ic_python_db import Database
+
+        db = Database.get_instance()
+        for field in fields:
+            flag = _index_flag(cls, field)
+            if db.load("_system", flag):
+                db.delete("_system", flag)
+    except Exception as e:
+        logger.warning(f"could not reset index flags for {cls.__name__}: {e}")
+
+
+def _index_ready(cls, field: str) -> bool:
+    try:
+        from ic_python_db import Database
+
+        return bool(Database.get_instance().load("_system", _index_flag(cls, field)))
+    except Exception:
+        return False
+
+
 # (ext_id, class_name) -> live class. Populated host-side only.
 _EXT_ENTITY_CLASSES: Dict[Any, Any] = {}
 
@@ -978,7 +1081,9 @@ def _own_entity_class(ext_id: str, name: str):
 
             manifest = (get_all_extension_manifests() or {}).get(ext_id)
             if manifest and name in declared_entities(manifest):
-                register_declared_entities(ext_id, manifest)
+                # May run inside a query: no timers, no writes. Boot and
+                # install schedule the backfills.
+                register_declared_entities(ext_id, manifest, backfill=False)
                 cls = _EXT_ENTITY_CLASSES.get((ext_id, name))
         except Exception:
             cls = None
@@ -1003,6 +1108,32 @@ def _own_fields(ext_id: str, name: str) -> List[str]:
     return list(declared_entities(manifest).get(name, {}).get("fields", {}))
 
 
+def rows_where(cls, where: Optional[dict] = None) -> list:
+    """Rows of an ORM class matching every ``where`` equality.
+
+    When one of the ``where`` keys is an indexed property whose backfill has
+    completed, candidates come from that index and only they are loaded. The
+    full ``where`` is still applied to them, so the result is the same as the
+    scan's, in the same id order. Typed verbs use this instead of
+    ``cls.instances()`` plus a comprehension (see
+    :mod:`core.procurement.entities`, and the zone verbs above for a ``ggg``
+    class).
+    """
+    where = where or {}
+    indexed = getattr(cls, "_indexed_properties", None)
+    indexed = indexed() if callable(indexed) else {}
+    key = next((k for k in where if k in indexed and _index_ready(cls, k)), None)
+    if key is None:
+        rows = list(cls.instances())
+    else:
+        value = where[key]
+        total = cls.count_by(key, value)
+        rows = cls.find_by(key, value, count=total)[0] if total else []
+    for k, v in where.items():
+        rows = [r for r in rows if getattr(r, k, None) == v]
+    return rows
+
+
 def _project_own(row, fields: List[str]) -> dict:
     out = {"id": getattr(row, "id", None)}
     for field in fields:
@@ -1029,11 +1160,10 @@ def _v_ext_entity_create(ext_id="", type="", values=None, **kwargs) -> dict:
 def _v_ext_entity_list(ext_id="", type="", where=None, limit=1000, **kwargs) -> dict:
     cls = _own_entity_class(ext_id, type)
     fields = _own_fields(ext_id, type)
-    rows = list(cls.instances())
-    for key, value in (where or {}).items():
+    for key in where or {}:
         if key not in fields:
             raise ValueError(f"'{type}' has no field '{key}'")
-        rows = [r for r in rows if getattr(r, key, None) == value]
+    rows = rows_where(cls, where)
     limit = max(1, min(int(limit or 1000), 5000))
     return {
         "rows": [_project_own(r, fields) for r in rows[:limit]],
@@ -1078,6 +1208,7 @@ VERBS: Dict[str, Callable[..., Any]] = {
     "time.now": _v_time_now,
     "log.write": _v_log_write,
     "system.snapshot": _v_system_snapshot,
+    "system.repair": _v_system_repair,
     "member.list": _v_member_list,
     "member.profile": _v_member_profile,
     "member.notifications": _v_member_notifications,
@@ -1129,6 +1260,7 @@ READ_VERBS = (
             "land.list",
             "land.get",
             "land.map",
+            "land.zones",
             "extension_access.list",
             "notification.list",
             "notification.departments",
@@ -1312,9 +1444,10 @@ def make_rpc_handler(
         with extension_call(ext_id):
             _cedar_check(action, caller, safe_kwargs)
 
-        result = dispatch(
-            VERBS, action, extension_call(ext_id), caller=caller, **safe_kwargs
-        )
+        with measure(f"extension_bridge.{action}"):
+            result = dispatch(
+                VERBS, action, extension_call(ext_id), caller=caller, **safe_kwargs
+            )
         return to_plain(result)
 
     return handler
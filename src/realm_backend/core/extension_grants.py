@@ -77,31 +77,23 @@ def _link(ext, kind: str, target):
 
 
 def v_list(caller="", **kwargs) -> dict:
-    """Every extension with the users, departments and profiles granted it.
-
-    The reverse ``extension.users`` index was removed in issue #242, so direct
-    user grants are found by one pass over the membership roster.
-    """
+    """Every extension with the users, departments and profiles granted it."""
     _require(caller, VIEW_OPERATION, "extension_access.list")
     from ggg import Extension
 
     users_by_extension: dict = {}
     try:
-        from core.membership import iter_users
-
-        for user in iter_users():
-            principal = getattr(user, "id", None)
-            if not principal:
-                continue
-            try:
-                granted = list(user.extensions)
-            except Exception:
-                continue
-            for ext in granted:
-                users_by_extension.setdefault(ext.name, []).append({
-                    "principal": principal,
+        from core.membership import KIND_EXTENSION, members_by_name
+
+        for name, users in members_by_name(KIND_EXTENSION).items():
+            users_by_extension[name] = [
+                {
+                    "principal": user.id,
                     "nickname": getattr(user, "nickname", "") or "",
-                })
+                }
+                for user in users
+                if getattr(user, "id", None)
+            ]
     except Exception:
         pass
 
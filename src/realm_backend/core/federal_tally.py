@@ -33,6 +33,9 @@ LEG_REJECTED = "rejected"
 LEG_NO_QUORUM = "no_quorum"
 LEG_ABSENT = "absent"
 
+# Proposal statuses a leg is still open under; every other status settles it.
+OPEN_PROPOSAL_STATUSES = ("voting", "pending_vote", "pending_review")
+
 _VOTE_ID_SAFE_RE = re.compile(r"[^a-zA-Z0-9_-]")
 _SECONDS_PER_DAY = 86400
 _SECONDS_PER_HOUR = 3600
@@ -171,8 +174,8 @@ def classify_leg_outcome(proposal_status: str) -> str:
 
     ``accepted`` / ``executed`` → ``adopted``; ``rejected`` / ``failed`` →
     ``rejected``; ``no_quorum`` → ``no_quorum``. Everything else, including the
-    open statuses ``voting`` / ``pending_vote`` / ``pending_review``, returns
-    ``""`` meaning the leg has not settled yet.
+    ``OPEN_PROPOSAL_STATUSES``, returns ``""`` meaning the leg has not settled
+    yet.
     """
     status = (proposal_status or "").strip().lower()
     if status in ("accepted", "executed"):
@@ -84,10 +84,28 @@ AGGREGATE_STEP_CODE = (
 _TERMINAL_PROPOSAL_STATUSES = frozenset(
     {"accepted", "executed", "rejected", "failed", "no_quorum"}
 )
-_VOTING_PROPOSAL_STATUSES = frozenset({"voting", "pending_vote", "pending_review"})
+_VOTING_PROPOSAL_STATUSES = frozenset(_tally.OPEN_PROPOSAL_STATUSES)
 
 _propose_counter = 0
 
+# Set by main.py's backfill once rows written before these indexes were
+# reliable (``quarter_canister_id`` was unindexed; a default ``status`` was
+# never indexed, see ``_index_default_status``) are in them. Until then
+# lookups scan.
+VOTE_INDEX_FLAG = "fi_backfill:FederalVote:v1"
+LEG_INDEX_FLAG = "fi_backfill:FederalVoteLeg:v1"
+VOTE_INDEX_FIELDS = ["status"]
+LEG_INDEX_FIELDS = ["status", "quarter_canister_id"]
+
+# Deadline-ordered queue of open votes (capital side): a JSON list of
+# ``[wake_at, vote_id]`` under ``_system``. ``advance_federal_aggregate`` pops
+# only entries whose ``wake_at`` has passed, so a tick costs O(due votes)
+# rather than O(votes ever filed). ``wake_at`` is the deadline (plus grace)
+# unless something needs attention sooner: a freshly proposed vote, a leg
+# tally arriving, or an ``open`` still unacknowledged by some quarter.
+VOTE_QUEUE_KEY = "federal_vote_queue"
+OPEN_RETRY_S = 60
+
 
 def _import_ggg():
     try:
@@ -172,7 +190,7 @@ def upsert_vote(**fields):
         for key, value in fields.items():
             setattr(vote, key, value)
         return vote
-    return FederalVote(**fields)
+    return _index_default_status(FederalVote(**fields))
 
 
 def upsert_leg(**fields):
@@ -185,7 +203,26 @@ def upsert_leg(**fields):
         for k, value in fields.items():
             setattr(leg, k, value)
         return leg
-    return FederalVoteLeg(**fields)
+    return _index_default_status(FederalVoteLeg(**fields))
+
+
+def _index_default_status(row):
+    """Put a new row's ``status`` into its index.
+
+    ic-python-db only indexes on a value *change*, so a row created with
+    ``status`` equal to the field default ("open") never enters the index,
+    and the status lookups below would miss every new vote. Adding is
+    idempotent, so this is harmless when the ORM did index it.
+    """
+    status = getattr(row, "status", None)
+    row_id = getattr(row, "_id", None)
+    if status is None or row_id is None or not hasattr(row, "db"):
+        return row
+    try:
+        row.db().field_index_add(row._type, "status", str(status), row_id)
+    except Exception as e:
+        logger.error(f"status index for {row_id}: {e}")
+    return row
 
 
 def build_leg_code_inline(action: dict) -> str:
@@ -238,9 +275,47 @@ def build_leg_proposal_pkg(
     }
 
 
+def _find_all(cls, field: str, value: str, flag: str = "") -> list:
+    """Every row whose indexed ``field`` equals ``value``, across pages.
+
+    ``find_by`` pages 50 at a time; a single call silently truncates.
+    Returns None — meaning "scan instead" — when the class has no index
+    support (test fakes) or *flag* says the backfill has not finished.
+    """
+    if not hasattr(cls, "find_by"):
+        return None
+    if flag:
+        db = _db()
+        if db is None or not db.load("_system", flag):
+            return None
+    rows: list = []
+    cursor = 1
+    while cursor is not None:
+        batch, cursor = cls.find_by(field, value, from_id=cursor, count=200)
+        rows.extend(batch)
+    return rows
+
+
+def _db():
+    try:
+        from ic_python_db import Database
+
+        return Database.get_instance()
+    except Exception:
+        return None
+
+
 def _local_legs():
     _FederalVote, FederalVoteLeg, *_rest = _import_ggg()
     self_id = _self_id()
+    try:
+        found = _find_all(
+            FederalVoteLeg, "quarter_canister_id", self_id, LEG_INDEX_FLAG
+        )
+        if found is not None:
+            return found
+    except Exception:
+        pass
     return [
         leg
         for leg in FederalVoteLeg.instances()
@@ -248,6 +323,38 @@ def _local_legs():
     ]
 
 
+def _active_local_legs():
+    """Local legs the leg task still has to drive (open or armed).
+
+    Read through the status index, which only ever holds live legs of
+    live votes, so the cost does not grow with finished votes.
+    """
+    _FederalVote, FederalVoteLeg, *_rest = _import_ggg()
+    self_id = _self_id()
+    legs = []
+    try:
+        for status in (LEG_STATUS_OPEN, LEG_STATUS_ARMED):
+            found = _find_all(FederalVoteLeg, "status", status, LEG_INDEX_FLAG)
+            if found is None:
+                legs = None
+                break
+            legs.extend(found)
+    except Exception:
+        legs = None
+    if legs is None:
+        legs = [
+            leg
+            for leg in FederalVoteLeg.instances()
+            if (getattr(leg, "status", "") or "").strip()
+            in (LEG_STATUS_OPEN, LEG_STATUS_ARMED)
+        ]
+    return [
+        leg
+        for leg in legs
+        if (getattr(leg, "quarter_canister_id", "") or "").strip() == self_id
+    ]
+
+
 def _leg_for_quarter(vote_id: str, quarter_id: str):
     _FederalVote, FederalVoteLeg, *_rest = _import_ggg()
     return FederalVoteLeg[leg_key(vote_id, quarter_id)]
@@ -272,9 +379,9 @@ def _legs_for_vote(vote_id: str):
     _FederalVote, FederalVoteLeg, *_rest = _import_ggg()
     vote_id = (vote_id or "").strip()
     try:
-        if hasattr(FederalVoteLeg, "find_by"):
-            batch, _ = FederalVoteLeg.find_by("vote_id", vote_id)
-            return list(batch)
+        found = _find_all(FederalVoteLeg, "vote_id", vote_id)
+        if found is not None:
+            return found
     except Exception:
         pass
     return [
@@ -285,20 +392,107 @@ def _legs_for_vote(vote_id: str):
 
 
 def _open_votes():
+    return _votes_with_status(VOTE_STATUS_OPEN)
+
+
+def _votes_with_status(status: str):
     FederalVote, *_rest = _import_ggg()
     try:
-        if hasattr(FederalVote, "find_by"):
-            batch, _ = FederalVote.find_by("status", VOTE_STATUS_OPEN)
-            return list(batch)
+        found = _find_all(FederalVote, "status", status, VOTE_INDEX_FLAG)
+        if found is not None:
+            return found
     except Exception:
         pass
     return [
         v
         for v in FederalVote.instances()
-        if (getattr(v, "status", "") or "").strip() == VOTE_STATUS_OPEN
+        if (getattr(v, "status", "") or "").strip() == status
     ]
 
 
+# ---------------------------------------------------------------------------
+# Open-vote queue (capital)
+# ---------------------------------------------------------------------------
+
+
+def _load_queue() -> List[list]:
+    """The persisted queue, seeded from the status index on first use.
+
+    A missing key means the queue predates this canister's build (upgrade
+    with votes already open), so every open vote starts due.
+    """
+    db = _db()
+    raw = None
+    try:
+        raw = db.load("_system", VOTE_QUEUE_KEY) if db is not None else None
+    except Exception:
+        raw = None
+    if raw is None:
+        queue = [[0, getattr(v, "vote_id", "")] for v in _open_votes()]
+        queue = [entry for entry in queue if entry[1]]
+        _save_queue(queue)
+        return queue
+    try:
+        queue = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        queue = []
+    return [list(e) for e in queue if isinstance(e, list) and len(e) == 2]
+
+
+def _save_queue(queue: List[list]) -> None:
+    db = _db()
+    if db is None:
+        return
+    queue.sort(key=lambda e: (int(e[0]), e[1]))
+    try:
+        db.save("_system", VOTE_QUEUE_KEY, json.dumps(queue, separators=(",", ":")))
+    except Exception as e:
+        logger.error(f"federal vote queue save failed: {e}")
+
+
+def schedule_vote(vote_id: str, wake_at: int) -> None:
+    """(Re)queue an open vote to be looked at by the aggregate tick at *wake_at*.
+
+    An existing entry only ever moves earlier, so an event cannot postpone a
+    deadline that is already queued.
+    """
+    vote_id = (vote_id or "").strip()
+    if not vote_id:
+        return
+    queue = _load_queue()
+    for entry in queue:
+        if entry[1] == vote_id:
+            if int(wake_at) >= int(entry[0]):
+                return
+            entry[0] = int(wake_at)
+            break
+    else:
+        queue.append([int(wake_at), vote_id])
+    _save_queue(queue)
+
+
+def _requeue_vote(vote_id: str, wake_at: int) -> None:
+    queue = [e for e in _load_queue() if e[1] != vote_id]
+    queue.append([int(wake_at), vote_id])
+    _save_queue(queue)
+
+
+def unschedule_vote(vote_id: str) -> None:
+    queue = _load_queue()
+    kept = [e for e in queue if e[1] != vote_id]
+    if len(kept) != len(queue):
+        _save_queue(kept)
+
+
+def due_vote_ids(now: int) -> List[str]:
+    """Queued vote ids whose wake time has passed, earliest first."""
+    return [vote_id for wake_at, vote_id in _load_queue() if int(wake_at) <= now]
+
+
+def queued_vote_ids() -> List[str]:
+    return [vote_id for _wake_at, vote_id in _load_queue()]
+
+
 def _vote_view(vote) -> dict:
     rule = {}
     try:
@@ -344,9 +538,10 @@ def get_vote_view(vote_id: str) -> Optional[dict]:
 def list_votes(status: Optional[str] = None) -> List[dict]:
     FederalVote, *_rest = _import_ggg()
     status = (status or "").strip()
-    votes = list(FederalVote.instances())
     if status:
-        votes = [v for v in votes if (getattr(v, "status", "") or "").strip() == status]
+        votes = _votes_with_status(status)
+    else:
+        votes = list(FederalVote.instances())
     return [_vote_view(v) for v in votes]
 
 
@@ -384,20 +579,14 @@ def seed_federal_tasks():
 def _maybe_disable_leg_task():
     from core.quarter_bootstrap import disable_recurring_task
 
-    active = [
-        leg
-        for leg in _local_legs()
-        if (getattr(leg, "status", "") or "").strip()
-        in (LEG_STATUS_OPEN, LEG_STATUS_ARMED)
-    ]
-    if not active:
+    if not _active_local_legs():
         disable_recurring_task(LEG_TASK_NAME)
 
 
 def _maybe_disable_aggregate_task():
     from core.quarter_bootstrap import disable_recurring_task
 
-    if not _open_votes():
+    if not queued_vote_ids():
         disable_recurring_task(AGGREGATE_TASK_NAME)
 
 
@@ -501,6 +690,8 @@ def handle_propose(source: str, body: dict) -> Dict[str, Any]:
             vote_hash=vote_hash,
             status=LEG_STATUS_OPEN,
         )
+    # Due now: the quarters' ``open`` messages go out on the next tick.
+    schedule_vote(vote_id, now)
 
     vote = FederalVote[vote_id]
     leg_result = open_local_leg(vote, action, vote_hash, deadline)
@@ -608,6 +799,12 @@ def handle_tally(source: str, body: dict) -> Dict[str, Any]:
         reported=True,
         status=LEG_STATUS_REPORTED,
     )
+    # This may have been the last outstanding leg; let the next tick check
+    # instead of waiting out the deadline.
+    FederalVote, *_rest = _import_ggg()
+    vote = FederalVote[vote_id]
+    if vote and (getattr(vote, "status", "") or "").strip() == VOTE_STATUS_OPEN:
+        schedule_vote(vote_id, now_epoch_s())
     return {"success": True}
 
 
@@ -646,6 +843,8 @@ def handle_result(source: str, body: dict) -> Dict[str, Any]:
             tally = {}
     vote.status = status[:32]
     vote.tally_json = json.dumps(tally, separators=(",", ":"))[:2048]
+    if vote.status != VOTE_STATUS_OPEN:
+        unschedule_vote(vote_id)
 
     if status == VOTE_STATUS_ADOPTED:
         local.status = LEG_STATUS_ARMED
@@ -729,6 +928,7 @@ def cancel_federal_vote(vote_id: str):
     if now >= int(getattr(vote, "deadline", 0) or 0):
         return {"success": False, "error": "vote deadline has passed"}
     vote.status = VOTE_STATUS_EXPIRED
+    unschedule_vote(vote_id)
 
     result_body = {
         "vote_id": vote_id,
@@ -793,7 +993,7 @@ def advance_federal_legs():
     tallied = 0
     executed = 0
 
-    for leg in _local_legs():
+    for leg in _active_local_legs():
         status = (getattr(leg, "status", "") or "").strip()
         vote_id = getattr(leg, "vote_id", "")
         vote = FederalVote[vote_id]
@@ -912,8 +1112,11 @@ def advance_federal_aggregate():
     finalized = 0
     self_id = _self_id()
 
-    for vote in _open_votes():
-        vote_id = getattr(vote, "vote_id", "")
+    for vote_id in due_vote_ids(now):
+        vote = FederalVote[vote_id]
+        if not vote or (getattr(vote, "status", "") or "").strip() != VOTE_STATUS_OPEN:
+            unschedule_vote(vote_id)
+            continue
         rule = {}
         try:
             rule = json.loads(getattr(vote, "rule_json", "") or "{}")
@@ -926,6 +1129,7 @@ def advance_federal_aggregate():
             action = {}
         deadline = int(getattr(vote, "deadline", 0) or 0)
         quarters = known_quarter_ids()
+        unacknowledged = False
 
         for qid in quarters:
             if qid == self_id:
@@ -948,10 +1152,17 @@ def advance_federal_aggregate():
             msg_id = f"fv-open:{vote_id}:{qid}"
             from core.federation import send_federation_message
 
-            yield from send_federation_message(
+            sent = yield from send_federation_message(
                 qid, "gos.federal.open", open_body, msg_id
             )
             opened += 1
+            # The quarter answers with its ballot's proposal id; recording it
+            # is the ack that stops the re-send on later ticks.
+            ack = (sent or {}).get("proposal_id") if isinstance(sent, dict) else ""
+            if (sent or {}).get("success") and ack:
+                leg.proposal_id = str(ack)[:64]
+            else:
+                unacknowledged = True
 
         legs_payload = []
         all_reported = True
@@ -975,11 +1186,17 @@ def advance_federal_aggregate():
 
         grace = int(rule.get("grace_hours") or 0)
         if not all_reported and not _tally.is_past(now, deadline, grace):
+            wake_at = deadline + grace * 3600
+            if unacknowledged:
+                wake_at = min(wake_at, now + OPEN_RETRY_S)
+            _requeue_vote(vote_id, wake_at)
             continue
 
         tally = _tally.aggregate(legs_payload, len(quarters), rule)
         vote.status = (tally.get("status") or "")[:32]
         vote.tally_json = json.dumps(tally, separators=(",", ":"))[:2048]
+        if vote.status != VOTE_STATUS_OPEN:
+            unschedule_vote(vote_id)
         finalized += 1
 
         result_body = {
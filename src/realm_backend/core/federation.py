@@ -100,14 +100,55 @@ def new_msg_id() -> str:
 # ---------------------------------------------------------------------------
 
 
-def federation_members() -> set:
-    """Canister ids this canister accepts federation messages from.
-
-    Union of both roles so the check needs no capital/quarter branching:
-    the capital knows its quarters (``Quarter`` rows), a quarter knows its
-    capital (``Realm.federation_realm_id``).
-    """
+# The member set is rebuilt only when the quarter directory generation moves.
+# ``Quarter`` and ``Realm`` saves and deletes report through ggg.projection
+# (:func:`entity_changed`), so every writer — ``sync_one_peer``, bootstrap,
+# provisioning, the admin endpoints — invalidates it without knowing about
+# it. Saves that leave the membership as it was (population pushes, status
+# changes) do not bump the generation. Heap only: empty after an upgrade.
+_directory_generation = 0
+_members_cache: Optional[Tuple[int, frozenset]] = None
+# What the cached set was built from, to tell whether a save changed it.
+_capital_seen = ""
+_quarters_seen: Dict[str, str] = {}
+_members_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def invalidate_members() -> None:
+    """Bump the quarter directory generation; the next lookup rebuilds."""
+    global _directory_generation
+    _directory_generation += 1
+    _members_stats["invalidations"] += 1
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("Quarter", "Realm")
+
+
+def entity_changed(entity) -> None:
+    """Save hook: invalidate when a quarter's or the capital's id moved."""
+    name = type(entity).__name__
+    if name == "Quarter":
+        cid = (getattr(entity, "canister_id", "") or "").strip()
+        if _quarters_seen.get(str(entity._id)) != cid:
+            invalidate_members()
+    elif name == "Realm" and str(entity._id) == "1":
+        capital_id = (getattr(entity, "federation_realm_id", "") or "").strip()
+        if capital_id != _capital_seen:
+            invalidate_members()
+
+
+def entity_removed(entity) -> None:
+    """Delete hook: a removed quarter (or realm) invalidates."""
+    if type(entity).__name__ in ("Quarter", "Realm"):
+        invalidate_members()
+
+
+def _build_members() -> frozenset:
+    global _capital_seen
     members = set()
+    quarters: Dict[str, str] = {}
+    capital_id = ""
     try:
         from ggg import Quarter, Realm
 
@@ -117,16 +158,67 @@ def federation_members() -> set:
             members.add(capital_id)
         for q in Quarter.instances():
             cid = (getattr(q, "canister_id", "") or "").strip()
+            quarters[str(getattr(q, "_id", ""))] = cid
             if cid:
                 members.add(cid)
     except Exception as e:
         logger.error(f"federation_members: {e}")
+    _capital_seen = capital_id
+    _quarters_seen.clear()
+    _quarters_seen.update(quarters)
+    return frozenset(members)
+
+
+def _members() -> frozenset:
+    global _members_cache
+    cached = _members_cache
+    if cached is not None and cached[0] == _directory_generation:
+        _members_stats["hits"] += 1
+        return cached[1]
+    _members_stats["misses"] += 1
+    generation = _directory_generation
+    members = _build_members()
+    _members_cache = (generation, members)
     return members
 
 
+def federation_members() -> set:
+    """Canister ids this canister accepts federation messages from.
+
+    Union of both roles so the check needs no capital/quarter branching:
+    the capital knows its quarters (``Quarter`` rows), a quarter knows its
+    capital (``Realm.federation_realm_id``). Served from cache while the
+    quarter directory generation is unchanged.
+    """
+    return set(_members())
+
+
+def members_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters and state of the federation member cache."""
+    cached = _members_cache
+    return {
+        **_members_stats,
+        "generation": _directory_generation,
+        "cached": cached is not None and cached[0] == _directory_generation,
+        "size": len(cached[1]) if cached is not None else 0,
+    }
+
+
+def reset_members_cache() -> None:
+    """Forget the cached set and counters (tests)."""
+    global _members_cache, _capital_seen
+    _members_cache = None
+    _capital_seen = ""
+    _quarters_seen.clear()
+    for key in _members_stats:
+        _members_stats[key] = 0
+    invalidate_members()
+    _members_stats["invalidations"] = 0
+
+
 def authorize_source(caller_id: str) -> bool:
     caller = (caller_id or "").strip()
-    return bool(caller) and caller in federation_members()
+    return bool(caller) and caller in _members()
 
 
 # ---------------------------------------------------------------------------
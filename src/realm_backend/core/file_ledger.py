@@ -0,0 +1,174 @@
+"""Running file-size ledger behind the ``files`` snapshot section.
+
+``system_snapshot.file_stats`` used to walk ``/`` on every call, so the
+diagnostics panel cost grew with every file on the canister's filesystem
+(and, since ``os.walk`` is not available on CPython WASM, the walk usually
+came back empty). The files this realm writes at runtime all land in one of
+two trees — ``/extensions/<id>`` and ``/codex_packages/<id>`` — so the
+install and uninstall paths in ``core.runtime_extensions`` and
+``core.runtime_codex`` record each tree here as they write or remove it:
+
+    {"extension:<id>": {"files": n, "bytes": b, "by_ext": {".py": n, ...}}, ...}
+
+stored under one ``_system`` key, so it survives upgrades with the files it
+describes. :func:`totals` then costs one read and a loop over installed
+trees. A realm that predates the ledger has it built once by a timer started
+in ``initialize()``; :func:`verify` re-measures every tree for audits and can
+repair drift.
+"""
+
+import os
+from typing import Dict, Optional
+
+from ic_python_logging import get_logger
+
+logger = get_logger("core.file_ledger")
+
+LEDGER_KEY = "file_ledger"
+NO_EXT = "(no ext)"
+
+
+def _db():
+    from ic_python_db import Database
+
+    return Database.get_instance()
+
+
+def _roots() -> Dict[str, str]:
+    """Tree kind -> the directory its trees live under (read at call time)."""
+    from core import runtime_codex, runtime_extensions
+
+    return {
+        "extension": runtime_extensions.EXTENSIONS_DIR,
+        "codex": runtime_codex.CODEX_PACKAGES_DIR,
+    }
+
+
+def _load() -> Optional[dict]:
+    raw = _db().load("_system", LEDGER_KEY)
+    return raw if isinstance(raw, dict) else None
+
+
+def _store(ledger: dict) -> None:
+    _db().save("_system", LEDGER_KEY, ledger)
+
+
+def ready() -> bool:
+    try:
+        return _load() is not None
+    except Exception:
+        return False
+
+
+def measure(path: str) -> dict:
+    """File count, bytes and per-suffix counts under *path*.
+
+    Recurses with ``os.listdir``; ``os.walk`` is not available on CPython WASM.
+    """
+    out = {"files": 0, "bytes": 0, "by_ext": {}}
+
+    def _visit(directory):
+        for name in os.listdir(directory):
+            item = os.path.join(directory, name)
+            if os.path.isdir(item):
+                _visit(item)
+                continue
+            suffix = os.path.splitext(name)[1].lower() or NO_EXT
+            out["files"] += 1
+            out["by_ext"][suffix] = out["by_ext"].get(suffix, 0) + 1
+            try:
+                out["bytes"] += os.path.getsize(item)
+            except OSError:
+                pass
+
+    if os.path.isdir(path):
+        _visit(path)
+    return out
+
+
+def record(kind: str, tree_id: str, path: str) -> None:
+    """Re-measure one installed tree. Never raises: a stale ledger entry is
+    something :func:`verify` reports, not a reason to fail an install."""
+    try:
+        ledger = _load() or {}
+        ledger[f"{kind}:{tree_id}"] = measure(path)
+        _store(ledger)
+    except Exception as e:
+        logger.warning(f"file ledger: could not record {kind} {tree_id}: {e}")
+
+
+def forget(kind: str, tree_id: str) -> None:
+    try:
+        ledger = _load()
+        if ledger is not None and ledger.pop(f"{kind}:{tree_id}", None) is not None:
+            _store(ledger)
+    except Exception as e:
+        logger.warning(f"file ledger: could not drop {kind} {tree_id}: {e}")
+
+
+def totals() -> dict:
+    """Summed counts over every recorded tree."""
+    ledger = _load() or {}
+    files = size = 0
+    by_ext: Dict[str, int] = {}
+    for entry in ledger.values():
+        files += int(entry.get("files", 0))
+        size += int(entry.get("bytes", 0))
+        for suffix, n in (entry.get("by_ext") or {}).items():
+            by_ext[suffix] = by_ext.get(suffix, 0) + int(n)
+    return {"files": files, "bytes": size, "by_ext": by_ext, "trees": len(ledger)}
+
+
+def verify(repair: bool = False) -> dict:
+    """Re-measure every tree on disk and compare with the ledger.
+
+    Returns the keys that are ``missing`` from the ledger, ``stale`` (recorded
+    but gone from disk) and ``drifted`` (recorded with other numbers). With
+    *repair*, the ledger is rewritten from what was measured.
+    """
+    recorded = _load()
+    ledger = dict(recorded or {})
+    measured = {}
+    for kind, root in _roots().items():
+        if not os.path.isdir(root):
+            continue
+        for tree_id in sorted(os.listdir(root)):
+            path = os.path.join(root, tree_id)
+            if os.path.isdir(path) and not tree_id.startswith("."):
+                measured[f"{kind}:{tree_id}"] = measure(path)
+
+    report = {
+        "trees": len(measured),
+        "missing": sorted(k for k in measured if k not in ledger),
+        "stale": sorted(k for k in ledger if k not in measured),
+        "drifted": sorted(
+            k for k, v in measured.items() if k in ledger and ledger[k] != v
+        ),
+    }
+    report["consistent"] = recorded is not None and not (
+        report["missing"] or report["stale"] or report["drifted"]
+    )
+    if repair and not report["consistent"]:
+        _store(measured)
+        report["repaired"] = True
+    return report
+
+
+def schedule_seed() -> None:
+    """Build the ledger once on a realm that predates it.
+
+    Timers must be set in init/post_upgrade/update context, which is why
+    ``initialize()`` calls this.
+    """
+    if ready():
+        return
+    from _cdk import ic
+
+    def _seed():
+        try:
+            report = verify(repair=True)
+            logger.info(f"file ledger: seeded {report['trees']} trees")
+        except Exception as e:
+            logger.error(f"file ledger: seed failed: {e}")
+
+    ic.set_timer(0, _seed)
@@ -83,20 +83,11 @@ def policy_is_direct(dept) -> bool:
 
 def governing_org(org_name: Optional[str] = None):
     """Resolve the governing Department: *org_name* if given, else root."""
-    from ggg import ROOT_ORG_NAME, Department
-
-    if org_name:
-        dept = Department[org_name]
-        if dept:
-            return dept
-        logger.warning(f"governing_org: '{org_name}' not found, falling back to root")
-    root = Department[ROOT_ORG_NAME]
-    if root:
-        return root
-    for dept in Department.instances():
-        if getattr(dept, "is_root", False):
-            return dept
-    return None
+    from core.org_policy import governing_entry
+    from ggg import Department
+
+    entry = governing_entry(org_name)
+    return Department.load(entry[0]) if entry else None
 
 
 def format_org_policy(dept) -> str:
@@ -174,6 +165,7 @@ def submit_replay_proposal(
     no eligible voters at all).
     """
     from _cdk import ic
+    from core.proposal_index import allocate_proposal_id
     from ggg import Proposal, User
 
     on_behalf_of = None
@@ -187,8 +179,7 @@ def submit_replay_proposal(
             "error": f"Caller {proposer_principal} is not a registered user; cannot propose",
         }
 
-    proposal_num = len(Proposal.instances()) + 1
-    proposal_id = f"prop_{proposal_num:03d}"
+    proposal_id = allocate_proposal_id()
 
     metadata = {
         "proposal_type": "governed_action",
@@ -365,8 +356,15 @@ def gate(
     if _is_controller_or_trusted(caller):
         return None
 
-    governing = governing_org(org_name)
-    if governing is None or policy_is_direct(governing):
+    from core.org_policy import governing_entry
+    from ggg import Department
+
+    # The cached policy settles the direct case without loading the org.
+    entry = governing_entry(org_name)
+    if entry is None or entry[1].direct:
+        return None
+    governing = Department.load(entry[0])
+    if governing is None:
         return None
 
     if not confirm:
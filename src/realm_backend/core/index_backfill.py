@@ -0,0 +1,85 @@
+"""Timer-driven backfill of field indexes over rows that predate them.
+
+The ORM only indexes on write, so an index declared on a type that already
+has rows is missing those rows until something walks the table. A walk over
+the whole table in one message runs into the instruction limit on a large
+realm, so :func:`kick_off` does it in batches of :data:`BATCH` rows, one
+batch per timer tick, and saves *flag* in ``_system`` when the last field is
+done. Readers keep their scan fallback until the flag is set.
+
+Timers can only be set in init/post_upgrade/update context; a query's timers
+and writes are thrown away, so never call this from a query path.
+"""
+
+from typing import Callable, List, Optional
+
+from _cdk import ic
+from ic_python_logging import get_logger
+
+logger = get_logger("core.index_backfill")
+
+BATCH = 50
+# Leave the first batch until init/upgrade has finished its own work.
+FIRST_DELAY = 5
+
+
+def kick_off(
+    entity_cls,
+    fields: List[str],
+    flag: str,
+    rebuild: Optional[Callable] = None,
+) -> None:
+    """Backfill *fields* of *entity_cls* once, then set *flag*.
+
+    ``rebuild`` defaults to ``entity_cls.rebuild_field_index``; indexes kept
+    outside the ORM pass their own with the same signature.
+    """
+    from ic_python_db import Database
+
+    rebuild = rebuild or entity_cls.rebuild_field_index
+    name = entity_cls.__name__
+    db = Database.get_instance()
+    if db.load("_system", flag):
+        return
+    if entity_cls.max_id() == 0:
+        db.save("_system", flag, "done")
+        return
+
+    state = {"field_idx": 0, "cursor": 1}
+
+    def _step():
+        try:
+            field = fields[state["field_idx"]]
+            next_cursor = rebuild(field, from_id=state["cursor"], batch=BATCH)
+            if next_cursor is None:
+                state["field_idx"] += 1
+                state["cursor"] = 1
+                if state["field_idx"] >= len(fields):
+                    db.save("_system", flag, "done")
+                    logger.info(f"✅ {name} field-index backfill complete")
+                    return
+            else:
+                state["cursor"] = next_cursor
+            ic.set_timer(1, _step)
+        except Exception as e:
+            logger.error(f"❌ {name} index backfill step failed: {str(e)}")
+
+    ic.set_timer(FIRST_DELAY, _step)
+    logger.info(f"{name} field-index backfill scheduled")
+
+
+def rebuild_batch(entity_cls, index_one: Callable, from_id=1, batch=BATCH):
+    """Run *index_one* over one batch of rows from *from_id*.
+
+    Returns the next cursor, or ``None`` past the last row — the contract of
+    ``Entity.rebuild_field_index`` — so an index kept outside the ORM builds
+    its ``rebuild`` for :func:`kick_off` on this. *index_one* must be
+    idempotent: a batch may run twice.
+    """
+    rows = entity_cls.load_some(from_id=max(1, int(from_id)), count=batch)
+    if not rows:
+        return None
+    for row in rows:
+        index_one(row)
+    next_id = int(rows[-1]._id) + 1
+    return next_id if next_id <= entity_cls.max_id() else None
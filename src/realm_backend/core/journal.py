@@ -0,0 +1,54 @@
+"""Epoch/clock journal behind the versioned delta answers.
+
+``core.quarter_directory`` and ``core.position_holders`` both keep a heap-only
+answer whose entries are stamped with the value of a change counter when they
+last changed, and both answer a requester's ``{epoch, clock}`` vector with
+only the entries stamped after it. This is that shared part; each module
+subclasses :class:`VersionedJournal` with its own entries and an
+:meth:`~VersionedJournal.entries` that picks the changed ones.
+
+A rebuild (after init/upgrade) starts a new *epoch*. A vector from another
+epoch — or one claiming a clock this journal never reached, or one that does
+not parse — gets every entry.
+"""
+
+from typing import Dict, Optional
+
+
+class VersionedJournal:
+    """Change stamps for keyed entries, and the vector they answer to."""
+
+    def __init__(self, epoch: int = 0):
+        self.versions: Dict[str, int] = {}
+        self.clock = 0
+        self.epoch = epoch
+        self.ready = False
+
+    def _stamp(self, key: str) -> None:
+        self.clock += 1
+        self.versions[key] = self.clock
+
+    def _changed(self, key: str, clock: int) -> bool:
+        return self.versions.get(key, 0) > clock
+
+    def entries(self, clock: int) -> dict:
+        """The answer's payload for entries stamped after *clock*."""
+        raise NotImplementedError
+
+    def vector(self) -> dict:
+        return {"epoch": self.epoch, "clock": self.clock}
+
+    def full(self) -> dict:
+        return {**self.vector(), "full": True, **self.entries(0)}
+
+    def since(self, vector: Optional[dict]) -> dict:
+        """Entries changed after *vector*, or every entry when it is unknown."""
+        vector = vector if isinstance(vector, dict) else {}
+        try:
+            epoch = int(vector.get("epoch", -1))
+            clock = int(vector.get("clock", -1))
+        except (TypeError, ValueError):
+            return self.full()
+        if epoch != self.epoch or not 0 <= clock <= self.clock:
+            return self.full()
+        return {**self.vector(), "full": False, **self.entries(clock)}
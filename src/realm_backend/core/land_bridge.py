@@ -61,38 +61,186 @@ def _land_cells(land) -> list:
     return []
 
 
-def _covering_zone_type(h3_index: str) -> str:
-    """Territory zone type at *h3_index*, or ``unassigned`` when absent."""
+# ---------------------------------------------------------------------------
+# Cell index
+# ---------------------------------------------------------------------------
+#
+# "Who holds this cell" used to mean walking every parcel and re-parsing its
+# metadata, so minting an n-cell parcel cost n full scans. Parcel cells are
+# now kept in field-index families under the ``Land`` type — the same
+# ``_fi:`` keys the ORM writes for ``indexed=True`` properties:
+#
+#   parcel_cell:<cell>    parcels occupying exactly <cell>
+#   parcel_cover:<cell>   parcels occupying a strict descendant of <cell>, for
+#                         cells at COVER_MIN_RES or finer
+#   parcel_cells:<id>     the cells parcel <id> is indexed under
+#
+# and, for coarser ancestors, a count in ``_system`` rather than an id list:
+# a resolution-0 cell spans a continent, and its list would name every
+# parcel in the realm. An overlap check is one read per ancestor plus
+# one for descendants, whatever the parcel count.
+#
+# ``Land`` saves and deletes arrive through ``ggg.projection``
+# (:func:`entity_changed`), so parcels written by import or by generic entity
+# verbs are indexed as well as those from ``land.create``, and a deleted
+# parcel stops holding its cells. Territory zones use the ORM's own index on
+# ``Zone.h3_index``. Reads switch over once ``main`` has backfilled the
+# index, and scan until then. The ``h3_cell``/``h3_cover`` families an
+# earlier layout wrote are no longer read.
+
+CELL_FIELD = "parcel_cell"
+COVER_FIELD = "parcel_cover"
+HELD_FIELD = "parcel_cells"
+CELL_INDEX_FLAG = "fi_backfill:Land:parcel_cell"
+# Territory zones are drawn at resolution 6; coarser ancestors only count.
+COVER_MIN_RES = 6
+_COVER_COUNT_KEY = "parcel_cover_count:{cell}"
+ZONE_INDEX_FIELD = "h3_index"
+# Matches extension_bridge._index_flag(Zone, "h3_index"), which rows_where reads.
+ZONE_INDEX_FLAG = "fi_backfill:Zone:h3_index"
+
+_CELL_INDEX_TYPE = "Land"
+
+
+def _h3_resolution(cell):
+    """Resolution of an H3 cell id, or ``None`` when it is not one."""
+    text = str(cell or "")
+    if len(text) != 15:
+        return None
+    try:
+        value = int(text, 16)
+    except ValueError:
+        return None
+    if (value >> 59) & 0xF != 1:
+        return None
+    return (value >> 52) & 0xF
+
+
+def _h3_parents(cell) -> list:
+    """Ancestors of an H3 cell id, nearest first; ``[]`` for anything else.
+
+    Pure bit arithmetic on the id — resolution lives in bits 52-55 and each
+    finer level is a 3-bit digit set to 7 when unused — so the backend stays
+    free of an h3 dependency.
+    """
+    resolution = _h3_resolution(cell)
+    if resolution is None:
+        return []
+    value = int(str(cell), 16)
+    parents = []
+    for res in range(resolution - 1, -1, -1):
+        value = (value & ~(0xF << 52)) | (res << 52)
+        value |= 0x7 << ((14 - res) * 3)
+        parents.append(f"{value:015x}")
+    return parents
+
+
+def _db():
+    from ic_python_db import Database
+
+    return Database.get_instance()
+
+
+def _flag_set(flag: str) -> bool:
+    try:
+        return bool(_db().load("_system", flag))
+    except Exception:
+        return False
+
+
+def _coarse(cell) -> bool:
+    """True for a cell too coarse to keep a ``parcel_cover`` id list."""
+    resolution = _h3_resolution(cell)
+    return resolution is not None and resolution < COVER_MIN_RES
+
+
+def _cover_count(cell) -> int:
+    try:
+        return int(_db().load("_system", _COVER_COUNT_KEY.format(cell=cell)) or 0)
+    except Exception:
+        return 0
+
+
+def _bump_cover_count(cell, delta: int) -> None:
+    old = _cover_count(cell)
+    n = max(0, old + delta)
+    key = _COVER_COUNT_KEY.format(cell=cell)
+    if n:
+        _db().save("_system", key, str(n))
+    elif old:
+        _db().delete("_system", key)
+
+
+def _index_land_cells(land_id: str, cells, add: bool = True) -> None:
+    db = _db()
+    write = db.field_index_add if add else db.field_index_remove
+    for cell in cells:
+        write(_CELL_INDEX_TYPE, CELL_FIELD, cell, land_id)
+        write(_CELL_INDEX_TYPE, HELD_FIELD, land_id, cell)
+        for parent in _h3_parents(cell):
+            if _coarse(parent):
+                _bump_cover_count(parent, 1 if add else -1)
+            else:
+                write(_CELL_INDEX_TYPE, COVER_FIELD, parent, land_id)
+
+
+def _held_cells(land_id: str) -> list:
+    return _db().field_index_get(_CELL_INDEX_TYPE, HELD_FIELD, land_id)
+
+
+def _sync_land_cells(land) -> None:
+    """Point the cell index at *land*'s current cells; idempotent.
+
+    Drops every old entry before adding, so an ancestor shared by a removed
+    and a kept cell ends up present.
+    """
+    land_id = str(land._id)
+    held = _held_cells(land_id)
+    cells = list(dict.fromkeys(_land_cells(land)))
+    if sorted(held) == sorted(cells):
+        return
+    _index_land_cells(land_id, held, add=False)
+    _index_land_cells(land_id, cells)
+
+
+def _forget_land_cells(land_id: str) -> None:
+    _index_land_cells(land_id, _held_cells(land_id), add=False)
+
+
+def rebuild_cell_index(field=CELL_FIELD, from_id=1, batch=50):
+    """Index one batch of existing parcels for ``main``'s backfill timer."""
+    from ggg import Land
+
+    from core.index_backfill import rebuild_batch
+
+    return rebuild_batch(Land, _sync_land_cells, from_id, batch)
+
+
+def _zones_at(cell: str) -> list:
+    """Every Zone row on *cell*, territory or land-linked."""
     from ggg import Zone
 
-    cell = str(h3_index)
-    zone = None
+    from core.extension_bridge import rows_where
+
     try:
-        zone = Zone[cell]
+        return rows_where(Zone, {"h3_index": cell})
     except Exception:
-        zone = None
-    if zone is not None:
-        try:
-            if zone.land is not None:
-                zone = None
-        except Exception:
-            pass
-    if zone is None:
-        try:
-            for z in Zone.instances():
-                if z.h3_index == cell:
-                    try:
-                        if z.land is None:
-                            zone = z
-                            break
-                    except Exception:
-                        zone = z
-                        break
-        except Exception:
-            pass
-    if zone is None:
-        return "unassigned"
-    return getattr(zone, "zone_type", None) or "unassigned"
+        return []
+
+
+def _covering_zone_type(h3_index: str) -> str:
+    """Territory zone type at *h3_index* or its nearest ancestor cell.
+
+    ``unassigned`` when no territory zone covers it.
+    """
+    from core.extension_bridge import _is_territory_zone
+
+    cell = str(h3_index)
+    for candidate in [cell] + _h3_parents(cell):
+        for zone in _zones_at(candidate):
+            if _is_territory_zone(zone):
+                return getattr(zone, "zone_type", None) or "unassigned"
+    return "unassigned"
 
 
 def _inherit_land_type(cells: list) -> str:
@@ -108,6 +256,40 @@ def _inherit_land_type(cells: list) -> str:
     return Counter(non_unassigned).most_common(1)[0][0]
 
 
+def _lands_covering(cells: list) -> list:
+    """Parcels occupying any of *cells* or a descendant of one."""
+    from ggg import Land
+
+    # Parcels under a coarse cell are only counted, so asking for one falls
+    # back to the scan — and only when some parcel is actually there.
+    if _flag_set(CELL_INDEX_FLAG) and not any(
+        _coarse(c) and _cover_count(c) for c in cells
+    ):
+        db = _db()
+        ids = []
+        for cell in cells:
+            for field in (CELL_FIELD, COVER_FIELD):
+                for land_id in db.field_index_get(_CELL_INDEX_TYPE, field, cell):
+                    if land_id not in ids:
+                        ids.append(land_id)
+        lands = []
+        for land_id in sorted(ids, key=int):
+            land = Land.load(land_id)
+            if land is not None:
+                lands.append(land)
+        return lands
+
+    lands = []
+    for land in _all_lands():
+        land_cells = _land_cells(land)
+        lineage = set(land_cells)
+        for c in land_cells:
+            lineage.update(_h3_parents(c))
+        if lineage.intersection(cells):
+            lands.append(land)
+    return lands
+
+
 def sync_parcels_covering(cells: list) -> None:
     """Recompute ``land_type`` on parcels whose cells overlap *cells*."""
     if not cells:
@@ -118,18 +300,459 @@ def sync_parcels_covering(cells: list) -> None:
         return
     cell_set = {str(c) for c in cells if c}
     try:
-        lands = _all_lands()
+        lands = _lands_covering(sorted(cell_set))
     except Exception:
         return
     for land in lands:
         land_cells = _land_cells(land)
         if not land_cells:
             continue
-        if not cell_set.intersection(land_cells):
-            continue
         land.land_type = _inherit_land_type(land_cells)
 
 
+# ---------------------------------------------------------------------------
+# Map index
+# ---------------------------------------------------------------------------
+#
+# ``land.map`` paged parcels by id and then filtered each page to the
+# viewport, so a small window over a large realm walked the whole table and
+# handed back mostly-empty pages; ``get_zones`` serialized every territory
+# zone at once. Two more indexes, backfilled like the cell index above:
+#
+#   Land parcel_tile:<tx>:<ty>  parcels whose x/y falls in that TILE_SIZE
+#                               square, plus the sorted list of occupied
+#                               tiles in _system
+#   Zone zone_bucket:<cell>     territory zones at or inside <cell>, for cells
+#                               at COVER_MIN_RES or finer
+#
+# A coarser cell keeps a summary in _system instead of an id list — zone and
+# distinct-user counts, counts per zone type, and which of its (at most 7)
+# child cells are occupied — so adding a zone rewrites a handful of small
+# records rather than one list naming every zone in the realm. The
+# summaries form a tree under a root ``*``: an aggregate at resolution r
+# reads the occupied cells down to r, and a viewport cell is expanded
+# through its occupied children.
+#
+# Each parcel and zone records what it was indexed under, and ``Land`` and
+# ``Zone`` saves and deletes arrive through ``ggg.projection``, so a moved or
+# deleted parcel or zone leaves no entry behind and an emptied tile or
+# bucket is pruned.
+
+TILE_SIZE = 64
+TILE_FIELD = "parcel_tile"
+TILE_HELD_FIELD = "parcel_tile_of"
+TILE_INDEX_FLAG = "fi_backfill:Land:parcel_tile"
+_TILES_KEY = "land_map_tiles:v2"
+
+ZONE_BUCKET_FIELD = "zone_bucket"
+ZONE_BUCKET_FLAG = "fi_backfill:Zone:zone_bucket"
+# Resolutions get_zones aggregates server-side. Territory zones are drawn at
+# resolution 6, so anything coarser is a bucket count rather than a zone list.
+AGGREGATE_RESOLUTIONS = tuple(range(COVER_MIN_RES))
+_SUMMARY_KEY = "zone_bucket:{cell}"
+_SUMMARY_USER_KEY = "zone_bucket_user:{cell}|{user}"
+_ZONE_RECORD_KEY = "zone_bucketed:{zone_id}"
+_ROOT = "*"
+
+MAX_VIEWPORT_CELLS = 64
+
+
+def _load_json(key: str, default):
+    raw = _db().load("_system", key)
+    try:
+        return json.loads(raw) if raw else default
+    except Exception:
+        return default
+
+
+def _save_json(key: str, value) -> None:
+    """Save *value* under *key*, or delete the key when *value* is empty."""
+    db = _db()
+    if value:
+        db.save("_system", key, json.dumps(value))
+    elif db.load("_system", key) is not None:
+        db.delete("_system", key)
+
+
+def _load_list(key: str) -> list:
+    return _load_json(key, [])
+
+
+def _tile_of(land):
+    x, y = land.x_coordinate, land.y_coordinate
+    if x is None or y is None:
+        return None
+    return [int(x) // TILE_SIZE, int(y) // TILE_SIZE]
+
+
+def _sync_land_tile(land) -> None:
+    """Point the tile index at *land*'s current x/y; idempotent."""
+    db = _db()
+    land_id = str(land._id)
+    held = db.field_index_get(_CELL_INDEX_TYPE, TILE_HELD_FIELD, land_id)
+    tile = _tile_of(land)
+    now = [f"{tile[0]}:{tile[1]}"] if tile is not None else []
+    if held == now:
+        return
+    _move_land_tile(land_id, held, now)
+
+
+def _forget_land_tile(land_id: str) -> None:
+    held = _db().field_index_get(_CELL_INDEX_TYPE, TILE_HELD_FIELD, land_id)
+    if held:
+        _move_land_tile(land_id, held, [])
+
+
+def _move_land_tile(land_id: str, held: list, now: list) -> None:
+    db = _db()
+    tiles = _load_list(_TILES_KEY)
+    for key in held:
+        db.field_index_remove(_CELL_INDEX_TYPE, TILE_FIELD, key, land_id)
+        db.field_index_remove(_CELL_INDEX_TYPE, TILE_HELD_FIELD, land_id, key)
+        if not db.field_index_get(_CELL_INDEX_TYPE, TILE_FIELD, key):
+            tiles = [t for t in tiles if f"{t[0]}:{t[1]}" != key]
+    for key in now:
+        db.field_index_add(_CELL_INDEX_TYPE, TILE_FIELD, key, land_id)
+        db.field_index_add(_CELL_INDEX_TYPE, TILE_HELD_FIELD, land_id, key)
+        tile = [int(p) for p in key.split(":")]
+        if tile not in tiles:
+            tiles.append(tile)
+    tiles.sort()
+    if tiles != _load_list(_TILES_KEY):
+        _save_json(_TILES_KEY, tiles)
+
+
+def _coords_taken(x, y) -> bool:
+    """True when a parcel already sits at exactly (x, y)."""
+    if _flag_set(TILE_INDEX_FLAG):
+        from ggg import Land
+
+        key = f"{int(x) // TILE_SIZE}:{int(y) // TILE_SIZE}"
+        candidates = (
+            Land.load(i)
+            for i in _db().field_index_get(_CELL_INDEX_TYPE, TILE_FIELD, key)
+        )
+    else:
+        candidates = _all_lands()
+    return any(
+        land is not None and land.x_coordinate == x and land.y_coordinate == y
+        for land in candidates
+    )
+
+
+def rebuild_tile_index(field=TILE_FIELD, from_id=1, batch=50):
+    """Tile one batch of existing parcels (see :func:`rebuild_cell_index`)."""
+    from ggg import Land
+
+    from core.index_backfill import rebuild_batch
+
+    return rebuild_batch(Land, _sync_land_tile, from_id, batch)
+
+
+def _viewport_page(min_x, max_x, min_y, max_y, cursor, page_size):
+    """Parcels inside the window from the tile index, and the next cursor.
+
+    The cursor is ``"<tx>,<ty>,<offset>"`` — the next candidate's position —
+    so tiles occupied between pages do not shift it. Filling a page looks one
+    match ahead, so ``has_more`` never promises an empty page.
+    """
+    from ggg import Land
+
+    db = _db()
+    start = (None, 0)
+    if cursor:
+        tx, ty, offset = (int(p) for p in str(cursor).split(","))
+        start = ((tx, ty), offset)
+
+    batch = []
+    lo_tx, hi_tx = min_x // TILE_SIZE, max_x // TILE_SIZE
+    lo_ty, hi_ty = min_y // TILE_SIZE, max_y // TILE_SIZE
+    for tx, ty in _load_list(_TILES_KEY):
+        if not (lo_tx <= tx <= hi_tx and lo_ty <= ty <= hi_ty):
+            continue
+        if start[0] is not None and (tx, ty) < start[0]:
+            continue
+        offset = start[1] if start[0] == (tx, ty) else 0
+        ids = db.field_index_get(_CELL_INDEX_TYPE, TILE_FIELD, f"{tx}:{ty}")
+        for pos in range(offset, len(ids)):
+            land = Land.load(ids[pos])
+            if land is None or not (min_x <= land.x_coordinate <= max_x
+                                    and min_y <= land.y_coordinate <= max_y):
+                continue
+            if len(batch) == page_size:
+                return batch, f"{tx},{ty},{pos}"
+            batch.append(land)
+    return batch, None
+
+
+def _zone_lineage(cell) -> list:
+    """*cell* and its ancestors — every bucket a zone there belongs to."""
+    if _h3_resolution(cell) is None:
+        return []
+    return [str(cell)] + _h3_parents(cell)
+
+
+def _zone_type(zone) -> str:
+    return getattr(zone, "zone_type", None) or "unassigned"
+
+
+def _zone_user_id(zone):
+    try:
+        user = zone.user
+    except Exception:
+        return None
+    return getattr(user, "id", None) if user is not None else None
+
+
+def _summary(cell: str) -> dict:
+    return _load_json(_SUMMARY_KEY.format(cell=cell), {})
+
+
+def _bump(counts: dict, key: str, delta: int) -> None:
+    n = counts.get(key, 0) + delta
+    if n > 0:
+        counts[key] = n
+    else:
+        counts.pop(key, None)
+
+
+def _contribute(zone_id: str, record: dict, sign: int) -> None:
+    """Add (``sign=1``) or withdraw (``-1``) one zone's bucket entries.
+
+    Finest first, so each coarse summary knows whether the child it links
+    to is still occupied once the zone is withdrawn.
+    """
+    db = _db()
+    lineage = _zone_lineage(record["cell"])
+    if not lineage:
+        return
+    child, child_empty = None, False
+    for cell in lineage + [_ROOT]:
+        if cell != _ROOT and not _coarse(cell):
+            if sign > 0:
+                db.field_index_add("Zone", ZONE_BUCKET_FIELD, cell, zone_id)
+            else:
+                db.field_index_remove("Zone", ZONE_BUCKET_FIELD, cell, zone_id)
+            child_empty = not db.field_index_get("Zone", ZONE_BUCKET_FIELD, cell)
+            child = cell
+            continue
+        summary = _summary(cell)
+        summary["zones"] = summary.get("zones", 0) + sign
+        types = summary.setdefault("types", {})
+        _bump(types, record["type"], sign)
+        user = record.get("user")
+        if user:
+            key = _SUMMARY_USER_KEY.format(cell=cell, user=user)
+            held = int(db.load("_system", key) or 0)
+            if sign > 0:
+                db.save("_system", key, str(held + 1))
+            elif held > 1:
+                db.save("_system", key, str(held - 1))
+            elif held:
+                db.delete("_system", key)
+            if (sign > 0 and held == 0) or (sign < 0 and held == 1):
+                summary["users"] = summary.get("users", 0) + sign
+        children = summary.setdefault("children", [])
+        if child is not None:
+            if sign > 0 and child not in children:
+                children.append(child)
+                children.sort()
+            elif sign < 0 and child_empty and child in children:
+                children.remove(child)
+        child_empty = summary["zones"] <= 0
+        child = cell
+        _save_json(_SUMMARY_KEY.format(cell=cell), None if child_empty else summary)
+
+
+def _zone_record(zone):
+    """What a zone is bucketed under, or None when it is not bucketed."""
+    from core.extension_bridge import _is_territory_zone
+
+    cell = str(getattr(zone, "h3_index", "") or "")
+    if not _zone_lineage(cell) or not _is_territory_zone(zone):
+        return None
+    return {"cell": cell, "type": _zone_type(zone), "user": _zone_user_id(zone)}
+
+
+def _sync_zone(zone) -> None:
+    zone_id = str(zone._id)
+    key = _ZONE_RECORD_KEY.format(zone_id=zone_id)
+    old = _load_json(key, None)
+    new = _zone_record(zone)
+    if old == new:
+        return
+    if old:
+        _contribute(zone_id, old, -1)
+    if new:
+        _contribute(zone_id, new, 1)
+    _save_json(key, new)
+
+
+def _forget_zone(zone_id: str) -> None:
+    key = _ZONE_RECORD_KEY.format(zone_id=zone_id)
+    old = _load_json(key, None)
+    if old:
+        _contribute(zone_id, old, -1)
+        _save_json(key, None)
+
+
+def index_zone(zone) -> None:
+    """Bring a zone's bucket entries up to date; idempotent.
+
+    The ``Zone`` save hook does the same; ``zone.*`` verbs call it directly
+    so the index does not depend on how the row was written.
+    """
+    try:
+        _sync_zone(zone)
+    except Exception:
+        pass
+
+
+def unindex_zone(zone) -> None:
+    """Drop a zone from the bucket index, before it is deleted."""
+    try:
+        _forget_zone(str(zone._id))
+    except Exception:
+        pass
+
+
+def rebuild_zone_index(field=ZONE_BUCKET_FIELD, from_id=1, batch=50):
+    """Bucket one batch of existing zones; idempotent like the rest."""
+    from ggg import Zone
+
+    from core.index_backfill import rebuild_batch
+
+    return rebuild_batch(Zone, _sync_zone, from_id, batch)
+
+
+def _occupied(cell: str) -> list:
+    return _summary(cell).get("children", [])
+
+
+def _sole_zone(cell: str):
+    """The one territory zone at or inside *cell* (its summary counts one)."""
+    from ggg import Zone
+
+    from core.extension_bridge import _is_territory_zone
+
+    for zone in _zones_at(cell):
+        if _is_territory_zone(zone):
+            return zone
+    for child in _occupied(cell):
+        if _coarse(child):
+            zone = _sole_zone(child)
+        else:
+            ids = _db().field_index_get("Zone", ZONE_BUCKET_FIELD, child)
+            zone = Zone.load(ids[0]) if ids else None
+        if zone is not None:
+            return zone
+    return None
+
+
+def zone_aggregate(resolution: int):
+    """Territory zones bucketed at a coarse *resolution*, from the index.
+
+    ``None`` when the resolution is not aggregated or the index is still
+    backfilling, in which case ``get_zones`` lists zones individually.
+    """
+    resolution = int(resolution)
+    if resolution not in AGGREGATE_RESOLUTIONS or not _flag_set(ZONE_BUCKET_FLAG):
+        return None
+    cells = _occupied(_ROOT)
+    for _ in range(resolution):
+        cells = [child for cell in cells for child in _occupied(cell)]
+    zones = []
+    for cell in cells:
+        summary = _summary(cell)
+        count = summary.get("zones", 0)
+        if not count:
+            continue
+        types = summary.get("types", {})
+        name = f"{count} zones"
+        if count == 1:
+            only = _sole_zone(cell)
+            name = (getattr(only, "name", None) if only else None) or "Zone"
+        zones.append({
+            "h3_index": cell,
+            "name": name,
+            "zone_type": max(types, key=types.get) if types else "unassigned",
+            "user_count": summary.get("users", 0),
+            "zone_count": count,
+            "zone_types": types,
+        })
+    return {
+        "success": True,
+        "zones": zones,
+        "total_users": _summary(_ROOT).get("users", 0),
+        "resolution": resolution,
+        "aggregated": True,
+    }
+
+
+def _zone_ids_under(cell: str, ids: set) -> None:
+    """Add the ids of territory zones at or inside *cell* to *ids*."""
+    from core.extension_bridge import _is_territory_zone
+
+    if not _coarse(cell):
+        ids.update(_db().field_index_get("Zone", ZONE_BUCKET_FIELD, cell))
+        return
+    if not _summary(cell):
+        return
+    for zone in _zones_at(cell):
+        if _is_territory_zone(zone):
+            ids.add(str(zone._id))
+    for child in _occupied(cell):
+        _zone_ids_under(child, ids)
+
+
+def _zone_ids_in(cells: list) -> list:
+    """Ids of territory zones inside, at, or containing any of *cells*."""
+    from core.extension_bridge import _is_territory_zone
+
+    ids = set()
+    for cell in cells:
+        _zone_ids_under(cell, ids)
+        for parent in _h3_parents(cell):
+            for zone in _zones_at(parent):
+                if _is_territory_zone(zone):
+                    ids.add(str(zone._id))
+    return sorted(ids, key=int)
+
+
+# ---------------------------------------------------------------------------
+# Maintenance
+# ---------------------------------------------------------------------------
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("Land", "Zone")
+
+
+def entity_changed(entity) -> None:
+    """Save hook: reindex a parcel's cells and tile, or a zone's buckets."""
+    kind = type(entity).__name__
+    try:
+        if kind == "Land":
+            _sync_land_cells(entity)
+            _sync_land_tile(entity)
+        elif kind == "Zone":
+            _sync_zone(entity)
+    except Exception:
+        pass
+
+
+def entity_removed(entity) -> None:
+    """Delete hook: a deleted parcel or zone leaves the indexes."""
+    kind = type(entity).__name__
+    try:
+        if kind == "Land":
+            _forget_land_cells(str(entity._id))
+            _forget_land_tile(str(entity._id))
+        elif kind == "Zone":
+            _forget_zone(str(entity._id))
+    except Exception:
+        pass
+
+
 def project(land) -> dict:
     """A land parcel as plain data."""
     meta = _metadata(land)
@@ -275,23 +898,37 @@ def _all_lands():
 
 
 def _cell_is_taken(h3_index: str) -> bool:
-    """True when another parcel or leftover land-linked Zone owns *h3_index*."""
-    from ggg import Zone
+    """True when a parcel or leftover land-linked Zone overlaps *h3_index*.
+
+    Overlap covers the cell itself, any ancestor a parcel holds, and any
+    descendant a parcel holds.
+    """
+    from core.extension_bridge import _is_territory_zone
 
     cell = str(h3_index)
-    for land in _all_lands():
-        if cell in _land_cells(land):
+    if _cell_is_held(cell, _h3_parents(cell)):
+        return True
+    return any(not _is_territory_zone(zone) for zone in _zones_at(cell))
+
+
+def _cell_is_held(cell: str, ancestors: list) -> bool:
+    if _flag_set(CELL_INDEX_FLAG):
+        db = _db()
+        if _coarse(cell):
+            if _cover_count(cell):
+                return True
+        elif db.field_index_get(_CELL_INDEX_TYPE, COVER_FIELD, cell):
             return True
-    try:
-        zone = Zone[cell]
-    except Exception:
-        zone = None
-    if not zone:
-        return False
-    try:
-        return zone.land is not None
-    except Exception:
-        return False
+        return any(
+            db.field_index_get(_CELL_INDEX_TYPE, CELL_FIELD, c)
+            for c in [cell] + ancestors
+        )
+    lineage = {cell, *ancestors}
+    for land in _all_lands():
+        for held in _land_cells(land):
+            if held in lineage or cell in _h3_parents(held):
+                return True
+    return False
 
 
 def _synthetic_coords(h3_indexes: list):
@@ -334,9 +971,24 @@ def v_get(caller="", land_id="", **kwargs) -> dict:
 
 
 def v_map(caller="", min_x=0, max_x=20, min_y=0, max_y=20, from_id=1,
-          page_size=DEFAULT_PAGE_SIZE, **kwargs) -> dict:
-    """Parcels within a coordinate window, keyed ``"x,y"`` for the map view."""
-    batch, max_id, next_from_id = _page(from_id, page_size)
+          page_size=DEFAULT_PAGE_SIZE, cursor=None, **kwargs) -> dict:
+    """Parcels within a coordinate window, keyed ``"x,y"`` for the map view.
+
+    Served from the tile index once it is backfilled: only parcels in the
+    window are loaded, and ``next_cursor`` pages through them. Until then it
+    pages by id (``from_id``/``next_from_id``) and filters each page.
+    """
+    from ggg import Land
+
+    if _flag_set(TILE_INDEX_FLAG):
+        page_size = max(1, min(int(page_size or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        batch, next_cursor = _viewport_page(
+            min_x, max_x, min_y, max_y, cursor, page_size
+        )
+        max_id, next_from_id = Land.max_id(), None
+    else:
+        batch, max_id, next_from_id = _page(from_id, page_size)
+        next_cursor = None
 
     lands = {}
     for land in batch:
@@ -364,7 +1016,58 @@ def v_map(caller="", min_x=0, max_x=20, min_y=0, max_y=20, from_id=1,
         "lands": lands,
         "max_id": max_id,
         "next_from_id": next_from_id,
-        "has_more": next_from_id is not None,
+        "next_cursor": next_cursor,
+        "has_more": next_from_id is not None or next_cursor is not None,
+    }
+
+
+def v_zones(caller="", cells=None, cursor=None, page_size=DEFAULT_PAGE_SIZE,
+            **kwargs) -> dict:
+    """Territory zones intersecting a viewport given as H3 cells.
+
+    The backend has no geometry, so the map covers its viewport with a few
+    coarse cells (h3-js ``polygonToCells``) and passes them here. ``cursor`` is
+    the last zone id already returned.
+    """
+    from ggg import Zone
+
+    from core.extension_bridge import ENTITY_POLICIES, _is_territory_zone, _project
+
+    cells = [str(c) for c in (cells or []) if c]
+    if not cells:
+        raise ValueError("cells is required")
+    if len(cells) > MAX_VIEWPORT_CELLS:
+        raise ValueError(f"at most {MAX_VIEWPORT_CELLS} cells per viewport")
+    page_size = max(1, min(int(page_size or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+
+    if _flag_set(ZONE_BUCKET_FLAG):
+        ids = _zone_ids_in(cells)
+    else:
+        wanted = set(cells)
+        around = set(wanted)
+        for cell in cells:
+            around.update(_h3_parents(cell))
+        ids = []
+        for zone in Zone.instances():
+            cell = str(zone.h3_index)
+            hit = cell in around or wanted.intersection(_zone_lineage(cell))
+            if hit and _is_territory_zone(zone):
+                ids.append(str(zone._id))
+        ids.sort(key=int)
+    if cursor:
+        ids = [i for i in ids if int(i) > int(cursor)]
+
+    rows = []
+    for zone_id in ids[:page_size]:
+        zone = Zone.load(zone_id)
+        if zone is not None:
+            rows.append(_project(zone, ENTITY_POLICIES["Zone"]))
+    has_more = len(ids) > page_size
+    return {
+        "zones": rows,
+        "count": len(rows),
+        "next_cursor": ids[page_size - 1] if has_more else None,
+        "has_more": has_more,
     }
 
 
@@ -431,10 +1134,8 @@ def v_create(caller="", land_type=None, name="", id="", h3_index=None,
     if x_coordinate is None or y_coordinate is None:
         raise ValueError("x_coordinate and y_coordinate are required")
 
-    for existing in _all_lands():
-        if (existing.x_coordinate == x_coordinate
-                and existing.y_coordinate == y_coordinate):
-            raise ValueError("Land already exists at these coordinates")
+    if _coords_taken(x_coordinate, y_coordinate):
+        raise ValueError("Land already exists at these coordinates")
 
     land = Land(
         x_coordinate=x_coordinate,
@@ -589,6 +1290,7 @@ READS = {
     "land.list": v_list,
     "land.get": v_get,
     "land.map": v_map,
+    "land.zones": v_zones,
 }
 
 WRITES = {
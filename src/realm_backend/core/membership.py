@@ -9,12 +9,24 @@ rewritten on every registration.
 Consequences:
   - Membership *checks* must traverse forward from the user (cheap).
   - Member/holder *counts* read the reverse counter (cheap).
-  - Member/holder *listing* is a paginated scan over users. That is O(all
-    users) and reserved for admin/display paths — never call it from hot
-    request paths.
+  - Member/holder *listing* reads a reverse membership index (below) once
+    it has been backfilled, costing O(members); until then it falls back to
+    a paginated scan over every user.
+
+The reverse index keeps, per department, profile and extension, the ids of
+the users holding it. It is split into pages by user id (``PAGE_SPAN`` ids a
+page), so adding a member rewrites one bounded page rather than an array as
+long as the membership — the cost #242 removed. Each user also records the
+memberships it was last indexed with, and :func:`sync_user` diffs the
+forward relations against that record. Every membership change saves the
+user (``ManyToMany.add``/``remove`` save the owner), so the ``User`` save
+hook keeps the index current for ``add_department_member``, the grant paths
+and anything else that edits the relations, without each call site
+remembering to. :func:`verify_index` and :func:`verify_members` check it
+against the forward relations and can repair drift.
 """
 
-from typing import Callable, Iterator, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from ic_python_logging import get_logger
 
@@ -24,18 +36,22 @@ logger = get_logger("core.membership")
 _SCAN_PAGE = 100
 
 
-def iter_users() -> Iterator:
-    from ggg import User
-
-    max_id = User.max_id()
+def _iter_rows(cls) -> Iterator:
+    max_id = cls.max_id()
     from_id = 1
     while from_id <= max_id:
-        batch = User.load_some(from_id=from_id, count=_SCAN_PAGE)
-        for u in batch:
-            yield u
+        batch = cls.load_some(from_id=from_id, count=_SCAN_PAGE)
+        for row in batch:
+            yield row
         from_id += _SCAN_PAGE
 
 
+def iter_users() -> Iterator:
+    from ggg import User
+
+    return _iter_rows(User)
+
+
 def _scan_users(predicate: Callable, limit: Optional[int] = None) -> List:
     result = []
     for user in iter_users():
@@ -49,6 +65,329 @@ def _scan_users(predicate: Callable, limit: Optional[int] = None) -> List:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Reverse membership index
+# ---------------------------------------------------------------------------
+
+INDEX_TYPE = "_Membership"
+INDEX_FLAG = "ri_backfill:User:memberships:v1"
+INDEX_FIELD = "memberships"
+
+# User ids per index page: bounds the array one membership change rewrites.
+PAGE_SPAN = 512
+DEFAULT_PAGE_LIMIT = 100
+
+KIND_DEPARTMENT = "department"
+KIND_PROFILE = "profile"
+KIND_EXTENSION = "extension"
+
+# kind -> User relation it mirrors
+_RELATIONS: Dict[str, str] = {
+    KIND_DEPARTMENT: "departments",
+    KIND_PROFILE: "profiles",
+    KIND_EXTENSION: "extensions",
+}
+
+
+def _db():
+    from ic_python_db import Database
+
+    return Database.get_instance()
+
+
+def index_ready() -> bool:
+    """True once existing users have been backfilled into the index."""
+    try:
+        return bool(_db().load("_system", INDEX_FLAG))
+    except Exception:
+        return False
+
+
+def _entry(kind: str, target_id) -> str:
+    return f"{kind}:{target_id}"
+
+
+def _forward(user) -> set:
+    """The ``kind:target_id`` entries *user*'s relations hold right now."""
+    db = _db()
+    entries = set()
+    for kind, relation in _RELATIONS.items():
+        for target_id in db.reverse_index_get(user._type, user._id, relation):
+            entries.add(_entry(kind, target_id))
+    return entries
+
+
+def _indexed(user_id: str) -> set:
+    return set(_db().field_index_get(INDEX_TYPE, "user", user_id))
+
+
+def _index_add(entry: str, user_id: str) -> None:
+    db = _db()
+    page = str(int(user_id) // PAGE_SPAN)
+    if page not in db.field_index_get(INDEX_TYPE, "pages", entry):
+        db.field_index_add(INDEX_TYPE, "pages", entry, page)
+    db.field_index_add(INDEX_TYPE, entry, page, user_id)
+    db.field_index_add(INDEX_TYPE, "user", user_id, entry)
+
+
+def _index_remove(entry: str, user_id: str) -> None:
+    db = _db()
+    page = str(int(user_id) // PAGE_SPAN)
+    db.field_index_remove(INDEX_TYPE, entry, page, user_id)
+    if not db.field_index_get(INDEX_TYPE, entry, page):
+        db.field_index_remove(INDEX_TYPE, "pages", entry, page)
+    db.field_index_remove(INDEX_TYPE, "user", user_id, entry)
+
+
+def sync_user(user) -> int:
+    """Bring *user*'s index entries in line with its relations.
+
+    Returns the number of entries added or removed; ``0`` means it was
+    already current. Idempotent, so the backfill and the save hook may both
+    reach the same user.
+    """
+    user_id = str(user._id)
+    current = _forward(user)
+    indexed = _indexed(user_id)
+    for entry in current - indexed:
+        _index_add(entry, user_id)
+    for entry in indexed - current:
+        _index_remove(entry, user_id)
+    return len(current ^ indexed)
+
+
+def forget_user(user) -> None:
+    """Drop a deleted user from every index entry it was recorded under."""
+    user_id = str(user._id)
+    for entry in _indexed(user_id):
+        _index_remove(entry, user_id)
+
+
+def forget_target(kind: str, target_id) -> None:
+    """Drop a deleted department or profile's pages and its members' records.
+
+    The relation is unidirectional, so the ORM cannot clear the members'
+    own links to the deleted row; they are cleared here too, or the next
+    save of each member would index it again.
+    """
+    db = _db()
+    entry = _entry(kind, target_id)
+    relation = _RELATIONS[kind]
+    for page in db.field_index_get(INDEX_TYPE, "pages", entry):
+        for user_id in db.field_index_get(INDEX_TYPE, entry, page):
+            db.reverse_index_remove("User", user_id, relation, str(target_id))
+            _index_remove(entry, user_id)
+
+
+# Entity types ``ggg.projection`` hands to the hooks below. ``Extension`` is
+# not a projected entity, so an uninstalled extension's pages are kept.
+WATCHES = ("User", "Department", "UserProfile")
+
+_KINDS = {"Department": KIND_DEPARTMENT, "UserProfile": KIND_PROFILE}
+
+
+def entity_changed(entity) -> None:
+    """Save hook: reindex a user's memberships. Never raises."""
+    if type(entity).__name__ != "User":
+        return
+    try:
+        sync_user(entity)
+    except Exception as e:
+        logger.warning(f"membership index: could not sync user {entity._id}: {e}")
+
+
+def entity_removed(entity) -> None:
+    """Delete hook: unindex a user, department or profile. Never raises."""
+    kind = type(entity).__name__
+    try:
+        if kind == "User":
+            forget_user(entity)
+        elif kind in _KINDS:
+            forget_target(_KINDS[kind], entity._id)
+    except Exception as e:
+        logger.warning(f"membership index: could not drop {kind} {entity._id}: {e}")
+
+
+def rebuild_index(field=INDEX_FIELD, from_id=1, batch=50):
+    """Index one batch of existing users for ``main``'s backfill timer."""
+    from ggg import User
+
+    from core.index_backfill import rebuild_batch
+
+    return rebuild_batch(User, sync_user, from_id, batch)
+
+
+def verify_index(from_id: int = 1, batch: int = 50, repair: bool = False) -> dict:
+    """Check one batch of users' index entries against their relations.
+
+    Returns ``{"checked", "drifted": [user ids], "next_cursor"}``; with
+    *repair* the drifted users are resynced. Run it batch by batch (feeding
+    ``next_cursor`` back) to cover the realm within the instruction limit.
+    """
+    from ggg import User
+
+    rows = User.load_some(from_id=max(1, int(from_id)), count=batch)
+    drifted = []
+    for user in rows:
+        user_id = str(user._id)
+        if _forward(user) != _indexed(user_id):
+            drifted.append(user_id)
+            if repair:
+                sync_user(user)
+    next_cursor = None
+    if rows and int(rows[-1]._id) + 1 <= User.max_id():
+        next_cursor = int(rows[-1]._id) + 1
+    return {"checked": len(rows), "drifted": drifted, "next_cursor": next_cursor}
+
+
+def verify_members(kind: str, target, repair: bool = False) -> dict:
+    """Check every user listed under *target* really holds it.
+
+    Costs O(listed members). Returns ``{"checked", "stale": [user ids]}``;
+    with *repair* stale entries are removed. Members missing from the list
+    are found from the user side by :func:`verify_index`.
+    """
+    target_id = _target_id(kind, target)
+    if target_id is None:
+        return {"checked": 0, "stale": []}
+    from ggg import User
+
+    entry = _entry(kind, target_id)
+    relation = _RELATIONS[kind]
+    db = _db()
+    checked, stale = 0, []
+    cursor = 0
+    while cursor is not None:
+        user_ids, cursor = member_ids(kind, target_id, cursor, limit=PAGE_SPAN)
+        for user_id in user_ids:
+            checked += 1
+            held = db.reverse_index_get("User", user_id, relation)
+            if User.load(user_id) is None or str(target_id) not in held:
+                stale.append(user_id)
+    if repair:
+        for user_id in stale:
+            _index_remove(entry, user_id)
+    return {"checked": checked, "stale": stale}
+
+
+def _target_class(kind: str):
+    from ggg import Department, Extension, UserProfile
+
+    return {
+        KIND_DEPARTMENT: Department,
+        KIND_PROFILE: UserProfile,
+        KIND_EXTENSION: Extension,
+    }[kind]
+
+
+def _target_id(kind: str, target) -> Optional[str]:
+    """The ``_id`` of *target*, given as an entity or by name."""
+    if target is None:
+        return None
+    if not isinstance(target, str):
+        return str(target._id) if getattr(target, "_id", None) else None
+    found = _target_class(kind)[target]
+    return str(found._id) if found is not None else None
+
+
+def member_ids(
+    kind: str, target_id, cursor: int = 0, limit: Optional[int] = None
+) -> Tuple[List[str], Optional[int]]:
+    """User ids indexed under *target_id*, ascending, after *cursor*.
+
+    Returns ``(ids, next_cursor)``; ``next_cursor`` is ``None`` on the last
+    page. Reads only the pages that hold members, never user rows.
+    """
+    if limit is not None and limit <= 0:
+        return [], None
+    db = _db()
+    entry = _entry(kind, target_id)
+    cursor = int(cursor or 0)
+    pages = sorted(int(p) for p in db.field_index_get(INDEX_TYPE, "pages", entry))
+    out: List[str] = []
+    for page in pages:
+        if (page + 1) * PAGE_SPAN <= cursor:
+            continue
+        ids = sorted(
+            int(i) for i in db.field_index_get(INDEX_TYPE, entry, str(page))
+        )
+        for user_id in ids:
+            if user_id <= cursor:
+                continue
+            if limit is not None and len(out) >= limit:
+                return out, int(out[-1])
+            out.append(str(user_id))
+    return out, None
+
+
+def members_page(
+    kind: str, target, cursor: int = 0, limit: int = DEFAULT_PAGE_LIMIT
+) -> dict:
+    """One page of User entities holding *target*, ordered by user id.
+
+    ``{"users": [...], "next_cursor": int | None}``. Needs the index; before
+    the backfill finishes the first page is served from a scan and
+    ``next_cursor`` is ``None``.
+    """
+    limit = max(1, int(limit or DEFAULT_PAGE_LIMIT))
+    if not index_ready():
+        return {"users": _list_by_scan(kind, target, limit), "next_cursor": None}
+    target_id = _target_id(kind, target)
+    if target_id is None:
+        return {"users": [], "next_cursor": None}
+    from ggg import User
+
+    user_ids, next_cursor = member_ids(kind, target_id, cursor, limit)
+    users = [u for u in (User.load(i) for i in user_ids) if u is not None]
+    return {"users": users, "next_cursor": next_cursor}
+
+
+def _list_members(kind: str, target, limit: Optional[int]) -> List:
+    if not index_ready():
+        return _list_by_scan(kind, target, limit)
+    target_id = _target_id(kind, target)
+    if target_id is None:
+        return []
+    from ggg import User
+
+    user_ids, _ = member_ids(kind, target_id, 0, limit)
+    return [u for u in (User.load(i) for i in user_ids) if u is not None]
+
+
+def members_by_name(kind: str) -> Dict[str, List]:
+    """Users holding each department, profile or extension, by its name.
+
+    With the index this costs O(memberships); before the backfill it is one
+    pass over every user. Targets nobody holds may be absent.
+    """
+    if index_ready():
+        return {
+            target.name: _list_members(kind, target, None)
+            for target in _iter_rows(_target_class(kind))
+        }
+    relation = _RELATIONS[kind]
+    by_name: Dict[str, List] = {}
+    for user in iter_users():
+        try:
+            held = list(getattr(user, relation))
+        except Exception:
+            continue
+        for target in held:
+            by_name.setdefault(target.name, []).append(user)
+    return by_name
+
+
+def _list_by_scan(kind: str, target, limit: Optional[int]) -> List:
+    name = target if isinstance(target, str) else getattr(target, "name", None)
+    if not name:
+        return []
+    relation = _RELATIONS[kind]
+    return _scan_users(
+        lambda u: any(getattr(t, "name", None) == name for t in getattr(u, relation)),
+        limit=limit,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Departments
 # ---------------------------------------------------------------------------
@@ -71,17 +410,12 @@ def user_in_department(user, dept) -> bool:
 
 
 def department_members(dept, limit: Optional[int] = None) -> List:
-    """List User entities that are members of *dept* (paginated user scan).
+    """List User entities that are members of *dept*, in user-id order.
 
-    Admin/display paths only.
+    ``dept`` may be a Department entity or a department name. For large
+    departments page with :func:`members_page` instead.
     """
-    dept_name = dept if isinstance(dept, str) else getattr(dept, "name", None)
-    if not dept_name:
-        return []
-    return _scan_users(
-        lambda u: any(getattr(d, "name", None) == dept_name for d in u.departments),
-        limit=limit,
-    )
+    return _list_members(KIND_DEPARTMENT, dept, limit)
 
 
 def department_member_principals(dept, include_head: bool = True) -> List[str]:
@@ -145,16 +479,8 @@ def user_has_profile(user, profile) -> bool:
 
 
 def users_with_profile(profile, limit: Optional[int] = None) -> List:
-    """List User entities holding *profile* (paginated user scan)."""
-    profile_name = (
-        profile if isinstance(profile, str) else getattr(profile, "name", None)
-    )
-    if not profile_name:
-        return []
-    return _scan_users(
-        lambda u: any(getattr(p, "name", None) == profile_name for p in u.profiles),
-        limit=limit,
-    )
+    """List User entities holding *profile*, in user-id order."""
+    return _list_members(KIND_PROFILE, profile, limit)
 
 
 def profile_user_count(profile) -> int:
@@ -183,14 +509,8 @@ def user_has_extension_grant(user, ext) -> bool:
 
 
 def users_with_extension(ext, limit: Optional[int] = None) -> List:
-    """List User entities with a direct grant on *ext* (paginated user scan)."""
-    ext_name = ext if isinstance(ext, str) else getattr(ext, "name", None)
-    if not ext_name:
-        return []
-    return _scan_users(
-        lambda u: any(getattr(e, "name", None) == ext_name for e in u.extensions),
-        limit=limit,
-    )
+    """List User entities with a direct grant on *ext*, in user-id order."""
+    return _list_members(KIND_EXTENSION, ext, limit)
 
 
 def extension_user_grant_count(ext) -> int:
@@ -2,14 +2,25 @@
 
 Realm-internal GGG rules for governance orgs (Department entity).
 Not related to Casals/Baton orchestration policies.
+
+The governed-action gate runs on every governed extension call, and needs
+only the governing org and whether its policy is direct. Both come from a
+heap cache of every department's name, id and parsed policy
+(:func:`governing_entry`), plus a root-org pointer, so the gate loads a
+``Department`` only when it has to build a confirmation or a proposal, and
+finding root never scans. The cache is built on first use and kept current by
+the ``Department`` save/delete hooks (``ggg.projection``); policy edits are
+department saves, so they land there too.
 """
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
 
 from ic_python_logging import get_logger
 
+from core.position_admin import policy_is_direct
+
 logger = get_logger("core.org_policy")
 
 # Default permissions root holds over every other local org.
@@ -77,24 +88,175 @@ def policy_satisfied(
     return True, "ok"
 
 
+class OrgPolicy(NamedTuple):
+    """A department's policy, parsed once for :func:`policy_satisfied`."""
+
+    threshold_m: int
+    threshold_n: int
+    quorum_percent: int
+    veto_principals: Tuple[str, ...]
+    # 1/1, no quorum, no veto: a single manager may act without a vote.
+    direct: bool
+
+    def satisfied(
+        self, *, approvals: Iterable[str], vetoes: Iterable[str], eligible: Iterable[str]
+    ) -> tuple[bool, str]:
+        return policy_satisfied(
+            approvals=approvals,
+            vetoes=vetoes,
+            eligible=eligible,
+            threshold_m=self.threshold_m,
+            threshold_n=self.threshold_n,
+            quorum_percent=self.quorum_percent,
+            veto_principals=self.veto_principals,
+        )
+
+
+def read_policy(dept) -> OrgPolicy:
+    m = int(getattr(dept, "policy_threshold_m", 1) or 1)
+    n = int(getattr(dept, "policy_threshold_n", 1) or 1)
+    q = int(getattr(dept, "policy_quorum_percent", 0) or 0)
+    raw_veto = (getattr(dept, "policy_veto_principals", "") or "").strip()
+    return OrgPolicy(
+        threshold_m=m,
+        threshold_n=n,
+        quorum_percent=q,
+        veto_principals=tuple(parse_veto_principals(raw_veto)),
+        direct=policy_is_direct(dept),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Department lookup cache
+# ---------------------------------------------------------------------------
+
+_by_name: Dict[str, str] = {}
+_names: Dict[str, str] = {}
+_policies: Dict[str, OrgPolicy] = {}
+_roots: set = set()
+_ready = False
+
+
+def _put(dept) -> None:
+    dept_id = str(dept._id)
+    old = _names.get(dept_id)
+    if old is not None and _by_name.get(old) == dept_id:
+        del _by_name[old]
+    name = getattr(dept, "name", "") or ""
+    _names[dept_id] = name
+    if name:
+        _by_name[name] = dept_id
+    _policies[dept_id] = read_policy(dept)
+    if getattr(dept, "is_root", False):
+        _roots.add(dept_id)
+    else:
+        _roots.discard(dept_id)
+
+
+def _drop(dept_id: str) -> None:
+    name = _names.pop(dept_id, None)
+    if name is not None and _by_name.get(name) == dept_id:
+        del _by_name[name]
+    _policies.pop(dept_id, None)
+    _roots.discard(dept_id)
+
+
+def _ensure() -> None:
+    global _ready
+    if _ready:
+        return
+    from ggg import Department
+
+    reset_cache()
+    for dept in Department.instances():
+        _put(dept)
+    _ready = True
+
+
+def reset_cache() -> None:
+    """Forget every department; the next lookup rebuilds."""
+    global _ready
+    _by_name.clear()
+    _names.clear()
+    _policies.clear()
+    _roots.clear()
+    _ready = False
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("Department",)
+
+
+def entity_changed(entity) -> None:
+    """Save hook: refresh a department's name and policy. Never raises."""
+    if not _ready or type(entity).__name__ != "Department":
+        return
+    try:
+        _put(entity)
+    except Exception as e:
+        logger.warning(f"org cache: could not refresh {entity!r}: {e}")
+        reset_cache()
+
+
+def entity_removed(entity) -> None:
+    if not _ready or type(entity).__name__ != "Department":
+        return
+    _drop(str(entity._id))
+
+
+def _root_id() -> Optional[str]:
+    from ggg import ROOT_ORG_NAME
+
+    dept_id = _by_name.get(ROOT_ORG_NAME)
+    if dept_id is not None:
+        return dept_id
+    # A root under another name: the oldest, as a scan in id order finds it.
+    return min(_roots, key=int) if _roots else None
+
+
+def department_id(name: str) -> Optional[str]:
+    _ensure()
+    return _by_name.get(name)
+
+
+def root_department():
+    """The root org (``root``, else any ``is_root`` org), or None."""
+    from ggg import Department
+
+    _ensure()
+    dept_id = _root_id()
+    return Department.load(dept_id) if dept_id else None
+
+
+def governing_entry(org_name: Optional[str] = None) -> Optional[Tuple[str, OrgPolicy]]:
+    """``(department id, policy)`` governing *org_name*: that org, else root."""
+    _ensure()
+    if org_name:
+        dept_id = _by_name.get(org_name)
+        if dept_id is not None:
+            return dept_id, _policies[dept_id]
+        logger.warning(f"governing_org: '{org_name}' not found, falling back to root")
+    dept_id = _root_id()
+    if dept_id is None:
+        return None
+    return dept_id, _policies[dept_id]
+
+
 def ensure_root_org(head_user=None):
     """Create the quarter ``root`` org if missing. Returns the root Department."""
     from ggg import ROOT_ORG_NAME, Department, Fund, FundType
 
-    existing = Department[ROOT_ORG_NAME]
+    existing = root_department()
     if existing:
-        if not getattr(existing, "is_root", False):
-            existing.is_root = True
-        return existing
-
-    # Avoid duplicate roots under other names.
-    for dept in Department.instances():
-        if getattr(dept, "is_root", False):
+        if existing.name != ROOT_ORG_NAME:
+            # Avoid duplicate roots under other names.
             logger.warning(
-                f"ensure_root_org: found is_root org named {dept.name!r}; "
+                f"ensure_root_org: found is_root org named {existing.name!r}; "
                 f"expected {ROOT_ORG_NAME!r}"
             )
-            return dept
+        elif not getattr(existing, "is_root", False):
+            existing.is_root = True
+        return existing
 
     fund = Fund["ROOT"]
     if not fund:
@@ -133,22 +295,26 @@ def grant_root_authority_over_local_orgs():
 
     from ggg import ROOT_ORG_NAME, Department, DepartmentAuthority
 
-    root = Department[ROOT_ORG_NAME] or ensure_root_org()
+    root = ensure_root_org()
     perms = ",".join(ROOT_DEFAULT_OVER_ORG)
 
-    for dept in Department.instances():
-        if dept.name == ROOT_ORG_NAME or getattr(dept, "is_root", False):
+    granted = set()
+    for auth in getattr(root, "authorities_granted", []) or []:
+        target = getattr(auth, "target", None)
+        name = getattr(target, "name", None) if target is not None else None
+        if name is None or name in granted:
+            continue
+        granted.add(name)
+        # Refresh permission set if empty.
+        if not (auth.permissions or "").strip():
+            auth.permissions = perms
+
+    _ensure()
+    for name, dept_id in list(_by_name.items()):
+        if name == ROOT_ORG_NAME or name in granted or dept_id in _roots:
             continue
-        already = False
-        for auth in getattr(root, "authorities_granted", []) or []:
-            target = getattr(auth, "target", None)
-            if target is not None and getattr(target, "name", None) == dept.name:
-                already = True
-                # Refresh permission set if empty.
-                if not (auth.permissions or "").strip():
-                    auth.permissions = perms
-                break
-        if already:
+        dept = Department.load(dept_id)
+        if dept is None:
             continue
         DepartmentAuthority(
             id=f"auth-root-{dept.name}-{uuid.uuid4().hex[:8]}",
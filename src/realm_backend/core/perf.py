@@ -0,0 +1,211 @@
+"""Per-name instruction profiling for endpoints, bridge verbs and sandbox spawns.
+
+Before this, only ``directory_list`` logged its own instruction count; every
+other endpoint was opaque, and so were the Cedar, sandbox and bridge costs
+inside them. :func:`profiled` wraps a function (plain or generator-based async)
+and records the instructions each call took under a name. Samples sit in a
+bounded ring per name in heap memory, so the numbers describe recent traffic on
+the running canister and ``get_perf_stats`` can read them without a redeploy.
+
+What a sample means:
+
+- Instructions come from ``ic.performance_counter(1)``, the *call context*
+  counter. Unlike counter 0 it keeps counting across the messages of an async
+  endpoint, so a ``yield`` to another canister does not reset the measurement.
+  The time spent waiting on the other canister is not counted — only our own
+  execution is.
+- Samples are inclusive. An endpoint's figure contains the bridge verbs and
+  Cedar decisions it made, which have their own names as well.
+- Heap memory is cleared on upgrade; the rings start empty after every deploy.
+- A query's writes to the heap are thrown away with the rest of its state, so
+  profiling a query endpoint records nothing that outlives the reply; measure
+  queries with ``scripts/benchmark_realm.py``.
+- In ``main.py`` only the update endpoints that carry traffic or batches are
+  decorated: joins and quarter moves, federation gossip and messages, batched
+  envelope writes and the extension entry points. Everything an extension or
+  codex does below those is named by the bridge, Cedar and sandbox samples.
+
+Off-chain there is no counter and every sample is 0, so call counts and errors
+are still meaningful in tests while instruction figures are not.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Optional
+
+from _cdk import ic
+
+# Samples kept per name. p99 over 256 samples is the 3rd-highest, which is as
+# fine-grained as a heap-resident ring is worth.
+RING_SIZE = 256
+
+
+class _Series:
+    __slots__ = ("calls", "errors", "total", "max", "samples")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0
+        self.max = 0
+        self.samples = deque(maxlen=RING_SIZE)
+
+    def add(self, instructions: int, failed: bool) -> None:
+        self.calls += 1
+        if failed:
+            self.errors += 1
+        self.total += instructions
+        if instructions > self.max:
+            self.max = instructions
+        self.samples.append(instructions)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total": self.total,
+            "mean": self.total // self.calls if self.calls else 0,
+            "p50": _percentile(ordered, 50),
+            "p99": _percentile(ordered, 99),
+            "max": self.max,
+            "window": len(ordered),
+        }
+
+
+_series: Dict[str, _Series] = {}
+_enabled = True
+
+
+def _percentile(ordered, pct: int) -> int:
+    """Nearest-rank percentile of an already-sorted list."""
+    if not ordered:
+        return 0
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+def _counter() -> int:
+    try:
+        return int(ic.performance_counter(1))
+    except Exception:
+        return 0
+
+
+def record(name: str, instructions: int, failed: bool = False) -> None:
+    """Add one sample under ``name``."""
+    series = _series.get(name)
+    if series is None:
+        series = _series[name] = _Series()
+    series.add(max(0, instructions), failed)
+
+
+@contextmanager
+def measure(name: str):
+    """Record the instructions spent inside the ``with`` block under ``name``."""
+    if not _enabled:
+        yield
+        return
+    start = _counter()
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        record(name, _counter() - start, failed)
+
+
+def profiled(name=None):
+    """Decorator recording each call's instructions under ``name``.
+
+    Usable bare (``@profiled``, named after the function) or with an explicit
+    name (``@profiled("codex_bridge.apply_effects")``). Generator-based async
+    endpoints are wrapped transparently, and the sample spans every message of
+    the call.
+    """
+    def decorator(fn):
+        label = name or fn.__name__
+        _is_gen = getattr(fn, '__code__', None) is not None and (fn.__code__.co_flags & 0x20)
+
+        if _is_gen:
+            @wraps(fn)
+            def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return (yield from fn(*args, **kwargs))
+                start = _counter()
+                failed = True
+                try:
+                    result = yield from fn(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    record(label, _counter() - start, failed)
+            return async_wrapper
+        else:
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not _enabled:
+                    return fn(*args, **kwargs)
+                start = _counter()
+                failed = True
+                try:
+                    result = fn(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    record(label, _counter() - start, failed)
+            return wrapper
+
+    if callable(name):
+        fn, name = name, None
+        return decorator(fn)
+    return decorator
+
+
+def stats(prefix: str = "") -> dict:
+    """Summaries per name, optionally only names starting with ``prefix``."""
+    return {
+        key: series.summary()
+        for key, series in sorted(_series.items())
+        if key.startswith(prefix)
+    }
+
+
+def top(n: int = 10, by: str = "total") -> list:
+    """The ``n`` hottest names by a summary field (``total``, ``p99``, ...)."""
+    ranked = sorted(
+        ((key, summary) for key, summary in stats().items()),
+        key=lambda kv: kv[1].get(by, 0),
+        reverse=True,
+    )
+    return [dict(summary, name=key) for key, summary in ranked[:n]]
+
+
+def reset(name: Optional[str] = None) -> None:
+    """Drop the samples for ``name``, or for every name."""
+    if name is None:
+        _series.clear()
+    else:
+        _series.pop(name, None)
+
+
+def set_enabled(enabled: bool) -> None:
+    """Switch recording on or off; wrapped functions run unchanged either way."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def snapshot() -> dict:
+    """The ``perf`` section of ``system_snapshot``."""
+    return {
+        "enabled": _enabled,
+        "ring_size": RING_SIZE,
+        "names": len(_series),
+        "top": top(10),
+        "stats": stats(),
+    }
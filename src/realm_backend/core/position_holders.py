@@ -0,0 +1,218 @@
+"""Versioned position-holder state for capital -> quarter acting appointments.
+
+``acting_appointments.dump_position_holders`` walks every ``Position`` and,
+through ``Position.active_appointments``, every ``Appointment`` for each one,
+and a quarter re-applied the whole answer each time it asked. This keeps the
+answer instead, one spec per seat,
+
+    {key, inherit_from_capital, holders: [{principal, kind}, ...]}
+
+each stamped with the value of a change counter when it last changed.
+``Position`` and ``Appointment`` saves and deletes arrive through
+``ggg.projection`` (:func:`entity_changed`), so only the seat a write touched
+is recomputed, from holders kept per seat here rather than by a scan.
+
+The epoch and clock handling is ``core.journal``'s, shared with
+``core.quarter_directory``: the journal lives in heap memory, a rebuild (after
+init/upgrade) starts a new *epoch*, and a requester vector from another epoch
+— or one claiming a clock this journal never reached — gets every seat.
+Deleted or renamed seats simply drop out: quarters only ever add acting
+holders, so a delta has nothing to say about them.
+"""
+
+from typing import Dict, Optional
+
+from ic_python_logging import get_logger
+
+from core.journal import VersionedJournal
+
+logger = get_logger("core.position_holders")
+
+
+class Journal(VersionedJournal):
+    """Seat specs with the clock value of their last change."""
+
+    def __init__(self, epoch: int = 0):
+        super().__init__(epoch)
+        # Position ``_id`` -> (key, inherit_from_capital).
+        self.seats: Dict[str, tuple] = {}
+        # Position ``_id`` -> {appointment ``_id``: holder}.
+        self.holders: Dict[str, Dict[str, dict]] = {}
+        # Appointment ``_id`` -> position ``_id``, to move a holder on re-point.
+        self.owners: Dict[str, str] = {}
+        self.specs: Dict[str, dict] = {}
+
+    def _refresh(self, pos_id: str) -> bool:
+        seat = self.seats.get(pos_id)
+        spec = None
+        if seat is not None and seat[0]:
+            held = self.holders.get(pos_id, {})
+            spec = {
+                "key": seat[0],
+                "inherit_from_capital": seat[1],
+                "holders": [held[a] for a in sorted(held, key=_id_order)],
+            }
+        if self.specs.get(pos_id) == spec:
+            return False
+        if spec is None:
+            del self.specs[pos_id]
+            self.versions.pop(pos_id, None)
+            return True
+        self.specs[pos_id] = spec
+        self._stamp(pos_id)
+        return True
+
+    def put_position(self, pos_id: str, key: Optional[str], inherit: bool = True) -> bool:
+        """Set (or, with ``None``, drop) a seat's key and inherit flag."""
+        if key is None:
+            self.seats.pop(pos_id, None)
+        else:
+            self.seats[pos_id] = (key, bool(inherit))
+        return self._refresh(pos_id)
+
+    def put_appointment(
+        self, appt_id: str, pos_id: Optional[str], holder: Optional[dict]
+    ) -> bool:
+        """Track the holder an appointment contributes (``None``: none)."""
+        changed = False
+        old = self.owners.get(appt_id)
+        if old is not None and (old != pos_id or holder is None):
+            self.holders.get(old, {}).pop(appt_id, None)
+            self.owners.pop(appt_id, None)
+            changed = self._refresh(old)
+        if pos_id is None or holder is None:
+            return changed
+        self.owners[appt_id] = pos_id
+        self.holders.setdefault(pos_id, {})[appt_id] = holder
+        return self._refresh(pos_id) or changed
+
+    def entries(self, clock: int) -> dict:
+        return {"positions": [
+            self.specs[p] for p in sorted(self.specs, key=_id_order)
+            if self._changed(p, clock)
+        ]}
+
+
+def _id_order(entity_id: str):
+    try:
+        return (0, int(entity_id), "")
+    except (TypeError, ValueError):
+        return (1, 0, str(entity_id))
+
+
+_journal = Journal()
+
+
+def journal() -> Journal:
+    return _journal
+
+
+def ready() -> bool:
+    return _journal.ready
+
+
+def since(vector: Optional[dict]) -> dict:
+    return _journal.since(vector)
+
+
+# ── Rows ────────────────────────────────────────────────────────────────────
+
+
+def holder_of(appointment) -> Optional[dict]:
+    """``{principal, kind}`` for an active appointment, else None."""
+    from ggg import AppointmentStatus, appointment_kind
+
+    if (appointment.status or AppointmentStatus.ACTIVE) != AppointmentStatus.ACTIVE:
+        return None
+    user = appointment.user
+    principal = (getattr(user, "id", "") or "") if user is not None else ""
+    if not principal:
+        return None
+    return {"principal": principal, "kind": appointment_kind(appointment)}
+
+
+def _track_position(pos) -> None:
+    _journal.put_position(
+        str(pos._id),
+        getattr(pos, "key", "") or "",
+        bool(getattr(pos, "inherit_from_capital", True)),
+    )
+
+
+def _track_appointment(appointment) -> None:
+    pos = appointment.position
+    _journal.put_appointment(
+        str(appointment._id),
+        str(pos._id) if pos is not None else None,
+        holder_of(appointment),
+    )
+
+
+# ── Maintenance ─────────────────────────────────────────────────────────────
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("Position", "Appointment")
+
+
+def entity_changed(entity) -> None:
+    """Save hook: restamp the seat a position or appointment write touched."""
+    kind = type(entity).__name__
+    if kind not in ("Position", "Appointment"):
+        return
+    try:
+        if kind == "Position":
+            _track_position(entity)
+        else:
+            _track_appointment(entity)
+    except Exception as e:
+        logger.warning(f"position holders: could not refresh {entity!r}: {e}")
+
+
+def entity_removed(entity) -> None:
+    kind = type(entity).__name__
+    try:
+        if kind == "Position":
+            _journal.put_position(str(entity._id), None)
+        elif kind == "Appointment":
+            _journal.put_appointment(str(entity._id), None, None)
+    except Exception as e:
+        logger.warning(f"position holders: could not drop {entity!r}: {e}")
+
+
+def rebuild() -> None:
+    """Start a new epoch: one pass over positions, one over appointments."""
+    global _journal
+    from _cdk import ic
+    from ggg import Appointment, Position
+
+    epoch = _journal.epoch + 1
+    try:
+        epoch = max(epoch, int(ic.time()))
+    except Exception:
+        pass
+    fresh = Journal(epoch)
+    _journal = fresh
+    for pos in Position.instances():
+        _track_position(pos)
+    for appointment in Appointment.instances():
+        _track_appointment(appointment)
+    fresh.ready = True
+    logger.info(f"position holders: {len(fresh.specs)} seats, epoch {epoch}")
+
+
+def schedule_rebuild() -> None:
+    """Build the journal after init/upgrade.
+
+    Timers must be set in init/post_upgrade/update context, which is why
+    ``initialize()`` calls this.
+    """
+    from _cdk import ic
+
+    def _rebuild():
+        try:
+            rebuild()
+        except Exception as e:
+            logger.error(f"position holders: rebuild failed: {e}")
+
+    ic.set_timer(0, _rebuild)
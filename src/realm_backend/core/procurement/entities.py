@@ -70,25 +70,23 @@ def all_vendors() -> List:
     return list(vendor_class().instances())
 
 
+def _rows_for_rfp(cls, rfp_id: str) -> List:
+    # Uses the manifest's ``rfp_id`` index when declared, else scans.
+    from core.extension_bridge import rows_where
+
+    return rows_where(cls, {"rfp_id": rfp_id})
+
+
 def list_rfp_transitions(rfp_id: str) -> List:
-    return [
-        t for t in transition_class().instances()
-        if getattr(t, "rfp_id", "") == rfp_id
-    ]
+    return _rows_for_rfp(transition_class(), rfp_id)
 
 
 def bids_for_rfp(rfp_id: str) -> List:
-    return [
-        b for b in bid_class().instances()
-        if getattr(b, "rfp_id", "") == rfp_id
-    ]
+    return _rows_for_rfp(bid_class(), rfp_id)
 
 
 def scores_for_rfp(rfp_id: str) -> List:
-    return [
-        s for s in score_class().instances()
-        if getattr(s, "rfp_id", "") == rfp_id
-    ]
+    return _rows_for_rfp(score_class(), rfp_id)
 
 
 # ---------------------------------------------------------------------------
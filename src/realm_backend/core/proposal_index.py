@@ -0,0 +1,300 @@
+"""Proposal id allocation and the open-proposal index.
+
+Proposal ids (``prop_001``, ...) used to be ``len(Proposal.instances()) + 1``,
+which loads every proposal ever filed to pick one id and hands out a used id
+again once a proposal has been deleted. :func:`allocate_proposal_id` keeps a
+counter in ``_system`` instead, so it survives upgrades and only ever moves
+forward. A realm that predates the counter seeds it from ``Proposal.max_id()``:
+every legacy id was at most the row count at the time, which never exceeds the
+highest row id.
+
+The open-proposal index keeps, per open status (``voting``, ``pending_vote``,
+``pending_review`` — ``core.federal_tally.OPEN_PROPOSAL_STATUSES``) and deadline
+bucket (``BUCKET_SECONDS`` wide), the ids of the proposals in it,
+so governance listings and deadline-driven tallying read only the ballots that
+are still open, and the ones due first first. It also keeps a short list of
+the newest proposals for the gossip ``self`` block
+(``core.quarter_drift.recent_proposals``). ``Proposal`` saves and deletes keep
+it current through ``ggg.projection``; rows written before it existed are
+backfilled by a timer chain started in ``initialize()``, and until that is done
+:func:`index_ready` is False and readers fall back to the status field index.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from ic_python_logging import get_logger
+
+from core.federal_tally import OPEN_PROPOSAL_STATUSES
+
+logger = get_logger("core.proposal_index")
+
+ID_PREFIX = "prop_"
+SEQ_KEY = "proposal_id_seq"
+
+INDEX_TYPE = "_OpenProposal"
+INDEX_FLAG = "ix_backfill:Proposal:open:v2"
+INDEX_FIELD = "open"
+
+OPEN_STATUSES = OPEN_PROPOSAL_STATUSES
+# Deadline bucket width: bounds the id list one ballot's change rewrites.
+BUCKET_SECONDS = 3600
+NO_DEADLINE = "none"
+# Newest proposals remembered for ``recent_ids``.
+RECENT_SIZE = 100
+
+
+def _db():
+    from ic_python_db import Database
+
+    return Database.get_instance()
+
+
+# ---------------------------------------------------------------------------
+# Id allocation
+# ---------------------------------------------------------------------------
+
+
+def format_proposal_id(number: int) -> str:
+    return f"{ID_PREFIX}{number:03d}"
+
+
+def allocate_proposal_id() -> str:
+    """Reserve the next proposal id. Never repeats, even after deletions."""
+    from ggg import Proposal
+
+    db = _db()
+    raw = db.load("_system", SEQ_KEY)
+    number = int(raw) if raw else int(Proposal.max_id() or 0)
+    while True:
+        number += 1
+        proposal_id = format_proposal_id(number)
+        # Ids filed outside the allocator (extensions, imports) are skipped.
+        if not Proposal[proposal_id]:
+            break
+    db.save("_system", SEQ_KEY, str(number))
+    return proposal_id
+
+
+# ---------------------------------------------------------------------------
+# Open-proposal index
+# ---------------------------------------------------------------------------
+
+
+def index_ready() -> bool:
+    """True once existing proposals have been backfilled into the index."""
+    try:
+        return bool(_db().load("_system", INDEX_FLAG))
+    except Exception:
+        return False
+
+
+def deadline_seconds(proposal) -> Optional[int]:
+    """``voting_deadline`` as epoch seconds (stored as digits or ISO text)."""
+    raw = (getattr(proposal, "voting_deadline", "") or "").strip()
+    if not raw:
+        return None
+    try:
+        return int(float(raw))
+    except ValueError:
+        pass
+    try:
+        return int(datetime.fromisoformat(raw.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return None
+
+
+def _bucket(deadline: Optional[int]) -> str:
+    return NO_DEADLINE if deadline is None else str(deadline // BUCKET_SECONDS)
+
+
+def _entry(proposal) -> Optional[str]:
+    """The ``status:bucket`` *proposal* belongs under, or None once closed."""
+    status = getattr(proposal, "status", None) or ""
+    if status not in OPEN_STATUSES:
+        return None
+    return f"{status}:{_bucket(deadline_seconds(proposal))}"
+
+
+def _index_add(entry: str, proposal_id: str) -> None:
+    db = _db()
+    status, bucket = entry.split(":", 1)
+    if bucket not in db.field_index_get(INDEX_TYPE, "buckets", status):
+        db.field_index_add(INDEX_TYPE, "buckets", status, bucket)
+    db.field_index_add(INDEX_TYPE, status, bucket, proposal_id)
+    db.field_index_add(INDEX_TYPE, "proposal", proposal_id, entry)
+
+
+def _index_remove(entry: str, proposal_id: str) -> None:
+    db = _db()
+    status, bucket = entry.split(":", 1)
+    db.field_index_remove(INDEX_TYPE, status, bucket, proposal_id)
+    if not db.field_index_get(INDEX_TYPE, status, bucket):
+        db.field_index_remove(INDEX_TYPE, "buckets", status, bucket)
+    db.field_index_remove(INDEX_TYPE, "proposal", proposal_id, entry)
+
+
+def _remember_recent(proposal_id: str) -> None:
+    db = _db()
+    recent = db.field_index_get(INDEX_TYPE, "recent", "ids")
+    if proposal_id in recent:
+        return
+    if len(recent) >= RECENT_SIZE:
+        oldest = min(recent, key=int)
+        if int(proposal_id) < int(oldest):
+            return
+        db.field_index_remove(INDEX_TYPE, "recent", "ids", oldest)
+    db.field_index_add(INDEX_TYPE, "recent", "ids", proposal_id)
+
+
+def sync_proposal(proposal) -> bool:
+    """Bring *proposal*'s index entry in line with its status and deadline.
+
+    Returns True if anything was rewritten. Idempotent, so the backfill and
+    the save hook may both reach the same proposal.
+    """
+    proposal_id = str(proposal._id)
+    _remember_recent(proposal_id)
+    wanted = _entry(proposal)
+    indexed = _db().field_index_get(INDEX_TYPE, "proposal", proposal_id)
+    if indexed == ([wanted] if wanted else []):
+        return False
+    for entry in indexed:
+        _index_remove(entry, proposal_id)
+    if wanted:
+        _index_add(wanted, proposal_id)
+    return True
+
+
+def forget_proposal(proposal) -> None:
+    proposal_id = str(proposal._id)
+    for entry in _db().field_index_get(INDEX_TYPE, "proposal", proposal_id):
+        _index_remove(entry, proposal_id)
+    _db().field_index_remove(INDEX_TYPE, "recent", "ids", proposal_id)
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("Proposal",)
+
+
+def entity_changed(entity) -> None:
+    """Save hook: reindex a proposal. Never raises."""
+    if type(entity).__name__ != "Proposal":
+        return
+    try:
+        sync_proposal(entity)
+    except Exception as e:
+        logger.warning(f"proposal index: could not sync {entity._id}: {e}")
+
+
+def entity_removed(entity) -> None:
+    """Delete hook: unindex a proposal. Never raises."""
+    if type(entity).__name__ != "Proposal":
+        return
+    try:
+        forget_proposal(entity)
+    except Exception as e:
+        logger.warning(f"proposal index: could not drop {entity._id}: {e}")
+
+
+def rebuild_index(field=INDEX_FIELD, from_id=1, batch=50):
+    """Index one batch of existing proposals for ``main``'s backfill timer."""
+    from ggg import Proposal
+
+    from core.index_backfill import rebuild_batch
+
+    return rebuild_batch(Proposal, sync_proposal, from_id, batch)
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+
+def _statuses(status: Optional[str]) -> tuple:
+    if status:
+        return (status,) if status in OPEN_STATUSES else ()
+    return OPEN_STATUSES
+
+
+def _load(ids) -> list:
+    from ggg import Proposal
+
+    out = []
+    for proposal_id in ids:
+        proposal = Proposal.load(proposal_id)
+        if proposal is not None:
+            out.append(proposal)
+    return out
+
+
+def _ordered(proposals: list) -> list:
+    """By deadline, soonest first; proposals without one last."""
+    def key(p):
+        deadline = deadline_seconds(p)
+        return (deadline is None, deadline or 0, int(p._id))
+
+    return sorted(proposals, key=key)
+
+
+def open_proposals(status: Optional[str] = None, limit: Optional[int] = None) -> list:
+    """Open proposals (optionally of one open status), soonest deadline first."""
+    from ggg import Proposal
+
+    if not index_ready():
+        proposals = []
+        for s in _statuses(status):
+            cursor = 1
+            while cursor is not None:
+                page, cursor = Proposal.find_by("status", s, from_id=cursor, count=100)
+                proposals.extend(page)
+        return _ordered(proposals)[:limit]
+
+    db = _db()
+    keyed = []
+    for s in _statuses(status):
+        for bucket in db.field_index_get(INDEX_TYPE, "buckets", s):
+            rank = (bucket == NO_DEADLINE, int(bucket) if bucket != NO_DEADLINE else 0)
+            keyed.append((rank, s, bucket))
+    proposals = []
+    for _rank, s, bucket in sorted(keyed):
+        proposals.extend(_load(db.field_index_get(INDEX_TYPE, s, bucket)))
+        if limit is not None and len(proposals) >= limit:
+            break
+    return _ordered(proposals)[:limit]
+
+
+def due_proposals(now_s: int, status: str = "voting", limit: Optional[int] = None) -> list:
+    """Open proposals whose deadline has passed at *now_s*, oldest first.
+
+    Reads only the deadline buckets up to *now_s*, so a tally sweep costs the
+    ballots that are due, not every ballot still open.
+    """
+    now_s = int(now_s)
+    if not index_ready():
+        due = [
+            p for p in open_proposals(status)
+            if deadline_seconds(p) is not None and deadline_seconds(p) <= now_s
+        ]
+        return due[:limit]
+
+    db = _db()
+    last = now_s // BUCKET_SECONDS
+    buckets = sorted(
+        int(b) for b in db.field_index_get(INDEX_TYPE, "buckets", status)
+        if b != NO_DEADLINE and int(b) <= last
+    )
+    due: List = []
+    for bucket in buckets:
+        for proposal in _ordered(_load(db.field_index_get(INDEX_TYPE, status, str(bucket)))):
+            if deadline_seconds(proposal) <= now_s:
+                due.append(proposal)
+        if limit is not None and len(due) >= limit:
+            break
+    return due[:limit]
+
+
+def recent_ids(limit: int = RECENT_SIZE) -> List[str]:
+    """Ids of the newest proposals (at most ``RECENT_SIZE``), oldest first."""
+    recent = sorted(_db().field_index_get(INDEX_TYPE, "recent", "ids"), key=int)
+    return recent[-limit:] if limit > 0 else []
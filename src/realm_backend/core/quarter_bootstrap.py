@@ -796,9 +796,11 @@ def inherit_acting_appointments_from_parent(realm, state):
         return {"success": True, "status": "skip", "reason": "no parent"}
 
     from api.cross_quarter import fetch_position_holders
-    from core.acting_appointments import apply_inherited_holders
+    from core.acting_appointments import apply_inherited_holders, inherit_vector
 
-    fetched = yield from fetch_position_holders(parent_id)
+    fetched = yield from fetch_position_holders(
+        parent_id, since=inherit_vector(parent_id) or {}
+    )
     if not fetched.get("success"):
         return {
             "success": False,
@@ -815,94 +817,238 @@ def inherit_acting_appointments_from_parent(realm, state):
     return {"success": True, "status": "inherited", "result": result}
 
 
+def sync_inherited_holders(realm):
+    """Generator: apply the capital's seat-holder changes since our last sync.
+
+    Asks the capital only for seats changed after the vector last applied
+    from it (see ``core.position_holders``); seats whose spec is unchanged
+    cause no writes. Returns a JSON-able dict.
+    """
+    if not bool(getattr(realm, "is_quarter", False)):
+        return {"success": True, "status": "skip", "reason": "not a quarter"}
+    parent_id = (getattr(realm, "federation_realm_id", "") or "").strip()
+    if not parent_id:
+        return {"success": True, "status": "skip", "reason": "no parent"}
+
+    try:
+        from api.cross_quarter import fetch_position_holders
+        from core.acting_appointments import apply_inherited_holders, inherit_vector
+
+        fetched = yield from fetch_position_holders(
+            parent_id, since=inherit_vector(parent_id) or {}
+        )
+        if not fetched.get("success"):
+            return {"success": False, "error": fetched.get("error", "fetch failed")}
+        result = apply_inherited_holders(fetched, parent_id)
+        return {
+            "success": result["success"],
+            "status": "synced",
+            "full": bool(fetched.get("full", True)),
+            "result": result,
+        }
+    except Exception as e:
+        import traceback as _tb
+
+        logger.error(f"Error in sync_inherited_holders: {e}\n{_tb.format_exc()}")
+        return {"success": False, "error": str(e)}
+
+
 # ── Capital-side quarter directory merge (capital ← quarters) ───────────────
 
 
+def _local_directory(quarters):
+    """One pass over our quarters: the merge input and a canister_id map.
+
+    Returns ``(local, by_cid, known)``: ``local`` is what
+    ``merge_quarter_directory`` takes, ``by_cid`` maps each canister id to its
+    (first) ``Quarter``, and ``known`` is every canister id seen, blank ones
+    included.
+    """
+    local, by_cid, known = [], {}, set()
+    for q in quarters:
+        cid = q.canister_id or ""
+        local.append(
+            {
+                "name": q.name or "",
+                "canister_id": cid,
+                "population": int(q.population or 0),
+                "status": q.status or "setup",
+            }
+        )
+        known.add(q.canister_id)
+        if cid and cid not in by_cid:
+            by_cid[cid] = q
+    return local, by_cid, known
+
+
+def _merge_peer_directories(fetched):
+    """Merge every successful peer directory into ours, then write once.
+
+    ``fetched`` maps peer canister id to a ``fetch_peer_directory`` result.
+    Quarters are read in a single pass; the merge runs on plain dicts; the
+    resulting field changes and new ``Quarter`` rows are applied afterwards,
+    looking quarters up by canister id rather than rescanning. Returns
+    ``(added, known_quarters, changed)``.
+    """
+    from _cdk import ic
+    from api.status_cache import invalidate as invalidate_status_cache
+    from core.cross_quarter import merge_quarter_directory
+    from core.quarter_drift import apply_self_report_to_quarter
+    from ggg import Quarter, Realm
+
+    self_id = ic.id().to_str()
+    local, by_cid, known = _local_directory(Quarter.instances())
+
+    merged, changed, reports = local, False, {}
+    for peer_canister_id, result in fetched.items():
+        if not result.get("success"):
+            continue
+        peer_self = result.get("self")
+        merged, peer_changed = merge_quarter_directory(
+            merged,
+            result.get("quarters", []),
+            peer_self=peer_self,
+            peer_canister_id=peer_canister_id,
+        )
+        changed = changed or bool(peer_changed)
+        reports[peer_canister_id] = peer_self
+
+    updates, new_entries = [], []
+    for entry in merged:
+        cid = entry.get("canister_id")
+        if not cid or cid == self_id or cid in known:
+            q = by_cid.get(cid)
+            if q is None:
+                continue
+            fields = {}
+            new_pop = int(entry.get("population", 0) or 0)
+            if new_pop > int(q.population or 0):
+                fields["population"] = new_pop
+            merged_status = entry.get("status")
+            if merged_status and merged_status != q.status:
+                fields["status"] = merged_status
+            if fields or cid in reports:
+                updates.append((q, fields, reports.get(cid)))
+        else:
+            new_entries.append(entry)
+
+    dirty = False
+    for q, fields, peer_self in updates:
+        for name, value in fields.items():
+            setattr(q, name, value)
+            dirty = True
+        if peer_self is not None:
+            apply_self_report_to_quarter(q, peer_self)
+
+    realm = Realm.load("1") if new_entries else None
+    for entry in new_entries:
+        cid = entry["canister_id"]
+        new_q = Quarter(
+            name=entry.get("name") or cid[:8],
+            canister_id=cid,
+            population=int(entry.get("population", 0) or 0),
+            status=entry.get("status") or "setup",
+        )
+        if realm is not None:
+            new_q.federation = realm
+        known.add(cid)
+    if dirty:
+        invalidate_status_cache()
+    return len(new_entries), len(known), changed
+
+
 def sync_one_peer(peer_canister_id):
     """Generator: pull one peer quarter's coarse directory and merge it into
     ours (un-gated). Adds ``Quarter`` entities for peers we did not know about
     and refreshes known populations (monotonic: takes the larger count, per
-    ``merge_quarter_directory``). Used by the ``sync_quarters`` gossip endpoint.
-    Returns a JSON-able dict.
+    ``merge_quarter_directory``). Asks only for what changed since the peer's
+    last answer (see ``core.quarter_directory``). Returns a JSON-able dict.
     """
     try:
-        from _cdk import ic
         from api.cross_quarter import fetch_peer_directory
-        from core.cross_quarter import merge_quarter_directory
-        from ggg import Quarter, Realm
+        from core import quarter_directory
 
-        fetched = yield from fetch_peer_directory(peer_canister_id)
+        fetched = yield from fetch_peer_directory(
+            peer_canister_id, since=quarter_directory.peer_vector(peer_canister_id) or {}
+        )
         if not fetched.get("success"):
             return {"success": False, "error": fetched.get("error", "fetch failed")}
 
-        peer_quarters = fetched.get("quarters", [])
-        peer_self = fetched.get("self")
-        self_id = ic.id().to_str()
-        realm = Realm.load("1")
+        added, known, changed = _merge_peer_directories({peer_canister_id: fetched})
+        quarter_directory.remember_peer_vector(peer_canister_id, fetched)
+        return {
+            "success": True,
+            "peer": peer_canister_id,
+            "added": added,
+            "known_quarters": known,
+            "changed": bool(changed),
+            "full": bool(fetched.get("full", True)),
+        }
+    except Exception as e:
+        import traceback as _tb
 
-        local = []
-        for q in Quarter.instances():
-            local.append(
-                {
-                    "name": q.name or "",
-                    "canister_id": q.canister_id or "",
-                    "population": int(q.population or 0),
-                    "status": q.status or "setup",
-                }
-            )
+        logger.error(f"Error in sync_one_peer: {e}\n{_tb.format_exc()}")
+        return {"success": False, "error": str(e)}
 
-        merged, changed = merge_quarter_directory(
-            local,
-            peer_quarters,
-            peer_self=peer_self,
-            peer_canister_id=peer_canister_id,
-        )
 
-        from core.quarter_drift import apply_self_report_to_quarter
-
-        existing_ids = {q.canister_id for q in Quarter.instances()}
-        added = 0
-        for entry in merged:
-            cid = entry.get("canister_id")
-            if not cid or cid == self_id or cid in existing_ids:
-                # Update population and drift report on a known quarter.
-                for q in Quarter.instances():
-                    if q.canister_id == cid:
-                        new_pop = int(entry.get("population", 0) or 0)
-                        if new_pop > int(q.population or 0):
-                            q.population = new_pop
-                        merged_status = entry.get("status")
-                        if merged_status and merged_status != q.status:
-                            q.status = merged_status
-                        if cid == peer_canister_id:
-                            apply_self_report_to_quarter(q, peer_self)
-                        break
-                continue
-            new_q = Quarter(
-                name=entry.get("name") or cid[:8],
-                canister_id=cid,
-                population=int(entry.get("population", 0) or 0),
-                status=entry.get("status") or "setup",
+def sync_many_peers(peer_canister_ids):
+    """Generator: pull several peers' directories, then merge them together.
+
+    Basilisk suspends a generator on one inter-canister call per ``yield``, so
+    the fetches go out one after another; what this saves over calling
+    ``sync_one_peer`` per peer is the local side — quarters are read once and
+    written once for the whole round, not once per peer. A peer that fails to
+    answer is reported and skipped. Returns a JSON-able dict with a per-peer
+    ``{"success", "error"?}`` map.
+    """
+    try:
+        from api.cross_quarter import fetch_peer_directory
+        from core import quarter_directory
+
+        fetched, peers = {}, {}
+        for peer_canister_id in dict.fromkeys(p for p in peer_canister_ids if p):
+            result = yield from fetch_peer_directory(
+                peer_canister_id,
+                since=quarter_directory.peer_vector(peer_canister_id) or {},
+            )
+            fetched[peer_canister_id] = result
+            peers[peer_canister_id] = (
+                {"success": True, "full": bool(result.get("full", True))}
+                if result.get("success")
+                else {"success": False, "error": result.get("error", "fetch failed")}
             )
-            if realm is not None:
-                new_q.federation = realm
-            existing_ids.add(cid)
-            added += 1
 
+        added, known, changed = _merge_peer_directories(fetched)
+        for peer_canister_id, result in fetched.items():
+            if result.get("success"):
+                quarter_directory.remember_peer_vector(peer_canister_id, result)
         return {
-            "success": True,
-            "peer": peer_canister_id,
+            "success": any(p["success"] for p in peers.values()),
+            "peers": peers,
             "added": added,
-            "known_quarters": len(existing_ids),
+            "known_quarters": known,
             "changed": bool(changed),
         }
     except Exception as e:
         import traceback as _tb
 
-        logger.error(f"Error in sync_one_peer: {e}\n{_tb.format_exc()}")
+        logger.error(f"Error in sync_many_peers: {e}\n{_tb.format_exc()}")
         return {"success": False, "error": str(e)}
 
 
+def sync_peers(peer_canister_ids):
+    """Generator behind the ``sync_quarters`` gossip endpoint.
+
+    ``peer_canister_ids`` is one canister id or a comma-separated list of
+    them: one peer goes through :func:`sync_one_peer`, several through
+    :func:`sync_many_peers`, so a gossip round over many peers merges once.
+    """
+    peers = [p.strip() for p in str(peer_canister_ids or "").split(",") if p.strip()]
+    if len(peers) > 1:
+        return (yield from sync_many_peers(peers))
+    return (yield from sync_one_peer(peers[0] if peers else ""))
+
+
 # ── TaskManager seeding / teardown (canister only) ──────────────────────────
 
 
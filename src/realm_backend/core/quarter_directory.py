@@ -0,0 +1,312 @@
+"""Versioned quarter directory for delta gossip.
+
+``get_quarter_directory`` builds the whole directory on every call — every
+``Quarter`` row, ``User.count()``, ``list_installed()`` and the codex-drift
+helpers for the ``self`` block — so a peer polling a quiet federation pays for
+all of it each round. This keeps the answer instead, one row per canister id,
+
+    {name, canister_id, population, status, index[, is_self]}
+
+each stamped with the value of a Lamport clock when it last changed.
+``Quarter`` saves and deletes arrive through ``ggg.projection``
+(:func:`entity_changed`); this canister's own row and ``self`` block are
+recomputed by a recurring timer (:func:`refresh_self`), because a query cannot
+keep what it computes.
+
+Requesters keep a per-origin version vector: for each peer they pull from,
+the ``(epoch, clock)`` that peer last answered with. :func:`since` returns only
+the rows stamped after that clock. The journal (``core.journal``, shared with
+``core.position_holders``) lives in heap memory; a rebuild (after
+init/upgrade) starts a new *epoch*, and a vector from another epoch — or one
+claiming a clock this journal never reached — gets the full directory.
+
+Deleted quarters simply drop out: gossip merges never delete, so a delta has
+nothing to say about them that a full directory would.
+"""
+
+from typing import Any, Dict, Optional
+
+from ic_python_logging import get_logger
+
+from core.journal import VersionedJournal
+
+logger = get_logger("core.quarter_directory")
+
+SELF_KEY = "self"
+REFRESH_SECONDS = 30
+
+
+class Journal(VersionedJournal):
+    """Directory rows with the clock value of their last change."""
+
+    def __init__(self, epoch: int = 0):
+        super().__init__(epoch)
+        self.rows: Dict[str, dict] = {}
+        self.self_block: Optional[dict] = None
+        # Quarter ``_id`` -> canister id, to drop the old row on a re-point.
+        self.owners: Dict[str, str] = {}
+
+    def put(self, cid: str, row: Optional[dict]) -> bool:
+        """Set (or, with ``None``, drop) the row for *cid*. True if changed."""
+        if self.rows.get(cid) == row:
+            return False
+        if row is None:
+            del self.rows[cid]
+            self.versions.pop(cid, None)
+            return True
+        self.rows[cid] = row
+        self._stamp(cid)
+        return True
+
+    def put_quarter(self, quarter_id: str, cid: str, row: Optional[dict]) -> bool:
+        """Track the row a given Quarter entity contributes."""
+        changed = False
+        old = self.owners.get(quarter_id)
+        if old is not None and old != cid:
+            changed = self.put(old, None)
+        if row is None:
+            self.owners.pop(quarter_id, None)
+        else:
+            self.owners[quarter_id] = cid
+        return self.put(cid, row) or changed
+
+    def drop_quarter(self, quarter_id: str) -> bool:
+        """Forget the row a Quarter entity contributed, if any."""
+        old = self.owners.pop(quarter_id, None)
+        return old is not None and self.put(old, None)
+
+    def put_self_block(self, block: Optional[dict]) -> bool:
+        if block == self.self_block:
+            return False
+        self.self_block = block
+        self._stamp(SELF_KEY)
+        return True
+
+    def entries(self, clock: int) -> dict:
+        out = {"quarters": [
+            row for cid, row in self.rows.items() if self._changed(cid, clock)
+        ]}
+        if self.self_block is not None and self._changed(SELF_KEY, clock):
+            out["self"] = self.self_block
+        return out
+
+
+_journal = Journal()
+# Peer canister id -> the {epoch, clock} it last answered with.
+_peer_vectors: Dict[str, dict] = {}
+
+
+def journal() -> Journal:
+    return _journal
+
+
+def ready() -> bool:
+    return _journal.ready
+
+
+def since(vector: Optional[dict]) -> dict:
+    return _journal.since(vector)
+
+
+# ── Rows ────────────────────────────────────────────────────────────────────
+
+
+def quarter_row(quarter) -> dict:
+    return {
+        "name": quarter.name or "",
+        "canister_id": quarter.canister_id or "",
+        "population": int(quarter.population or 0),
+        "status": quarter.status or "setup",
+        "index": int(quarter.index or 0),
+    }
+
+
+def self_row(realm, self_id: str) -> Optional[dict]:
+    """This canister's own directory row, or None before the realm exists."""
+    if realm is None:
+        return None
+    from ggg import User
+
+    from core.join_targets import catalog_status_for_self, is_dashboard_installed
+    from core.runtime_extensions import list_installed, resolve_extension_id
+
+    if bool(getattr(realm, "is_quarter", False)):
+        dashboard_installed = is_dashboard_installed(
+            list_installed(),
+            resolve_extension_id("member_dashboard"),
+        )
+        status = catalog_status_for_self(True, dashboard_installed)
+    else:
+        status = "active"
+    try:
+        population = int(User.count())
+    except Exception:
+        population = 0
+    return {
+        "name": getattr(realm, "name", "") or "",
+        "canister_id": self_id,
+        "population": population,
+        "status": status,
+        "index": 0,
+        "is_self": True,
+    }
+
+
+def self_block(self_id: str) -> dict:
+    """The gossip ``self`` block: installed codex and latest sync ballot."""
+    from ggg import Proposal
+
+    from core.quarter_drift import (
+        build_directory_self,
+        find_latest_codex_sync_ballot,
+        recent_proposals,
+    )
+    from core.quarter_sync import derive_quarter_current_codex
+
+    from core import proposal_index
+
+    codex = derive_quarter_current_codex()
+    recent_ids = proposal_index.recent_ids if proposal_index.index_ready() else None
+    ballot = find_latest_codex_sync_ballot(
+        recent_proposals(Proposal, recent_ids=recent_ids)
+    )
+    federal = None
+    try:
+        from core.federal_vote_runtime import latest_leg_for_directory
+
+        federal = latest_leg_for_directory()
+    except Exception:
+        pass
+    return build_directory_self(self_id, codex, ballot, federal=federal)
+
+
+# ── Maintenance ─────────────────────────────────────────────────────────────
+
+
+# Entity types ``ggg.projection`` hands to the hooks below.
+WATCHES = ("Quarter",)
+
+
+def _self_id() -> str:
+    from _cdk import ic
+
+    try:
+        return ic.id().to_str()
+    except Exception:
+        return ""
+
+
+def _gossiped(cid: str, self_id: str) -> bool:
+    """Whether a ``Quarter`` row for *cid* gets a directory row.
+
+    Rows without a canister id have nothing to gossip, and this canister's own
+    row is :func:`refresh_self`'s, not the ``Quarter`` table's.
+    """
+    return bool(cid) and cid != self_id
+
+
+def entity_changed(entity) -> None:
+    """Save hook: restamp a quarter's row if its gossip fields moved."""
+    if type(entity).__name__ != "Quarter":
+        return
+    try:
+        cid = entity.canister_id or ""
+        if _gossiped(cid, _self_id()):
+            _journal.put_quarter(str(entity._id), cid, quarter_row(entity))
+        else:
+            _journal.drop_quarter(str(entity._id))
+    except Exception as e:
+        logger.warning(f"quarter directory: could not refresh {entity!r}: {e}")
+
+
+def entity_removed(entity) -> None:
+    if type(entity).__name__ != "Quarter":
+        return
+    try:
+        _journal.drop_quarter(str(entity._id))
+    except Exception as e:
+        logger.warning(f"quarter directory: could not drop {entity!r}: {e}")
+
+
+def refresh_self() -> bool:
+    """Recompute this canister's row and ``self`` block. True if either moved."""
+    from _cdk import ic
+    from ggg import Realm
+
+    self_id = ic.id().to_str()
+    changed = False
+    try:
+        row = self_row(Realm.load("1"), self_id)
+        if row is not None:
+            changed = _journal.put(self_id, row)
+    except Exception as e:
+        logger.warning(f"quarter directory: self row unavailable: {e}")
+    try:
+        changed = _journal.put_self_block(self_block(self_id)) or changed
+    except Exception as e:
+        logger.warning(f"quarter directory: self block unavailable: {e}")
+    return changed
+
+
+def rebuild() -> None:
+    """Start a new epoch and load every row. Quarters are few; one message."""
+    global _journal
+    from _cdk import ic
+    from ggg import Quarter
+
+    epoch = _journal.epoch + 1
+    try:
+        epoch = max(epoch, int(ic.time()))
+    except Exception:
+        pass
+    fresh = Journal(epoch)
+    _journal = fresh
+    refresh_self()
+    self_id = _self_id()
+    for q in Quarter.instances():
+        cid = q.canister_id or ""
+        if not _gossiped(cid, self_id) or cid in fresh.rows:
+            continue
+        fresh.put_quarter(str(q._id), cid, quarter_row(q))
+    fresh.ready = True
+    logger.info(f"quarter directory: {len(fresh.rows)} rows, epoch {epoch}")
+
+
+def schedule_refresh(seconds: int = REFRESH_SECONDS) -> None:
+    """Rebuild after init/upgrade, then keep the self row current.
+
+    Timers must be set in init/post_upgrade/update context, which is why
+    ``initialize()`` calls this.
+    """
+    from _cdk import ic
+
+    def _rebuild():
+        try:
+            rebuild()
+        except Exception as e:
+            logger.error(f"quarter directory: rebuild failed: {e}")
+
+    def _refresh():
+        if _journal.ready:
+            refresh_self()
+
+    ic.set_timer(0, _rebuild)
+    ic.set_timer_interval(seconds, _refresh)
+
+
+# ── Requester side ──────────────────────────────────────────────────────────
+
+
+def peer_vector(peer_canister_id: str) -> Optional[dict]:
+    """What to ask *peer_canister_id* for: the vector it last answered with."""
+    return _peer_vectors.get(peer_canister_id)
+
+
+def remember_peer_vector(peer_canister_id: str, answer: Dict[str, Any]) -> None:
+    """Record the vector a merged answer carried (full or delta)."""
+    try:
+        vector = {"epoch": int(answer["epoch"]), "clock": int(answer["clock"])}
+    except (KeyError, TypeError, ValueError):
+        _peer_vectors.pop(peer_canister_id, None)
+        return
+    _peer_vectors[peer_canister_id] = vector
@@ -8,7 +8,7 @@ the existing ``get_quarter_directory`` gossip exchange — no new transport.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
 
 # Terminal outcomes where a sync was requested but not applied. Silence on an
 # org-scoped ballot settles as ``failed`` (threshold checked before quorum in
@@ -38,8 +38,22 @@ def is_codex_sync_proposal(meta: Mapping[str, Any]) -> bool:
 RECENT_BALLOT_SCAN_LIMIT = 100
 
 
-def recent_proposals(proposal_cls: Any, limit: int = RECENT_BALLOT_SCAN_LIMIT) -> list:
-    """The newest *limit* proposals, or ``[]`` if the entity cannot be scanned."""
+def recent_proposals(
+    proposal_cls: Any,
+    limit: int = RECENT_BALLOT_SCAN_LIMIT,
+    recent_ids: Optional[Callable[[int], Iterable[str]]] = None,
+) -> list:
+    """The newest *limit* proposals, or ``[]`` if the entity cannot be scanned.
+
+    *recent_ids* (``core.proposal_index.recent_ids`` once it is backfilled)
+    names the rows to load; without it the window is ``max_id``-relative.
+    """
+    if recent_ids is not None:
+        try:
+            loaded = (proposal_cls.load(i) for i in recent_ids(limit))
+            return [p for p in loaded if p is not None]
+        except Exception:
+            pass
     try:
         max_id = int(proposal_cls.max_id() or 0)
     except Exception:
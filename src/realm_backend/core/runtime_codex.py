@@ -144,6 +144,8 @@ def install_codex_package(codex_id: str, files: Dict[str, str]) -> bool:
     Returns:
         True if installation succeeded.
     """
+    from core import file_ledger
+
     _ensure_packages_dir()
     pkg_path = _pkg_dir(codex_id)
     os.makedirs(pkg_path, exist_ok=True)
@@ -165,6 +167,8 @@ def install_codex_package(codex_id: str, files: Dict[str, str]) -> bool:
             code = f.read()
         _create_or_update_codex_entity(name, code)
 
+    file_ledger.record("codex", codex_id, pkg_path)
+
     # Clear manifest cache
     _installed_manifests.pop(codex_id, None)
     manifest = _load_manifest(codex_id, force=True)
@@ -231,6 +235,8 @@ def uninstall_codex_package(codex_id: str) -> bool:
     Returns:
         True if removal succeeded.
     """
+    from core import file_ledger
+
     pkg_path = _pkg_dir(codex_id)
     if not os.path.exists(pkg_path):
         logger.warning(f"Codex package {codex_id}: not installed")
@@ -251,6 +257,7 @@ def uninstall_codex_package(codex_id: str) -> bool:
         os.rmdir(path)
 
     _rmtree(pkg_path)
+    file_ledger.forget("codex", codex_id)
 
     # Clear cache
     _installed_manifests.pop(codex_id, None)
@@ -287,6 +287,8 @@ def install_extension(
     Returns:
         True if installation succeeded.
     """
+    from core import file_ledger
+
     _ensure_extensions_dir()
     ext_path = _ext_dir(ext_id)
     os.makedirs(ext_path, exist_ok=True)
@@ -319,9 +321,11 @@ def install_extension(
         invalidate_cache()
     except Exception:
         pass
+    _invalidate_status_cache()
 
     manifest = _load_manifest(ext_id, force=True)
     if manifest is None:
+        file_ledger.record("extension", ext_id, ext_path)
         logger.error(f"Extension {ext_id}: installed but missing manifest.json")
         return False
 
@@ -346,6 +350,7 @@ def install_extension(
             except Exception as e:
                 logger.warning(f"Extension {ext_id}: could not sync _source.json — {e}")
 
+    file_ledger.record("extension", ext_id, ext_path)
     _seed_extension_entity(ext_id, manifest)
 
     # Entities an extension declares in its manifest are registered here, on
@@ -398,6 +403,8 @@ def uninstall_extension(ext_id: str) -> bool:
     Returns:
         True if removal succeeded.
     """
+    from core import file_ledger
+
     ext_path = _ext_dir(ext_id)
     if not os.path.exists(ext_path):
         logger.warning(f"Extension {ext_id}: not installed")
@@ -414,6 +421,7 @@ def uninstall_extension(ext_id: str) -> bool:
         os.rmdir(path)
 
     _rmtree(ext_path)
+    file_ledger.forget("extension", ext_id)
 
     # Clear caches
     _loaded_modules.pop(ext_id, None)
@@ -424,6 +432,7 @@ def uninstall_extension(ext_id: str) -> bool:
         invalidate_cache()
     except Exception:
         pass
+    _invalidate_status_cache()
 
     # Remove from sys.modules
     module_name = f"_runtime_ext_{ext_id}"
@@ -433,8 +442,19 @@ def uninstall_extension(ext_id: str) -> bool:
     return True
 
 
+def _invalidate_status_cache() -> None:
+    """Let the next cached status or extension-list read see the change."""
+    try:
+        from api.status_cache import invalidate
+
+        invalidate()
+    except Exception:
+        pass
+
+
 def reload_extension(ext_id: str) -> bool:
     """Force-reload an extension's code from the filesystem."""
     module = _load_module(ext_id, force=True)
     _load_manifest(ext_id, force=True)
+    _invalidate_status_cache()
     return module is not None
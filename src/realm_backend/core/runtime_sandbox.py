@@ -64,6 +64,7 @@ import json
 import os
 from typing import Any, Dict, List, Optional
 
+from core.perf import profiled
 from ic_python_logging import get_logger
 
 logger = get_logger("core.runtime_sandbox")
@@ -581,6 +582,7 @@ def _spawn_subinterpreter(
     return _basilisk_sandbox.spawn_subinterpreter(source, content_hash)
 
 
+@profiled("sandbox.run")
 def _run_in_subinterpreter(
     source: str,
     function_name: str,
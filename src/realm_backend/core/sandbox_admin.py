@@ -208,10 +208,10 @@ def _submit_sandbox_proposal(patch: dict, root, summary: str, proposer) -> dict:
         if not proposer:
             raise ValueError(f"Caller user '{caller}' not found")
 
-    proposal_num = len(Proposal.instances()) + 1
-    proposal_id = f"prop_{proposal_num:03d}"
-
     from core import runtime_sandbox
+    from core.proposal_index import allocate_proposal_id
+
+    proposal_id = allocate_proposal_id()
 
     code_inline = runtime_sandbox.build_proposal_code(patch)
     metadata = {
@@ -46,7 +46,7 @@ def _runtime() -> dict:
 
 
 def db_stats() -> dict:
-    """Per-entity-type row counts across the whole database."""
+    """Per-entity-type row counts, from the counters the ORM keeps."""
     from ic_python_db import Database
 
     db = Database.get_instance()
@@ -133,36 +133,146 @@ def token_balances() -> dict:
     return {"tokens": tokens, "count": len(tokens)}
 
 
+def _top(by_extension: dict) -> dict:
+    return dict(sorted(by_extension.items(), key=lambda kv: kv[1],
+                       reverse=True)[:10])
+
+
 def file_stats() -> dict:
-    """File counts and sizes, by extension.
+    """File counts and sizes, by extension, of installed extension and codex
+    trees.
 
-    Walking ``/`` is exactly the kind of ambient authority that should not sit
-    in extension code, which is the point of it living here.
+    Read from the ledger ``core.file_ledger`` keeps as trees are installed and
+    removed, so the cost follows the number of installed trees rather than
+    the number of files. ``files_audit`` measures the disk instead.
     """
-    total_files = 0
-    total_size = 0
-    by_extension = {}
-    try:
-        for root, _dirs, files in os.walk("/"):
-            if root.startswith(SKIP_ROOTS):
+    from core import file_ledger
+
+    totals = file_ledger.totals()
+    return {
+        "total_files": totals["files"],
+        "total_size_bytes": totals["bytes"],
+        "total_size_mb": round(totals["bytes"] / (1024 * 1024), 2),
+        "top_extensions": _top(totals["by_ext"]),
+        "trees": totals["trees"],
+        "ledger_ready": file_ledger.ready(),
+    }
+
+
+def _walk(root: str, skip=SKIP_ROOTS) -> dict:
+    """Everything under *root*, by ``os.listdir`` (no ``os.walk`` on WASM)."""
+    out = {"files": 0, "bytes": 0, "by_ext": {}}
+
+    def _visit(directory):
+        for name in _safe(lambda: os.listdir(directory), []):
+            path = os.path.join(directory, name)
+            if path.startswith(skip):
                 continue
-            for name in files:
-                total_files += 1
-                suffix = os.path.splitext(name)[1].lower() or "(no ext)"
-                by_extension[suffix] = by_extension.get(suffix, 0) + 1
-                total_size += _safe(
-                    lambda: os.path.getsize(os.path.join(root, name)), 0
-                ) or 0
-    except Exception:
-        pass
+            if os.path.isdir(path) and not os.path.islink(path):
+                _visit(path)
+                continue
+            suffix = os.path.splitext(name)[1].lower() or "(no ext)"
+            out["files"] += 1
+            out["by_ext"][suffix] = out["by_ext"].get(suffix, 0) + 1
+            out["bytes"] += _safe(lambda: os.path.getsize(path), 0) or 0
+
+    _visit(root)
+    return out
+
+
+def files_audit(repair: bool = False) -> dict:
+    """The slow path: walk ``/`` and re-measure every ledger tree.
 
-    top = dict(sorted(by_extension.items(), key=lambda kv: kv[1],
-                      reverse=True)[:10])
+    Only run when asked for by name — it costs every file on the canister.
+    """
+    from core import file_ledger
+
+    walked = _walk("/")
     return {
-        "total_files": total_files,
-        "total_size_bytes": total_size,
-        "total_size_mb": round(total_size / (1024 * 1024), 2),
-        "top_extensions": top,
+        "total_files": walked["files"],
+        "total_size_bytes": walked["bytes"],
+        "total_size_mb": round(walked["bytes"] / (1024 * 1024), 2),
+        "top_extensions": _top(walked["by_ext"]),
+        "ledger": file_ledger.verify(repair=repair),
+    }
+
+
+# Ids ``db_audit`` probes per call, and how far past a type's ``{type}_id``
+# it looks for rows the counter fell behind.
+AUDIT_PAGE = 2000
+AUDIT_HEADROOM = 64
+
+
+def db_audit(cursor: dict = None, repair: bool = False, page: int = AUDIT_PAGE) -> dict:
+    """The slow path for ``db``: count stored rows per type, one page per call.
+
+    ``db_stats`` trusts the ``{type}_count`` counters the ORM keeps on create
+    and delete. This loads ids ``1 .. {type}_id`` (plus ``AUDIT_HEADROOM``
+    beyond the highest row found) type by type and reports each type whose
+    counter disagrees, or whose ``{type}_id`` is below a stored row id (the
+    next create would collide). With *repair*, both counters are rewritten as
+    each type is finished. Rows with non-numeric ids are not probed.
+
+    A call stops after *page* ids and returns ``next_cursor``; pass it back to
+    carry on. The report is cumulative, so the call that returns
+    ``next_cursor: None`` holds the whole audit.
+    """
+    from ic_python_db import Database
+
+    db = Database.get_instance()
+    types = {}
+    for cls in db._entity_types.values():
+        types.setdefault(cls.get_full_type_name(), cls)
+    names = sorted(types)
+
+    state = dict(cursor or {})
+    index = int(state.get("type_index", 0))
+    next_id = int(state.get("from", 1))
+    rows, top_id = int(state.get("rows", 0)), int(state.get("top", 0))
+    total = int(state.get("total", 0))
+    mismatched = dict(state.get("mismatched") or {})
+    repaired = bool(state.get("repaired", False))
+
+    budget = max(1, int(page))
+    while index < len(names) and budget > 0:
+        name = names[index]
+        cls = types[name]
+        max_id = _safe(cls.max_id, 0)
+        end = max(max_id, top_id) + AUDIT_HEADROOM
+        while next_id <= end and budget > 0:
+            if _safe(lambda: db.load(name, str(next_id))) is not None:
+                rows += 1
+                top_id = next_id
+                end = max(max_id, top_id) + AUDIT_HEADROOM
+            next_id += 1
+            budget -= 1
+        if next_id <= end:
+            break
+
+        counted = _safe(cls.count, -1)
+        if counted != rows or max_id < top_id:
+            mismatched[name] = {"counter": counted, "rows": rows,
+                                "max_id": max_id, "highest_row_id": top_id}
+            if repair:
+                db.save("_system", f"{name}_count", str(rows))
+                if max_id < top_id:
+                    db.save("_system", f"{name}_id", str(top_id))
+                repaired = True
+        total += rows
+        index, next_id, rows, top_id = index + 1, 1, 0, 0
+
+    done = index >= len(names)
+    return {
+        "entity_types": len(names),
+        "checked_types": index,
+        "total_entities": total,
+        "consistent": not mismatched,
+        "mismatched": mismatched,
+        "repaired": repaired,
+        "next_cursor": None if done else {
+            "type_index": index, "from": next_id, "rows": rows, "top": top_id,
+            "total": total, "mismatched": mismatched, "repaired": repaired,
+        },
     }
 
 
@@ -184,6 +294,13 @@ def extensions_info() -> dict:
             "count": len(extensions)}
 
 
+def perf_stats() -> dict:
+    """Instruction profile of recent endpoint, bridge and sandbox calls."""
+    from core import perf
+
+    return perf.snapshot()
+
+
 SECTIONS = {
     "runtime": _runtime,
     "db": db_stats,
@@ -191,21 +308,51 @@ SECTIONS = {
     "tokens": token_balances,
     "files": file_stats,
     "extensions": extensions_info,
+    "perf": perf_stats,
+}
+
+# Full scans behind ``db`` and ``files``: never part of the default snapshot,
+# only run when a caller names them.
+AUDITS = {
+    "db_audit": db_audit,
+    "files_audit": files_audit,
 }
 
 
-def snapshot(sections=None) -> dict:
-    """Gather the requested sections, defaulting to all of them.
+def snapshot(sections=None, options=None) -> dict:
+    """Gather the requested sections, defaulting to all of ``SECTIONS``.
 
     A failing section degrades to an error entry rather than sinking the whole
     snapshot — this is a diagnostics panel, and it is most wanted precisely
-    when something is broken.
+    when something is broken. The ``AUDITS`` scans run only when named;
+    *options* maps an audit to its keyword arguments, e.g.
+    ``{"db_audit": {"cursor": ...}}``. The snapshot only reads: an audit asked
+    to repair is refused here, see :func:`repair`.
     """
-    wanted = [s for s in (sections or SECTIONS) if s in SECTIONS]
+    available = {**SECTIONS, **AUDITS} if sections else SECTIONS
+    wanted = [s for s in (sections or SECTIONS) if s in available]
+    options = options or {}
     out = {}
     for name in wanted:
         try:
-            out[name] = SECTIONS[name]()
+            kwargs = dict(options.get(name) or {}) if name in AUDITS else {}
+            if kwargs.pop("repair", False):
+                raise ValueError(f"{name} repairs through repair(), not the snapshot")
+            out[name] = available[name](**kwargs)
         except Exception as e:
             out[name] = {"error": str(e)}
     return out
+
+
+def repair(section: str, cursor: dict = None) -> dict:
+    """Run one of the ``AUDITS`` with repair on and return its report.
+
+    The write half of the audits, kept out of :func:`snapshot` so reading
+    diagnostics can never rewrite a counter or the file ledger. ``db_audit``
+    pages like it does in the snapshot: pass ``next_cursor`` back to carry on.
+    """
+    if section == "db_audit":
+        return db_audit(cursor=cursor, repair=True)
+    if section == "files_audit":
+        return files_audit(repair=True)
+    raise ValueError(f"unknown audit '{section}'; expected one of {sorted(AUDITS)}")
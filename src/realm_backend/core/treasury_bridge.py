@@ -295,10 +295,11 @@ def _voting_deadline_seconds() -> int:
 
 
 def _submit_proposal(action: dict, department, summary: str, proposer) -> dict:
+    from core.proposal_index import allocate_proposal_id
     from core.treasury_allocation import build_treasury_proposal_code
     from ggg import Proposal
 
-    proposal_id = f"prop_{len(Proposal.instances()) + 1:03d}"
+    proposal_id = allocate_proposal_id()
     metadata = {
         "proposal_type": "treasury_action",
         "org_scope": department.name,
@@ -10,7 +10,9 @@ capital opened.
 ``FederalVoteLeg`` is that per-quarter ballot row. On the capital there is
 one leg per quarter; on a quarter there is exactly one leg (its own). The
 composite ``leg_key`` gives O(1) idempotent upsert when federation messages
-are replayed.
+are replayed, and doubles as the (vote, quarter) index. ``vote_id``,
+``quarter_canister_id`` and ``status`` are indexed so the recurring federal
+tasks never scan historical legs.
 
 Each leg stores its own ``vote_hash`` — a digest of the frozen action, rule,
 and deadline — so a quarter executes only what its members actually voted on.
@@ -57,7 +59,7 @@ class FederalVoteLeg(Entity, TimestampedMixin):
 
     leg_key = String(max_length=130)
     vote_id = String(max_length=64, indexed=True)
-    quarter_canister_id = String(max_length=64)
+    quarter_canister_id = String(max_length=64, indexed=True)
     proposal_id = String(max_length=64, default="")
     outcome = String(max_length=32, default="")
     votes_yes = Integer(default=0)
@@ -3,10 +3,12 @@ import json
 from ic_python_db import Entity, Float, ManyToOne, OneToMany, String, TimestampedMixin
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 logger = get_logger("entity.proposal")
 
 
-class Proposal(Entity, TimestampedMixin):
+class Proposal(Projected, Entity, TimestampedMixin):
     __owner_field__ = "proposer"  # realms#282 — SecureORM ownership stamp/protect
     """Governance proposal entity for voting system.
 
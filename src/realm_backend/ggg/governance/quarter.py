@@ -1,5 +1,7 @@
 from ic_python_db import Entity, Integer, ManyToOne, String, TimestampedMixin
 from ic_python_logging import get_logger
+
+from ..projection import Projected
 from ..system.constants import STATUS_MAX_LENGTH
 
 logger = get_logger("entity.quarter")
@@ -13,7 +15,7 @@ class QuarterStatus:
     MERGING = "merging"
 
 
-class Quarter(Entity, TimestampedMixin):
+class Quarter(Projected, Entity, TimestampedMixin):
     __alias__ = "name"
     __version__ = 2
 
@@ -1,5 +1,7 @@
 from ic_python_db import Boolean, Entity, Integer, OneToMany, OneToOne, String, TimestampedMixin
 from ic_python_logging import get_logger
+
+from ..projection import Projected
 from ..system.constants import STATUS_MAX_LENGTH
 
 logger = get_logger("entity.realm")
@@ -14,7 +16,7 @@ class RealmStatus:
     TERMINATED = "terminated"    # Closed, read-only archive
 
 
-class Realm(Entity, TimestampedMixin):
+class Realm(Projected, Entity, TimestampedMixin):
     __alias__ = "name"
     __version__ = 8
     name = String(min_length=2, max_length=256)
@@ -1,10 +1,12 @@
 from ic_python_db import Entity, Float, OneToMany, OneToOne, String, TimestampedMixin
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 logger = get_logger("entity.human")
 
 
-class Human(Entity, TimestampedMixin):
+class Human(Projected, Entity, TimestampedMixin):
     __owner_field__ = "user"  # realms#282 — SecureORM ownership stamp/protect
     __alias__ = "name"
     name = String(max_length=256)
@@ -1,6 +1,8 @@
 from ic_python_db import Entity, Integer, ManyToOne, OneToMany, String, TimestampedMixin
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 logger = get_logger("entity.land")
 
 
@@ -19,7 +21,7 @@ class LandStatus:
     REVOKED = "revoked"
 
 
-class Land(Entity, TimestampedMixin):
+class Land(Projected, Entity, TimestampedMixin):
     __owner_field__ = "owner_user"  # realms#282 — SecureORM ownership stamp/protect
     __alias__ = "id"
     id = String()
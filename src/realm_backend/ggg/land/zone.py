@@ -1,10 +1,12 @@
 from ic_python_db import Entity, ManyToOne, String, TimestampedMixin
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 logger = get_logger("entity.zone")
 
 
-class Zone(Entity, TimestampedMixin):
+class Zone(Projected, Entity, TimestampedMixin):
     __owner_field__ = "user"  # realms#282 — SecureORM ownership stamp/protect
     """
     Geographic zone of influence, stored as an H3 cell index.
@@ -15,12 +17,16 @@ class Zone(Entity, TimestampedMixin):
     it only enforces one territory zone per H3 cell via the ``h3_index`` alias
     and stores descriptive metadata (name, description, zone_type).
 
+    ``h3_index`` is also a field index: the alias keeps only the newest row per
+    cell, while a cell can carry both a territory zone and a legacy
+    land-linked one, and lookups need all of them.
+
     v2: removed latitude/longitude/resolution; added zone_type.
     """
 
     __version__ = 2
     __alias__ = "h3_index"
-    h3_index = String(max_length=32)  # H3 cell index (e.g., "861203a4fffffff")
+    h3_index = String(max_length=32, indexed=True)  # H3 cell index (e.g., "861203a4fffffff")
     name = String(max_length=256)
     description = String(max_length=1024)
     zone_type = String(max_length=32, default="unassigned")
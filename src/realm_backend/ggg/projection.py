@@ -0,0 +1,82 @@
+"""Entity-write notifications for state ``core`` derives from ggg rows.
+
+Entities that list :class:`Projected` among their bases report their saves
+and deletes here, so the realm directory (``core.directory``), the cached
+Cedar principal slices (``core.cedar_authz``), the reverse membership index
+(``core.membership``), the federation member set (``core.federation``), the
+versioned quarter directory (``core.quarter_directory``), the open-proposal
+index (``core.proposal_index``), the department policy cache
+(``core.org_policy``), the citizen-import index (``core.citizen_import``),
+the versioned position holders (``core.position_holders``), the parcel
+and zone map indexes (``core.land_bridge``) and the cached status response
+(``api.status_cache``) stay current without a rescan.
+
+Each target exposes ``entity_changed`` and ``entity_removed`` and names the
+entity types it follows in ``WATCHES``; a write is only handed to the targets
+that watch its type, so a save costs nothing in the others. The ``core`` side
+is resolved once and lazily, because ``core`` depends on ``ggg`` and because
+``ggg`` is also imported outside the canister (the CLI links it in) where
+there is no ``core`` to notify.
+"""
+
+_by_type = None
+
+
+def _resolve() -> dict:
+    """Entity type name -> the targets that watch it."""
+    global _by_type
+    if _by_type is None:
+        try:
+            from core import (
+                cedar_authz,
+                citizen_import,
+                directory,
+                federation,
+                land_bridge,
+                membership,
+                org_policy,
+                position_holders,
+                proposal_index,
+                quarter_directory,
+            )
+            from api import status_cache
+
+            targets = (
+                directory, cedar_authz, membership, federation, quarter_directory,
+                proposal_index, org_policy, citizen_import, position_holders,
+                land_bridge, status_cache,
+            )
+        except ImportError:
+            targets = ()
+        by_type = {}
+        for target in targets:
+            for name in target.WATCHES:
+                by_type.setdefault(name, []).append(target)
+        _by_type = {name: tuple(ts) for name, ts in by_type.items()}
+    return _by_type
+
+
+def changed(entity) -> None:
+    for target in _resolve().get(type(entity).__name__, ()):
+        target.entity_changed(entity)
+
+
+def removed(entity) -> None:
+    for target in _resolve().get(type(entity).__name__, ()):
+        target.entity_removed(entity)
+
+
+class Projected:
+    """Mixin: report the entity's saves and deletes to :func:`changed` and
+    :func:`removed`. List it before ``Entity`` so it wraps the ORM's methods.
+    """
+
+    def _save(self):
+        saved = super()._save()
+        if not self._do_not_save:
+            changed(self)
+        return saved
+
+    def delete(self) -> None:
+        super().delete()
+        removed(self)
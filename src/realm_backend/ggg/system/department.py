@@ -11,13 +11,15 @@ from ic_python_db import (
 )
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 logger = get_logger("entity.department")
 
 # Reserved name for the quarter's top governing department (issue #240).
 ROOT_ORG_NAME = "root"
 
 
-class Department(Entity, TimestampedMixin):
+class Department(Projected, Entity, TimestampedMixin):
     """Internal governance department within a quarter.
 
     Not to be confused with ``Organization`` (an external party the realm
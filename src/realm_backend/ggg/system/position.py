@@ -25,6 +25,8 @@ from ic_python_db import (
 )
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 logger = get_logger("entity.position")
 
 
@@ -55,7 +57,7 @@ def position_key(department_name: str, title: str) -> str:
     return f"{department_name}/{title}"
 
 
-class Position(Entity, TimestampedMixin):
+class Position(Projected, Entity, TimestampedMixin):
     """A titled seat on a Department (product name: Organization).
 
     - ``key`` is the unique alias ``<department>/<title>`` (titles like
@@ -127,7 +129,7 @@ class Position(Entity, TimestampedMixin):
         return result
 
 
-class Appointment(Entity, TimestampedMixin):
+class Appointment(Projected, Entity, TimestampedMixin):
     """One user holding one position for a period."""
 
     position = ManyToOne("Position", "appointments")
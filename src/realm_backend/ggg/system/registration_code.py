@@ -48,8 +48,10 @@ def _now_dt() -> datetime:
 from ic_python_db import Entity, TimestampedMixin
 from ic_python_db.properties import Integer, String
 
+from ..projection import Projected
 
-class RegistrationCode(Entity, TimestampedMixin):
+
+class RegistrationCode(Projected, Entity, TimestampedMixin):
     """Invite code that grants a profile/role when redeemed during signup.
 
     Attributes:
@@ -11,12 +11,14 @@ from ic_python_db import (
 )
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 from .user_profile import UserProfile
 
 logger = get_logger("entity.user")
 
 
-class User(Entity, TimestampedMixin):
+class User(Projected, Entity, TimestampedMixin):
     __owner_field__ = "id"  # realms#282 — SecureORM ownership stamp/protect
     __alias__ = "id"
     id = String()
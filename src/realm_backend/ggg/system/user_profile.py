@@ -1,6 +1,8 @@
 from ic_python_db import Entity, ManyToMany, String, TimestampedMixin
 from ic_python_logging import get_logger
 
+from ..projection import Projected
+
 logger = get_logger("entity.user_profile")
 
 
@@ -500,15 +502,15 @@ class Profiles:
 OPERATIONS_SEPARATOR = ","
 
 
-class UserProfile(Entity, TimestampedMixin):
+class UserProfile(Projected, Entity, TimestampedMixin):
 
     __alias__ = "name"
     name = String(max_length=256)
     description = String(max_length=256)
     allowed_to = String()
     # The User→profiles relation is unidirectional (issue #242): use
-    # ``self.reverse_count("users")`` for the holder count; list holders by
-    # scanning users (core.membership.users_with_profile).
+    # ``self.reverse_count("users")`` for the holder count; list holders
+    # through core.membership.users_with_profile (reverse membership index).
     permissions = ManyToMany(["Permission"], "profiles")
     extensions = ManyToMany(["Extension"], "profiles")
 
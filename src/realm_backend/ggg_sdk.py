@@ -1211,7 +1211,8 @@ class _ExtensionAccess:
 class _Lands:
     """The land registry.
 
-    Reads are paginated host-side; writes are typed because land carries
+    Reads are paginated host-side (``map`` and ``zones`` page by the
+    ``next_cursor`` they return); writes are typed because land carries
     invariants (one parcel per H3 cell, residential land belongs to members)
     that a generic update could not express, and because ownership must not be
     settable as an ordinary field.
@@ -1226,10 +1227,15 @@ class _Lands:
         return _require_rpc("land.get", {"land_id": land_id})
 
     def map(self, min_x=0, max_x=20, min_y=0, max_y=20, from_id=1,
-            page_size=10):
+            page_size=10, cursor=None):
         return _require_rpc("land.map", {
             "min_x": min_x, "max_x": max_x, "min_y": min_y, "max_y": max_y,
-            "from_id": from_id, "page_size": page_size,
+            "from_id": from_id, "page_size": page_size, "cursor": cursor,
+        })
+
+    def zones(self, cells, cursor=None, page_size=10):
+        return _require_rpc("land.zones", {
+            "cells": cells, "cursor": cursor, "page_size": page_size,
         })
 
     def create(self, **fields):
@@ -1361,13 +1367,20 @@ class _Ctx:
         """Write to the canister log, tagged with this extension's id."""
         return _require_rpc("log.write", {"message": str(message)})
 
-    def system_snapshot(self, sections=None):
+    def system_snapshot(self, sections=None, options=None):
         """Admin-gated operational diagnostics.
 
         ``sections`` selects a subset of ``runtime, db, canister, tokens,
-        files, extensions``; omit it for all of them.
+        files, extensions``; omit it for all of them. The ``db_audit`` and
+        ``files_audit`` checks run only when named, with their arguments in
+        ``options`` (``{"db_audit": {"cursor": ...}}``).
         """
-        return _require_rpc("system.snapshot", {"sections": sections})
+        return _require_rpc("system.snapshot", {"sections": sections, "options": options})
+
+    def system_repair(self, section, cursor=None):
+        """Admin-gated: rewrite what ``db_audit`` or ``files_audit`` found
+        wrong. ``db_audit`` pages; pass ``next_cursor`` back to carry on."""
+        return _require_rpc("system.repair", {"section": section, "cursor": cursor})
 
     def realm_info(self):
         """``{"canister_id", "registry_canister_id", "version"}`` — how this
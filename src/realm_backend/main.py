@@ -44,6 +44,8 @@ from api.crypto import revoke_many as crypto_revoke_many
 from api.crypto import list_scopes as crypto_list_scopes
 from api.crypto import revoke_group as crypto_revoke_group
 from api.crypto import revoke_principal as crypto_revoke_principal
+from api.crypto import rotate_scope as crypto_rotate_scope_chunk
+from api.crypto import rotation_status as crypto_scope_rotation_status
 from api.crypto import share_with_group as crypto_share_group
 from api.crypto import share_with_principal as crypto_share_principal
 from api.crypto import store_envelope as crypto_store_envelope
@@ -67,8 +69,8 @@ from api.nft import (
     mint_land_nft,
     unfreeze_nft,
 )
+from api import status_cache
 from api.registry import get_registry_info, register_realm
-from api.status import get_status
 from api.user import (
     user_get,
     user_register,
@@ -83,6 +85,7 @@ from api.vetkeys import (
 )
 from api.zones import get_zone_aggregation
 from core.access import _check_access, require, require_controller, set_controller
+from core.perf import profiled
 from core.setup import setup_gate_error
 from core.cross_quarter import (
     ResolutionStatus,
@@ -284,32 +287,18 @@ logger = get_logger("main")
 
 
 def _init_secure_orm():
-    """Build the Cedar-gated ORM singleton for the sandboxed REPL (realms#282)."""
-    from ic_python_db import Entity
-    from ic_python_db.schema import build_schema
+    """Build the Cedar-gated ORM singleton for the sandboxed REPL (realms#282).
+
+    The entity list and ORM schema come precomputed from
+    ``core/cedar_schema_frozen.py`` while it matches the ggg definitions.
+    """
     from ic_basilisk_toolkit.secure_orm import SecureORM
 
     import ggg
     from core import cedar_authz
+    from core.cedar_schema_runtime import orm_schema
 
-    candidates = [
-        getattr(ggg, name)
-        for name in ggg.__all__
-        if isinstance(getattr(ggg, name), type)
-        and issubclass(getattr(ggg, name), Entity)
-    ]
-    included = []
-    for cls in candidates:
-        try:
-            build_schema({cls.__name__: cls})
-        except Exception as exc:
-            logger.warning(
-                f"secure_orm: excluding {cls.__name__} from REPL stubs: {exc}"
-            )
-            continue
-        included.append(cls)
-
-    schema = build_schema({cls.__name__: cls for cls in included})
+    included, schema = orm_schema()
     return SecureORM(
         engine=cedar_authz._get_engine(),
         namespace="Realm",
@@ -386,12 +375,43 @@ def policy_status() -> str:
     return json.dumps(cedar_authz.status())
 
 
+@query
+@require(Operations.REALM_ADMIN)
+def get_perf_stats(prefix: text) -> text:
+    """Instruction counts per profiled name, as JSON (admin only).
+
+    Each name — an ``@update`` endpoint, ``extension_bridge.<verb>``,
+    ``codex_bridge.apply_effects``, ``cedar.is_authorized``,
+    ``sandbox.run`` — reports calls, errors, total, mean, p50/p99 and max over
+    its recent samples (see :mod:`core.perf`). ``prefix`` filters by name; pass
+    ``""`` for everything.
+    """
+    from core import perf
+
+    return json.dumps({
+        "enabled": perf.enabled(),
+        "ring_size": perf.RING_SIZE,
+        "stats": perf.stats(prefix or ""),
+    })
+
+
+@update
+@require_controller
+def reset_perf_stats(name: text) -> text:
+    """Drop profiling samples for ``name``, or for every name when empty."""
+    from core import perf
+
+    perf.reset(name or None)
+    return json.dumps({"success": True})
+
+
 @query
 def status() -> RealmResponse:
     try:
         logger.info("Status query executed")
         return RealmResponse(
-            success=True, data=RealmResponseData(status=StatusRecord(**get_status()))
+            success=True,
+            data=RealmResponseData(status=StatusRecord(**status_cache.status())),
         )
     except Exception as e:
         logger.error(f"Error getting status: {str(e)}\n{traceback.format_exc()}")
@@ -551,6 +571,7 @@ def _default_registration_profile(realm) -> str:
 
 
 @update
+@profiled
 def join_realm(
     profile: str, preferred_quarter: text, invite_code_checksum_hex: text
 ) -> Async[RealmResponse]:
@@ -1115,6 +1136,7 @@ def list_delegations_json() -> text:
 
 
 @update
+@profiled
 @require(Operations.SELF_CHANGE_QUARTER)
 def change_quarter(new_quarter_canister_id: text) -> RealmResponse:
     """Change the caller's assigned quarter."""
@@ -2192,74 +2214,28 @@ def get_quarter_directory() -> text:
     Includes this canister plus every Quarter entity it knows about.
     """
     try:
-        from core.join_targets import (
-            catalog_status_for_self,
-            is_dashboard_installed,
-        )
-        from core.quarter_drift import (
-            build_directory_self,
-            find_latest_codex_sync_ballot,
-        )
-        from core.quarter_sync import derive_quarter_current_codex
-        from core.runtime_extensions import list_installed, resolve_extension_id
-        from ggg import Proposal, Quarter, Realm, User
+        from core import quarter_directory
+        from ggg import Quarter, Realm
 
         self_id = ic.id().to_str()
-        realm = Realm.load("1")
         quarters = []
         seen = set()
-        is_quarter = bool(getattr(realm, "is_quarter", False)) if realm else False
-        if is_quarter:
-            dashboard_installed = is_dashboard_installed(
-                list_installed(),
-                resolve_extension_id("member_dashboard"),
-            )
-            self_status = catalog_status_for_self(True, dashboard_installed)
-        else:
-            self_status = "active"
-        if realm is not None:
-            try:
-                self_pop = int(User.count())
-            except Exception:
-                self_pop = 0
-            quarters.append({
-                "name": getattr(realm, "name", "") or "",
-                "canister_id": self_id,
-                "population": self_pop,
-                "status": self_status,
-                "index": 0,
-                "is_self": True,
-            })
+        row = quarter_directory.self_row(Realm.load("1"), self_id)
+        if row is not None:
+            quarters.append(row)
             seen.add(self_id)
         for q in Quarter.instances():
             cid = q.canister_id or ""
             if cid in seen:
                 continue
             seen.add(cid)
-            quarters.append({
-                "name": q.name or "",
-                "canister_id": cid,
-                "population": int(q.population or 0),
-                "status": q.status or "setup",
-                "index": int(q.index or 0),
-            })
+            quarters.append(quarter_directory.quarter_row(q))
 
         # Peers depend on this directory; a failure to describe our own codex
         # must not cost them the quarter list.
         payload = {"quarters": quarters}
         try:
-            from core.quarter_drift import recent_proposals
-
-            codex = derive_quarter_current_codex()
-            ballot = find_latest_codex_sync_ballot(recent_proposals(Proposal))
-            federal = None
-            try:
-                from core.federal_vote_runtime import latest_leg_for_directory
-
-                federal = latest_leg_for_directory()
-            except Exception:
-                pass
-            payload["self"] = build_directory_self(self_id, codex, ballot, federal=federal)
+            payload["self"] = quarter_directory.self_block(self_id)
         except Exception as e:
             logger.warning(f"get_quarter_directory: self block unavailable: {e}")
 
@@ -2269,6 +2245,33 @@ def get_quarter_directory() -> text:
         return json.dumps({"quarters": [], "error": str(e)})
 
 
+@query
+def get_quarter_directory_since(vector: text) -> text:
+    """Delta form of ``get_quarter_directory`` for gossip.
+
+    ``vector`` is the ``{"epoch", "clock"}`` this canister last answered the
+    caller with (``""`` for none). Returns ``{epoch, clock, full, quarters,
+    self?}``: with ``full`` false, ``quarters`` holds only the rows changed
+    since that clock and ``self`` appears only if it changed. An unknown
+    vector gets the whole directory (see :mod:`core.quarter_directory`).
+    """
+    try:
+        from core import quarter_directory
+
+        try:
+            since = json.loads(vector) if vector else None
+        except (json.JSONDecodeError, TypeError):
+            since = None
+        if not quarter_directory.ready():
+            payload = json.loads(get_quarter_directory())
+            payload.update({"epoch": 0, "clock": 0, "full": True})
+            return json.dumps(payload)
+        return json.dumps(quarter_directory.since(since))
+    except Exception as e:
+        logger.error(f"Error in get_quarter_directory_since: {e}\n{traceback.format_exc()}")
+        return json.dumps({"quarters": [], "full": True, "error": str(e)})
+
+
 @query
 def list_position_holders() -> text:
     try:
@@ -2278,6 +2281,41 @@ def list_position_holders() -> text:
         return json.dumps({"success": False, "error": str(e), "positions": []})
 
 
+@query
+def list_position_holders_since(vector: text) -> text:
+    """Seats whose holders changed since ``vector`` (``{"epoch", "clock"}``).
+
+    ``full`` is True when the vector is empty, unknown or from before an
+    upgrade; the answer's ``epoch``/``clock`` is the vector to send next time.
+    """
+    try:
+        from core.acting_appointments import dump_position_holders
+
+        try:
+            since = json.loads(vector) if vector else {}
+        except (json.JSONDecodeError, TypeError):
+            since = {}
+        return json.dumps(dump_position_holders(ic.id().to_str(), since=since))
+    except Exception as e:
+        return json.dumps({"success": False, "error": str(e), "positions": []})
+
+
+@update
+@profiled
+@require(Operations.QUARTER_REGISTER)
+def sync_position_holders() -> Async[text]:
+    """Quarter: apply the capital's seat-holder changes as acting appointments.
+
+    Delegates to ``core.quarter_bootstrap.sync_inherited_holders``, which asks
+    the capital only for seats changed since the last sync.
+    """
+    from core.quarter_bootstrap import sync_inherited_holders
+    from ggg import Realm
+
+    res = yield from sync_inherited_holders(Realm.load("1"))
+    return json.dumps(res)
+
+
 @query
 def get_join_targets() -> text:
     """Public join policy for the registration page (issue #156).
@@ -2360,19 +2398,21 @@ def get_join_targets() -> text:
 
 
 @update
+@profiled
 @require(Operations.QUARTER_REGISTER)
 def sync_quarters(peer_canister_id: text) -> Async[text]:
-    """Gossip: pull a peer quarter's coarse directory and merge it into ours.
+    """Gossip: pull peer quarters' coarse directories and merge them into ours.
 
     Adds Quarter entities for peers we did not know about and updates known
     populations. Carries only container-level data (see issue #156).
 
-    Delegates to ``core.quarter_bootstrap.sync_one_peer`` — the same un-gated
-    merge the recurring population-sync task uses, so both paths stay identical.
+    ``peer_canister_id`` may be a comma-separated list: the peers are then
+    fetched in turn and merged in one pass. Delegates to
+    ``core.quarter_bootstrap.sync_peers``.
     """
-    from core.quarter_bootstrap import sync_one_peer
+    from core.quarter_bootstrap import sync_peers
 
-    res = yield from sync_one_peer(peer_canister_id)
+    res = yield from sync_peers(peer_canister_id)
     return json.dumps(res)
 
 
@@ -2426,6 +2466,7 @@ def get_quarter_codex_drift() -> text:
 
 
 @update
+@profiled
 def report_quarter_population(population: nat) -> text:
     """Accept a quarter's live population push (issue #156).
 
@@ -2464,6 +2505,7 @@ def report_quarter_population(population: nat) -> text:
 
         if decision.get("updated") and target is not None:
             target.population = int(decision["population"])
+            status_cache.invalidate()
             logger.info(
                 f"Population report from {caller}: "
                 f"{decision['previous']} -> {decision['population']}"
@@ -2552,6 +2594,7 @@ def report_quarter_ready() -> text:
 
 
 @update
+@profiled
 def register_demo_citizens(payload: text) -> Async[text]:
     """Register synthetic demo citizens on this canister (capital or quarter).
 
@@ -2569,6 +2612,7 @@ def register_demo_citizens(payload: text) -> Async[text]:
 
 
 @update
+@profiled
 def federation_message(payload: text) -> text:
     """Generic federation transport endpoint (issue #263).
 
@@ -2589,6 +2633,19 @@ def federation_message(payload: text) -> text:
         return json.dumps({"success": False, "error": str(e)})
 
 
+@query
+def federation_member_cache_stats() -> text:
+    """Hits, misses and generation of the federation member cache, as JSON.
+
+    ``federation_message`` authorizes each sender against this cache; a
+    steady miss count under gossip load means something keeps invalidating
+    it (see :func:`core.federation.entity_changed`).
+    """
+    from core.federation import members_cache_stats
+
+    return json.dumps(members_cache_stats())
+
+
 @update
 @require(Operations.FEDERAL_VOTE_PROPOSE)
 def propose_federal_vote(args: text) -> Async[text]:
@@ -3031,6 +3088,42 @@ def ensure_population_sync_task() -> bool:
     return True
 
 
+@query
+@require(Operations.REALM_ADMIN)
+def export_entity_types() -> text:
+    """Entity types available to ``export_entities``, with counts and max ids.
+
+    JSON ``{"success": true, "types": [{"type", "count", "max_id"}, ...]}``.
+    """
+    try:
+        from core.entity_export import export_types
+
+        return json.dumps({"success": True, "types": export_types()})
+    except Exception as e:
+        logger.error(f"Error listing export types: {e}\n{traceback.format_exc()}")
+        return json.dumps({"success": False, "error": str(e)})
+
+
+@query
+@require(Operations.REALM_ADMIN)
+def export_entities(entity_type: text, from_id: nat, limit: nat) -> text:
+    """One page of serialized entities of one type, for streaming export.
+
+    JSON ``{"success": true, "type", "records": [...], "next_from_id", "max_id"}``;
+    call again with ``next_from_id`` until it is ``null``. Pages are capped by
+    count and by size (see ``core.entity_export``).
+    """
+    try:
+        from core.entity_export import export_page
+
+        return json.dumps(
+            dict(export_page(entity_type, from_id, limit), success=True)
+        )
+    except Exception as e:
+        logger.error(f"Error exporting {entity_type}: {e}\n{traceback.format_exc()}")
+        return json.dumps({"success": False, "error": str(e)})
+
+
 @query
 def get_zones(resolution: nat = 6) -> text:
     """
@@ -3446,6 +3539,7 @@ def crypto_get_my_scopes() -> CryptoResponse:
 
 
 @update
+@profiled
 @require(Operations.SELF_UPDATE_PRIVATE_DATA)
 def crypto_grant_to_scope_batch(
     scope: text, wrapped_deks_json: text
@@ -3494,6 +3588,7 @@ def crypto_grant_to_scope_batch(
 
 
 @update
+@profiled
 @require(Operations.SELF_UPDATE_PRIVATE_DATA)
 def crypto_revoke_from_scope_batch(
     scope: text, principals_json: text
@@ -3538,6 +3633,80 @@ def crypto_revoke_from_scope_batch(
         return CryptoResponse(success=False, data=CryptoResponseData(error=str(e)))
 
 
+@update
+@profiled
+@require(Operations.SELF_UPDATE_PRIVATE_DATA)
+def crypto_rotate_scope(
+    scope: text, rotation_id: text, wrapped_deks_json: text, final: bool
+) -> CryptoResponse:
+    """Re-wrap a new scope key for its members, one chunk per call.
+
+    ``wrapped_deks_json`` maps ``principal -> wrapped_dek`` for this chunk.
+    Every chunk of one rotation carries the same ``rotation_id``; resending a
+    chunk is harmless, and ``crypto_rotation_status`` lists who is still
+    pending after an interruption. The call with ``final`` set closes the
+    rotation and revokes members that were not re-wrapped. The message is
+    the rotation's progress as JSON.
+    """
+    try:
+        if not _caller_can_manage_scope(scope):
+            return CryptoResponse(
+                success=False,
+                data=CryptoResponseData(
+                    error="You are not allowed to manage sharing for this scope"
+                ),
+            )
+        try:
+            wrapped_deks = json.loads(wrapped_deks_json or "{}")
+        except Exception:
+            return CryptoResponse(
+                success=False,
+                data=CryptoResponseData(error="Invalid wrapped_deks JSON"),
+            )
+        if not isinstance(wrapped_deks, dict):
+            return CryptoResponse(
+                success=False,
+                data=CryptoResponseData(error="wrapped_deks must be a JSON object"),
+            )
+        result = crypto_rotate_scope_chunk(scope, rotation_id, wrapped_deks, final)
+        if not result.pop("success"):
+            return CryptoResponse(
+                success=False, data=CryptoResponseData(error=result["error"])
+            )
+        return CryptoResponse(
+            success=True, data=CryptoResponseData(message=json.dumps(result))
+        )
+    except Exception as e:
+        logger.error(f"Error rotating scope key: {e}\n{traceback.format_exc()}")
+        return CryptoResponse(success=False, data=CryptoResponseData(error=str(e)))
+
+
+@query
+@require(Operations.SELF_UPDATE_PRIVATE_DATA)
+def crypto_rotation_status(scope: text, cursor: nat, limit: nat) -> CryptoResponse:
+    """Open key rotation for a scope and the members it has not re-wrapped yet.
+
+    Pending principals are paged; pass the returned ``next_cursor`` back as
+    ``cursor`` until it is null. The message is JSON.
+    """
+    try:
+        if not _caller_can_manage_scope(scope):
+            return CryptoResponse(
+                success=False,
+                data=CryptoResponseData(
+                    error="You are not allowed to manage sharing for this scope"
+                ),
+            )
+        result = crypto_scope_rotation_status(scope, int(cursor), int(limit))
+        result.pop("success")
+        return CryptoResponse(
+            success=True, data=CryptoResponseData(message=json.dumps(result))
+        )
+    except Exception as e:
+        logger.error(f"Error reading scope rotation: {e}\n{traceback.format_exc()}")
+        return CryptoResponse(success=False, data=CryptoResponseData(error=str(e)))
+
+
 @query
 @require(Operations.SELF_UPDATE_PRIVATE_DATA)
 def crypto_list_scope_envelopes(scope: text) -> CryptoResponse:
@@ -3604,21 +3773,13 @@ def list_share_audiences() -> RealmResponse:
             logger.warning(f"list_share_audiences: admins group unavailable: {e}")
 
         try:
-            from core.membership import iter_users
+            from core.membership import KIND_DEPARTMENT, members_by_name
             from ggg import Department
 
-            # Single user scan building dept → principals (the reverse
-            # dept.members index no longer exists — issue #242).
-            by_dept: dict = {}
-            for u in iter_users():
-                pid = getattr(u, "id", None)
-                if not pid:
-                    continue
-                try:
-                    for d in u.departments:
-                        by_dept.setdefault(d.name, []).append(pid)
-                except Exception:
-                    continue
+            by_dept = {
+                name: [u.id for u in users if getattr(u, "id", None)]
+                for name, users in members_by_name(KIND_DEPARTMENT).items()
+            }
 
             for dept in Department.instances():
                 audiences.append(
@@ -3651,12 +3812,27 @@ def directory_list() -> RealmResponse:
     instead of an expensive per-extension update call. Read-only; exposes only
     identities already visible across the realm, never private content.
 
-    The client is expected to fetch this once and filter in the browser. We log
-    the instruction count so we can decide whether the simple full-scan needs a
-    projection/index later (see ROADMAP perf notes).
+    The client is expected to fetch this once and filter in the browser; large
+    realms should page through ``directory_search`` and keep up to date with
+    ``directory_delta`` instead. Entries come from the maintained projection
+    (``core.directory``) once it is built, and from a full scan until then.
     """
     _t0 = ic.performance_counter(0)
     try:
+        from core import directory
+
+        if directory.ready():
+            entries = directory.entries()
+            instructions = ic.performance_counter(0) - _t0
+            logger.info(
+                f"directory_list: {len(entries)} entries from projection "
+                f"in {instructions} instructions"
+            )
+            return RealmResponse(
+                success=True,
+                data=RealmResponseData(message=json.dumps({"entries": entries})),
+            )
+
         from ggg import Department, User
 
         entries = []
@@ -3717,6 +3893,56 @@ def directory_list() -> RealmResponse:
         return RealmResponse(success=False, data=RealmResponseData(error=str(e)))
 
 
+@query
+def directory_search(args: text) -> text:
+    """Page through the realm directory, optionally by name/principal prefix.
+
+    JSON args (all optional): prefix, offset, limit (default 200, max 1000),
+    kind ("user" or "department"). Returns ``rows`` of
+    ``[kind, principal, label, id]`` plus ``total``, ``next_offset`` and the
+    ``epoch``/``generation`` to pass to ``directory_delta`` later.
+    """
+    try:
+        from core import directory
+
+        if not directory.ready():
+            return json.dumps({"success": False, "error": "directory not ready"})
+        params = json.loads(args) if args else {}
+        result = directory.search(
+            prefix=str(params.get("prefix") or ""),
+            offset=int(params.get("offset") or 0),
+            limit=int(params.get("limit") or directory.DEFAULT_LIMIT),
+            kind=str(params.get("kind") or ""),
+        )
+        return json.dumps({"success": True, **result})
+    except Exception as e:
+        logger.error(f"Error in directory_search: {e}\n{traceback.format_exc()}")
+        return json.dumps({"success": False, "error": str(e)})
+
+
+@query
+def directory_delta(args: text) -> text:
+    """Directory rows changed since a generation the client already holds.
+
+    JSON args: since_generation, epoch (both from an earlier search or delta).
+    Returns changed ``rows``, ``removed`` ``[kind, id]`` pairs and the new
+    ``generation``. ``reset: true`` means the client must reload through
+    ``directory_search`` (the projection was rebuilt or it fell too far behind).
+    """
+    try:
+        from core import directory
+
+        params = json.loads(args) if args else {}
+        result = directory.delta(
+            int(params.get("since_generation") or 0),
+            int(params.get("epoch") or 0),
+        )
+        return json.dumps({"success": True, **result})
+    except Exception as e:
+        logger.error(f"Error in directory_delta: {e}\n{traceback.format_exc()}")
+        return json.dumps({"success": False, "error": str(e)})
+
+
 @query
 @require(Operations.REALM_ADMIN)
 def crypto_get_envelopes(scope: text) -> CryptoResponse:
@@ -3908,6 +4134,7 @@ def crypto_get_group_members(group_name: text) -> CryptoResponse:
 
 
 @update
+@profiled
 @require(Operations.REALM_ADMIN)
 def crypto_share_with_group(scope: text, group_name: text) -> CryptoResponse:
     """Share access to a scope with all members of a group (admin only)."""
@@ -4609,6 +4836,18 @@ def initialize() -> void:
                 )
                 status["entity_error"] = True
 
+            # Manifest-declared entities: rebuild their classes and schedule
+            # the backfill of any declared index that is not ready yet.
+            try:
+                from core.extension_bridge import register_declared_entities
+
+                register_declared_entities(extension_id, extension_manifest)
+            except Exception as e:
+                logger.warning(
+                    f"Error registering declared entities for {extension_id}: {str(e)}"
+                )
+                status["entity_error"] = True
+
             # Step 2: Try to call extension initialize function
             try:
                 result = api.extensions.extension_sync_call(
@@ -4719,7 +4958,8 @@ def initialize() -> void:
     except Exception as e:
         logger.error(f"❌ Error disabling retired population-sync task: {str(e)}")
 
-    # Backfill Proposal field indexes (status, org_scope — ic-python-db#11).
+    # Backfill field indexes (Proposal status/org_scope, federal vote and
+    # leg status/quarter — ic-python-db#11).
     # Runs as a self-re-arming timer chain so each batch stays far below the
     # per-message instruction limit; a persisted flag makes it once-only.
     try:
@@ -4727,6 +4967,31 @@ def initialize() -> void:
     except Exception as e:
         logger.error(f"❌ Error starting proposal index backfill: {str(e)}")
 
+    try:
+        _kick_off_federal_vote_index_backfill()
+    except Exception as e:
+        logger.error(f"❌ Error starting federal vote index backfill: {str(e)}")
+
+    try:
+        _kick_off_land_cell_index_backfill()
+    except Exception as e:
+        logger.error(f"❌ Error starting land cell index backfill: {str(e)}")
+
+    try:
+        _kick_off_membership_index_backfill()
+    except Exception as e:
+        logger.error(f"❌ Error starting membership index backfill: {str(e)}")
+
+    try:
+        _kick_off_citizen_import_index_backfill()
+    except Exception as e:
+        logger.error(f"❌ Error starting citizen import index backfill: {str(e)}")
+
+    try:
+        _kick_off_envelope_index_backfill()
+    except Exception as e:
+        logger.error(f"❌ Error starting envelope index backfill: {str(e)}")
+
     try:
         from core.treasury_reconcile import schedule_treasury_reconcile_on_boot
 
@@ -4734,6 +4999,43 @@ def initialize() -> void:
     except Exception as e:
         logger.warning(f"Could not schedule treasury token reconcile: {e}")
 
+    # Keep the status/extensions response cache warm; queries that miss it
+    # cannot fill it themselves.
+    try:
+        status_cache.schedule_refresh()
+    except Exception as e:
+        logger.warning(f"Could not schedule status cache refresh: {e}")
+
+    # Heap projections are gone after an upgrade; rebuild them in batches.
+    try:
+        from core import directory
+
+        directory.schedule_rebuild()
+    except Exception as e:
+        logger.warning(f"Could not schedule directory rebuild: {e}")
+
+    try:
+        from core import quarter_directory
+
+        quarter_directory.schedule_refresh()
+    except Exception as e:
+        logger.warning(f"Could not schedule quarter directory refresh: {e}")
+
+    try:
+        from core import position_holders
+
+        position_holders.schedule_rebuild()
+    except Exception as e:
+        logger.warning(f"Could not schedule position holders rebuild: {e}")
+
+    # Realms that predate the file ledger get it built once, off the init path.
+    try:
+        from core import file_ledger
+
+        file_ledger.schedule_seed()
+    except Exception as e:
+        logger.warning(f"Could not schedule file ledger seed: {e}")
+
 
 _PROPOSAL_INDEX_BACKFILL_FLAG = "fi_backfill:Proposal:v2"
 _PROPOSAL_INDEX_FIELDS = ["status", "org_scope"]
@@ -4747,40 +5049,111 @@ def _kick_off_proposal_index_backfill() -> void:
     Loading each row also eagerly applies the v1→v2 migration (org_scope
     promoted out of the metadata JSON). Timer callbacks must be created in
     init/post_upgrade/update context, which is why this is called from
-    initialize().
+    initialize(). The open-proposal index (``core.proposal_index``) gets
+    the same treatment; until it completes its readers use the status index.
     """
+    from core import proposal_index
     from ggg import Proposal
 
-    db = Database.get_instance()
-    if db.load("_system", _PROPOSAL_INDEX_BACKFILL_FLAG):
-        return
-    if Proposal.max_id() == 0:
-        db.save("_system", _PROPOSAL_INDEX_BACKFILL_FLAG, "done")
-        return
+    _kick_off_field_index_backfill(
+        Proposal, _PROPOSAL_INDEX_FIELDS, _PROPOSAL_INDEX_BACKFILL_FLAG
+    )
+    _kick_off_field_index_backfill(
+        Proposal, [proposal_index.INDEX_FIELD], proposal_index.INDEX_FLAG,
+        rebuild=proposal_index.rebuild_index,
+    )
 
-    state = {"field_idx": 0, "cursor": 1}
 
-    def _step():
-        try:
-            field = _PROPOSAL_INDEX_FIELDS[state["field_idx"]]
-            next_cursor = Proposal.rebuild_field_index(
-                field, from_id=state["cursor"], batch=50
-            )
-            if next_cursor is None:
-                state["field_idx"] += 1
-                state["cursor"] = 1
-                if state["field_idx"] >= len(_PROPOSAL_INDEX_FIELDS):
-                    db.save("_system", _PROPOSAL_INDEX_BACKFILL_FLAG, "done")
-                    logger.info("✅ Proposal field-index backfill complete")
-                    return
-            else:
-                state["cursor"] = next_cursor
-            ic.set_timer(1, _step)
-        except Exception as e:
-            logger.error(f"❌ Proposal index backfill step failed: {str(e)}")
+def _kick_off_federal_vote_index_backfill() -> void:
+    """Index pre-existing federal votes and legs, once (see above)."""
+    from core import federal_vote_runtime as fvr
+    from ggg import FederalVote, FederalVoteLeg
+
+    _kick_off_field_index_backfill(
+        FederalVote, fvr.VOTE_INDEX_FIELDS, fvr.VOTE_INDEX_FLAG
+    )
+    _kick_off_field_index_backfill(
+        FederalVoteLeg, fvr.LEG_INDEX_FIELDS, fvr.LEG_INDEX_FLAG
+    )
+
+
+def _kick_off_land_cell_index_backfill() -> void:
+    """Index pre-existing zones and parcels by H3 cell and map tile, once."""
+    from core import land_bridge
+    from ggg import Land, Zone
+
+    _kick_off_field_index_backfill(
+        Zone, [land_bridge.ZONE_INDEX_FIELD], land_bridge.ZONE_INDEX_FLAG
+    )
+    _kick_off_field_index_backfill(
+        Land, [land_bridge.CELL_FIELD], land_bridge.CELL_INDEX_FLAG,
+        rebuild=land_bridge.rebuild_cell_index,
+    )
+    _kick_off_field_index_backfill(
+        Land, [land_bridge.TILE_FIELD], land_bridge.TILE_INDEX_FLAG,
+        rebuild=land_bridge.rebuild_tile_index,
+    )
+    _kick_off_field_index_backfill(
+        Zone, [land_bridge.ZONE_BUCKET_FIELD], land_bridge.ZONE_BUCKET_FLAG,
+        rebuild=land_bridge.rebuild_zone_index,
+    )
+
 
-    ic.set_timer(5, _step)
-    logger.info("Proposal field-index backfill scheduled")
+def _kick_off_membership_index_backfill() -> void:
+    """Index pre-existing users' departments, profiles and grants, once.
+
+    Until this completes ``core.membership`` lists members by scanning.
+    """
+    from core import membership
+    from ggg import User
+
+    _kick_off_field_index_backfill(
+        User, [membership.INDEX_FIELD], membership.INDEX_FLAG,
+        rebuild=membership.rebuild_index,
+    )
+
+
+def _kick_off_citizen_import_index_backfill() -> void:
+    """Index pre-existing citizen-import codes, once.
+
+    Until this completes ``core.citizen_import`` finds duplicates and
+    tallies claims by scanning every registration code.
+    """
+    from core import citizen_import
+    from ggg import RegistrationCode
+
+    _kick_off_field_index_backfill(
+        RegistrationCode, [citizen_import.INDEX_FIELD], citizen_import.INDEX_FLAG,
+        rebuild=citizen_import.rebuild_index,
+    )
+
+
+def _kick_off_envelope_index_backfill() -> void:
+    """Index pre-existing key envelopes by scope and principal, once.
+
+    Until this completes ``api.crypto`` answers envelope lookups by scanning
+    every ``KeyEnvelope``. Once it has, rows written past the index since
+    (by the toolkit or an import) are indexed on a timer chain instead.
+    """
+    from core import envelope_index, index_backfill
+    from ic_basilisk_toolkit.crypto import KeyEnvelope
+
+    _kick_off_field_index_backfill(
+        KeyEnvelope, [envelope_index.INDEX_FIELD], envelope_index.INDEX_FLAG,
+        rebuild=envelope_index.rebuild_index,
+    )
+    if not envelope_index.index_ready():
+        envelope_index.schedule_catch_up(delay=index_backfill.FIRST_DELAY)
+
+
+def _kick_off_field_index_backfill(entity_cls, fields, flag, rebuild=None) -> void:
+    """Timer chain behind the ``_kick_off_*_index_backfill`` helpers.
+
+    See ``core.index_backfill.kick_off``.
+    """
+    from core import index_backfill
+
+    index_backfill.kick_off(entity_cls, fields, flag, rebuild=rebuild)
 
 
 @init
@@ -4934,6 +5307,7 @@ def extension_call(extension_name: text, function_name: text, args: text) -> Ext
 
 
 @update
+@profiled
 def extension_sync_call(extension_name: text, function_name: text, args: text) -> ExtensionCallResponse:
     try:
         caller = ic.caller().to_str()
@@ -4975,6 +5349,7 @@ def extension_sync_call(extension_name: text, function_name: text, args: text) -
 
 
 @update
+@profiled
 def extension_async_call(extension_name: text, function_name: text, args: text) -> Async[ExtensionCallResponse]:
     try:
         caller = ic.caller().to_str()
@@ -5031,20 +5406,6 @@ def extension_async_call(extension_name: text, function_name: text, args: text)
         return ExtensionCallResponse(success=False, response=str(e))
 
 
-def http_request_core(data):
-    d = json.dumps(data)
-    return {
-        "status_code": 200,
-        "headers": [
-            ("Content-Type", "application/json"),
-            ("Access-Control-Allow-Origin", "*"),
-        ],
-        "body": bytes(d + "\n", "ascii"),
-        "streaming_strategy": None,
-        "upgrade": False,
-    }
-
-
 def http_request_404():
     return {
         "status_code": 404,
@@ -5081,10 +5442,10 @@ def http_request(req: HttpRequest) -> HttpResponseIncoming:
 
             # Handle /status
             if path == "status" or path == "":
-                return http_request_core(get_status())
+                return status_cache.http_response("status", req["headers"])
             # Handle /extensions
             elif path == "extensions":
-                return http_request_core({"extensions": list_extensions()})
+                return status_cache.http_response("extensions", req["headers"])
 
         return not_found
     except Exception as e:
@@ -5344,6 +5705,7 @@ def send_realm_message(
 
 
 @update
+@profiled
 @require_controller
 def receive_realm_message(
     title: text,
@@ -5424,11 +5786,10 @@ def get_upgrade_status() -> text:
     Returns the job_id of the most recent upgrade and its current version.
     """
     from api.upgrade import get_last_upgrade_job_id
-    from api.status import get_status
 
     try:
         job_id = get_last_upgrade_job_id()
-        status = get_status()
+        status = status_cache.status()
         current_version = status.get("version", "")
         return json.dumps({
             "success": True,
@@ -5473,7 +5834,6 @@ def get_available_upgrade(registry_canister_id: text = "") -> Async[text]:
         registry_canister_id: Optional override for registry canister ID.
     """
     from api.upgrade import get_available_version, _get_registry_canister_id
-    from api.status import get_status
 
     try:
         reg_id = registry_canister_id.strip() if registry_canister_id else ""
@@ -5487,7 +5847,7 @@ def get_available_upgrade(registry_canister_id: text = "") -> Async[text]:
         if not result.get("success"):
             return json.dumps(result)
 
-        status = get_status()
+        status = status_cache.status()
         current_version = status.get("version", "")
         latest = result.get("version", {})
         latest_version = latest.get("version", "")
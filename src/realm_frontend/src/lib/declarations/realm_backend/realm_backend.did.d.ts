@@ -1080,6 +1080,14 @@ export interface _SERVICE {
     [string, string],
     CryptoResponse
   >,
+  'crypto_rotate_scope' : ActorMethod<
+    [string, string, string, boolean],
+    CryptoResponse
+  >,
+  'crypto_rotation_status' : ActorMethod<
+    [string, bigint, bigint],
+    CryptoResponse
+  >,
   'crypto_share' : ActorMethod<[string, string, string], CryptoResponse>,
   'crypto_share_with_group' : ActorMethod<[string, string], CryptoResponse>,
   'crypto_store_my_envelope' : ActorMethod<[string, string], CryptoResponse>,
@@ -1087,7 +1095,11 @@ export interface _SERVICE {
   'deregister_quarter' : ActorMethod<[string], RealmResponse>,
   'derive_my_sharing_vetkey' : ActorMethod<[string], RealmResponse>,
   'derive_my_vetkey' : ActorMethod<[string], RealmResponse>,
+  'directory_delta' : ActorMethod<[string], string>,
   'directory_list' : ActorMethod<[], RealmResponse>,
+  'directory_search' : ActorMethod<[string], string>,
+  'export_entities' : ActorMethod<[string, bigint, bigint], string>,
+  'export_entity_types' : ActorMethod<[], string>,
   'extension_async_call' : ActorMethod<
     [string, string, string],
     ExtensionCallResponse
@@ -1100,6 +1112,7 @@ export interface _SERVICE {
     [string, string, string],
     ExtensionCallResponse
   >,
+  'federation_member_cache_stats' : ActorMethod<[], string>,
   'federation_message' : ActorMethod<[string], string>,
   'finalize_federal_vote' : ActorMethod<[string], string>,
   'find_objects' : ActorMethod<
@@ -1139,8 +1152,10 @@ export interface _SERVICE {
     [string, bigint, bigint, string],
     RealmResponse
   >,
+  'get_perf_stats' : ActorMethod<[string], string>,
   'get_quarter_codex_drift' : ActorMethod<[], string>,
   'get_quarter_directory' : ActorMethod<[], string>,
+  'get_quarter_directory_since' : ActorMethod<[string], string>,
   'get_quarter_info' : ActorMethod<[], RealmResponse>,
   'get_realm_credits' : ActorMethod<[string], string>,
   'get_realm_registry_info' : ActorMethod<[], string>,
@@ -1171,6 +1186,7 @@ export interface _SERVICE {
   'list_extensions' : ActorMethod<[string], RealmResponse>,
   'list_federal_votes' : ActorMethod<[string], string>,
   'list_position_holders' : ActorMethod<[], string>,
+  'list_position_holders_since' : ActorMethod<[string], string>,
   'list_runtime_extensions' : ActorMethod<[], string>,
   'list_share_audiences' : ActorMethod<[], RealmResponse>,
   'mint_land_nft_for_parcel' : ActorMethod<[string, string, string], string>,
@@ -1198,6 +1214,7 @@ export interface _SERVICE {
   'request_codex_sync' : ActorMethod<[string], string>,
   'request_quarter_codex_sync' : ActorMethod<[string], string>,
   'request_upgrade' : ActorMethod<[string], string>,
+  'reset_perf_stats' : ActorMethod<[string], string>,
   'resolve_ref' : ActorMethod<[string], string>,
   'resolve_token_ledger' : ActorMethod<[string], string>,
   'resync_extension_frontends' : ActorMethod<[string], string>,
@@ -1233,6 +1250,7 @@ export interface _SERVICE {
   'start_task_manager' : ActorMethod<[], string>,
   'status' : ActorMethod<[], RealmResponse>,
   'store_admin_invite_hash' : ActorMethod<[string], RealmResponse>,
+  'sync_position_holders' : ActorMethod<[], string>,
   'sync_quarters' : ActorMethod<[string], string>,
   'test_timer' : ActorMethod<[], string>,
   'unfreeze_land_nft' : ActorMethod<[string], string>,
@@ -236,6 +236,16 @@ export const idlFactory = ({ IDL }) => {
         [CryptoResponse],
         [],
       ),
+    'crypto_rotate_scope' : IDL.Func(
+        [IDL.Text, IDL.Text, IDL.Text, IDL.Bool],
+        [CryptoResponse],
+        [],
+      ),
+    'crypto_rotation_status' : IDL.Func(
+        [IDL.Text, IDL.Nat, IDL.Nat],
+        [CryptoResponse],
+        ['query'],
+      ),
     'crypto_share' : IDL.Func(
         [IDL.Text, IDL.Text, IDL.Text],
         [CryptoResponse],
@@ -255,7 +265,15 @@ export const idlFactory = ({ IDL }) => {
     'deregister_quarter' : IDL.Func([IDL.Text], [RealmResponse], []),
     'derive_my_sharing_vetkey' : IDL.Func([IDL.Text], [RealmResponse], []),
     'derive_my_vetkey' : IDL.Func([IDL.Text], [RealmResponse], []),
+    'directory_delta' : IDL.Func([IDL.Text], [IDL.Text], ['query']),
     'directory_list' : IDL.Func([], [RealmResponse], ['query']),
+    'directory_search' : IDL.Func([IDL.Text], [IDL.Text], ['query']),
+    'export_entities' : IDL.Func(
+        [IDL.Text, IDL.Nat, IDL.Nat],
+        [IDL.Text],
+        ['query'],
+      ),
+    'export_entity_types' : IDL.Func([], [IDL.Text], ['query']),
     'extension_async_call' : IDL.Func(
         [IDL.Text, IDL.Text, IDL.Text],
         [ExtensionCallResponse],
@@ -271,6 +289,7 @@ export const idlFactory = ({ IDL }) => {
         [ExtensionCallResponse],
         [],
       ),
+    'federation_member_cache_stats' : IDL.Func([], [IDL.Text], ['query']),
     'federation_message' : IDL.Func([IDL.Text], [IDL.Text], []),
     'finalize_federal_vote' : IDL.Func([IDL.Text], [IDL.Text], []),
     'find_objects' : IDL.Func(
@@ -327,8 +346,10 @@ export const idlFactory = ({ IDL }) => {
         [RealmResponse],
         ['query'],
       ),
+    'get_perf_stats' : IDL.Func([IDL.Text], [IDL.Text], ['query']),
     'get_quarter_codex_drift' : IDL.Func([], [IDL.Text], ['query']),
     'get_quarter_directory' : IDL.Func([], [IDL.Text], ['query']),
+    'get_quarter_directory_since' : IDL.Func([IDL.Text], [IDL.Text], ['query']),
     'get_quarter_info' : IDL.Func([], [RealmResponse], ['query']),
     'get_realm_credits' : IDL.Func([IDL.Text], [IDL.Text], []),
     'get_realm_registry_info' : IDL.Func([], [IDL.Text], ['query']),
@@ -363,6 +384,7 @@ export const idlFactory = ({ IDL }) => {
     'list_extensions' : IDL.Func([IDL.Text], [RealmResponse], ['query']),
     'list_federal_votes' : IDL.Func([IDL.Text], [IDL.Text], ['query']),
     'list_position_holders' : IDL.Func([], [IDL.Text], ['query']),
+    'list_position_holders_since' : IDL.Func([IDL.Text], [IDL.Text], ['query']),
     'list_runtime_extensions' : IDL.Func([], [IDL.Text], ['query']),
     'list_share_audiences' : IDL.Func([], [RealmResponse], ['query']),
     'mint_land_nft_for_parcel' : IDL.Func(
@@ -396,6 +418,7 @@ export const idlFactory = ({ IDL }) => {
     'request_codex_sync' : IDL.Func([IDL.Text], [IDL.Text], []),
     'request_quarter_codex_sync' : IDL.Func([IDL.Text], [IDL.Text], []),
     'request_upgrade' : IDL.Func([IDL.Text], [IDL.Text], []),
+    'reset_perf_stats' : IDL.Func([IDL.Text], [IDL.Text], []),
     'resolve_ref' : IDL.Func([IDL.Text], [IDL.Text], ['query']),
     'resolve_token_ledger' : IDL.Func([IDL.Text], [IDL.Text], []),
     'resync_extension_frontends' : IDL.Func([IDL.Text], [IDL.Text], []),
@@ -440,6 +463,7 @@ export const idlFactory = ({ IDL }) => {
     'start_task_manager' : IDL.Func([], [IDL.Text], []),
     'status' : IDL.Func([], [RealmResponse], ['query']),
     'store_admin_invite_hash' : IDL.Func([IDL.Text], [RealmResponse], []),
+    'sync_position_holders' : IDL.Func([], [IDL.Text], []),
     'sync_quarters' : IDL.Func([IDL.Text], [IDL.Text], []),
     'test_timer' : IDL.Func([], [IDL.Text], []),
     'unfreeze_land_nft' : IDL.Func([IDL.Text], [IDL.Text], []),
@@ -0,0 +1,61 @@
+"""Shared pytest fixtures for backend tests that run on the real ORM.
+
+``storage`` gives a test its own empty storage and identity map, so every row
+a call needs is read from storage and can be counted, and puts the previous
+ones back afterwards. The database is created on first use rather than at
+import, for the same reason as in ``marketplace/conftest.py``: modules that
+initialise it themselves at load time must not find it already taken.
+"""
+
+import pytest
+from ic_python_db import Database, Entity
+
+
+class MockStorage:
+    """In-memory storage that records the keys it is asked to read and write."""
+
+    def __init__(self):
+        self.data = {}
+        self.reads = []
+        self.writes = []
+
+    def get(self, key):
+        self.reads.append(key)
+        return self.data.get(key)
+
+    def insert(self, key, value):
+        self.writes.append(key)
+        self.data[key] = value
+
+    def remove(self, key):
+        if key in self.data:
+            del self.data[key]
+
+    def items(self):
+        return self.data.items()
+
+    def keys(self):
+        return list(self.data.keys())
+
+    def __len__(self):
+        return len(self.data)
+
+
+def _ensure_db() -> Database:
+    if Database._instance is None:
+        Database.init(db_storage=MockStorage(), audit_enabled=False)
+    return Database.get_instance()
+
+
+@pytest.fixture
+def storage():
+    db = _ensure_db()
+    saved = (db._db_storage, dict(db._entity_registry), set(Entity._context))
+    db._db_storage = MockStorage()
+    db.clear_registry()
+    yield db._db_storage
+    db._db_storage, registry, context = saved
+    db._entity_registry.clear()
+    db._entity_registry.update(registry)
+    Entity._context.clear()
+    Entity._context.update(context)
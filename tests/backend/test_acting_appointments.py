@@ -102,11 +102,23 @@ def _appointment_kind(appt):
     return ACTING if raw == ACTING else SUBSTANTIVE
 
 
+def _forget_inherited(capital_id="capital-1"):
+    from ic_python_db import Database
+
+    from core.acting_appointments import INHERIT_STATE_PREFIX
+
+    db = Database.get_instance()
+    if db.load("_system", f"{INHERIT_STATE_PREFIX}{capital_id}") is not None:
+        db.delete("_system", f"{INHERIT_STATE_PREFIX}{capital_id}")
+
+
 @pytest.fixture(autouse=True)
 def _reset_position_registry():
     FakePosition.reset()
+    _forget_inherited()
     yield
     FakePosition.reset()
+    _forget_inherited()
 
 
 class TestDumpPositionHolders:
@@ -270,9 +282,24 @@ class TestApplyInheritedHolders:
             second = apply_inherited_holders(payload, "capital-1")
 
         assert first["created"] == 1
-        assert second["created"] == 1
+        # The seat's spec is what was last applied: nothing is re-appointed.
+        assert second["created"] == 0 and second["unchanged"] == 1
+        assert len(pos._appointments) == 1
+        assert mock_appoint.call_count == 1
+
+        # A fresh quarter state applies again, and appoint stays idempotent.
+        _forget_inherited()
+        with (
+            patch("ggg.Position", FakePosition),
+            patch("ggg.User") as mock_user_cls,
+            patch("ggg.appoint", side_effect=fake_appoint),
+            patch("ggg.system.user.user_register"),
+            patch("core.membership.add_department_member"),
+        ):
+            mock_user_cls.__getitem__ = MagicMock(return_value=user)
+            third = apply_inherited_holders(payload, "capital-1")
+        assert third["created"] == 1
         assert len(pos._appointments) == 1
-        assert mock_appoint.call_count == 2
 
 
 class TestApplyTargetPolicies:
@@ -322,3 +322,79 @@ class TestEntitySlice:
         # to parse twelve entities, so the store must not grow with the realm.
         entities = cedar_entities.slice_for("alice", "Mandate", "m1")
         assert len(entities) <= 4
+
+
+class TestDecisionCache:
+    """A cached answer must never outlive any fact it was decided on."""
+
+    def test_a_repeated_question_is_answered_once(self, loaded):
+        fake = loaded()
+        for _ in range(3):
+            assert cedar_authz.is_authorized("alice", "entity.get", "Mandate", "m1")
+        assert len(fake.requests) == 1
+        assert cedar_authz.cache_stats()["decisions"]["hits"] == 2
+
+    def test_the_store_is_the_one_the_engine_builds(self, loaded):
+        fake = loaded()
+        cedar_authz.is_authorized("alice", "entity.get", "Mandate", "m1")
+        engine = cedar_authz._get_engine()
+        assert fake.requests[0]["entities"] == engine.slicer.slice_for(
+            "alice", "Mandate", "m1"
+        )
+
+    def test_reloading_policies_asks_again(self, loaded):
+        fake = loaded()
+        cedar_authz.is_authorized("alice", "read")
+        cedar_authz.load()
+        cedar_authz.is_authorized("alice", "read")
+        assert len(fake.requests) == 2
+
+    def test_the_origin_is_part_of_the_question(self, loaded):
+        from core.call_origin import extension_call
+
+        fake = loaded()
+        cedar_authz.is_authorized("alice", "write", "User", "bob")
+        with extension_call("procurement"):
+            cedar_authz.is_authorized("alice", "write", "User", "bob")
+        assert len(fake.requests) == 2
+
+    def test_resource_attributes_are_part_of_the_question(self, loaded):
+        class Row:
+            id = "m1"
+            name = "before"
+
+        fake = loaded()
+        cedar_authz.is_authorized("alice", "write", "Mandate", "m1", Row())
+        Row.name = "after"
+        cedar_authz.is_authorized("alice", "write", "Mandate", "m1", Row())
+        assert len(fake.requests) == 2
+
+    def test_a_user_save_builds_the_slice_again(self, loaded):
+        fake = loaded()
+        cedar_authz.is_authorized("alice", "write")
+
+        class User:
+            id = "alice"
+
+        cedar_authz.entity_changed(User())
+        cedar_authz.is_authorized("alice", "write")
+        assert cedar_authz.cache_stats()["slices"]["misses"] == 2
+        # Same slice, so the same decision: Cedar is still asked once.
+        assert len(fake.requests) == 1
+
+    def test_an_error_building_the_key_denies(self, loaded, monkeypatch):
+        loaded(decision=True)
+
+        def broken(principal_id):
+            raise RuntimeError("storage unavailable")
+
+        monkeypatch.setattr(cedar_entities, "principal_slice", broken)
+        assert cedar_authz.is_authorized("alice", "read") is False
+
+    def test_status_reports_hit_rates(self, loaded):
+        loaded()
+        cedar_authz.is_authorized("alice", "read")
+        cedar_authz.is_authorized("alice", "read")
+        cache = cedar_authz.status()["cache"]
+        assert cache["decisions"]["hit_rate"] == 0.5
+        assert cache["slices"]["misses"] == 1 and cache["slices"]["hits"] == 1
@@ -36,6 +36,7 @@ sys.path.insert(
 )
 
 from core import cedar_authz, cedar_entities  # noqa: E402
+from core import cedar_schema_runtime  # noqa: E402
 from core.cedar_schema_runtime import generate_realm_cedar_schema  # noqa: E402
 
 EXPECTED_ACTIONS = frozenset(
@@ -224,3 +225,43 @@ class TestGuardrailWiring:
         fake = loaded()
         assert fake.loaded_schema == generate_realm_cedar_schema()
         assert fake.loaded_schema == cedar_authz.schema()
+
+
+class TestFrozenSchema:
+    """The precomputed constants stand in for generation only while current."""
+
+    def _generated(self, monkeypatch):
+        monkeypatch.setattr(cedar_schema_runtime, "_frozen", lambda: None)
+        cedar_schema_runtime.reset_for_tests()
+        text = generate_realm_cedar_schema()
+        included, orm = cedar_schema_runtime.orm_schema()
+        cedar_schema_runtime.reset_for_tests()
+        return text, [cls.__name__ for cls in included], orm
+
+    def test_frozen_constants_are_in_use_and_match_generation(self, monkeypatch):
+        assert cedar_schema_runtime.schema_source() == "frozen"
+        frozen_text = generate_realm_cedar_schema()
+        frozen_included, frozen_orm = cedar_schema_runtime.orm_schema()
+
+        text, included, orm = self._generated(monkeypatch)
+        assert frozen_text == text
+        assert [cls.__name__ for cls in frozen_included] == included
+        assert frozen_orm == orm
+
+    def test_drifted_definitions_fall_back_to_generation(self, monkeypatch):
+        from core import cedar_schema_frozen
+
+        monkeypatch.setattr(cedar_schema_frozen, "SOURCE_HASH", "stale")
+        monkeypatch.setattr(cedar_schema_frozen, "CEDAR_SCHEMA", "namespace Stale {}")
+        cedar_schema_runtime.reset_for_tests()
+        assert cedar_schema_runtime.schema_source() == "runtime"
+        assert "entity User in" in generate_realm_cedar_schema()
+
+    def test_hash_sees_a_new_field(self, monkeypatch):
+        import ggg
+        from ic_python_db import String
+
+        classes = cedar_schema_runtime.entity_classes()
+        before = cedar_schema_runtime.definitions_hash(classes)
+        monkeypatch.setattr(ggg.Mandate, "extra_note", String(), raising=False)
+        assert cedar_schema_runtime.definitions_hash(classes) != before
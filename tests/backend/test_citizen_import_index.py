@@ -0,0 +1,146 @@
+"""Citizen-import index and resumable bulk import (``core.citizen_import``)."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Database, Entity  # noqa: E402
+
+from core import citizen_import as ci  # noqa: E402
+from ggg import RegistrationCode  # noqa: E402
+
+
+def _forget_loaded():
+    """Drop cached instances, as an upgrade does; storage survives."""
+    Database.get_instance().clear_registry()
+    Entity._context.clear()
+
+
+def _mark_ready():
+    Database.get_instance().save("_system", ci.INDEX_FLAG, "done")
+
+
+def _census(start, count):
+    return [{"id": f"C-{i}", "name": f"Citizen {i}"} for i in range(start, start + count)]
+
+
+def _imported_census(storage, count):
+    """*count* citizens imported earlier, written straight into storage."""
+    meta = json.dumps({"kind": ci.CITIZEN_IMPORT_KIND, "name": "", "quarter": "", "extra": {}})
+    for i in range(1, count + 1):
+        storage.data[f"RegistrationCode@{i}"] = json.dumps({
+            "_type": "RegistrationCode", "_id": str(i), "user_id": f"C-{i - 1}",
+            "metadata": meta, "uses_count": 0, "revoked": 0, "__version__": 3,
+        })
+        ci._index_add(f"pending:1:C-{i - 1}", str(i))
+    storage.data["_system@RegistrationCode_id"] = json.dumps(str(count))
+    storage.data["_system@RegistrationCode_count"] = json.dumps(str(count))
+    _mark_ready()
+
+
+def _chunk_cost(storage, existing):
+    """Storage reads and writes importing one fresh chunk on top of *existing*."""
+    storage.data.clear()
+    _imported_census(storage, existing)
+    _forget_loaded()
+    storage.reads.clear()
+    storage.writes.clear()
+    report = ci.import_citizens(_census(existing, ci.MAX_BATCH))
+    assert report["data"]["created_count"] == ci.MAX_BATCH
+    history = {f"RegistrationCode@{i}" for i in range(1, existing + 1)}
+    assert not history.intersection(storage.reads)
+    return len(storage.reads), len(storage.writes)
+
+
+def test_chunk_cost_does_not_grow_with_the_census(storage, monkeypatch):
+    def _scan(*args, **kwargs):
+        raise AssertionError("import must not scan registration codes")
+
+    monkeypatch.setattr(RegistrationCode, "instances", classmethod(_scan))
+    large = _chunk_cost(storage, 50_000)
+    assert ci.import_status()["total"] == 50_000 + ci.MAX_BATCH
+    assert large == _chunk_cost(storage, 100)
+
+
+def test_rerunning_an_import_is_a_cheap_no_op(storage):
+    _imported_census(storage, 50_000)
+    _forget_loaded()
+    storage.reads.clear()
+    storage.writes.clear()
+
+    records = _census(0, 50_000)
+    for start in range(0, len(records), ci.MAX_BATCH):
+        data = ci.import_citizens(records[start:start + ci.MAX_BATCH])["data"]
+        assert data["created_count"] == 0
+        assert data["skipped_count"] == ci.MAX_BATCH
+    # One citizen-index read per record, and nothing written.
+    assert len(storage.reads) <= len(records) + 2 * (len(records) // ci.MAX_BATCH)
+    assert storage.writes == []
+
+
+def test_job_resumes_from_its_cursor(storage):
+    _mark_ready()
+    records = _census(0, 10)
+    ci.import_citizens(records[:4], job="census-2024")
+    # The caller lost the reply and resends from the start.
+    data = ci.import_citizens(records[:6], job="census-2024", offset=0)["data"]
+    assert [c["id"] for c in data["created"]] == ["C-4", "C-5"]
+    assert data["skipped"] == []
+
+    job = ci.import_status()["job"]
+    assert job == {"job": "census-2024", "next_offset": 6, "created": 6,
+                   "skipped": 0, "errors": 0}
+    gap = ci.import_citizens(records[8:], job="census-2024", offset=8)
+    assert not gap["success"] and "is at 6" in gap["error"]
+
+    storage.reads.clear()
+    done = ci.import_citizens(records[:6], job="census-2024", offset=0)["data"]
+    assert done["created_count"] == done["skipped_count"] == 0
+    assert not [k for k in storage.reads if k.startswith("_fi:")]
+    ci.import_citizens(records[6:], job="census-2024")
+    assert ci.import_status()["job"]["next_offset"] == 10
+
+
+def test_index_follows_claims_and_revocations(storage):
+    _mark_ready()
+    ci.import_citizens(_census(0, 3))
+    codes = {c.user_id: c for c in RegistrationCode.load_some(from_id=1, count=10)}
+    codes["C-0"].mark_used("aaaaa-principal")
+    codes["C-1"].revoked = 1
+    assert ci.import_status() == {"total": 3, "claimed": 1, "revoked": 1, "pending": 1}
+
+    # A revoked citizen can be imported again; a claimed one cannot.
+    data = ci.import_citizens(_census(0, 2))["data"]
+    assert data["skipped"] == ["C-0"]
+    assert [c["id"] for c in data["created"]] == ["C-1"]
+    codes["C-2"].delete()
+    assert ci.import_status() == {"total": 3, "claimed": 1, "revoked": 1, "pending": 1}
+
+
+def test_backfill_matches_the_scan(storage):
+    ci.import_citizens(_census(0, 5))
+    codes = sorted(RegistrationCode.load_some(from_id=1, count=10), key=lambda c: c.user_id)
+    codes[0].uses_count = 1
+    codes[1].revoked = 1
+    RegistrationCode.create(user_id="staff", created_by="admin", frontend_url="")
+    # Make these rows predate the index: drop what the save hook wrote.
+    for key in [k for k in storage.data if ci.INDEX_TYPE in k or ci.TALLY_KEY in k]:
+        del storage.data[key]
+    assert not ci.index_ready()
+    scanned = ci.import_status()
+
+    cursor = 1
+    while cursor is not None:
+        cursor = ci.rebuild_index(from_id=cursor, batch=2)
+    _mark_ready()
+    assert ci.import_status() == scanned == {
+        "total": 5, "claimed": 1, "revoked": 1, "pending": 3,
+    }
+    assert ci.import_citizens(_census(0, 5))["data"]["created"][0]["id"] == "C-1"
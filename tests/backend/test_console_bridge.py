@@ -136,6 +136,10 @@ def realm(monkeypatch):
 
     membership = types.ModuleType("core.membership")
     membership.iter_users = lambda: [alice]
+    membership.KIND_DEPARTMENT = "department"
+    membership.members_by_name = lambda kind: {
+        dept.name: [alice] for dept in alice.departments
+    }
     monkeypatch.setitem(sys.modules, "core.membership", membership)
 
     granted = set()
@@ -0,0 +1,233 @@
+"""Scope/principal envelope indexes and batched writes (``core.envelope_index``)."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Database, Entity  # noqa: E402
+
+from ic_basilisk_toolkit.crypto import CryptoService, KeyEnvelope  # noqa: E402
+
+from core import envelope_index as ix  # noqa: E402
+
+DOCS = "dept:docs"
+
+
+@pytest.fixture
+def crypto():
+    # Resolved per test: other suites replace modules under ``api``.
+    from api import crypto
+
+    return crypto
+
+
+def _forget_loaded():
+    """Drop cached instances, as an upgrade does; storage survives."""
+    Database.get_instance().clear_registry()
+    Entity._context.clear()
+
+
+def _mark_ready():
+    Database.get_instance().save("_system", ix.INDEX_FLAG, "done")
+
+
+def _no_scan(monkeypatch):
+    def _scan(*args, **kwargs):
+        raise AssertionError("envelope lookups must not scan")
+
+    monkeypatch.setattr(KeyEnvelope, "instances", classmethod(_scan))
+
+
+def _deks(count, key="k1", start=0):
+    return {f"p{i}": f"{key}{i:04x}" for i in range(start, start + count)}
+
+
+def _rows(storage):
+    return {k for k in storage.data if k.startswith("KeyEnvelope@")}
+
+
+def test_batch_writes_and_reads_do_not_scan(storage, crypto, monkeypatch):
+    _mark_ready()
+    for i in range(200):
+        crypto.store_envelope(f"other{i}", f"user:other{i}:private", "aa")
+    _no_scan(monkeypatch)
+
+    assert crypto.grant_many(DOCS, _deks(300))["envelopes_granted"] == 300
+    assert crypto.grant_many(DOCS, _deks(10, key="k2"))["envelopes_granted"] == 10
+    assert crypto.revoke_many(DOCS, ["p1", "p2", "nobody"])["envelopes_revoked"] == 2
+    assert crypto.revoke_principal(DOCS, "p3")["success"]
+    assert not crypto.revoke_principal(DOCS, "p3")["success"]
+    assert len(_rows(storage)) == 200 + 297
+
+    _forget_loaded()
+    storage.reads.clear()
+    listed = crypto.list_envelopes(DOCS)["envelopes"]
+    assert len(listed) == 297 == ix.scope_member_count(DOCS)
+    # Only this scope's envelopes are loaded, never the other 200.
+    loaded = {k for k in storage.reads if k.startswith("KeyEnvelope@")}
+    assert len(loaded) == 297
+    assert crypto.get_envelope("p0", DOCS)["wrapped_dek"] == "env:v=2:k=k20000"
+    assert crypto.get_envelope("p200", DOCS)["wrapped_dek"] == "env:v=2:k=k100c8"
+    assert crypto.list_scopes("p0")["scopes"] == [DOCS]
+    assert crypto.list_scopes("p1")["scopes"] == []
+
+
+def test_groups_share_and_revoke_through_the_batch(storage, crypto):
+    _mark_ready()
+    CryptoService.create_group("council")
+    for p in ("alice", "bob"):
+        CryptoService.add_member("council", p)
+    crypto.store_envelope("alice", "realm:minutes", "01")
+
+    assert crypto.share_with_group("realm:minutes", "council", {"bob": "02"})[
+        "envelopes_created"
+    ] == 2
+    assert crypto.get_envelope("alice", "realm:minutes")["wrapped_dek"] == "env:v=2:k=01"
+    assert ix.principal_scopes("bob") == ["realm:minutes"]
+    assert crypto.revoke_group("realm:minutes", "council")["envelopes_deleted"] == 2
+    assert ix.scope_member_count("realm:minutes") == 0
+    assert _rows(storage) == set()
+
+
+def test_backfill_matches_the_scan(storage, crypto):
+    # Rows written before the index, through the toolkit directly.
+    legacy = CryptoService(vetkey_service=None)
+    for i in range(7):
+        legacy.grant_access(DOCS if i % 2 else "dept:hr", f"p{i}", "ab")
+    legacy.grant_access("dept:hr", "p1", "cd")
+    assert not ix.index_ready()
+    scanned = {p: sorted(crypto.list_scopes(p)["scopes"]) for p in ("p0", "p1", "p6")}
+
+    # Writes before the backfill finishes are indexed too.
+    crypto.grant_many(DOCS, {"p0": "ef"})
+    cursor = 1
+    while cursor is not None:
+        cursor = ix.rebuild_index(from_id=cursor, batch=3)
+    _mark_ready()
+
+    assert {p: crypto.list_scopes(p)["scopes"] for p in ("p0", "p1", "p6")} == {
+        "p0": ["dept:docs", "dept:hr"], "p1": scanned["p1"], "p6": scanned["p6"],
+    }
+    assert sorted(e["principal"] for e in crypto.list_envelopes(DOCS)["envelopes"]) == [
+        "p0", "p1", "p3", "p5",
+    ]
+    # An existing envelope is updated in place, not duplicated.
+    crypto.grant_many("dept:hr", {"p2": "99"})
+    assert len(_rows(storage)) == 9
+
+
+def test_rows_written_past_the_index_are_caught_up(storage, crypto, monkeypatch):
+    _mark_ready()
+    crypto.grant_many(DOCS, _deks(3))
+    # Written by the toolkit (or an import, or an extension) directly.
+    toolkit = CryptoService(vetkey_service=None)
+    toolkit.grant_access(DOCS, "outsider", "ab")
+    toolkit.grant_access("dept:hr", "p0", "cd")
+    toolkit.revoke_access(DOCS, "p1")
+
+    # Reads stay correct by scanning, and write nothing.
+    before = dict(storage.data)
+    assert crypto.get_envelope("outsider", DOCS)["wrapped_dek"] == "env:v=2:k=ab"
+    assert crypto.list_scopes("p0")["scopes"] == [DOCS, "dept:hr"]
+    assert storage.data == before and not ix.index_ready()
+
+    # The next write catches the index up first.
+    crypto.grant_many("dept:other", {"p9": "01"})
+    assert ix.index_ready()
+    _no_scan(monkeypatch)
+    assert crypto.get_envelope("outsider", DOCS)["wrapped_dek"] == "env:v=2:k=ab"
+    assert crypto.list_scopes("p0")["scopes"] == [DOCS, "dept:hr"]
+    assert crypto.list_scopes("p1")["scopes"] == []
+    assert not crypto.get_envelope("p1", DOCS)["success"]
+    assert sorted(e["principal"] for e in crypto.list_envelopes(DOCS)["envelopes"]) == [
+        "outsider", "p0", "p2",
+    ]
+    # The outsider's row is updated in place, not duplicated.
+    crypto.grant_many(DOCS, {"outsider": "ef"})
+    assert len(_rows(storage)) == 5
+
+
+def test_a_large_gap_is_left_to_the_timer(storage, crypto, monkeypatch):
+    _mark_ready()
+    toolkit = CryptoService(vetkey_service=None)
+    for i in range(ix.CATCH_UP + 20):
+        toolkit.grant_access(DOCS, f"p{i}", "ab")
+    timers = []
+    monkeypatch.setattr(sys.modules["_cdk"].ic, "set_timer", lambda d, fn: timers.append(fn))
+
+    # Too far behind for one write: it scans, and leaves the rest to a timer.
+    assert crypto.grant_many(DOCS, {"p0": "cd"})["envelopes_granted"] == 1
+    assert not ix.index_ready() and len(timers) == 1
+    ix.schedule_catch_up()
+    assert len(timers) == 1
+    timers.pop()()
+    assert ix.index_ready() and not timers
+    _no_scan(monkeypatch)
+    assert len(crypto.list_envelopes(DOCS)["envelopes"]) == ix.CATCH_UP + 20
+
+
+def test_rotation_resumes_and_revokes_the_rest(storage, crypto, monkeypatch):
+    _mark_ready()
+    crypto.grant_many(DOCS, _deks(1000))
+    _no_scan(monkeypatch)
+    rotated = _deks(1000, key="k2")
+    chunks = [dict(list(rotated.items())[i:i + 250]) for i in range(0, 1000, 250)]
+
+    assert crypto.rotate_scope(DOCS, "r1", chunks[0])["rewrapped"] == 250
+    # Reply lost: the chunk is resent, then the rotation carries on.
+    assert crypto.rotate_scope(DOCS, "r1", chunks[0])["rewrapped"] == 250
+    crypto.rotate_scope(DOCS, "r1", chunks[1])
+    # A member joins mid-rotation with the old key.
+    crypto.grant_many(DOCS, {"late": "k1ffff"})
+
+    pending, cursor = [], 0
+    while cursor is not None:
+        page = crypto.rotation_status(DOCS, cursor, 100)
+        pending.extend(page["pending"])
+        cursor = page["next_cursor"]
+    assert page["rotation"] == {"id": "r1", "gen": 1, "rewrapped": 500}
+    assert sorted(pending) == sorted(list(chunks[2]) + list(chunks[3]) + ["late"])
+
+    crypto.rotate_scope(DOCS, "r1", chunks[2])
+    done = crypto.rotate_scope(DOCS, "r1", dict(list(chunks[3].items())[:200]), final=True)
+    assert done == {
+        "success": True, "rotation": "r1", "generation": 1, "rewrapped": 950,
+        "members": 950, "revoked": 51, "closed": True,
+    }
+    assert crypto.rotation_status(DOCS)["rotation"] is None
+    # Reply to the final chunk lost: the resend is answered, not re-run.
+    last = dict(list(chunks[3].items())[:200])
+    assert crypto.rotate_scope(DOCS, "r1", last, final=True) == done
+    assert ix.rotation_state(DOCS) is None
+    assert crypto.rotate_scope(DOCS, "r2", {"p0": "k30000"})["generation"] == 2
+    assert crypto.get_envelope("p0", DOCS)["wrapped_dek"] == "env:v=2:k=k30000"
+    assert not crypto.get_envelope("late", DOCS)["success"]
+    assert crypto.list_scopes("p999")["scopes"] == []
+    assert len(_rows(storage)) == 950
+    assert not crypto.rotate_scope(DOCS, "", {})["success"]
+
+
+def test_chunk_cost_does_not_grow_with_the_scope(storage, crypto, monkeypatch):
+    _mark_ready()
+    _no_scan(monkeypatch)
+
+    def _cost(members):
+        storage.data.clear()
+        _forget_loaded()
+        _mark_ready()
+        crypto.grant_many(DOCS, _deks(members))
+        _forget_loaded()
+        storage.reads.clear()
+        crypto.rotate_scope(DOCS, "r", _deks(100, key="k2"))
+        return len(storage.reads)
+
+    # Page reads level off once every index page exists.
+    assert _cost(5000) <= _cost(1000) + 5
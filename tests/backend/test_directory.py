@@ -0,0 +1,109 @@
+"""Maintained realm directory projection (``core.directory``).
+
+Entities are created through the real ORM, so the ``User`` / ``Human`` /
+``Department`` save hooks are what keeps the projection current here.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from core import directory  # noqa: E402
+from ggg import Department, Human, User  # noqa: E402
+
+
+def _labels(result):
+    return [row[2] for row in result["rows"]]
+
+
+@pytest.fixture
+def realm(storage):
+    alice = User(id="dir-alice-principal", nickname="alice")
+    Human(name="Alice Zephyr", user=alice)
+    bob = User(id="dir-bob-principal", nickname="Bob Zed")
+    dept = Department(name="Zoning Board", head=bob)
+    directory.rebuild()
+    return {"alice": alice, "bob": bob, "dept": dept}
+
+
+def test_rebuild_matches_legacy_entries(realm):
+    entries = directory.entries()
+    by_principal = {e["principal"]: e for e in entries if e["kind"] == "user"}
+    assert by_principal["dir-alice-principal"]["label"] == "Alice Zephyr"
+    assert by_principal["dir-bob-principal"]["label"] == "Bob Zed"
+    dept = [e for e in entries if e["kind"] == "department" and e["label"] == "Zoning Board"]
+    assert dept == [{"kind": "department", "principal": "dir-bob-principal",
+                     "label": "Zoning Board", "id": str(realm["dept"]._id)}]
+    kinds = [e["kind"] for e in entries]
+    assert kinds == sorted(kinds, key=["user", "department"].index)
+
+
+def test_prefix_search_matches_words_and_principals(realm):
+    assert _labels(directory.search("zep")) == ["Alice Zephyr"]
+    assert _labels(directory.search("Z")) == ["Alice Zephyr", "Bob Zed", "Zoning Board"]
+    assert _labels(directory.search("z", kind="department")) == ["Zoning Board"]
+    assert _labels(directory.search("dir-bob")) == ["Bob Zed", "Zoning Board"]
+
+
+def test_pagination(realm):
+    first = directory.search("z", limit=2)
+    assert first["total"] == 3 and first["next_offset"] == 2
+    rest = directory.search("z", offset=first["next_offset"], limit=2)
+    assert _labels(rest) == ["Zoning Board"] and rest["next_offset"] is None
+
+
+def test_delta_follows_saves_and_deletes(realm):
+    start = directory.search()
+    gen, epoch = start["generation"], start["epoch"]
+
+    realm["alice"].human.name = "Alice Young"
+    realm["dept"].delete()
+    d = directory.delta(gen, epoch)
+    assert d["reset"] is False
+    assert [row[2] for row in d["rows"]] == ["Alice Young"]
+    assert d["removed"] == [["department", str(realm["dept"]._id)]]
+    assert _labels(directory.search("zep")) == []
+
+    assert directory.delta(d["generation"], epoch)["rows"] == []
+
+
+def test_delta_asks_for_reload_across_epochs(realm):
+    old = directory.search()
+    directory.rebuild()
+    assert directory.delta(old["generation"], old["epoch"])["reset"] is True
+    directory.reset()
+    assert directory.delta(0, directory.epoch())["reset"] is True
+
+
+def test_writes_reach_only_the_targets_watching_their_type(storage, monkeypatch):
+    import ggg
+    from ggg import projection
+
+    calls = []
+    for targets in projection._resolve().values():
+        for target in targets:
+            monkeypatch.setattr(
+                target, "entity_changed",
+                lambda entity, t=target: calls.append(t.__name__),
+            )
+
+    dept = Department(name="Watched Board")
+    assert sorted(set(calls)) == ["core.directory", "core.membership", "core.org_policy"]
+    dept.delete()
+
+    # Every watched type is a projected entity, and every projected entity
+    # is watched by someone.
+    projected = {
+        name for name in dir(ggg)
+        if isinstance(getattr(ggg, name), type)
+        and issubclass(getattr(ggg, name), projection.Projected)
+    }
+    assert projected == set(projection._resolve())
@@ -40,6 +40,7 @@ if BACKEND not in sys.path:
 
 import ggg  # noqa: F401, E402
 from core.entity_import import (  # noqa: E402
+    batch_waves,
     build_type_dependency_graph,
     chunk_records,
     plan_import_batches,
@@ -86,6 +87,24 @@ def test_plan_import_batches_preserves_order_within_chunks():
     assert types.index("User") < types.index("Vote")
 
 
+def test_waves_only_wait_for_referenced_batches():
+    records = [
+        {"_type": "User", "_id": "u1", "nickname": "alice"},
+        {"_type": "Organization", "_id": "o1", "name": "Acme"},
+        {"_type": "Proposal", "_id": "p1", "title": "P", "status": "voting"},
+        {"_type": "Vote", "_id": "v1", "proposal": "p1", "voter": "u1"},
+    ]
+    batches = [[r] for r in records]
+    assert batch_waves(batches) == [[0, 1, 2], [3]]
+
+    plan = plan_import_batches(records, batch_size=1)
+    assert sorted(b for wave in plan["waves"] for b in wave) == [0, 1, 2, 3]
+    vote_batch = next(
+        i for i, batch in enumerate(plan["batches"]) if batch[0]["_type"] == "Vote"
+    )
+    assert plan["waves"][-1] == [vote_batch]
+
+
 def test_records_without_keys_not_duplicated():
     records = [
         {"id": "cit-001", "name": "Alice"},
@@ -89,7 +89,8 @@ def realm(monkeypatch):
     # The real snapshot walks the whole filesystem, which is fine in a
     # canister and ruinous in a test run.
     snapshot = types.ModuleType("core.system_snapshot")
-    snapshot.snapshot = lambda sections=None: {"db": {"total_entities": 7}}
+    snapshot.snapshot = lambda sections=None, options=None: {"db": {"total_entities": 7}}
+    snapshot.repair = lambda section, cursor=None: {"repaired": True}
     monkeypatch.setitem(sys.modules, "core.system_snapshot", snapshot)
     return types.SimpleNamespace(
         users=users, notes=notes, granted=granted, sent=FakeNotification,
@@ -98,7 +99,7 @@ def realm(monkeypatch):
 
 CAPS = [
     "member.list", "member.profile", "member.notifications",
-    "notification.create", "crypto.envelope", "system.snapshot",
+    "notification.create", "crypto.envelope", "system.snapshot", "system.repair",
     "time.now", "log.write",
 ]
 
@@ -117,6 +118,7 @@ def handler(caller="admin"):
     ("member.profile", {"subject": "alice"}, "user.view"),
     ("member.notifications", {"subject": "alice"}, "user.view"),
     ("system.snapshot", {}, "realm.admin"),
+    ("system.repair", {"section": "db_audit"}, "realm.admin"),
 ])
 def test_declared_capability_is_not_enough(realm, verb, kwargs, operation):
     call = handler("mallory")
@@ -127,6 +129,11 @@ def test_declared_capability_is_not_enough(realm, verb, kwargs, operation):
     call("member_manager", verb, kwargs)
 
 
+def test_repair_is_a_write_verb():
+    assert "system.snapshot" in eb.READ_VERBS
+    assert "system.repair" in eb.WRITE_VERBS
+
+
 # ---------------------------------------------------------------------------
 # Member directory reads
 # ---------------------------------------------------------------------------
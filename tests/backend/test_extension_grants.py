@@ -77,6 +77,16 @@ def realm(monkeypatch):
 
     membership = types.ModuleType("core.membership")
     membership.iter_users = lambda: list(users.values())
+    membership.KIND_EXTENSION = "extension"
+
+    def members_by_name(kind):
+        by_name = {}
+        for user in users.values():
+            for ext in user.extensions:
+                by_name.setdefault(ext.name, []).append(user)
+        return by_name
+
+    membership.members_by_name = members_by_name
     monkeypatch.setitem(sys.modules, "core.membership", membership)
 
     granted = set()
@@ -226,3 +226,175 @@ def test_own_entity_verbs_still_need_capabilities(two_extensions):
     handler = eb.make_rpc_handler("passport_verification", [], "alice")
     with pytest.raises(PermissionError, match="not granted"):
         handler("passport_verification", "ext_entity.list", {"type": "AppConfig"})
+
+
+# ---------------------------------------------------------------------------
+# Manifest-declared indexes
+# ---------------------------------------------------------------------------
+
+
+BIDS_MANIFEST = {
+    "entities": {
+        "Bid": {
+            "fields": {
+                "rfp_id": {"type": "String", "max_length": 64},
+                "vendor": {"type": "String", "max_length": 64},
+            },
+            "indexes": ["rfp_id"],
+        }
+    }
+}
+
+
+class _MemStorage(dict):
+    def get(self, key):
+        return dict.get(self, key)
+
+    def insert(self, key, value):
+        self[key] = value
+
+    def remove(self, key):
+        self.pop(key, None)
+
+
+@pytest.fixture
+def bids_extension(monkeypatch):
+    """A real ORM-backed extension type, so the index path is exercised."""
+    from ic_python_db import Database
+
+    if Database._instance is None:
+        Database.init(db_storage=_MemStorage(), audit_enabled=False)
+    Database.get_instance().clear()
+    monkeypatch.setattr(eb, "_EXT_ENTITY_CLASSES", {})
+
+    module = types.ModuleType("core.runtime_extensions")
+    module.get_all_extension_manifests = lambda: {"idx_test": BIDS_MANIFEST}
+    monkeypatch.setitem(sys.modules, "core.runtime_extensions", module)
+    monkeypatch.setattr(eb, "caller_has_operation", lambda c, o: False)
+    from core import index_backfill
+
+    timers = []
+    monkeypatch.setattr(index_backfill, "ic", types.SimpleNamespace(
+        set_timer=lambda delay, fn: timers.append(fn)))
+    yield timers
+    Database.get_instance().clear()
+
+
+def _run_timers(timers):
+    while timers:
+        timers.pop(0)()
+
+
+def test_indexes_are_validated():
+    parsed = eb.declared_entities(BIDS_MANIFEST)
+    assert parsed["Bid"]["indexes"] == ["rfp_id"]
+    assert eb.declared_entities(PASSPORT_MANIFEST)["AppConfig"]["indexes"] == []
+
+    with pytest.raises(ValueError, match="indexes undeclared field"):
+        eb.declared_entities({"entities": {"Ok": {
+            "fields": {"a": {}}, "indexes": ["b"]}}})
+    with pytest.raises(ValueError, match="must be a list"):
+        eb.declared_entities({"entities": {"Ok": {
+            "fields": {"a": {}}, "indexes": "a"}}})
+
+
+def test_list_uses_declared_index(bids_extension, monkeypatch):
+    eb.register_declared_entities("idx_test", BIDS_MANIFEST)
+    handler = eb.make_rpc_handler("idx_test", CAPS, "alice")
+    for rfp, vendor in [("r1", "a"), ("r2", "b"), ("r1", "c"), ("r3", "d")]:
+        handler("idx_test", "ext_entity.create", {
+            "type": "Bid", "values": {"rfp_id": rfp, "vendor": vendor}})
+
+    cls = eb.own_entity_class("idx_test", "Bid")
+    monkeypatch.setattr(cls, "instances", classmethod(
+        lambda c: pytest.fail("indexed list must not scan")))
+
+    out = handler("idx_test", "ext_entity.list",
+                  {"type": "Bid", "where": {"rfp_id": "r1"}})
+    assert [r["vendor"] for r in out["rows"]] == ["a", "c"]
+    assert out["total"] == 2
+
+    # Non-indexed keys still narrow the indexed candidates.
+    out = handler("idx_test", "ext_entity.list",
+                  {"type": "Bid", "where": {"rfp_id": "r1", "vendor": "c"}})
+    assert [r["vendor"] for r in out["rows"]] == ["c"]
+
+
+def test_index_follows_update_and_delete(bids_extension):
+    eb.register_declared_entities("idx_test", BIDS_MANIFEST)
+    handler = eb.make_rpc_handler("idx_test", CAPS, "alice")
+    cls = eb.own_entity_class("idx_test", "Bid")
+    first = cls(rfp_id="r1", vendor="a")
+    second = cls(rfp_id="r1", vendor="b")
+
+    handler("idx_test", "ext_entity.update", {
+        "type": "Bid", "id": first._id, "values": {"rfp_id": "r2"}})
+    handler("idx_test", "ext_entity.delete", {"type": "Bid", "id": second._id})
+
+    def listed(rfp):
+        return handler("idx_test", "ext_entity.list",
+                       {"type": "Bid", "where": {"rfp_id": rfp}})["rows"]
+
+    assert listed("r1") == []
+    assert [r["vendor"] for r in listed("r2")] == ["a"]
+
+
+def test_index_declared_later_is_backfilled(bids_extension):
+    """Rows written before ``indexes`` existed are found once registered."""
+    unindexed = {"entities": {"Bid": dict(BIDS_MANIFEST["entities"]["Bid"],
+                                          indexes=[])}}
+    eb.register_declared_entities("idx_test", unindexed)
+    old_cls = eb.own_entity_class("idx_test", "Bid")
+    old_cls(rfp_id="r1", vendor="legacy")
+
+    eb.register_declared_entities("idx_test", BIDS_MANIFEST)
+    cls = eb.own_entity_class("idx_test", "Bid")
+    # Registration only schedules the backfill; the scan serves meanwhile.
+    assert not eb._index_ready(cls, "rfp_id")
+    assert [b.vendor for b in eb.rows_where(cls, {"rfp_id": "r1"})] == ["legacy"]
+
+    _run_timers(bids_extension)
+    assert eb._index_ready(cls, "rfp_id")
+    assert [b.vendor for b in eb.rows_where(cls, {"rfp_id": "r1"})] == ["legacy"]
+    assert cls.count_by("rfp_id", "r1") == 1
+
+
+def test_index_dropped_and_readded_is_backfilled_again(bids_extension):
+    """Rows written while a field was unindexed are not lost when it returns."""
+    unindexed = {"entities": {"Bid": dict(BIDS_MANIFEST["entities"]["Bid"],
+                                          indexes=[])}}
+    eb.register_declared_entities("idx_test", BIDS_MANIFEST)
+    eb.own_entity_class("idx_test", "Bid")(rfp_id="r1", vendor="indexed")
+    assert eb._index_ready(eb.own_entity_class("idx_test", "Bid"), "rfp_id")
+
+    eb.register_declared_entities("idx_test", unindexed)
+    eb.own_entity_class("idx_test", "Bid")(rfp_id="r1", vendor="unindexed")
+
+    eb.register_declared_entities("idx_test", BIDS_MANIFEST)
+    cls = eb.own_entity_class("idx_test", "Bid")
+    assert not eb._index_ready(cls, "rfp_id")
+    assert sorted(b.vendor for b in eb.rows_where(cls, {"rfp_id": "r1"})) == [
+        "indexed", "unindexed"]
+
+    _run_timers(bids_extension)
+    assert cls.count_by("rfp_id", "r1") == 2
+    assert sorted(b.vendor for b in eb.rows_where(cls, {"rfp_id": "r1"})) == [
+        "indexed", "unindexed"]
+
+
+def test_query_path_registration_schedules_nothing(bids_extension):
+    """The class rebuilt on a miss after an upgrade sets no timer."""
+    from ic_python_db import Database
+
+    unindexed = {"entities": {"Bid": dict(BIDS_MANIFEST["entities"]["Bid"],
+                                          indexes=[])}}
+    eb.register_declared_entities("idx_test", unindexed)
+    cls = eb.own_entity_class("idx_test", "Bid")
+    cls(rfp_id="r1", vendor="a")
+
+    eb._EXT_ENTITY_CLASSES.clear()
+    cls = eb.own_entity_class("idx_test", "Bid")
+    assert bids_extension == []
+    assert not eb._index_ready(cls, "rfp_id")
+    assert Database.get_instance().load("_system", eb._index_flag(cls, "rfp_id")) is None
+    assert [b.vendor for b in eb.rows_where(cls, {"rfp_id": "r1"})] == ["a"]
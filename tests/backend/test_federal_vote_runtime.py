@@ -614,3 +614,171 @@ class TestDeferExecution:
 
         mod._schedule_execution("prop_001")
         timer.assert_not_called()
+
+
+def _load_real_vote_entities():
+    """The real ORM classes, so the status/vote/quarter indexes are exercised."""
+    path = src_path / "ggg" / "governance" / "federal_vote.py"
+    spec = importlib.util.spec_from_file_location("federal_vote_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.FederalVote, module.FederalVoteLeg
+
+
+def _drain(gen):
+    while True:
+        try:
+            next(gen)
+        except StopIteration as stop:
+            return stop.value
+
+
+@pytest.fixture
+def indexed_ggg(monkeypatch):
+    from ic_python_db import Database
+
+    db = Database.get_instance()
+    db.clear()
+    ggg, *_ = _install_fake_ggg(is_capital=True, quarter_canister_ids=["q1-cai"])
+    ggg.FederalVote, ggg.FederalVoteLeg = _load_real_vote_entities()
+    db.save("_system", fv_runtime.VOTE_INDEX_FLAG, "done")
+    db.save("_system", fv_runtime.LEG_INDEX_FLAG, "done")
+    # Other suites may have swapped the shared _cdk mock; pin what we read.
+    monkeypatch.setattr(fv_runtime, "_self_id", lambda: "cap-cai")
+    monkeypatch.setattr(fv_runtime, "now_epoch_s", lambda: 1_700_000_000)
+    yield ggg
+    db.clear()
+
+
+def _open_vote(ggg, vote_id, deadline, quarters=("cap-cai", "q1-cai")):
+    # Through the upserts: "open" is the field default, which the ORM alone
+    # would leave out of the status index.
+    fv_runtime.upsert_vote(
+        vote_id=vote_id, action="{}", rule_json="{}", vote_hash="h",
+        deadline=deadline, status="open",
+    )
+    for qid in quarters:
+        fv_runtime.upsert_leg(
+            leg_key=fv_runtime.leg_key(vote_id, qid), vote_id=vote_id,
+            quarter_canister_id=qid, status="open",
+        )
+
+
+class TestIndexedLookups:
+    def test_legs_for_vote_is_not_truncated_to_one_page(self, indexed_ggg):
+        quarters = [f"q{i}-cai" for i in range(120)]
+        _open_vote(indexed_ggg, "fv_wide", 10**10, quarters=quarters)
+        legs = fv_runtime._legs_for_vote("fv_wide")
+        assert len(legs) == 120
+
+    def test_active_local_legs_skip_finished_votes(self, indexed_ggg, monkeypatch):
+        for i in range(30):
+            indexed_ggg.FederalVoteLeg(
+                leg_key=f"old_{i}:cap-cai", vote_id=f"old_{i}",
+                quarter_canister_id="cap-cai", status="executed",
+            )
+        _open_vote(indexed_ggg, "fv_live", 10**10)
+        monkeypatch.setattr(
+            indexed_ggg.FederalVoteLeg, "instances",
+            classmethod(lambda c: pytest.fail("must not scan legs")),
+        )
+        legs = fv_runtime._active_local_legs()
+        assert [leg.vote_id for leg in legs] == ["fv_live"]
+
+    def test_scans_until_backfill_has_finished(self, indexed_ggg):
+        from ic_python_db import Database
+
+        _open_vote(indexed_ggg, "fv_x", 10**10)
+        Database.get_instance().delete("_system", fv_runtime.VOTE_INDEX_FLAG)
+        assert fv_runtime._find_all(
+            indexed_ggg.FederalVote, "status", "open", fv_runtime.VOTE_INDEX_FLAG
+        ) is None
+        assert [v.vote_id for v in fv_runtime._open_votes()] == ["fv_x"]
+
+    def test_list_votes_by_status_reads_the_index(self, indexed_ggg, monkeypatch):
+        _open_vote(indexed_ggg, "fv_a", 10**10)
+        indexed_ggg.FederalVote(vote_id="fv_b", status="adopted", deadline=1)
+        monkeypatch.setattr(
+            indexed_ggg.FederalVote, "instances",
+            classmethod(lambda c: pytest.fail("must not scan votes")),
+        )
+        assert [v["vote_id"] for v in fv_runtime.list_votes("adopted")] == ["fv_b"]
+
+
+class TestOpenVoteQueue:
+    NOW = 1_700_000_000
+
+    def test_queue_is_deadline_ordered_and_only_moves_earlier(self, indexed_ggg):
+        fv_runtime.schedule_vote("late", self.NOW + 500)
+        fv_runtime.schedule_vote("soon", self.NOW + 10)
+        fv_runtime.schedule_vote("late", self.NOW + 900)
+        assert fv_runtime.queued_vote_ids() == ["soon", "late"]
+        assert fv_runtime.due_vote_ids(self.NOW + 10) == ["soon"]
+
+        fv_runtime.schedule_vote("late", self.NOW)
+        assert fv_runtime.due_vote_ids(self.NOW) == ["late"]
+        fv_runtime.unschedule_vote("late")
+        assert fv_runtime.queued_vote_ids() == ["soon"]
+
+    def test_missing_queue_is_seeded_from_open_votes(self, indexed_ggg):
+        _open_vote(indexed_ggg, "fv_pre_upgrade", self.NOW + 3600)
+        assert fv_runtime.due_vote_ids(self.NOW) == ["fv_pre_upgrade"]
+
+    def test_tick_only_touches_due_votes(self, indexed_ggg, monkeypatch):
+        import core.federation as federation
+
+        sent = []
+
+        def fake_send(target, topic, body, msg_id=""):
+            sent.append((target, topic, body["vote_id"]))
+            yield from []
+            return {"success": True, "proposal_id": f"p-{body['vote_id']}"}
+
+        monkeypatch.setattr(federation, "send_federation_message", fake_send)
+        monkeypatch.setattr(fv_runtime, "_maybe_disable_aggregate_task", lambda: None)
+
+        for i in range(20):
+            indexed_ggg.FederalVote(vote_id=f"hist_{i}", status="adopted", deadline=1)
+        _open_vote(indexed_ggg, "fv_new", self.NOW + 3600)
+        _open_vote(indexed_ggg, "fv_quiet", self.NOW + 7200)
+        fv_runtime._save_queue([])
+        fv_runtime.schedule_vote("fv_new", self.NOW)
+        fv_runtime.schedule_vote("fv_quiet", self.NOW + 7200)
+
+        result = _drain(fv_runtime.advance_federal_aggregate())
+        assert result == {"success": True, "opened": 1, "finalized": 0}
+        assert sent == [("q1-cai", "gos.federal.open", "fv_new")]
+        # Acknowledged, so it sleeps until its deadline rather than re-sending.
+        leg = indexed_ggg.FederalVoteLeg[fv_runtime.leg_key("fv_new", "q1-cai")]
+        assert leg.proposal_id == "p-fv_new"
+        assert fv_runtime.due_vote_ids(self.NOW) == []
+
+        second = _drain(fv_runtime.advance_federal_aggregate())
+        assert second == {"success": True, "opened": 0, "finalized": 0}
+
+    def test_tally_wakes_the_vote_and_finalizing_dequeues_it(
+        self, indexed_ggg, monkeypatch
+    ):
+        import core.federation as federation
+
+        def fake_send(target, topic, body, msg_id=""):
+            yield from []
+            return {"success": True}
+
+        monkeypatch.setattr(federation, "send_federation_message", fake_send)
+        monkeypatch.setattr(fv_runtime, "_maybe_disable_aggregate_task", lambda: None)
+        _open_vote(indexed_ggg, "fv_t", self.NOW + 3600)
+        for qid in ("cap-cai", "q1-cai"):
+            leg = indexed_ggg.FederalVoteLeg[fv_runtime.leg_key("fv_t", qid)]
+            leg.proposal_id = f"p-{qid}"
+        fv_runtime._save_queue([[self.NOW + 3600, "fv_t"]])
+
+        fv_runtime.handle_tally("cap-cai", {"vote_id": "fv_t", "outcome": "accepted",
+                                            "yes": 3, "eligible": 3})
+        fv_runtime.handle_tally("q1-cai", {"vote_id": "fv_t", "outcome": "accepted",
+                                           "yes": 2, "eligible": 2})
+        assert fv_runtime.due_vote_ids(self.NOW) == ["fv_t"]
+
+        result = _drain(fv_runtime.advance_federal_aggregate())
+        assert result["finalized"] == 1
+        assert fv_runtime.queued_vote_ids() == []
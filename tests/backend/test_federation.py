@@ -93,6 +93,9 @@ def _install_fake_ggg(
 
 @pytest.fixture(autouse=True)
 def _clean_modules():
+    # The fakes bypass the Quarter/Realm save hooks that invalidate the
+    # cached member set, so start every test from an empty cache.
+    federation.reset_members_cache()
     yield
     sys.modules.pop("ggg", None)
 
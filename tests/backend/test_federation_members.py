@@ -0,0 +1,78 @@
+"""Cached federation member set (``core.federation.federation_members``).
+
+Runs on the real ORM so invalidation goes through the ``Quarter`` / ``Realm``
+save and delete hooks, as it does for ``sync_one_peer`` and provisioning.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from core import federation  # noqa: E402
+
+
+@pytest.fixture
+def realm(storage):
+    # ``ggg`` may have been swapped for a fake by another test module.
+    sys.modules.pop("ggg", None)
+    from ggg import Quarter, Realm
+
+    federation.reset_members_cache()
+    home = Realm(name="fed-cache-realm")
+    Quarter(name="north", canister_id="north-cai")
+    yield home, Quarter
+    federation.reset_members_cache()
+
+
+def test_repeat_lookups_hit_the_cache(realm):
+    assert federation.authorize_source("north-cai")
+    assert not federation.authorize_source("stranger")
+    stats = federation.members_cache_stats()
+    assert (stats["misses"], stats["hits"], stats["size"]) == (1, 1, 1)
+
+
+def test_added_quarter_is_accepted(realm):
+    _home, Quarter = realm
+    assert not federation.authorize_source("south-cai")
+    Quarter(name="south", canister_id="south-cai")
+    assert federation.authorize_source("south-cai")
+
+
+def test_removed_quarter_is_rejected(realm):
+    _home, Quarter = realm
+    assert federation.authorize_source("north-cai")
+    Quarter["north"].delete()
+    assert not federation.authorize_source("north-cai")
+
+
+def test_repointed_quarter_and_capital(realm):
+    home, Quarter = realm
+    assert federation.authorize_source("north-cai")
+    Quarter["north"].canister_id = "north-v2-cai"
+    assert not federation.authorize_source("north-cai")
+    assert federation.authorize_source("north-v2-cai")
+
+    home.federation_realm_id = "capital-cai"
+    assert federation.authorize_source("capital-cai")
+
+
+def test_unrelated_saves_keep_the_cache(realm):
+    home, Quarter = realm
+    federation.federation_members()
+    before = federation.members_cache_stats()
+    north = Quarter["north"]
+    north.population = 42
+    north.status = "active"
+    home.manifesto = "unchanged membership"
+    federation.federation_members()
+    after = federation.members_cache_stats()
+    assert after["generation"] == before["generation"]
+    assert (after["misses"], after["hits"]) == (before["misses"], before["hits"] + 1)
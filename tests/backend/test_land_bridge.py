@@ -8,6 +8,7 @@ per cell, one owner, residential-means-member, mint-once) are enforced where
 extension code cannot skip them.
 """
 
+import json
 import sys
 import types
 from pathlib import Path
@@ -22,8 +23,13 @@ from core import extension_bridge as eb  # noqa: E402
 from core import land_bridge as lb  # noqa: E402
 
 
-class Row:
-    def __init__(self, store, **fields):
+class Land:
+    """A parcel row. Like an ORM row, it is saved on every attribute write
+    after construction and reports saves and deletes the way
+    ``ggg.projection`` does; ``hooks=False`` makes a row that predates them.
+    """
+
+    def __init__(self, store, hooks=True, **fields):
         self._id = len(store) + 1
         self.id = str(self._id)
         self.x_coordinate = None
@@ -39,18 +45,31 @@ class Row:
         self.owner_organization = None
         self.zones = []
         self.__dict__.update(fields)
+        self._store = store
         store.append(self)
+        self._hooks = hooks
+        if hooks:
+            lb.entity_changed(self)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if self.__dict__.get("_hooks"):
+            lb.entity_changed(self)
+
+    def delete(self):
+        self._store.remove(self)
+        lb.entity_removed(self)
 
 
 @pytest.fixture
 def realm(monkeypatch):
     lands, zones, users, orgs = [], {}, {}, {}
 
-    class Land:
+    class Lands:
         RESIDENTIAL = "residential"
 
         def __new__(cls, **fields):
-            return Row(lands, **fields)
+            return Land(lands, **fields)
 
         @staticmethod
         def max_id():
@@ -66,7 +85,7 @@ def realm(monkeypatch):
             return next((land for land in lands if land.id == str(key)), None)
 
         def __class_getitem__(cls, key):
-            return Land.load(key)
+            return Lands.load(key)
 
     class Zone:
         def __new__(cls, **fields):
@@ -81,6 +100,11 @@ def realm(monkeypatch):
         def instances():
             return list(zones.values())
 
+        @staticmethod
+        def load(key):
+            return next((z for z in zones.values()
+                         if str(getattr(z, "_id", "")) == str(key)), None)
+
         def __class_getitem__(cls, key):
             return zones.get(key)
 
@@ -95,7 +119,7 @@ def realm(monkeypatch):
             return orgs.get(key)
 
     ggg = types.ModuleType("ggg")
-    ggg.Land = Land
+    ggg.Land = Lands
     ggg.Zone = Zone
     ggg.User = User
     ggg.Organization = Organization
@@ -138,6 +162,12 @@ def test_every_write_requires_realm_admin(realm, verb):
         call("mallory")("land_registry", verb, {"land_id": "1"})
 
 
+@pytest.mark.parametrize("verb", sorted(lb.READS))
+def test_every_read_is_a_read_verb(verb):
+    """Sandboxed and async extensions are only ever handed READ_VERBS."""
+    assert verb in eb.READ_VERBS
+
+
 def test_reads_do_not_require_admin(realm):
     make_land(realm, x_coordinate=1, y_coordinate=1)
     realm.granted.clear()
@@ -344,3 +374,259 @@ def test_map_filters_to_the_requested_window(realm):
     result = call()("land_registry", "land.map",
                     {"min_x": 0, "max_x": 10, "min_y": 0, "max_y": 10})
     assert list(result["lands"]) == ["5,5"]
+
+
+# ---------------------------------------------------------------------------
+# Cell index
+# ---------------------------------------------------------------------------
+
+CELL = "8928308280fffff"     # resolution 9
+PARENT = "8828308281fffff"   # its resolution-8 parent
+SIBLING = "8928308280bffff"  # same parent, different cell
+
+
+class _MemStorage(dict):
+    def get(self, key):
+        return dict.get(self, key)
+
+    def insert(self, key, value):
+        self[key] = value
+
+    def remove(self, key):
+        self.pop(key, None)
+
+
+@pytest.fixture
+def indexed(realm, monkeypatch):
+    """``realm`` with the parcel cell index backfilled and scans forbidden."""
+    from ic_python_db import Database
+
+    if Database._instance is None:
+        Database.init(db_storage=_MemStorage(), audit_enabled=False)
+    db = Database.get_instance()
+    db.clear()
+    for flag in (lb.CELL_INDEX_FLAG, lb.TILE_INDEX_FLAG, lb.ZONE_BUCKET_FLAG):
+        db.save("_system", flag, "done")
+
+    def no_scan():
+        raise AssertionError("scanned every parcel")
+
+    monkeypatch.setattr(lb, "_all_lands", no_scan)
+    monkeypatch.setattr(lb, "_page", no_scan)
+    yield realm
+    db.clear()
+
+
+def test_h3_parents_are_computed_from_the_id():
+    assert lb._h3_parents(CELL)[:2] == [PARENT, "872830828ffffff"]
+    assert len(lb._h3_parents(CELL)) == 9
+    assert lb._h3_parents("8a1f") == []
+
+
+def test_indexed_overlap_checks_cover_ancestors_and_descendants(indexed):
+    make_land(indexed, id="1", h3_indexes=[CELL])
+    for cell in (CELL, PARENT):
+        with pytest.raises(ValueError, match="already exists at H3 cell"):
+            make_land(indexed, id="2", h3_indexes=[cell])
+    assert make_land(indexed, id="2", h3_indexes=[SIBLING])["created"]
+
+    make_land(indexed, id="3", h3_indexes=["872830829ffffff"])
+    with pytest.raises(ValueError, match="already exists at H3 cell"):
+        make_land(indexed, id="4", h3_indexes=["8928308290bffff"])
+
+
+def test_metadata_update_moves_the_parcel_in_the_index(indexed):
+    make_land(indexed, id="1", h3_indexes=[CELL])
+    call()("land_registry", "land.update", {
+        "land_id": "1", "metadata": json.dumps({"h3_indexes": [SIBLING]}),
+    })
+    assert lb._cell_is_taken(SIBLING)
+    assert not lb._cell_is_taken(CELL)
+    assert lb._cell_is_taken(PARENT)
+
+
+def test_parcel_follows_an_ancestor_territory_zone(indexed):
+    indexed.zones[PARENT] = types.SimpleNamespace(
+        h3_index=PARENT, land=None, zone_type="agricultural", name="Valley",
+    )
+    make_land(indexed, id="1", h3_indexes=[CELL])
+    assert indexed.lands[0].land_type == "agricultural"
+
+    indexed.zones[PARENT].zone_type = "industrial"
+    lb.sync_parcels_covering([PARENT])
+    assert indexed.lands[0].land_type == "industrial"
+
+
+def test_cell_index_backfills_existing_parcels(indexed):
+    Land(indexed.lands, hooks=False, id="1",
+         metadata=json.dumps({"h3_indexes": [CELL]}))
+    assert not lb._cell_is_taken(PARENT)
+
+    cursor = 1
+    while cursor is not None:
+        cursor = lb.rebuild_cell_index(from_id=cursor, batch=1)
+    assert lb._cell_is_taken(PARENT)
+
+
+def test_deleted_parcel_releases_its_cells(indexed):
+    make_land(indexed, id="1", h3_indexes=[CELL])
+    indexed.lands[0].delete()
+    for cell in (CELL, PARENT, lb._h3_parents(CELL)[-1]):
+        assert not lb._cell_is_taken(cell)
+    assert make_land(indexed, id="2", h3_indexes=[CELL])["created"]
+
+
+def test_parcels_written_outside_land_create_are_indexed(indexed):
+    """An imported row is saved through the ORM, not ``land.create``."""
+    Land(indexed.lands, id="1", metadata=json.dumps({"h3_indexes": [CELL]}))
+    with pytest.raises(ValueError, match="already exists at H3 cell"):
+        make_land(indexed, id="2", h3_indexes=[PARENT])
+
+
+def test_coarse_ancestors_are_counted_not_listed(indexed):
+    from ic_python_db import Database
+
+    make_land(indexed, id="1", h3_indexes=[CELL])
+    make_land(indexed, id="2", h3_indexes=[SIBLING])
+    db = Database.get_instance()
+    for parent in lb._h3_parents(CELL):
+        listed = db.field_index_get("Land", lb.COVER_FIELD, parent)
+        if lb._h3_resolution(parent) >= lb.COVER_MIN_RES:
+            assert listed == ["1", "2"]
+        else:
+            assert listed == []
+            assert lb._cover_count(parent) == 2
+
+    indexed.lands[0].delete()
+    res0 = lb._h3_parents(CELL)[-1]
+    assert lb._cover_count(res0) == 1 and lb._cell_is_taken(res0)
+    indexed.lands[0].delete()
+    assert lb._cover_count(res0) == 0 and not lb._cell_is_taken(res0)
+
+
+# ---------------------------------------------------------------------------
+# Map index
+# ---------------------------------------------------------------------------
+
+FAR = "89283470c27ffff"
+
+
+def territory(realm, zone_id, cell, zone_type="residential", user="alice"):
+    zone = types.SimpleNamespace(
+        _id=str(zone_id), id=str(zone_id), h3_index=cell, land=None,
+        zone_type=zone_type, name=f"Zone {zone_id}", description="",
+        metadata="{}", user=types.SimpleNamespace(id=user, zones=[]),
+    )
+    zone.user.zones.append(zone)
+    realm.zones[cell] = zone
+    lb.index_zone(zone)
+    return zone
+
+
+def test_map_pages_only_parcels_in_the_viewport(indexed):
+    for i, (x, y) in enumerate([(1, 1), (500, 500), (2, 3), (70, 5),
+                                (900, 2), (10, 10)], start=1):
+        make_land(indexed, id=str(i), x_coordinate=x, y_coordinate=y)
+
+    seen, cursor = [], None
+    while True:
+        page = call()("land_registry", "land.map", {
+            "min_x": 0, "max_x": 80, "min_y": 0, "max_y": 20,
+            "page_size": 2, "cursor": cursor,
+        })
+        assert page["lands"], "a page promised by has_more came back empty"
+        seen.extend(page["lands"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+    assert sorted(seen) == ["1,1", "10,10", "2,3", "70,5"]
+
+
+def test_get_zones_aggregates_coarse_resolutions(indexed):
+    territory(indexed, 1, CELL, "residential", "alice")
+    territory(indexed, 2, SIBLING, "commercial", "bob")
+    territory(indexed, 3, FAR, "commercial", "bob")
+
+    result = lb.zone_aggregate(5)
+    buckets = {z["h3_index"]: z for z in result["zones"]}
+    res5 = lb._h3_parents(CELL)[3]
+    assert buckets[res5]["zone_count"] == 2
+    assert buckets[res5]["zone_types"] == {"residential": 1, "commercial": 1}
+    assert buckets[res5]["user_count"] == 2
+    assert result["total_users"] == 2
+    assert [z["user_count"] for z in lb.zone_aggregate(0)["zones"]] == [2]
+    assert sum(z["zone_count"] for z in lb.zone_aggregate(0)["zones"]) == 3
+    assert lb.zone_aggregate(9) is None
+
+
+def test_zone_buckets_follow_retype_and_delete(indexed):
+    zone = territory(indexed, 1, CELL, "residential")
+    zone.zone_type = "industrial"
+    lb.index_zone(zone)
+    [bucket] = lb.zone_aggregate(5)["zones"]
+    assert bucket["zone_types"] == {"industrial": 1}
+
+    lb.unindex_zone(zone)
+    assert lb.zone_aggregate(5)["zones"] == []
+    assert lb.zone_aggregate(5)["total_users"] == 0
+
+
+def test_zone_viewport_is_paginated(indexed):
+    for i, cell in enumerate([CELL, SIBLING, FAR], start=1):
+        territory(indexed, i, cell)
+
+    first = call()("land_registry", "land.zones",
+                   {"cells": [PARENT], "page_size": 1})
+    assert [z["h3_index"] for z in first["zones"]] == [CELL]
+    rest = call()("land_registry", "land.zones", {
+        "cells": [PARENT], "page_size": 1, "cursor": first["next_cursor"],
+    })
+    assert [z["h3_index"] for z in rest["zones"]] == [SIBLING]
+    assert rest["has_more"] is False
+
+    inner = call()("land_registry", "land.zones", {"cells": [CELL]})
+    assert [z["h3_index"] for z in inner["zones"]] == [CELL]
+
+
+def test_coarse_buckets_keep_summaries_not_id_lists(indexed):
+    from ic_python_db import Database
+
+    territory(indexed, 1, CELL, "residential", "alice")
+    territory(indexed, 2, SIBLING, "commercial", "alice")
+    db = Database.get_instance()
+    res5 = lb._h3_parents(CELL)[3]
+    assert db.field_index_get("Zone", lb.ZONE_BUCKET_FIELD, res5) == []
+    assert db.field_index_get("Zone", lb.ZONE_BUCKET_FIELD, PARENT) == ["1", "2"]
+    summary = lb._summary(res5)
+    assert summary["zones"] == 2 and summary["users"] == 1
+    assert len(summary["children"]) == 1
+
+    # A viewport given as one coarse cell still finds the zones inside it.
+    out = call()("land_registry", "land.zones", {"cells": [res5]})
+    assert [z["h3_index"] for z in out["zones"]] == [CELL, SIBLING]
+
+
+def test_deleted_zones_and_parcels_are_pruned(indexed):
+    from ic_python_db import Database
+
+    first = territory(indexed, 1, CELL, "residential", "alice")
+    second = territory(indexed, 2, FAR, "commercial", "bob")
+    lb.unindex_zone(first)
+    assert {z["h3_index"] for z in lb.zone_aggregate(5)["zones"]} == {
+        lb._h3_parents(FAR)[3]}
+    assert lb.zone_aggregate(5)["total_users"] == 1
+    lb.unindex_zone(second)
+    db = Database.get_instance()
+    assert [k for k in db._db_storage.keys() if "zone_bucket" in k] == [
+        f"_system@{lb.ZONE_BUCKET_FLAG}"]
+    assert lb.zone_aggregate(0)["zones"] == []
+
+    make_land(indexed, id="1", x_coordinate=1, y_coordinate=1)
+    make_land(indexed, id="2", x_coordinate=2, y_coordinate=2)
+    assert lb._load_list(lb._TILES_KEY) == [[0, 0]]
+    indexed.lands[0].x_coordinate = 700
+    assert lb._load_list(lb._TILES_KEY) == [[0, 0], [10, 0]]
+    for land in list(indexed.lands):
+        land.delete()
+    assert lb._load_list(lb._TILES_KEY) == []
+    assert not lb._coords_taken(2, 2)
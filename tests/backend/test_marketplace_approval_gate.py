@@ -3,6 +3,7 @@
 Covers api/file_registry.py:
   - _trust_policy: what the realm requires and whose approvals it honours
   - _check_marketplace_approval: the refusal decision itself
+  - frontend copies and registry pulls that sit behind the gate
 
 The gate is the thing standing between a realm and unreviewed code, so the
 cases that matter most here are the ones where it must say no: content that
@@ -475,7 +476,7 @@ def test_copy_frontend_to_asset_canister_errors_on_empty_registry_namespace():
     original_resolve = fr._resolve_registry_namespace
     original_frs = fr.FileRegistryService
 
-    def fake_pull(registry, ext_id, version):
+    def fake_pull(registry, ext_id, version, existing=None):
         if False:
             yield
         return {}, "1.3.9", None
@@ -497,7 +498,7 @@ def test_copy_frontend_to_asset_canister_errors_on_empty_registry_namespace():
                 "1.3.9",
                 "frontend-id",
             ),
-            [],
+            [[]],  # the frontend's (empty) asset listing
         )
         assert err == (
             "no frontend files found in registry namespace ext/public_dashboard/1.3.9"
@@ -508,6 +509,238 @@ def test_copy_frontend_to_asset_canister_errors_on_empty_registry_namespace():
         fr.FileRegistryService = original_frs
 
 
+def _sha(data):
+    import hashlib
+
+    return hashlib.sha256(data).hexdigest()
+
+
+class FakeAssetCanister:
+    """Records batch-API calls; answers are fed back through run_async."""
+
+    calls = []
+
+    def __init__(self, principal):
+        pass
+
+    def list(self, arg):
+        return ("list",)
+
+    def create_batch(self, arg):
+        FakeAssetCanister.calls.append(("create_batch",))
+        return ("create_batch",)
+
+    def create_chunk(self, arg):
+        FakeAssetCanister.calls.append(("create_chunk", arg["content"]))
+        return ("create_chunk",)
+
+    def commit_batch(self, arg):
+        FakeAssetCanister.calls.append(("commit_batch", arg["operations"]))
+        return ("commit_batch",)
+
+
+def test_copy_frontend_uploads_only_changed_files_in_one_batch(monkeypatch):
+    FakeAssetCanister.calls = []
+    monkeypatch.setattr(fr, "AssetCanisterService", FakeAssetCanister)
+    key = "/ext/vault/1.0.0/frontend/dist/"
+    existing = {
+        key + "index.js": _sha(b"same"),
+        key + "logo.png": _sha(b"old"),
+    }
+    files = {
+        "frontend/dist/index.js": b"same",
+        "frontend/dist/logo.png": b"\x89PNG\x00new",
+        "frontend/dist/app.css": "body {}",
+    }
+
+    err = run_async(
+        fr._copy_frontend_to_asset_canister(
+            "registry-id", "vault", "1.0.0", "frontend-id",
+            files=files, existing=existing,
+        ),
+        [{"batch_id": 7}, {"chunk_id": 1}, {"chunk_id": 2}, None, None],
+    )
+
+    assert err is None
+    names = [c[0] for c in FakeAssetCanister.calls]
+    assert names == ["create_batch", "create_chunk", "create_chunk", "commit_batch"]
+    assert FakeAssetCanister.calls[1][1] == b"\x89PNG\x00new"
+    ops = FakeAssetCanister.calls[3][1]
+    # logo.png already exists and only gets new content; app.css is created.
+    assert [list(op)[0] for op in ops] == [
+        "SetAssetContent", "CreateAsset", "SetAssetContent",
+    ]
+    assert ops[0]["SetAssetContent"]["sha256"] == bytes.fromhex(_sha(b"\x89PNG\x00new"))
+    assert existing[key + "app.css"] == _sha(b"body {}")
+
+
+def test_copy_frontend_with_nothing_changed_makes_no_calls(monkeypatch):
+    FakeAssetCanister.calls = []
+    monkeypatch.setattr(fr, "AssetCanisterService", FakeAssetCanister)
+    existing = {"/ext/vault/1.0.0/frontend/index.js": _sha(b"same")}
+
+    err = run_async(
+        fr._copy_frontend_to_asset_canister(
+            "registry-id", "vault", "1.0.0", "frontend-id",
+            files={"frontend/index.js": b"same"}, existing=existing,
+        ),
+        [],
+    )
+    assert err is None
+    assert FakeAssetCanister.calls == []
+
+
+def test_frontend_pull_skips_files_the_frontend_already_serves(monkeypatch):
+    def fake_resolve(registry, category, item_id, version):
+        if False:
+            yield
+        return "ext/vault/1.0.0", "1.0.0", None
+
+    def approve(registry, namespace):
+        if False:
+            yield
+        return ""
+
+    class Registry:
+        def list_files_icc(self, namespace):
+            return ("list_files_icc",)
+
+        def get_file_chunk_blob_icc(self, namespace, path, offset, length):
+            return ("chunk", path)
+
+    monkeypatch.setattr(fr, "_resolve_registry_namespace", fake_resolve)
+    monkeypatch.setattr(fr, "_check_marketplace_approval", approve)
+    listing = json.dumps([
+        {"path": "frontend/a.js", "sha256": _sha(b"a")},
+        {"path": "frontend/b.js", "sha256": _sha(b"b2")},
+        {"path": "backend/main.py", "sha256": _sha(b"x")},
+    ])
+    existing = {
+        "/ext/vault/1.0.0/frontend/a.js": _sha(b"a"),
+        "/ext/vault/1.0.0/frontend/b.js": _sha(b"b1"),
+    }
+
+    files, version, err = run_async(
+        fr._pull_extension_frontend_files(Registry(), "vault", "1.0.0", existing),
+        [listing, {"Ok": b"b2"}, {"Ok": b""}],
+    )
+    assert err is None
+    assert files == {"frontend/a.js": None, "frontend/b.js": b"b2"}
+
+
+# ---------------------------------------------------------------------------
+# Registry pulls
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def pull_state(monkeypatch):
+    monkeypatch.setattr(fr, "_pulled_by_hash", fr.OrderedDict())
+    monkeypatch.setattr(fr, "_pulled_bytes", 0)
+    monkeypatch.setattr(fr, "_blob_chunks_unsupported", set())
+
+
+class PullRegistry:
+    """Records which chunk method was asked for which path."""
+
+    def __init__(self):
+        self.calls = []
+
+    def list_files_icc(self, namespace):
+        self.calls.append(("list",))
+        return ("list",)
+
+    def get_file_size_icc(self, namespace, path):
+        raise AssertionError("the size probe is redundant with the listing")
+
+    def get_file_chunk_blob_icc(self, namespace, path, offset, length):
+        self.calls.append(("blob", path, offset))
+        return ("blob", path)
+
+    def get_file_chunk_icc(self, namespace, path, offset, length):
+        self.calls.append(("b64", path, offset))
+        return ("b64", path)
+
+
+def _b64_chunk(data):
+    import base64
+
+    return json.dumps({"content_b64": base64.b64encode(data).decode(), "eof": True})
+
+
+def test_pull_uses_blob_windows_and_skips_the_size_probe(pull_state, monkeypatch):
+    monkeypatch.setattr(fr, "PULL_WINDOW_BYTES", 4)
+    registry = PullRegistry()
+    listing = json.dumps([
+        {"path": "backend/a.py", "sha256": _sha(b"abcdefg"), "size": 7},
+    ])
+    files = run_async(
+        fr._pull_namespace_files(registry, "codex/x/1", lambda p: True),
+        [listing, {"Ok": b"abcd"}, {"Ok": b"efg"}],
+    )
+    assert files == {"backend/a.py": "abcdefg"}
+    assert registry.calls == [
+        ("list",), ("blob", "backend/a.py", 0), ("blob", "backend/a.py", 4),
+    ]
+
+
+def test_short_windows_do_not_end_the_file(pull_state, monkeypatch):
+    monkeypatch.setattr(fr, "PULL_WINDOW_BYTES", 4)
+    registry = PullRegistry()
+    listing = json.dumps([
+        {"path": "a.py", "sha256": _sha(b"abcdefg"), "size": 7},
+        {"path": "b.py", "sha256": _sha(b"xyz")},
+    ])
+    files = run_async(
+        fr._pull_namespace_files(registry, "codex/x/1", lambda p: True),
+        [listing, {"Ok": b"ab"}, {"Ok": b"cde"}, {"Ok": b"fg"},
+         {"Ok": b"xy"}, {"Ok": b"z"}, {"Ok": b""}],
+    )
+    assert files == {"a.py": "abcdefg", "b.py": "xyz"}
+    assert [c[2] for c in registry.calls[1:]] == [0, 2, 5, 0, 2, 3]
+
+
+def test_registry_without_blob_chunks_falls_back_once(pull_state):
+    registry = PullRegistry()
+    listing = json.dumps([
+        {"path": "a.py", "sha256": _sha(b"a")},
+        {"path": "b.py", "sha256": _sha(b"b")},
+    ])
+    files = run_async(
+        fr._pull_namespace_files(registry, "codex/x/1", lambda p: True),
+        [listing, {"Err": "no such method"}, _b64_chunk(b"a"), _b64_chunk(b"b")],
+    )
+    assert files == {"a.py": "a", "b.py": "b"}
+    assert [c[0] for c in registry.calls] == ["list", "blob", "b64", "b64"]
+
+
+def test_shared_files_are_pulled_once_by_hash(pull_state):
+    listing = json.dumps([{"path": "util.py", "sha256": _sha(b"shared")}])
+    first = PullRegistry()
+    run_async(
+        fr._pull_namespace_files(first, "codex/dep/1", lambda p: True),
+        [listing, {"Ok": b"shared"}, {"Ok": b""}],
+    )
+    second = PullRegistry()
+    files = run_async(
+        fr._pull_namespace_files(second, "codex/other/1", lambda p: True),
+        [listing],
+    )
+    assert files == {"util.py": "shared"}
+    assert second.calls == [("list",)]
+
+
+def test_content_that_does_not_match_the_listing_is_dropped(pull_state):
+    registry = PullRegistry()
+    listing = json.dumps([{"path": "a.py", "sha256": _sha(b"reviewed")}])
+    files = run_async(
+        fr._pull_namespace_files(registry, "codex/x/1", lambda p: True),
+        [listing, {"Ok": b"tampered"}, {"Ok": b""}],
+    )
+    assert files == {}
+    assert fr._cache_get(_sha(b"tampered")) is None
+
+
 def test_run_codex_init_never_executes(tmp_path, monkeypatch):
     """Even a leftover call site must not exec the file."""
     from core import runtime_codex
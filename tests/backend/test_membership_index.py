@@ -0,0 +1,171 @@
+"""Reverse membership index (``core.membership``).
+
+Listings are measured in user rows read from storage.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Database, Entity  # noqa: E402
+
+from core import membership  # noqa: E402
+from ggg import Department, Extension, User, UserProfile  # noqa: E402
+
+
+def _backfill():
+    cursor = 1
+    while cursor is not None:
+        cursor = membership.rebuild_index(from_id=cursor, batch=500)
+    Database.get_instance().save("_system", membership.INDEX_FLAG, "done")
+
+
+def _forget_loaded():
+    """Drop cached instances so the next load reads storage."""
+    Database.get_instance().clear_registry()
+    Entity._context.clear()
+
+
+def _ids(users):
+    return sorted(int(u._id) for u in users)
+
+
+def test_listing_reads_only_member_rows(storage):
+    ops = Department(name="mi-ops")
+    auditor = UserProfile(name="mi-auditor")
+    vault = Extension(name="mi-vault")
+    members, auditors, grantees = set(), set(), set()
+    for i in range(1, 20_001):
+        user = User(id=f"mi-user-{i}")
+        if i % 400 == 0:
+            user.departments.add(ops)
+            members.add(i)
+        if i % 700 == 0:
+            user.profiles.add(auditor)
+            auditors.add(i)
+        if i % 1000 == 0:
+            user.extensions.add(vault)
+            grantees.add(i)
+        if i % 500 == 0:
+            # ``Entity._context`` slows down as it grows; keep it small.
+            _forget_loaded()
+    _backfill()
+    _forget_loaded()
+
+    storage.reads.clear()
+    listed = membership.department_members("mi-ops")
+    touched = {int(k.split("@", 1)[1]) for k in storage.reads if k.startswith("User@")}
+    assert _ids(listed) == sorted(members)
+    assert touched == members
+
+    storage.reads.clear()
+    assert _ids(membership.users_with_profile(auditor)) == sorted(auditors)
+    assert _ids(membership.users_with_extension("mi-vault")) == sorted(grantees)
+    touched = {int(k.split("@", 1)[1]) for k in storage.reads if k.startswith("User@")}
+    assert touched <= auditors | grantees
+    assert not any(k.startswith("_fi:User") for k in storage.reads)
+
+
+def test_save_hook_follows_membership_changes(storage):
+    ops = Department(name="mi-ops")
+    alice, bob = User(id="mi-alice"), User(id="mi-bob")
+    _backfill()
+
+    membership.add_department_member(ops, alice)
+    membership.add_department_member(ops, bob)
+    assert membership.member_ids(membership.KIND_DEPARTMENT, ops._id) == (
+        [alice._id, bob._id], None,
+    )
+
+    membership.remove_department_member(ops, alice)
+    assert [u.id for u in membership.department_members(ops)] == ["mi-bob"]
+
+    bob.delete()
+    assert membership.department_members(ops) == []
+    assert storage.get(f"_fi:{membership.INDEX_TYPE}:user:{bob._id}") is None
+
+
+def test_members_page_walks_across_index_pages(storage):
+    ops = Department(name="mi-ops")
+    span = membership.PAGE_SPAN
+    for i in range(1, 2 * span + 10):
+        user = User(id=f"mi-user-{i}")
+        if i % 50 == 0 or i == span:
+            user.departments.add(ops)
+    _backfill()
+
+    expected = sorted(i for i in range(1, 2 * span + 10) if i % 50 == 0 or i == span)
+    seen, cursor = [], 0
+    while True:
+        page = membership.members_page("department", "mi-ops", cursor, limit=4)
+        assert len(page["users"]) <= 4
+        seen.extend(int(u._id) for u in page["users"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+
+def test_scan_fallback_until_backfilled(storage):
+    ops = Department(name="mi-ops")
+    user = User(id="mi-alice")
+    user.departments.add(ops)
+    assert not membership.index_ready()
+    assert [u.id for u in membership.department_members("mi-ops")] == ["mi-alice"]
+    assert membership.members_page("department", ops)["next_cursor"] is None
+
+
+def test_verify_reports_and_repairs_drift(storage):
+    db = Database.get_instance()
+    ops = Department(name="mi-ops")
+    alice, bob = User(id="mi-alice"), User(id="mi-bob")
+    alice.departments.add(ops)
+    _backfill()
+
+    entry = f"department:{ops._id}"
+    page = str(int(alice._id) // membership.PAGE_SPAN)
+    db.field_index_remove(membership.INDEX_TYPE, "user", alice._id, entry)
+    db.field_index_add(membership.INDEX_TYPE, entry, page, bob._id)
+
+    report = membership.verify_index()
+    assert report["drifted"] == [alice._id] and report["next_cursor"] is None
+    assert membership.verify_members("department", ops)["stale"] == [bob._id]
+
+    membership.verify_index(repair=True)
+    membership.verify_members("department", ops, repair=True)
+    assert membership.verify_index()["drifted"] == []
+    assert membership.verify_members("department", ops) == {"checked": 1, "stale": []}
+
+
+def test_deleted_department_leaves_no_pages(storage, monkeypatch):
+    ops = Department(name="mi-ops")
+    keep = Department(name="mi-keep")
+    alice, bob = User(id="mi-alice"), User(id="mi-bob")
+    for user in (alice, bob):
+        membership.add_department_member(ops, user)
+    membership.add_department_member(keep, alice)
+    _backfill()
+
+    entry = f"department:{ops._id}"
+    ops.delete()
+    assert not [k for k in storage.data if entry in k]
+    alice.nickname = "saved again"
+    assert membership._indexed(alice._id) == {f"department:{keep._id}"}
+    assert membership.member_ids(membership.KIND_DEPARTMENT, keep._id) == (
+        [alice._id], None,
+    )
+
+    monkeypatch.setattr(Department, "instances", classmethod(
+        lambda c: pytest.fail("members_by_name must page, not call instances()")))
+    by_name = membership.members_by_name(membership.KIND_DEPARTMENT)
+    assert {name: [u.id for u in users] for name, users in by_name.items()} == {
+        "mi-keep": ["mi-alice"],
+    }
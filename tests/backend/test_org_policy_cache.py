@@ -0,0 +1,122 @@
+"""Department lookup cache behind the governed-action gate (``core.org_policy``).
+
+Each test starts from a cold cache, so the department rows a call reads from
+storage can be counted.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Database, Entity  # noqa: E402
+
+from core import access, governed_action, org_policy  # noqa: E402
+from ggg import Department, DepartmentAuthority  # noqa: E402
+
+
+@pytest.fixture
+def storage(storage, monkeypatch):
+    org_policy.reset_cache()
+    monkeypatch.setattr(access, "_is_controller_or_trusted", lambda caller: False)
+    yield storage
+    org_policy.reset_cache()
+
+
+def _forget_loaded():
+    Database.get_instance().clear_registry()
+    Entity._context.clear()
+
+
+def _no_scan(monkeypatch):
+    def _scan(*args, **kwargs):
+        raise AssertionError("department lookups must not scan")
+
+    monkeypatch.setattr(Department, "instances", classmethod(_scan))
+
+
+def _gate(org_name=None):
+    return governed_action.gate(
+        caller="alice", summary="do it", replay_code="pass", org_name=org_name,
+    )
+
+
+def test_gate_reads_no_department_on_the_direct_path(storage, monkeypatch):
+    Department(name="root", is_root=True)
+    for i in range(50):
+        Department(name=f"org-{i}")
+    Department(name="council", policy_threshold_m=2, policy_threshold_n=3)
+    org_policy.governing_entry()
+    _forget_loaded()
+    _no_scan(monkeypatch)
+
+    storage.reads.clear()
+    assert _gate("org-7") is None
+    assert _gate() is None
+    assert not [k for k in storage.reads if k.startswith("Department")]
+
+    verdict = _gate("council")
+    assert verdict["requires_confirmation"] and verdict["governed_by"] == "council"
+    loaded = {k for k in storage.reads if k.startswith("Department@")}
+    assert loaded == {f"Department@{org_policy.department_id('council')}"}
+
+
+def test_cache_follows_policy_edits_renames_and_deletes(storage):
+    root = Department(name="root", is_root=True)
+    ops = Department(name="ops")
+    assert _gate("ops") is None
+
+    ops.policy_veto_principals = "carol, dave"
+    dept_id, policy = org_policy.governing_entry("ops")
+    assert dept_id == ops._id and policy.veto_principals == ("carol", "dave")
+    assert not policy.direct
+    assert policy.satisfied(approvals=["x"], vetoes=["dave"], eligible=["x"]) == (
+        False, "vetoed by dave",
+    )
+    assert _gate("ops")["governed_by"] == "ops"
+
+    ops.name = "operations"
+    assert org_policy.department_id("ops") is None
+    assert org_policy.department_id("operations") == ops._id
+    # An unknown org falls back to root, whose 1/1 policy is direct.
+    assert _gate("ops") is None
+
+    root.policy_threshold_m = 2
+    root.policy_threshold_n = 2
+    assert _gate("ops")["governed_by"] == "root"
+    ops.delete()
+    assert org_policy.department_id("operations") is None
+
+
+def test_root_under_another_name_is_found_without_a_scan(storage, monkeypatch):
+    Department(name="alpha")
+    legacy = Department(name="founders", is_root=True)
+    Department(name="later-root", is_root=True)
+    org_policy.governing_entry()
+    _no_scan(monkeypatch)
+
+    assert governed_action.governing_org("missing")._id == legacy._id
+    assert org_policy.ensure_root_org()._id == legacy._id
+    assert Department["root"] is None
+
+
+def test_grant_root_authority_adds_only_missing_grants(storage, monkeypatch):
+    root = org_policy.ensure_root_org()
+    for name in ("a", "b"):
+        Department(name=name)
+    org_policy.grant_root_authority_over_local_orgs()
+    assert sorted(a.target.name for a in root.authorities_granted) == ["a", "b"]
+
+    Department(name="c")
+    _no_scan(monkeypatch)
+    org_policy.grant_root_authority_over_local_orgs()
+    org_policy.grant_root_authority_over_local_orgs()
+    assert sorted(a.target.name for a in root.authorities_granted) == ["a", "b", "c"]
+    assert len(DepartmentAuthority.instances()) == 3
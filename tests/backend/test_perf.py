@@ -0,0 +1,113 @@
+"""Per-name instruction profiling (``core.perf``).
+
+The instruction counter is replaced with a scripted one, so each sample's size
+is known exactly; the generator case checks that an async endpoint is measured
+across its ``yield`` rather than stopping at the first one.
+"""
+
+import os
+import sys
+
+import pytest
+
+BACKEND = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "src",
+    "realm_backend",
+)
+sys.path.insert(0, BACKEND)
+
+from core import perf  # noqa: E402
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    """A counter the test advances by hand."""
+    state = {"now": 0}
+    monkeypatch.setattr(perf, "_counter", lambda: state["now"])
+    perf.reset()
+    perf.set_enabled(True)
+    yield state
+    perf.reset()
+    perf.set_enabled(True)
+
+
+def test_plain_function_is_recorded_under_its_name(counter):
+    @perf.profiled
+    def endpoint(n):
+        counter["now"] += n
+        return n * 2
+
+    assert endpoint(100) == 200
+    endpoint(300)
+    s = perf.stats()["endpoint"]
+    assert (s["calls"], s["errors"], s["total"], s["max"]) == (2, 0, 400, 300)
+    assert s["p50"] == 100 and s["p99"] == 300
+    assert endpoint.__name__ == "endpoint"
+
+
+def test_generator_is_measured_across_yields(counter):
+    @perf.profiled("bridge.async")
+    def endpoint():
+        counter["now"] += 10
+        reply = yield "call"
+        counter["now"] += 5
+        return reply
+
+    gen = endpoint()
+    assert next(gen) == "call"
+    with pytest.raises(StopIteration) as done:
+        gen.send("answer")
+    assert done.value.value == "answer"
+    assert perf.stats()["bridge.async"]["total"] == 15
+
+
+def test_failures_are_counted_and_reraised(counter):
+    @perf.profiled("boom")
+    def endpoint():
+        counter["now"] += 7
+        raise PermissionError("denied")
+
+    with pytest.raises(PermissionError):
+        endpoint()
+    s = perf.stats()["boom"]
+    assert (s["calls"], s["errors"], s["total"]) == (1, 1, 7)
+
+
+def test_ring_keeps_recent_samples_but_counts_everything(counter):
+    for i in range(perf.RING_SIZE + 50):
+        perf.record("hot", i)
+    s = perf.stats()["hot"]
+    assert s["calls"] == perf.RING_SIZE + 50
+    assert s["window"] == perf.RING_SIZE
+    assert s["p50"] >= 50
+
+
+def test_measure_prefix_top_and_reset(counter):
+    with perf.measure("extension_bridge.entity.get"):
+        counter["now"] += 40
+    perf.record("join_realm", 90)
+    assert list(perf.stats("extension_bridge.")) == ["extension_bridge.entity.get"]
+    assert [t["name"] for t in perf.top(2)] == ["join_realm", "extension_bridge.entity.get"]
+    perf.reset("join_realm")
+    assert list(perf.stats()) == ["extension_bridge.entity.get"]
+
+
+def test_disabled_records_nothing(counter):
+    perf.set_enabled(False)
+
+    @perf.profiled
+    def endpoint():
+        return 1
+
+    assert endpoint() == 1
+    assert perf.stats() == {}
+
+
+def test_snapshot_section(counter):
+    from core import system_snapshot
+
+    perf.record("join_realm", 5)
+    section = system_snapshot.snapshot(["perf"])["perf"]
+    assert section["stats"]["join_realm"]["calls"] == 1
+    assert section["top"][0]["name"] == "join_realm"
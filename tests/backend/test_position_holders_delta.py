@@ -0,0 +1,207 @@
+"""Versioned position holders and incremental acting-appointment sync.
+
+A capital and several quarters are simulated in one process: each canister
+has its own storage and its own ``core.position_holders`` journal, and the
+capital's answers cross to the quarters as JSON, as they would on the wire.
+"""
+
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Database, Entity  # noqa: E402
+
+from tests.backend.conftest import MockStorage  # noqa: E402
+
+
+SEATS = ("congress/speaker", "court/judge", "treasury/auditor")
+
+
+class Canister:
+    """One realm: its storage and its in-heap position-holder journal."""
+
+    def __init__(self, cid):
+        from core import position_holders
+
+        self.cid = cid
+        self.storage = MockStorage()
+        self.journal = position_holders.Journal()
+
+    @contextmanager
+    def active(self):
+        from core import position_holders
+
+        db = Database.get_instance()
+        db._db_storage = self.storage
+        db.clear_registry()
+        Entity._context.clear()
+        position_holders._journal = self.journal
+        try:
+            yield self
+        finally:
+            self.journal = position_holders._journal
+
+
+@pytest.fixture
+def federation(storage):
+    from core import position_holders
+
+    saved = position_holders._journal
+    capital = Canister("capital")
+    quarters = [Canister(f"quarter-{i}") for i in range(3)]
+    for canister in [capital, *quarters]:
+        with canister.active():
+            _seed_seats()
+    with capital.active():
+        position_holders.rebuild()
+    yield capital, quarters
+    position_holders._journal = saved
+
+
+def _seed_seats():
+    """The codex seats every realm starts with."""
+    from ggg import Department, Position, UserProfile
+
+    profile = UserProfile(name="officer")
+    for key in SEATS:
+        org, title = key.split("/")
+        dept = Department[org] or Department(name=org)
+        Position(key=key, title=title, department=dept, profile=profile, headcount=3)
+
+
+def _appoint(key, principal):
+    from ggg import Position, User, appoint
+
+    user = User[principal] or User(id=principal)
+    return appoint(Position[key], user)
+
+
+def _ask(capital, since):
+    from core.acting_appointments import dump_position_holders
+
+    with capital.active():
+        return json.loads(json.dumps(dump_position_holders(capital.cid, since=since)))
+
+
+def _sync(capital, quarter):
+    """One quarter sync round; returns (payload, result, storage writes, reads)."""
+    from core.acting_appointments import apply_inherited_holders, inherit_vector
+
+    with quarter.active():
+        since = inherit_vector(capital.cid) or {}
+    payload = _ask(capital, since)
+    with quarter.active():
+        quarter.storage.writes.clear()
+        quarter.storage.reads.clear()
+        result = apply_inherited_holders(payload, capital.cid)
+        return payload, result, list(quarter.storage.writes), list(quarter.storage.reads)
+
+
+def _holders(quarter, key):
+    from ggg import Position
+
+    with quarter.active():
+        return sorted(
+            (a.user.id, a.kind) for a in Position[key].active_appointments()
+        )
+
+
+def test_quarters_apply_only_changed_seats(federation):
+    capital, quarters = federation
+    with capital.active():
+        _appoint("congress/speaker", "alice")
+        _appoint("court/judge", "bob")
+
+    for quarter in quarters:
+        payload, result, _, _ = _sync(capital, quarter)
+        assert payload["full"] is True and len(payload["positions"]) == 3
+        assert result["created"] == 2 and result["errors"] == []
+        assert _holders(quarter, "court/judge") == [("bob", "acting")]
+
+    # Nothing changed at the capital: an empty delta, and no writes anywhere.
+    for quarter in quarters:
+        payload, result, writes, reads = _sync(capital, quarter)
+        assert payload["full"] is False and payload["positions"] == []
+        assert writes == []
+
+    with capital.active():
+        _appoint("court/judge", "carol")
+    for quarter in quarters:
+        payload, result, writes, reads = _sync(capital, quarter)
+        assert [p["key"] for p in payload["positions"]] == ["court/judge"]
+        assert result["created"] == 2
+        # The unchanged seats are not even looked up.
+        assert [r for r in reads if "court/judge" in r]
+        assert not [r for r in reads if "speaker" in r or "auditor" in r]
+        assert writes
+        assert _holders(quarter, "court/judge") == [("bob", "acting"), ("carol", "acting")]
+        assert _holders(quarter, "congress/speaker") == [("alice", "acting")]
+
+
+def test_full_answer_after_capital_upgrade_writes_nothing(federation):
+    from core import position_holders
+
+    capital, quarters = federation
+    with capital.active():
+        _appoint("treasury/auditor", "dave")
+    quarter = quarters[0]
+    _sync(capital, quarter)
+
+    # The capital's journal is rebuilt under a new epoch: the quarter's
+    # vector no longer matches and it is sent every seat again.
+    with capital.active():
+        old_epoch = position_holders.journal().epoch
+        position_holders.rebuild()
+        assert position_holders.journal().epoch != old_epoch
+    payload, result, writes, reads = _sync(capital, quarter)
+    assert payload["full"] is True
+    assert result["unchanged"] == 3 and result["created"] == 0
+    # Only the new vector is recorded.
+    assert writes == ["_system@acting_inherit:capital"]
+    payload, result, writes, reads = _sync(capital, quarter)
+    assert payload["full"] is False and writes == []
+
+
+def test_journal_follows_holder_changes_without_a_scan(federation, monkeypatch):
+    from core import position_holders
+    from ggg import Appointment, Position, User
+
+    capital, _ = federation
+
+    def _scan(*args, **kwargs):
+        raise AssertionError("the journal must not scan")
+
+    with capital.active():
+        monkeypatch.setattr(Appointment, "instances", classmethod(_scan))
+        monkeypatch.setattr(Position, "instances", classmethod(_scan))
+        start = position_holders.journal().vector()
+        speaker = Appointment(position=Position["congress/speaker"], user=User(id="erin"))
+        judge = Position["court/judge"]
+        judge.inherit_from_capital = False
+        delta = position_holders.since(start)["positions"]
+        assert {p["key"]: p["holders"] for p in delta} == {
+            "congress/speaker": [{"principal": "erin", "kind": "substantive"}],
+            "court/judge": [],
+        }
+        assert [p["inherit_from_capital"] for p in delta] == [True, False]
+
+        mark = position_holders.journal().vector()
+        speaker.end()
+        judge.delete()
+        delta = position_holders.since(mark)["positions"]
+        assert delta == [
+            {"key": "congress/speaker", "inherit_from_capital": True, "holders": []},
+        ]
+        assert [p["key"] for p in position_holders.journal().full()["positions"]] == [
+            "congress/speaker", "treasury/auditor",
+        ]
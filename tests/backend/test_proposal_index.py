@@ -0,0 +1,155 @@
+"""Proposal id allocation and the open-proposal index (``core.proposal_index``)."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Database, Entity  # noqa: E402
+
+from core import proposal_index  # noqa: E402
+from core.quarter_drift import recent_proposals  # noqa: E402
+from ggg import Proposal  # noqa: E402
+
+HOUR = proposal_index.BUCKET_SECONDS
+
+
+def _forget_loaded():
+    """Drop cached instances, as an upgrade does; storage survives."""
+    Database.get_instance().clear_registry()
+    Entity._context.clear()
+
+
+def _backfill():
+    cursor = 1
+    while cursor is not None:
+        cursor = proposal_index.rebuild_index(from_id=cursor, batch=50)
+    Database.get_instance().save("_system", proposal_index.INDEX_FLAG, "done")
+
+
+def _submit(deadline=None, status="voting"):
+    return Proposal(
+        proposal_id=proposal_index.allocate_proposal_id(),
+        title="t",
+        status=status,
+        voting_deadline="" if deadline is None else str(deadline),
+    )
+
+
+def _legacy_history(storage, count):
+    """*count* closed proposals filed before the allocator existed."""
+    for i in range(1, count + 1):
+        pid = f"prop_{i:03d}"
+        storage.data[f"Proposal@{i}"] = json.dumps({
+            "_type": "Proposal", "_id": str(i), "proposal_id": pid,
+            "status": "executed", "__version__": 2,
+        })
+        storage.data[f"{Proposal._alias_key()}@{pid}"] = json.dumps(str(i))
+    storage.data["_system@Proposal_id"] = json.dumps(str(count))
+    storage.data["_system@Proposal_count"] = json.dumps(str(count))
+
+
+def test_allocator_is_monotonic_across_upgrade(storage):
+    first = [_submit().proposal_id for _ in range(3)]
+    assert first == ["prop_001", "prop_002", "prop_003"]
+    Proposal["prop_003"].delete()
+
+    _forget_loaded()
+    assert proposal_index.allocate_proposal_id() == "prop_004"
+    assert storage.data[f"_system@{proposal_index.SEQ_KEY}"] == json.dumps("4")
+
+
+def test_allocator_seeds_from_legacy_rows_and_skips_taken_ids(storage):
+    _legacy_history(storage, 5)
+    # Filed by hand with an id the counter has not reached yet.
+    Proposal(proposal_id="prop_007", title="manual", status="executed")
+    assert proposal_index.allocate_proposal_id() == "prop_008"
+    assert proposal_index.allocate_proposal_id() == "prop_009"
+
+
+def _submit_reads(storage, history):
+    """Storage reads one submit costs on a fresh realm with *history* rows."""
+    storage.data.clear()
+    _forget_loaded()
+    _legacy_history(storage, history)
+    # Closed ballots leave nothing in the open index to backfill.
+    Database.get_instance().save("_system", proposal_index.INDEX_FLAG, "done")
+    _forget_loaded()
+    storage.reads.clear()
+    proposal = _submit(deadline=10 * HOUR)
+    assert proposal.proposal_id == f"prop_{history + 1:03d}"
+    return list(storage.reads)
+
+
+def test_submit_cost_does_not_grow_with_history(storage, monkeypatch):
+    def _scan(*args, **kwargs):
+        raise AssertionError("submit must not scan proposals")
+
+    monkeypatch.setattr(Proposal, "instances", classmethod(_scan))
+    monkeypatch.setattr(Proposal, "load_some", classmethod(_scan))
+    small = _submit_reads(storage, 10)
+    large = _submit_reads(storage, 50_000)
+    assert len(large) == len(small)
+    history = {f"Proposal@{i}" for i in range(1, 50_001)}
+    assert not history.intersection(large)
+
+
+def test_open_index_tracks_status_and_deadline(storage):
+    now = 100 * HOUR
+    overdue = _submit(deadline=now - 2 * HOUR)
+    due = _submit(deadline=now - 5)
+    later = _submit(deadline=now + 3 * HOUR)
+    queued = _submit(deadline=now - HOUR, status="pending_vote")
+    review = _submit(status="pending_review")
+    _submit(status="executed")
+    _backfill()
+
+    assert [p._id for p in proposal_index.due_proposals(now)] == [overdue._id, due._id]
+    assert [p._id for p in proposal_index.open_proposals()] == [
+        overdue._id, queued._id, due._id, later._id, review._id,
+    ]
+    assert [p._id for p in proposal_index.open_proposals("pending_vote")] == [queued._id]
+    assert [p._id for p in proposal_index.open_proposals("pending_review")] == [review._id]
+    assert proposal_index.open_proposals("executed") == []
+
+    due.status = "approved"
+    later.voting_deadline = str(now - 1)
+    queued.delete()
+    _forget_loaded()
+    storage.reads.clear()
+    assert [p._id for p in proposal_index.due_proposals(now)] == [overdue._id, later._id]
+    loaded = {k for k in storage.reads if k.startswith("Proposal@")}
+    assert loaded == {f"Proposal@{overdue._id}", f"Proposal@{later._id}"}
+    assert proposal_index.open_proposals("pending_vote") == []
+
+
+def test_status_index_fallback_until_backfilled(storage):
+    now = 100 * HOUR
+    a = _submit(deadline=now - 1)
+    b = _submit(deadline=now + 1)
+    assert not proposal_index.index_ready()
+    assert [p._id for p in proposal_index.open_proposals()] == [a._id, b._id]
+    assert [p._id for p in proposal_index.due_proposals(now)] == [a._id]
+
+
+def test_recent_proposals_reads_the_index(storage, monkeypatch):
+    for _ in range(proposal_index.RECENT_SIZE + 5):
+        _submit(status="executed")
+    _backfill()
+    newest = proposal_index.recent_ids(3)
+    assert newest == [str(i) for i in range(103, 106)]
+
+    def _scan(*args, **kwargs):
+        raise AssertionError("index-backed read must not page by max_id")
+
+    monkeypatch.setattr(Proposal, "load_some", classmethod(_scan))
+    got = recent_proposals(Proposal, limit=3, recent_ids=proposal_index.recent_ids)
+    assert [p._id for p in got] == newest
+    Proposal.load("105").delete()
+    assert proposal_index.recent_ids(2) == ["103", "104"]
@@ -5,12 +5,17 @@ automatic index maintenance on create/update, and the resumable backfill
 used by the post-upgrade timer chain in main.py.
 """
 
-import importlib.util
 import json
-import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
 
 from ic_python_db import Database
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src" / "realm_backend"))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
 
 class MockStorage:
     def __init__(self):
@@ -39,21 +44,7 @@ class MockStorage:
 if Database._instance is None:
     Database.init(db_storage=MockStorage(), audit_enabled=False)
 
-
-def _load_proposal_class():
-    """Load the Proposal module directly, bypassing the ggg package
-    __init__ (which drags in canister-only dependencies)."""
-    path = os.path.join(
-        os.path.dirname(__file__),
-        "../../src/realm_backend/ggg/governance/proposal.py",
-    )
-    spec = importlib.util.spec_from_file_location("proposal_under_test", path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module.Proposal
-
-
-Proposal = _load_proposal_class()
+from ggg import Proposal  # noqa: E402
 
 
 def setup_function(_fn):
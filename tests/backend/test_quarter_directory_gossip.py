@@ -0,0 +1,236 @@
+"""Delta quarter-directory gossip (``core.quarter_directory``).
+
+An in-process federation: each simulated quarter has its own ``Journal`` and
+a plain list standing in for its ``Quarter`` rows. ``fetch_peer_directory``
+runs unmodified against a fake ``QuarterDirectoryService`` that answers from
+the target quarter's journal, and the replies are merged with the real
+``merge_quarter_directory``.
+"""
+
+import importlib.util
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from tests.backend._cdk_stub import ensure_cdk_stub
+
+BACKEND = Path(__file__).resolve().parents[2] / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+ensure_cdk_stub()
+
+from core import quarter_directory  # noqa: E402
+from core.cross_quarter import merge_quarter_directory  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location(
+    "realm_api_cross_quarter", BACKEND / "api" / "cross_quarter.py"
+)
+transport = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(transport)
+
+
+class SimQuarter:
+    def __init__(self, cid, population=1, legacy=False, epoch=1):
+        self.cid = cid
+        self.legacy = legacy
+        self.journal = quarter_directory.Journal(epoch)
+        self.journal.ready = True
+        self.rows = {}
+        self.vectors = {}
+        self.served = []
+        self.journal.put(cid, {"name": cid, "canister_id": cid,
+                               "population": population, "status": "active",
+                               "index": 0, "is_self": True})
+
+    def save(self, row):
+        """A ``Quarter`` save: the table changes and the hook stamps it."""
+        self.rows[row["canister_id"]] = row
+        self.journal.put(row["canister_id"], dict(row))
+
+    def set_population(self, population):
+        row = dict(self.journal.rows[self.cid], population=population)
+        self.journal.put(self.cid, row)
+
+    # -- what the peer's endpoints answer ----------------------------------
+
+    def get_quarter_directory(self):
+        self.served.append("full")
+        out = self.journal.full()
+        return json.dumps({"quarters": out["quarters"], "self": out.get("self")})
+
+    def get_quarter_directory_since(self, vector):
+        if self.legacy:
+            return {"Err": "Canister has no query method 'get_quarter_directory_since'"}
+        answer = self.journal.since(json.loads(vector) if vector else None)
+        self.served.append("full" if answer["full"] else "delta")
+        return json.dumps(answer)
+
+
+@pytest.fixture
+def federation(monkeypatch):
+    quarters = {}
+
+    class Service:
+        def __init__(self, principal):
+            self.peer = quarters[principal]
+
+        def get_quarter_directory(self):
+            return self.peer.get_quarter_directory()
+
+        def get_quarter_directory_since(self, vector):
+            return self.peer.get_quarter_directory_since(vector)
+
+    monkeypatch.setattr(transport, "QuarterDirectoryService", Service)
+    monkeypatch.setattr(
+        transport, "Principal", types.SimpleNamespace(from_str=lambda s: s)
+    )
+
+    def add(cid, **kwargs):
+        quarters[cid] = SimQuarter(cid, **kwargs)
+        return quarters[cid]
+
+    return add
+
+
+def _drive(gen):
+    """Run a fetch generator; each yielded call is already its reply."""
+    reply = None
+    try:
+        while True:
+            reply = gen.send(reply)
+    except StopIteration as done:
+        return done.value
+
+
+def pull(a, b):
+    """One gossip round: *a* pulls *b*'s directory and merges it."""
+    answer = _drive(transport.fetch_peer_directory(b.cid, since=a.vectors.get(b.cid, {})))
+    assert answer["success"], answer
+    local = [dict(row) for row in a.rows.values()]
+    merged, _changed = merge_quarter_directory(
+        local, answer["quarters"], peer_self=answer["self"], peer_canister_id=b.cid,
+    )
+    for entry in merged:
+        cid = entry["canister_id"]
+        if cid == a.cid:
+            continue
+        row = {k: entry.get(k) for k in ("name", "canister_id", "population", "status")}
+        if a.rows.get(cid) != row:
+            a.save(row)
+    if "clock" in answer:
+        a.vectors[b.cid] = {"epoch": answer["epoch"], "clock": answer["clock"]}
+    return answer
+
+
+def test_quiet_peer_sends_nothing_after_first_round(federation):
+    a, b = federation("a-cai"), federation("b-cai", population=7)
+    first = pull(a, b)
+    assert first["full"] and [q["canister_id"] for q in first["quarters"]] == ["b-cai"]
+    again = pull(a, b)
+    assert again["full"] is False and again["quarters"] == []
+    assert b.served == ["full", "delta"]
+
+
+def test_delta_carries_only_changes_across_hops(federation):
+    a, b, c = federation("a-cai"), federation("b-cai"), federation("c-cai")
+    b.save({"name": "d", "canister_id": "d-cai", "population": 3, "status": "active"})
+    pull(a, b)
+    pull(c, a)
+    assert set(c.rows) == {"a-cai", "b-cai", "d-cai"}
+
+    b.save({"name": "d", "canister_id": "d-cai", "population": 9, "status": "active"})
+    delta = pull(a, b)
+    assert [q["canister_id"] for q in delta["quarters"]] == ["d-cai"]
+    hop = pull(c, a)
+    assert hop["full"] is False
+    assert [q["canister_id"] for q in hop["quarters"]] == ["d-cai"]
+    assert c.rows["d-cai"]["population"] == 9
+
+
+def test_federation_converges(federation):
+    sims = [federation(f"q{i}-cai", population=i + 1) for i in range(4)]
+    for _ in range(3):
+        for i, sim in enumerate(sims):
+            pull(sim, sims[(i + 1) % len(sims)])
+    everyone = {s.cid for s in sims}
+    for sim in sims:
+        assert set(sim.rows) | {sim.cid} == everyone
+    served = [kind for s in sims for kind in s.served]
+    assert served.count("full") == len(sims)
+
+
+def test_unknown_vector_gets_the_full_directory(federation):
+    a, b = federation("a-cai"), federation("b-cai")
+    pull(a, b)
+    # b was upgraded: its heap journal comes back in a new epoch.
+    rebuilt = quarter_directory.Journal(epoch=2)
+    rebuilt.ready = True
+    rebuilt.put("b-cai", b.journal.rows["b-cai"])
+    b.journal = rebuilt
+    assert pull(a, b)["full"] is True
+
+    ahead = b.journal.since({"epoch": 2, "clock": b.journal.clock + 5})
+    assert ahead["full"] is True
+    assert b.journal.since({"epoch": "x"})["full"] is True
+
+
+def test_legacy_peer_falls_back_to_full_fetch(federation):
+    a, old = federation("a-cai"), federation("old-cai", legacy=True)
+    answer = pull(a, old)
+    assert answer["full"] is True and "clock" not in answer
+    assert "old-cai" in a.rows and "old-cai" not in a.vectors
+    assert old.served == ["full"]
+
+
+def test_self_block_and_repointed_quarter():
+    journal = quarter_directory.Journal(epoch=1)
+    journal.ready = True
+    journal.put_self_block({"canister_id": "a-cai", "codex_id": "c1"})
+    journal.put_quarter("7", "old-cai", {"canister_id": "old-cai", "population": 1})
+    vector = journal.vector()
+
+    assert "self" not in journal.since(vector)
+    journal.put_quarter("7", "new-cai", {"canister_id": "new-cai", "population": 1})
+    delta = journal.since(vector)
+    assert [q["canister_id"] for q in delta["quarters"]] == ["new-cai"]
+    assert "old-cai" not in journal.rows
+
+    journal.put_self_block({"canister_id": "a-cai", "codex_id": "c2"})
+    assert journal.since(vector)["self"]["codex_id"] == "c2"
+
+
+class Quarter:
+    def __init__(self, _id, canister_id, population=1):
+        self._id = _id
+        self.name = canister_id
+        self.canister_id = canister_id
+        self.population = population
+        self.status = "active"
+        self.index = 0
+
+
+def test_save_hook_skips_self_and_empty_ids(monkeypatch):
+    journal = quarter_directory.Journal(epoch=1)
+    journal.put("a-cai", {"canister_id": "a-cai", "is_self": True})
+    monkeypatch.setattr(quarter_directory, "_journal", journal)
+    monkeypatch.setattr(quarter_directory, "_self_id", lambda: "a-cai")
+
+    quarter_directory.entity_changed(Quarter(1, "a-cai", population=99))
+    quarter_directory.entity_changed(Quarter(2, ""))
+    assert journal.rows == {"a-cai": {"canister_id": "a-cai", "is_self": True}}
+
+    quarter_directory.entity_changed(Quarter(3, "b-cai"))
+    assert sorted(journal.rows) == ["a-cai", "b-cai"]
+    quarter_directory.entity_changed(Quarter(3, ""))
+    quarter_directory.entity_removed(Quarter(1, "a-cai"))
+    assert journal.rows == {"a-cai": {"canister_id": "a-cai", "is_self": True}}
+
+
+def test_remembered_vectors(monkeypatch):
+    monkeypatch.setattr(quarter_directory, "_peer_vectors", {})
+    quarter_directory.remember_peer_vector("b-cai", {"epoch": 3, "clock": 8})
+    assert quarter_directory.peer_vector("b-cai") == {"epoch": 3, "clock": 8}
+    quarter_directory.remember_peer_vector("b-cai", {"success": True})
+    assert quarter_directory.peer_vector("b-cai") is None
@@ -0,0 +1,155 @@
+"""Quarter directory gossip merge (``core.quarter_bootstrap.sync_*_peer*``).
+
+``fetch_peer_directory`` is replaced by a canned directory per peer; the
+merge and the writes run on the real ORM. The scaling test counts executed
+bytecodes the way ``scripts/benchmark_realm.py`` does.
+"""
+
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Entity  # noqa: E402
+
+from core import quarter_bootstrap  # noqa: E402
+
+
+@pytest.fixture
+def peers(storage, monkeypatch):
+    """Peer canister id -> the directory it answers with (None: unreachable)."""
+    Entity._context.clear()
+    # ``ggg`` may have been swapped for a fake by another test module.
+    sys.modules.pop("ggg", None)
+    from ggg import Realm
+
+    Realm(name="sync-realm")
+
+    directories = {}
+
+    def fetch_peer_directory(peer_canister_id, since=None):
+        if False:
+            yield
+        answer = directories.get(peer_canister_id)
+        if answer is None:
+            return {"success": False, "error": "unreachable"}
+        return {"success": True, **answer}
+
+    transport = types.ModuleType("api.cross_quarter")
+    transport.fetch_peer_directory = fetch_peer_directory
+    monkeypatch.setitem(sys.modules, "api.cross_quarter", transport)
+    yield directories
+
+
+def _run(gen):
+    try:
+        while True:
+            next(gen)
+    except StopIteration as done:
+        return done.value
+
+
+def _quarters(n, population=10):
+    return [
+        {"name": f"q-{i}", "canister_id": f"q{i}-cai", "population": population,
+         "status": "active"}
+        for i in range(n)
+    ]
+
+
+def _seed(n, population=10):
+    from ggg import Quarter
+
+    for entry in _quarters(n, population):
+        Quarter(**entry)
+
+
+def test_one_peer_adds_and_refreshes(peers):
+    from ggg import Quarter
+
+    _seed(2)
+    peers["q0-cai"] = {
+        "quarters": _quarters(3, population=25),
+        "self": {"codex_id": "codex-a", "codex_version": "1.2.0"},
+    }
+    res = _run(quarter_bootstrap.sync_one_peer("q0-cai"))
+    assert res == {"success": True, "peer": "q0-cai", "added": 1,
+                   "known_quarters": 3, "changed": True, "full": True}
+    assert sorted(q.canister_id for q in Quarter.instances()) == [
+        "q0-cai", "q1-cai", "q2-cai"]
+    q0 = Quarter["q-0"]
+    assert q0.population == 25 and q0.reported_codex_id == "codex-a"
+    assert Quarter["q-1"].reported_codex_id in ("", None)
+
+
+def test_unreachable_peer_is_an_error(peers):
+    res = _run(quarter_bootstrap.sync_one_peer("nobody-cai"))
+    assert res == {"success": False, "error": "unreachable"}
+    assert _run(quarter_bootstrap.sync_peers(" nobody-cai ")) == res
+
+
+def test_many_peers_merge_in_one_pass(peers, monkeypatch):
+    from ggg import Quarter
+
+    _seed(1)
+    peers["q0-cai"] = {"quarters": _quarters(2, population=12)}
+    peers["q5-cai"] = {"quarters": [{"name": "q-5", "canister_id": "q5-cai",
+                                     "population": 40, "status": "active"}]}
+    scans = []
+    instances = Quarter.instances.__func__
+
+    def counting(cls):
+        scans.append(1)
+        return instances(cls)
+
+    monkeypatch.setattr(Quarter, "instances", classmethod(counting))
+    # ``sync_quarters`` takes the peers as one comma-separated argument.
+    res = _run(quarter_bootstrap.sync_peers("q0-cai, gone-cai,q5-cai,q0-cai"))
+
+    assert len(scans) == 1
+    assert res["success"] and res["added"] == 2 and res["known_quarters"] == 3
+    assert res["peers"] == {"q0-cai": {"success": True, "full": True},
+                            "gone-cai": {"success": False, "error": "unreachable"},
+                            "q5-cai": {"success": True, "full": True}}
+    assert Quarter["q-0"].population == 12 and Quarter["q-5"].population == 40
+
+
+def _count_opcodes(fn):
+    count = [0]
+
+    def tracer(frame, event, arg):
+        frame.f_trace_opcodes = True
+        if event == "opcode":
+            count[0] += 1
+        return tracer
+
+    sys.settrace(tracer)
+    try:
+        fn()
+    finally:
+        sys.settrace(None)
+    return count[0]
+
+
+def test_merge_cost_grows_linearly_with_quarters(peers):
+    """A peer echoing our own 100 vs 500 quarters: ~5x the work, not ~25x."""
+    from ggg import Quarter
+
+    costs = {}
+    for n in (100, 500):
+        for q in list(Quarter.instances()):
+            q.delete()
+        _seed(n)
+        peers["q0-cai"] = {"quarters": _quarters(n)}
+        costs[n] = _count_opcodes(
+            lambda: _run(quarter_bootstrap.sync_one_peer("q0-cai"))
+        )
+    assert costs[500] < 7 * costs[100]
@@ -0,0 +1,91 @@
+"""Status / extensions response cache (``api.status_cache``).
+
+Builders are swapped for counting fakes so the tests see exactly when the
+expensive path runs; the stamp itself reads the real ORM counts.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from api import status_cache  # noqa: E402
+
+
+@pytest.fixture
+def builds(storage, monkeypatch):
+    calls = {"status": 0, "extensions": 0}
+
+    def build(key):
+        def _build():
+            calls[key] += 1
+            return {"key": key, "n": calls[key]}
+        return _build
+
+    monkeypatch.setattr(
+        status_cache, "BUILDERS", {k: build(k) for k in ("status", "extensions")}
+    )
+    status_cache._entries.clear()
+    yield calls
+    status_cache._entries.clear()
+
+
+def test_repeat_reads_hit_the_cache(builds):
+    first = status_cache.status()
+    assert status_cache.status() is first
+    assert builds["status"] == 1
+
+
+def test_entity_count_change_rebuilds(builds):
+    from ggg import Organization
+
+    status_cache.status()
+    Organization(name="status-cache-org")
+    assert status_cache.status()["n"] == 2
+
+
+def test_invalidate_rebuilds(builds):
+    body, etag = status_cache.response("extensions")
+    status_cache.invalidate()
+    body2, etag2 = status_cache.response("extensions")
+    assert builds["extensions"] == 2
+    assert etag2 != etag and body2 != body
+
+
+def test_http_etag_round_trip(builds):
+    ok = status_cache.http_response("status", [])
+    assert ok["status_code"] == 200
+    etag = dict(ok["headers"])["ETag"]
+    assert ok["body"].startswith(b'{"key": "status"')
+
+    again = status_cache.http_response("status", [("If-None-Match", etag)])
+    assert again["status_code"] == 304 and again["body"] == b""
+    assert builds["status"] == 1
+
+    stale = status_cache.http_response("status", [("if-none-match", '"other"')])
+    assert stale["status_code"] == 200
+
+
+def test_refresh_only_rebuilds_stale_entries(builds):
+    assert status_cache.refresh() == 2
+    assert status_cache.refresh() == 0
+    status_cache.invalidate()
+    assert status_cache.refresh() == 2
+
+
+def test_home_quarter_move_rebuilds(builds):
+    from ggg import User
+
+    user = User(id="status-cache-mover")
+    status_cache.status()
+    # No count changes: only the User save hook can see this.
+    user.home_quarter = "quarter-a"
+    assert status_cache.status()["n"] == 2
+    assert status_cache.status()["n"] == 2
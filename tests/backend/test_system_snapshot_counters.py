@@ -0,0 +1,201 @@
+"""Counter-backed ``db`` and ledger-backed ``files`` snapshot sections.
+
+``core.system_snapshot`` reads the per-type counters the ORM keeps and the
+file ledger the install paths keep (``core.file_ledger``); the ``db_audit``
+and ``files_audit`` sections are the slow paths that check them.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND = REPO_ROOT / "src" / "realm_backend"
+sys.path.insert(0, str(BACKEND))
+sys.modules.setdefault("basilisk", MagicMock())
+sys.modules.setdefault("_cdk", MagicMock())
+
+from ic_python_db import Database, Entity  # noqa: E402
+
+from core import file_ledger  # noqa: E402
+from ggg import Department, Proposal  # noqa: E402
+
+
+@pytest.fixture
+def snapshot():
+    # Imported per test rather than at collection: other suites put a stub
+    # ``core.system_snapshot`` in sys.modules and must find it unimported.
+    from core import system_snapshot
+
+    return system_snapshot
+
+
+@pytest.fixture
+def trees(storage, tmp_path, monkeypatch):
+    from core import runtime_codex, runtime_extensions
+
+    monkeypatch.setattr(runtime_extensions, "EXTENSIONS_DIR", str(tmp_path / "extensions"))
+    monkeypatch.setattr(runtime_codex, "CODEX_PACKAGES_DIR", str(tmp_path / "codex_packages"))
+    return SimpleNamespace(root=tmp_path, extensions=runtime_extensions, codex=runtime_codex)
+
+
+def _forget_loaded():
+    """Drop cached instances, as an upgrade does; storage survives."""
+    Database.get_instance().clear_registry()
+    Entity._context.clear()
+
+
+def _audit(snapshot, repair=False):
+    """Run the whole audit, following its cursor: through ``snapshot`` to
+    read, through ``repair`` to fix."""
+    cursor = None
+    while True:
+        if repair:
+            report = snapshot.repair("db_audit", cursor)
+        else:
+            options = {"db_audit": {"cursor": cursor}}
+            report = snapshot.snapshot(["db_audit"], options)["db_audit"]
+        cursor = report["next_cursor"]
+        if cursor is None:
+            return report
+
+
+def test_counters_hold_through_import_delete_and_upgrade(storage, snapshot):
+    for i in range(30):
+        Department(name=f"org-{i}")
+    # Bulk import: rows with and without ids of their own.
+    for i in range(20):
+        Proposal.deserialize({"_type": "Proposal", "_id": str(100 + i), "title": "x"})
+    for i in range(5):
+        Proposal.deserialize({"_type": "Proposal", "title": "y"})
+    for dept in Department.load_some(from_id=1, count=7):
+        dept.delete()
+    Proposal.load("105").delete()
+
+    _forget_loaded()
+    counts = snapshot.snapshot(["db"])["db"]["counts"]
+    assert counts["Department"] == 23 and counts["Proposal"] == 24
+    report = _audit(snapshot)
+    assert report["consistent"] is True and report["mismatched"] == {}
+    assert report["total_entities"] == 47
+    assert "db_audit" not in snapshot.snapshot()
+
+
+def test_audit_repairs_counters_behind_raw_rows(storage, snapshot):
+    Department(name="kept")
+    # Rows restored straight into storage, past the ORM and its counters.
+    for i in (2, 3, 9):
+        storage.data[f"Department@{i}"] = json.dumps(
+            {"_type": "Department", "_id": str(i), "name": f"raw-{i}"}
+        )
+
+    report = _audit(snapshot)
+    assert report["mismatched"]["Department"] == {
+        "counter": 1, "rows": 4, "max_id": 1, "highest_row_id": 9,
+    }
+    assert Department.count() == 1
+
+    assert _audit(snapshot, repair=True)["repaired"] is True
+    assert Department.count() == 4 and Department.max_id() == 9
+    assert _audit(snapshot)["consistent"] is True
+    assert Department(name="next")._id == "10"
+
+
+def test_snapshot_never_repairs(storage, snapshot):
+    Department(name="kept")
+    storage.data["Department@5"] = json.dumps(
+        {"_type": "Department", "_id": "5", "name": "raw"}
+    )
+
+    options = {"db_audit": {"repair": True}, "files_audit": {"repair": True}}
+    out = snapshot.snapshot(["db_audit", "files_audit"], options)
+    assert "repair()" in out["db_audit"]["error"]
+    assert "repair()" in out["files_audit"]["error"]
+    assert Department.count() == 1 and Department.max_id() == 1
+
+
+def _manifest(name):
+    return json.dumps({"name": name, "version": "1.0.0"})
+
+
+def test_file_stats_come_from_the_ledger(trees, snapshot, monkeypatch):
+    assert trees.extensions.install_extension(
+        "notes", {"manifest.json": _manifest("notes"), "dist/app.js": "x" * 100}
+    )
+    assert trees.codex.install_codex_package("civics", {"manifest.json": "{}", "README.md": "hi"})
+
+    def _no_walk(*args, **kwargs):
+        raise AssertionError("file_stats must not walk the filesystem")
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "walk", _no_walk)
+        m.setattr(os, "listdir", _no_walk)
+        stats = snapshot.snapshot(["files"])["files"]
+
+    assert stats["trees"] == 2 and stats["ledger_ready"] is True
+    # The extension also carries the _source.json written at install.
+    assert stats["total_files"] == 5
+    assert stats["top_extensions"] == {".json": 3, ".js": 1, ".md": 1}
+    on_disk = sum(
+        os.path.getsize(os.path.join(d, f))
+        for d, _, files in os.walk(trees.root) for f in files
+    )
+    assert stats["total_size_bytes"] == on_disk
+
+    assert trees.extensions.uninstall_extension("notes")
+    assert snapshot.file_stats()["total_files"] == 2
+
+
+def test_verify_reports_and_repairs_drift(trees, snapshot):
+    trees.codex.install_codex_package("civics", {"manifest.json": "{}"})
+    assert file_ledger.verify()["consistent"] is True
+
+    # Written behind the install path's back, and a tree that predates the ledger.
+    pkg = trees.root / "codex_packages" / "civics"
+    (pkg / "extra.md").write_text("late")
+    legacy = trees.root / "extensions" / "legacy"
+    legacy.mkdir(parents=True)
+    (legacy / "manifest.json").write_text("{}")
+
+    report = file_ledger.verify()
+    assert report["drifted"] == ["codex:civics"]
+    assert report["missing"] == ["extension:legacy"]
+    assert report["consistent"] is False
+
+    file_ledger.verify(repair=True)
+    assert file_ledger.verify()["consistent"] is True
+    assert snapshot.file_stats()["total_files"] == 3
+
+
+def test_audit_pages_by_id_cursor(storage, snapshot, monkeypatch):
+    for i in range(40):
+        Department(name=f"org-{i}")
+    storage.data["Department@45"] = json.dumps(
+        {"_type": "Department", "_id": "45", "name": "raw"}
+    )
+
+    def _keys():
+        raise AssertionError("the audit must not list storage keys")
+
+    monkeypatch.setattr(storage, "keys", _keys)
+    monkeypatch.setattr(storage, "items", _keys)
+
+    pages, cursor = 0, None
+    while True:
+        report = snapshot.db_audit(cursor=cursor, page=30)
+        pages += 1
+        cursor = report["next_cursor"]
+        if cursor is None:
+            break
+        assert report["checked_types"] < report["entity_types"]
+    assert pages > 3
+    assert report["checked_types"] == report["entity_types"]
+    assert report["total_entities"] == 41
+    assert report["mismatched"] == {"Department": {
+        "counter": 40, "rows": 41, "max_id": 40, "highest_row_id": 45,
+    }}
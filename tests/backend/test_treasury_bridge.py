@@ -68,10 +68,6 @@ def realm(monkeypatch):
     proposals = []
 
     class Proposal:
-        @staticmethod
-        def instances():
-            return list(proposals)
-
         def __init__(self, **fields):
             self.__dict__.update(fields)
             proposals.append(self)
@@ -109,6 +105,10 @@ def realm(monkeypatch):
     )
     monkeypatch.setitem(sys.modules, "core.position_admin", position_admin)
 
+    proposal_index = types.ModuleType("core.proposal_index")
+    proposal_index.allocate_proposal_id = lambda: f"prop_{len(proposals) + 1:03d}"
+    monkeypatch.setitem(sys.modules, "core.proposal_index", proposal_index)
+
     monkeypatch.setitem(sys.modules, "ggg", MagicMock(Proposal=Proposal))
 
     return {
@@ -0,0 +1,88 @@
+"""Tests for ``scripts/benchmark_realm.py``.
+
+The threshold logic is pure and checked directly; one small in-process run
+(worker subprocess, generated realm, real ``main``) guards the harness itself
+against drifting away from the backend it measures.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import benchmark_realm as br  # noqa: E402
+
+
+def _result(case, scale, instructions, ok=True):
+    return {"case": case, "scale": scale, "instructions": instructions, "ok": ok}
+
+
+def test_regression_past_tolerance_is_reported():
+    thresholds = {"tolerance": 0.1, "in-process": {"directory_list": {"1000": 100}}}
+    assert br.check_regressions(
+        [_result("directory_list", 1000, 110)], thresholds, "in-process"
+    ) == []
+    (problem,) = br.check_regressions(
+        [_result("directory_list", 1000, 111)], thresholds, "in-process"
+    )
+    assert problem.startswith("directory_list @ 1000: 111 instructions")
+
+
+def test_failures_count_and_missing_baselines_do_not():
+    results = [
+        _result("find_objects", 1000, 5, ok=False),
+        _result("get_sidebar", 100_000, 10**9),
+        {"case": "extension_call_sandboxed", "scale": 1000, "skipped": "replica only"},
+    ]
+    problems = br.check_regressions(results, {}, "in-process")
+    assert len(problems) == 1 and problems[0].startswith("find_objects @ 1000: failed")
+
+
+def test_check_fails_on_a_case_without_a_threshold(tmp_path, monkeypatch):
+    thresholds = tmp_path / "thresholds.json"
+    thresholds.write_text(json.dumps({"in-process": {"get_sidebar": {"1000": 100}}}))
+    results = [_result("get_sidebar", 1000, 100), _result("get_sidebar", 100_000, 100)]
+    monkeypatch.setattr(br, "run_in_process", lambda scale, args: [
+        r for r in results if r["scale"] == scale
+    ])
+    out = tmp_path / "results.json"
+    argv = ["--scales", "1000,100000", "--thresholds", str(thresholds), "--output", str(out)]
+
+    assert br.main(argv) == 0
+    assert br.main(argv + ["--check"]) == 1
+    report = json.loads(out.read_text())
+    assert report["regressions"] == []
+    assert report["unchecked"] == ["get_sidebar @ 100000"]
+    assert br.main(["--scales", "1000", "--thresholds", str(thresholds), "--check"]) == 0
+
+
+def test_update_thresholds_keeps_other_scales():
+    thresholds = {"in-process": {"directory_list": {"10000": 900}}}
+    br.update_thresholds(
+        [_result("directory_list", 1000, 80), _result("join_realm", 1000, 7, ok=False)],
+        thresholds,
+        "in-process",
+    )
+    assert thresholds["in-process"] == {"directory_list": {"1000": 80, "10000": 900}}
+    assert thresholds["tolerance"] == br.DEFAULT_TOLERANCE
+
+
+def test_in_process_smoke(tmp_path, monkeypatch):
+    monkeypatch.setattr(br, "CACHE_DIR", tmp_path / "cache")
+    out = tmp_path / "results.json"
+    rc = br.main([
+        "--scales", "30", "--repeat", "1", "--no-opcodes",
+        "--thresholds", str(tmp_path / "thresholds.json"), "--output", str(out),
+    ])
+    assert rc == 0
+    report = json.loads(out.read_text())
+    by_case = {e["case"]: e for e in report["results"]}
+    assert set(by_case) == {c.name for c in br.CASES}
+    assert by_case["extension_call_sandboxed"]["skipped"]
+    failed = [e for e in report["results"] if e.get("ok") is False]
+    assert failed == []
+    assert report["regressions"] == []